@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional, List, Union
+from typing import Optional, List, Union, TYPE_CHECKING
 import numpy as np
 
-# A importação do pandas é crucial para aceitar DataFrames
-try:
+# O pandas não é importado aqui (custa centenas de ms na inicialização): DataFrames são
+# reconhecidos pelo método to_numpy, sem exigir o pandas instalado
+if TYPE_CHECKING:
     import pandas as pd
-except ImportError:
-    pd = None
-    print("Aviso: Pandas não está instalado. A classe TimeSeries só aceitará numpy.ndarray/List.")
 
 # Definição de tipos
 TimeSeriesData = np.ndarray
@@ -30,7 +28,7 @@ class TimeSeries:
     def __post_init__(self):
         
         # 1. Converte Pandas DataFrame para NumPy array
-        if pd is not None and isinstance(self.data, pd.DataFrame):
+        if not isinstance(self.data, np.ndarray) and hasattr(self.data, "to_numpy"):
             self.data = self.data.to_numpy(dtype=float)
         
         # 2. Garante que o input é um array numpy
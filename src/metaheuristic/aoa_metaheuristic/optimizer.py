@@ -1,6 +1,5 @@
 import numpy as np
 from typing import Callable, Optional, Tuple
-import matplotlib.pyplot as plt
 import os
 import time
 
@@ -154,6 +153,8 @@ class AOA:
         if self.conv_curve is None:
             raise ValueError("Nenhuma curva de convergência carregada. Rode solve() primeiro.")
 
+        import matplotlib.pyplot as plt   # Importado só aqui: o matplotlib é caro e só serve para o gráfico
+
         plt.figure(figsize=(8, 5))
         plt.plot(self.conv_curve, marker='o', markersize=3)
         plt.title(title)
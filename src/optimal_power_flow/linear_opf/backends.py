@@ -0,0 +1,348 @@
+"""
+Backends de solução para os modelos matriciais (LPModel) do despacho linear.
+
+Cada backend recebe o LPModel (matrizes, lado direito, custos e limites) e
+devolve um LPSolution com os arrays primais e duais:
+
+- "highs":   HiGHS em processo (highspy). O modelo é passado em memória e a
+             instância é mantida entre as soluções (ver HighsBackend).
+- "linprog": scipy.optimize.linprog(method="highs"), sem estado (sempre
+             resolve do zero).
+- "cbc":     PuLP + CBC (ou outro solver do PuLP). Monta um LpProblem a
+             partir das matrizes, mantido entre os re-solves do mesmo
+             LPModel (ver PulpBackend), e resolve por arquivo/subprocesso,
+             como o LinearDispatch fazia antes; é o padrão do LinearDispatch.
+
+Nos LPs degenerados do despacho o HiGHS chega ao mesmo custo ótimo por outro
+vértice: as perdas calculadas a partir desse despacho mudam, e com elas o
+resultado do solve_loss (ex.: IEEE 14, perdas de 15,33 MW com o CBC e 6,32 MW
+com o HiGHS). Por isso DEFAULT_BACKEND é o "cbc", usado quando backend=None
+pelo LinearDispatch e pelos despachos multiperíodo e estocástico, e o
+"highs" (re-solves a quente, sem arquivos) é pedido com backend="highs".
+"""
+from __future__ import annotations
+import numpy as np
+import pulp as pl
+from typing import Dict, Optional, Type, Union
+from optimal_power_flow.linear_opf.lp_model import LPModel, LPSolution
+
+# Backend dos despachos quando backend=None: o CBC reproduz os resultados anteriores aos backends matriciais
+DEFAULT_BACKEND = "cbc"
+
+
+class SolverBackend:
+    """Resolve LPModels. As subclasses implementam solve()."""
+    name: str = "base"
+
+    def solve(self, model: LPModel) -> LPSolution:
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+def _split_col_dual(col_dual: np.ndarray, lower: np.ndarray, upper: np.ndarray):
+    """
+    Custos reduzidos -> (duais dos limites inferiores >= 0, duais dos limites
+    superiores <= 0), separados pelo sinal. Nas colunas fixas (lower == upper)
+    os dois limites são uma igualdade e o sinal não diz qual deles está ativo:
+    o custo reduzido inteiro (de qualquer sinal) fica no dual do limite
+    inferior e o do superior é zero. A soma lower + upper é, em todos os
+    casos, a sensibilidade do objetivo ao valor da coluna (cortes do Benders).
+    """
+    col_dual = np.asarray(col_dual, dtype=float)
+    fixed = lower == upper
+    lower_dual = np.where(fixed, col_dual, np.maximum(col_dual, 0.0))
+    upper_dual = np.where(fixed, 0.0, np.minimum(col_dual, 0.0))
+    return lower_dual, upper_dual
+
+
+def _model_data(model: LPModel) -> dict:
+    """Cópia dos custos, limites e lado direito de um LPModel (comparada no próximo solve para enviar só as mudanças)."""
+    return {"c": model.c.copy(), "lower": model.lower.copy(), "upper": model.upper.copy(),
+            "row_lower": np.concatenate([model.b_eq, np.full(len(model.b_ub), -np.inf)]),
+            "row_upper": np.concatenate([model.b_eq, model.b_ub]),
+            "shape": (model.A_eq.shape, model.A_eq.nnz, model.A_ub.shape, model.A_ub.nnz)}
+
+
+def _appended_ub_rows(model: LPModel, shape: tuple) -> Optional[int]:
+    """
+    Número de linhas <= acrescentadas (LPModel.add_ub_rows) desde que o modelo
+    tinha o formato `shape` (ver _model_data), ou None se a estrutura mudou de
+    outra forma (outra A_eq, outras colunas, linhas <= removidas ou alteradas).
+    """
+    eq_shape, eq_nnz, (n_ub, n_col), ub_nnz = shape
+    if (model.A_eq.shape, model.A_eq.nnz) != (eq_shape, eq_nnz) or model.n_cols != n_col or model.A_ub.shape[0] < n_ub:
+        return None
+    if model.A_ub.indptr[n_ub] != ub_nnz:   # CSR: nnz das linhas que já existiam
+        return None
+    return model.A_ub.shape[0] - n_ub
+
+
+class HighsBackend(SolverBackend):
+    """
+    HiGHS em processo (highspy). As matrizes são passadas direto ao solver e
+    os arrays primais/duais são lidos de volta sem nenhum arquivo.
+
+    A instância Highs guarda o modelo carregado e a sua base ótima. Quando o
+    mesmo LPModel é resolvido de novo depois de ter custos, limites ou lado
+    direito alterados no lugar, ou linhas <= acrescentadas, só as mudanças
+    são enviadas ao HiGHS e o solve parte da base anterior (simplex dual
+    quando só o lado direito mudou ou linhas foram acrescentadas). Um novo
+    LPModel, ou outra A_eq, recarrega o modelo; coeficientes de linhas
+    existentes alterados no lugar não são detectados (chamar load()).
+    """
+    name = "highs"
+
+    def __init__(self, **options):
+        import highspy
+
+        self._highspy = highspy
+        self.highs = highspy.Highs()
+        self.highs.setOptionValue("output_flag", False)
+        # Devex no simplex dual: os pesos de steepest edge seriam recalculados do zero no primeiro
+        # re-solve após um solve com presolve (segundos em redes de 10k barras); com Devex o re-solve
+        # a quente custa uma fração do primeiro solve.
+        self.highs.setOptionValue("simplex_dual_edge_weight_strategy", 1)
+        for option, value in options.items():
+            self.highs.setOptionValue(option, value)
+        self.model: Optional[LPModel] = None
+        self._loaded: Optional[dict] = None    # Cópia dos custos/limites enviados ao HiGHS
+
+    def load(self, model: LPModel) -> None:
+        """Passa o modelo ao HiGHS: linhas [A_eq; A_ub] com limites [b_eq, b_eq] e [-inf, b_ub]."""
+        from scipy import sparse
+
+        hs = self._highspy
+        data = _model_data(model)
+        A = sparse.vstack([model.A_eq, model.A_ub], format="csc")
+        lp = hs.HighsLp()
+        lp.num_col_, lp.num_row_ = model.n_cols, A.shape[0]
+        lp.col_cost_ = data["c"]
+        lp.col_lower_, lp.col_upper_ = data["lower"], data["upper"]
+        lp.row_lower_, lp.row_upper_ = data["row_lower"], data["row_upper"]
+        lp.a_matrix_.format_ = hs.MatrixFormat.kColwise
+        lp.a_matrix_.start_, lp.a_matrix_.index_, lp.a_matrix_.value_ = A.indptr, A.indices, A.data
+        self.highs.passModel(lp)
+        self.model, self._loaded = model, data
+
+    def _sync(self, model: LPModel) -> None:
+        """
+        Envia ao HiGHS os custos, limites e lado direito de `model` que mudaram
+        desde o último solve e as linhas <= acrescentadas (LPModel.add_ub_rows).
+        """
+        data, old = _model_data(model), self._loaded
+        appended = _appended_ub_rows(model, old["shape"])
+        if appended is None:
+            self.load(model)
+            return
+        highs = self.highs
+        eq_shape, n_ub = old["shape"][0], old["shape"][2][0]
+        if appended:
+            new = model.A_ub[n_ub:]
+            highs.addRows(new.shape[0], np.full(new.shape[0], -np.inf), model.b_ub[n_ub:], new.nnz,
+                          new.indptr[:-1].astype(np.int32), new.indices.astype(np.int32), new.data)
+            n_old = eq_shape[0] + n_ub
+            old = dict(old, row_lower=np.concatenate([old["row_lower"], data["row_lower"][n_old:]]),
+                       row_upper=np.concatenate([old["row_upper"], data["row_upper"][n_old:]]))
+        cost = np.flatnonzero(data["c"] != old["c"]).astype(np.int32)
+        if len(cost):
+            highs.changeColsCost(len(cost), cost, data["c"][cost])
+        cols = np.flatnonzero((data["lower"] != old["lower"]) | (data["upper"] != old["upper"])).astype(np.int32)
+        if len(cols):
+            highs.changeColsBounds(len(cols), cols, data["lower"][cols], data["upper"][cols])
+        rows = np.flatnonzero((data["row_lower"] != old["row_lower"]) | (data["row_upper"] != old["row_upper"])).astype(np.int32)
+        if len(rows):
+            highs.changeRowsBounds(len(rows), rows, data["row_lower"][rows], data["row_upper"][rows])
+        self._loaded = data
+
+    def basis(self):
+        """Status (colunas, linhas) da base atual como arrays de int (códigos HighsBasisStatus), ou None."""
+        basis = self.highs.getBasis()
+        if not basis.valid:
+            return None
+        return (np.array([int(s) for s in basis.col_status], dtype=np.int8),
+                np.array([int(s) for s in basis.row_status], dtype=np.int8))
+
+    def set_basis(self, col_status: np.ndarray, row_status: np.ndarray) -> bool:
+        """
+        Faz o próximo solve do modelo carregado partir dos status dados (ex.: a
+        base de um modelo parecido, deslocada). Uma base com o número errado de
+        variáveis básicas é passada como "alien" e reparada pelo HiGHS.
+        Retorna False se o HiGHS a rejeitar (a base anterior é mantida).
+        """
+        hs = self._highspy
+        if self.model is None:
+            return False
+        status = {int(s): s for s in hs.HighsBasisStatus.__members__.values()}
+        basis = hs.HighsBasis()
+        basis.col_status = [status[int(s)] for s in col_status]
+        basis.row_status = [status[int(s)] for s in row_status]
+        basic = int(hs.HighsBasisStatus.kBasic)
+        basis.alien = int(np.sum(col_status == basic) + np.sum(row_status == basic)) != len(row_status)
+        basis.valid = True
+        return self.highs.setBasis(basis) == hs.HighsStatus.kOk
+
+    def solve(self, model: LPModel) -> LPSolution:
+        if model is self.model:
+            self._sync(model)
+        else:
+            self.load(model)
+        hs, highs = self._highspy, self.highs
+        highs.run()
+        status = highs.getModelStatus()
+        info = highs.getInfo()
+        if status != hs.HighsModelStatus.kOptimal:
+            code = {hs.HighsModelStatus.kInfeasible: pl.LpStatusInfeasible,
+                    hs.HighsModelStatus.kUnbounded: pl.LpStatusUnbounded}.get(status, pl.LpStatusUndefined)
+            return LPSolution(status=code, message=highs.modelStatusToString(status))
+        sol = highs.getSolution()
+        row_dual = np.asarray(sol.row_dual)
+        lower_dual, upper_dual = _split_col_dual(sol.col_dual, model.lower, model.upper)
+        n_eq = len(model.b_eq)
+        return LPSolution(status=pl.LpStatusOptimal, objective=info.objective_function_value,
+                          x=np.asarray(sol.col_value), eq_dual=row_dual[:n_eq], ub_dual=row_dual[n_eq:],
+                          lower_dual=lower_dual, upper_dual=upper_dual, message="Optimal",
+                          iterations=info.simplex_iteration_count)
+
+
+# Status do scipy.optimize.linprog -> status do PuLP
+_LINPROG_STATUS = {0: pl.LpStatusOptimal, 2: pl.LpStatusInfeasible, 3: pl.LpStatusUnbounded}
+
+
+class LinprogBackend(SolverBackend):
+    """scipy.optimize.linprog com os solvers do HiGHS; sem estado, as matrizes são passadas em memória."""
+    name = "linprog"
+
+    def __init__(self, method: str = "highs", **options):
+        self.method = method
+        self.options = options
+
+    def solve(self, model: LPModel) -> LPSolution:
+        from scipy.optimize import linprog
+
+        has_eq, has_ub = model.A_eq.shape[0] > 0, model.A_ub.shape[0] > 0
+        res = linprog(model.c,
+                      A_ub=model.A_ub if has_ub else None, b_ub=model.b_ub if has_ub else None,
+                      A_eq=model.A_eq if has_eq else None, b_eq=model.b_eq if has_eq else None,
+                      bounds=np.column_stack([model.lower, model.upper]), method=self.method,
+                      options=self.options or None)
+        status = _LINPROG_STATUS.get(res.status, pl.LpStatusUndefined)
+        if status != pl.LpStatusOptimal:
+            return LPSolution(status=status, message=res.message)
+        lower_dual, upper_dual = _split_col_dual(res.lower.marginals + res.upper.marginals, model.lower, model.upper)
+        return LPSolution(status=status, objective=float(res.fun), x=res.x,
+                          eq_dual=res.eqlin.marginals if has_eq else np.zeros(0),
+                          ub_dual=res.ineqlin.marginals if has_ub else np.zeros(0),
+                          lower_dual=lower_dual, upper_dual=upper_dual, message=res.message,
+                          iterations=res.nit)
+
+
+class PulpBackend(SolverBackend):
+    """
+    Monta um pl.LpProblem a partir das matrizes e o resolve com um solver do
+    PuLP (padrão CBC). Os duais dos limites vêm dos custos reduzidos (var.dj).
+
+    Como no HighsBackend, o LpProblem do último LPModel é mantido: quando o
+    mesmo LPModel é resolvido de novo (ex.: as iterações de perdas do
+    solve_loss, que só mudam o lado direito do balanço) só os custos, limites
+    e lados direitos alterados são atualizados no LpProblem e as linhas <=
+    acrescentadas viram novas restrições, sem remontar as expressões. O CBC
+    em si roda do zero a cada solve (o PuLP o chama por arquivo); para
+    re-solves a quente use o backend "highs".
+    """
+    name = "cbc"
+
+    def __init__(self, solver=None):
+        self.solver = solver
+        self.model: Optional[LPModel] = None
+        self.problem: Optional[pl.LpProblem] = None
+        self._x = []        # Variáveis do LpProblem, na ordem das colunas
+        self._rows = []     # Restrições do LpProblem, na ordem das linhas [A_eq; A_ub]
+        self._loaded: Optional[dict] = None
+
+    @staticmethod
+    def _bound(value):
+        return None if np.isinf(value) else float(value)
+
+    def _add_rows(self, A, b, sense) -> None:
+        x = self._x
+        for i in range(A.shape[0]):
+            lo, hi = A.indptr[i], A.indptr[i + 1]
+            expr = pl.LpAffineExpression([(x[j], float(v)) for j, v in zip(A.indices[lo:hi], A.data[lo:hi])])
+            constraint = pl.LpConstraint(expr, sense, name=f"r{len(self._rows)}", rhs=float(b[i]))
+            self.problem += constraint
+            self._rows.append(constraint)
+
+    def load(self, model: LPModel) -> None:
+        """Monta o LpProblem de `model` do zero."""
+        bound = self._bound
+        self.problem = pl.LpProblem(model.name, pl.LpMinimize)
+        self._x = [pl.LpVariable(f"x{j}", bound(lo), bound(up)) for j, (lo, up) in enumerate(zip(model.lower, model.upper))]
+        self._rows = []
+        nz = np.flatnonzero(model.c)
+        self.problem += pl.LpAffineExpression([(self._x[j], float(model.c[j])) for j in nz])
+        self._add_rows(model.A_eq, model.b_eq, pl.LpConstraintEQ)
+        self._add_rows(model.A_ub, model.b_ub, pl.LpConstraintLE)
+        self.model, self._loaded = model, _model_data(model)
+
+    def _sync(self, model: LPModel) -> None:
+        """Atualiza no LpProblem os custos, limites e lados direitos de `model` que mudaram e acrescenta as linhas <= novas."""
+        data, old = _model_data(model), self._loaded
+        appended = _appended_ub_rows(model, old["shape"])
+        if appended is None:
+            self.load(model)
+            return
+        n_old = len(self._rows)
+        if appended:
+            self._add_rows(model.A_ub[-appended:], model.b_ub[-appended:], pl.LpConstraintLE)
+        objective, x, bound = self.problem.objective, self._x, self._bound
+        for j in np.flatnonzero(data["c"] != old["c"]).tolist():
+            if data["c"][j]:
+                objective[x[j]] = float(data["c"][j])
+            else:
+                objective.pop(x[j], None)
+        for j in np.flatnonzero((data["lower"] != old["lower"]) | (data["upper"] != old["upper"])).tolist():
+            x[j].lowBound, x[j].upBound = bound(data["lower"][j]), bound(data["upper"][j])
+        rows = np.flatnonzero(data["row_upper"][:n_old] != old["row_upper"]).tolist()
+        for i in rows:
+            self._rows[i].constant = -float(data["row_upper"][i])
+        self._loaded = data
+
+    def solve(self, model: LPModel) -> LPSolution:
+        if model is self.model:
+            self._sync(model)
+        else:
+            self.load(model)
+        problem, x = self.problem, self._x
+        problem.solve(self.solver or pl.PULP_CBC_CMD(msg=False))
+        if problem.status != pl.LpStatusOptimal:
+            return LPSolution(status=problem.status, message=pl.LpStatus[problem.status])
+        n_eq = model.A_eq.shape[0]
+        pi = np.array([c.pi for c in self._rows], dtype=float)
+        lower_dual, upper_dual = _split_col_dual(np.array([v.dj for v in x], dtype=float), model.lower, model.upper)
+        return LPSolution(status=pl.LpStatusOptimal, objective=pl.value(problem.objective) or 0.0,
+                          x=np.array([v.value() for v in x], dtype=float), eq_dual=pi[:n_eq], ub_dual=pi[n_eq:],
+                          lower_dual=lower_dual, upper_dual=upper_dual, message="Optimal")
+
+
+BACKENDS: Dict[str, Type[SolverBackend]] = {"highs": HighsBackend, "linprog": LinprogBackend, "cbc": PulpBackend}
+
+
+def default_backend() -> str:
+    """'highs' quando o highspy está instalado, senão 'linprog'."""
+    try:
+        import highspy  # noqa: F401
+    except ImportError:
+        return "linprog"
+    return "highs"
+
+
+def get_backend(backend: Union[str, SolverBackend, None] = None) -> SolverBackend:
+    """Instância de backend a partir de um nome de BACKENDS, de uma instância (devolvida como está) ou de None (default_backend())."""
+    if isinstance(backend, SolverBackend):
+        return backend
+    name = default_backend() if backend is None else backend
+    if name not in BACKENDS:
+        raise ValueError(f"Backend de solver desconhecido '{name}'. Opções: {sorted(BACKENDS)}.")
+    return BACKENDS[name]()
@@ -0,0 +1,284 @@
+"""
+Montagem matricial do despacho DC linear (LinearDispatch) a partir dos
+arrays compilados da rede (NetworkArrays) e da matriz de incidência.
+
+Colunas: theta (barras), flow (linhas), p (geradores térmicos e eólicos),
+shed (cargas) e, com armazenamento, p_out / p_in (baterias).
+Linhas:  flow_def  flow - (theta_from - theta_to) / x == 0
+         balance   p + shed + p_out - p_in - C·flow == carga + perdas da barra
+         soc_upper p_in <= capacity - soc        soc_lower p_out <= soc
+
+Com o modelo de perdas linearizado por partes (loss_segments), cada linha
+ganha uma coluna loss >= g·Δθ², representada por cortes tangentes
+(loss_cut); metade da perda de cada linha entra no balanço de cada barra
+terminal no lugar das perdas fixas do lado direito.
+
+LazyLimitProblem resolve o mesmo modelo gerando os limites de fluxo sob
+demanda: os limites só entram nas colunas flow das linhas que os violam.
+"""
+from __future__ import annotations
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Sequence
+from power.electricity_models.network_models.network_arrays import NetworkArrays, GenKind, BUS_TYPE_CODE
+from optimal_power_flow.linear_opf.lp_model import LPModel, MatrixProblem
+
+OBJECTIVES = ("cost", "min_loss", "transmission")
+
+
+def incidence(arrays: NetworkArrays):
+    """Bus x line incidence matrix (CSR): +1 at the 'from' bus, -1 at the 'to' bus."""
+    from scipy.sparse import csr_matrix
+
+    n_line = arrays.n_line
+    cols = np.arange(n_line)
+    return csr_matrix((np.concatenate([np.ones(n_line), -np.ones(n_line)]),
+                       (np.concatenate([arrays.line_from, arrays.line_to]), np.concatenate([cols, cols]))),
+                      shape=(arrays.n_bus, n_line))
+
+
+@dataclass
+class StorageArrays:
+    """Battery data used by the dispatch, indexed like the battery positions of NetworkArrays.gen_*."""
+    gen_pos:           np.ndarray   # Posição da bateria nos arrays de geradores
+    soc_pu:            np.ndarray
+    capacity_pu:       np.ndarray
+    cost_charge_pu:    np.ndarray
+    cost_discharge_pu: np.ndarray
+    efficiency_charge:    np.ndarray   # Usadas só no despacho multiperíodo (balanço do SOC)
+    efficiency_discharge: np.ndarray
+
+    @classmethod
+    def from_network(cls, net, arrays: NetworkArrays) -> "StorageArrays":
+        gen_pos = np.flatnonzero(arrays.gen_kind == GenKind.BATTERY)
+        gen_idx, gens = net.gen_idx, net.generators
+        bats = [gens[gen_idx[int(i)]] for i in arrays.gen_id[gen_pos]]
+
+        def col(getter):
+            return np.fromiter((getter(b) for b in bats), dtype=float, count=len(bats))
+        return cls(gen_pos=gen_pos,
+                   # Energia em pu da base (soc_mwh / sb), como capacity_pu; Battery.soc_pu é a fração da capacidade
+                   soc_pu=col(lambda b: b.soc_mwh / b.sb_mva),
+                   capacity_pu=col(lambda b: b.capacity_pu),
+                   cost_charge_pu=col(lambda b: b.cost_charge_pu),
+                   cost_discharge_pu=col(lambda b: b.cost_discharge_pu),
+                   efficiency_charge=col(lambda b: b.efficiency_charge),
+                   efficiency_discharge=col(lambda b: b.efficiency_discharge))
+
+
+def dispatchable(arrays: NetworkArrays) -> np.ndarray:
+    """Positions in the generator arrays of the units with a p column (thermal and wind)."""
+    return np.flatnonzero(np.isin(arrays.gen_kind, (GenKind.THERMAL, GenKind.WIND)))
+
+
+def bus_load(arrays: NetworkArrays) -> np.ndarray:
+    """Total active load of each bus (pu)."""
+    return np.bincount(arrays.load_bus, weights=arrays.load_p_pu, minlength=arrays.n_bus)
+
+
+def load_incidence(arrays: NetworkArrays):
+    """Bus x load matrix (CSR): 1 at the bus of each load (bus loads of several load vectors at once)."""
+    from scipy.sparse import csr_matrix
+
+    return csr_matrix((np.ones(arrays.n_load), (arrays.load_bus, np.arange(arrays.n_load))),
+                      shape=(arrays.n_bus, arrays.n_load))
+
+
+def series_conductance(arrays: NetworkArrays) -> np.ndarray:
+    """Series conductance g = r / (r² + x²) of each line (0 when r = x = 0)."""
+    z2 = arrays.line_r_pu ** 2 + arrays.line_x_pu ** 2
+    return np.divide(arrays.line_r_pu, z2, out=np.zeros_like(z2), where=z2 > 0)
+
+
+def max_angle_difference(arrays: NetworkArrays) -> np.ndarray:
+    """
+    Largest |theta_from - theta_to| allowed by the flow limit of each line,
+    capped at pi/2 (also used for unlimited lines). Placeholder limits such
+    as 999999 MW would otherwise spread the loss cuts far beyond any angle
+    difference the model can reach.
+    """
+    return np.fmin(np.abs(arrays.line_x_pu) * arrays.line_flow_max_pu, np.pi / 2)
+
+
+def loss_cuts(arrays: NetworkArrays, model: LPModel, line_pos: np.ndarray, points: np.ndarray):
+    """
+    Tangent cuts of the loss g·Δθ² of the lines `line_pos` at Δθ = +-points
+    (one point per line): g·(+-2a·Δθ - a²) <= loss. Returns (A, b, line ids),
+    two rows per point.
+    """
+    from scipy.sparse import csr_matrix
+
+    line_pos, points = np.asarray(line_pos), np.asarray(points, dtype=float)
+    g = series_conductance(arrays)[line_pos]
+    n = len(line_pos)
+    theta, loss = model.columns["theta"].start, model.columns["loss"].start
+    slope = np.concatenate([2 * g * points, -2 * g * points])
+    cols = np.column_stack([theta + np.tile(arrays.line_from[line_pos], 2), theta + np.tile(arrays.line_to[line_pos], 2),
+                            loss + np.tile(line_pos, 2)])
+    vals = np.column_stack([slope, -slope, -np.ones(2 * n)])
+    A = csr_matrix((vals.ravel(), (np.repeat(np.arange(2 * n), 3), cols.ravel())), shape=(2 * n, model.n_cols))
+    return A, np.tile(g * points ** 2, 2), np.tile(arrays.line_id[line_pos], 2)
+
+
+def build_dispatch_model(arrays: NetworkArrays, objective: str = "cost", bus_loss: Optional[np.ndarray] = None,
+                         storage: Optional[StorageArrays] = None, flow_sign: Optional[Sequence[int]] = None,
+                         loss_segments: Optional[int] = None, name: str = "Linear_Economic_Dispatch") -> LPModel:
+    """
+    Builds the DC dispatch LP of LinearDispatch in matrix form.
+
+    Args:
+        arrays: compiled network (Network.compile() or Scenario.compile()).
+        objective: "cost" (thermal, shedding and battery costs), "min_loss"
+            (total generation) or "transmission" (flow_sign * flow_max * flow).
+        bus_loss: losses allocated to each bus (pu), added to the balance RHS.
+        storage: battery data; without it batteries are left out of the model.
+        flow_sign: flow direction of each line, required by "transmission".
+        loss_segments: if given, the losses are variables of the model: each
+            line gets a loss column bounded by loss_segments tangent cuts of
+            g·Δθ² per flow direction, evenly spaced up to the angle difference
+            of the flow limit (see max_angle_difference), and bus_loss is ignored.
+    """
+    from scipy import sparse
+
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}'. Options: {OBJECTIVES}.")
+    n_bus, n_line, n_load = arrays.n_bus, arrays.n_line, arrays.n_load
+    gen_pos = dispatchable(arrays)
+    n_gen = len(gen_pos)
+    n_bat = 0 if storage is None else len(storage.gen_pos)
+    n_loss = n_line if loss_segments is not None else 0
+
+    # --- Colunas ---
+    sizes = {"theta": n_bus, "flow": n_line, "p": n_gen, "shed": n_load, "p_out": n_bat, "p_in": n_bat, "loss": n_loss}
+    columns, start = {}, 0
+    for block, size in sizes.items():
+        columns[block] = slice(start, start + size)
+        start += size
+    n_col = start
+
+    lower, upper = np.empty(n_col), np.empty(n_col)
+    slack = arrays.bus_type == BUS_TYPE_CODE["SLACK"]
+    lower[columns["theta"]] = np.where(slack, 0.0, -np.pi)
+    upper[columns["theta"]] = np.where(slack, 0.0, np.pi)
+    flow_max = np.where(np.isnan(arrays.line_flow_max_pu), np.inf, arrays.line_flow_max_pu)
+    lower[columns["flow"]], upper[columns["flow"]] = -flow_max, flow_max
+    lower[columns["p"]], upper[columns["p"]] = arrays.gen_p_min_pu[gen_pos], arrays.gen_p_max_pu[gen_pos]
+    lower[columns["shed"]], upper[columns["shed"]] = 0.0, arrays.load_p_pu
+    if n_bat:
+        lower[columns["p_out"]], upper[columns["p_out"]] = 0.0, arrays.gen_p_max_pu[storage.gen_pos]
+        lower[columns["p_in"]], upper[columns["p_in"]] = 0.0, -arrays.gen_p_min_pu[storage.gen_pos]
+    lower[columns["loss"]], upper[columns["loss"]] = 0.0, np.inf
+
+    # --- Objetivo ---
+    c = np.zeros(n_col)
+    if objective == "cost":
+        thermal = arrays.gen_kind[gen_pos] == GenKind.THERMAL
+        c[columns["p"]] = np.where(thermal, arrays.gen_cost_b_pu[gen_pos], 0.0)
+        c[columns["shed"]] = arrays.load_cost_shed_pu
+        if n_bat:
+            c[columns["p_out"]] = storage.cost_discharge_pu
+            c[columns["p_in"]] = storage.cost_charge_pu
+    elif objective == "min_loss":
+        c[columns["p"]] = 1.0
+    else:
+        if flow_sign is None:
+            raise ValueError("The 'transmission' objective needs the flow sign of every line.")
+        c[columns["flow"]] = np.asarray(flow_sign) * np.where(np.isinf(flow_max), 0.0, flow_max)
+
+    # --- Restrições de igualdade: definição do fluxo e balanço nodal ---
+    C = incidence(arrays)
+    eye_line = sparse.identity(n_line, format="csr")
+    flow_def = sparse.hstack([-sparse.diags(1.0 / arrays.line_x_pu) @ C.T, eye_line,
+                              sparse.csr_matrix((n_line, n_gen + n_load + 2 * n_bat + n_loss))])
+    to_bus = lambda pos, n: sparse.csr_matrix((np.ones(n), (pos, np.arange(n))), shape=(n_bus, n))
+    bat_bus = arrays.gen_bus[storage.gen_pos] if n_bat else np.zeros(0, dtype=np.int64)
+    balance = sparse.hstack([sparse.csr_matrix((n_bus, n_bus)), -C,
+                             to_bus(arrays.gen_bus[gen_pos], n_gen), to_bus(arrays.load_bus, n_load),
+                             to_bus(bat_bus, n_bat), -to_bus(bat_bus, n_bat), -0.5 * abs(C)[:, :n_loss]])
+    A_eq = sparse.vstack([flow_def, balance], format="csr")
+    fixed_loss = 0.0 if bus_loss is None or n_loss else bus_loss
+    b_eq = np.concatenate([np.zeros(n_line), bus_load(arrays) + fixed_loss])
+    eq_rows = {"flow_def": slice(0, n_line), "balance": slice(n_line, n_line + n_bus)}
+
+    # --- Restrições de desigualdade: estado de carga das baterias ---
+    if n_bat:
+        eye_bat = sparse.identity(n_bat, format="csr")
+        pad = lambda block, m: sparse.hstack([sparse.csr_matrix((n_bat, columns[block].start)), m,
+                                              sparse.csr_matrix((n_bat, n_col - columns[block].stop))])
+        A_ub = sparse.vstack([pad("p_in", eye_bat), pad("p_out", eye_bat)], format="csr")
+        b_ub = np.concatenate([storage.capacity_pu - storage.soc_pu, storage.soc_pu])
+    else:
+        A_ub, b_ub = sparse.csr_matrix((0, n_col)), np.zeros(0)
+    ub_rows = {"soc_upper": slice(0, n_bat), "soc_lower": slice(n_bat, 2 * n_bat)}
+
+    bat_id = arrays.gen_id[storage.gen_pos] if n_bat else np.zeros(0, dtype=np.int64)
+    ids = {"theta": arrays.bus_id, "flow": arrays.line_id, "p": arrays.gen_id[gen_pos], "shed": arrays.load_id,
+           "p_out": bat_id, "p_in": bat_id, "loss": arrays.line_id[:n_loss], "flow_def": arrays.line_id,
+           "balance": arrays.bus_id, "soc_upper": bat_id, "soc_lower": bat_id}
+    model = LPModel(c=c, A_eq=A_eq, b_eq=b_eq, A_ub=A_ub, b_ub=b_ub, lower=lower, upper=upper,
+                    columns=columns, eq_rows=eq_rows, ub_rows=ub_rows, ids=ids, name=name)
+
+    # --- Perdas linearizadas: loss_segments cortes tangentes por sentido de fluxo ---
+    if n_loss:
+        lossy = np.flatnonzero(series_conductance(arrays) > 0)
+        k = np.arange(1, max(int(loss_segments), 0) + 1)
+        points = (max_angle_difference(arrays)[lossy, None] * k / max(len(k), 1)).ravel()
+        A, b, line_ids = loss_cuts(arrays, model, np.repeat(lossy, len(k)), points)
+        model.add_ub_rows("loss_cut", A, b, line_ids)
+    return model
+
+
+class LazyLimitProblem(MatrixProblem):
+    """
+    MatrixProblem over a dispatch model whose flow limits are generated
+    lazily. The flow columns start unbounded; solve() solves, checks every
+    flow against its limit, restores the bounds of the violated lines and
+    re-solves (warm with HighsBackend, only the bounds change) until no line
+    is overloaded. Activated limits stay in the model for later solves.
+
+    Args:
+        model: dispatch model from build_dispatch_model (its flow bounds are released).
+        names: constraint name function (see MatrixProblem).
+        near_limit: lines whose flow reaches near_limit * flow_max are activated
+            together with the violated ones (1.0: only the violated ones).
+        tol: flow violation tolerance (pu).
+    """
+
+    def __init__(self, model: LPModel, names=None, near_limit: float = 1.0, tol: float = 1e-6):
+        super().__init__(model, names=names)
+        cols = model.columns["flow"]
+        self.flow_max = model.upper[cols].copy()
+        model.lower[cols], model.upper[cols] = -np.inf, np.inf
+        self.active = np.zeros(len(self.flow_max), dtype=bool)   # Linhas com o limite no modelo
+        self.rounds = 0                                           # Solves feitos até não haver violações
+        self.near_limit, self.tol = near_limit, tol
+
+    def activate(self, line_pos) -> None:
+        """Imposes the flow limits of the lines at positions line_pos."""
+        cols = self.model.columns["flow"]
+        self.active[line_pos] = True
+        self.model.lower[cols][line_pos] = -self.flow_max[line_pos]
+        self.model.upper[cols][line_pos] = self.flow_max[line_pos]
+
+    def violated_lines(self) -> np.ndarray:
+        """Inactive lines whose flow exceeds the limit (and, if any, those above near_limit)."""
+        flow = np.abs(self.solution.x[self.model.columns["flow"]])
+        free = ~self.active & np.isfinite(self.flow_max)
+        if not np.any(free & (flow > self.flow_max + self.tol)):
+            return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero(free & (flow >= self.near_limit * self.flow_max))
+
+    def solve(self, backend) -> int:
+        iterations = 0
+        while True:
+            self.solution = backend.solve(self.model)
+            iterations += self.solution.iterations
+            self.rounds += 1
+            if not self.solution.optimal:
+                break
+            new = self.violated_lines()
+            if len(new) == 0:
+                break
+            self.activate(new)
+        self.solution.iterations = iterations
+        return self.solution.status
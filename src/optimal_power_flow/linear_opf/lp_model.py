@@ -0,0 +1,173 @@
+"""
+Modelo de programação linear em forma matricial e a visão no estilo PuLP
+usada pelo código que lê a solução pelo nome das variáveis/restrições.
+
+    min c·x   s.a.   A_eq x == b_eq,   A_ub x <= b_ub,   lower <= x <= upper
+
+As colunas e as linhas são organizadas em blocos nomeados (ex.: "theta",
+"flow", "balance"); cada bloco guarda a fatia que ocupa e os ids dos
+elementos da rede a que corresponde.
+"""
+from __future__ import annotations
+import numpy as np
+import pulp as pl
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class LPModel:
+    """
+    Sparse linear program (A, b, c, bounds). A_eq / A_ub are scipy CSR
+    matrices; unbounded bounds are +-inf. `columns`, `eq_rows` and `ub_rows`
+    map block names to slices and `ids` maps the same names to the element
+    ids of each position of the block.
+    """
+    c:       np.ndarray
+    A_eq:    "scipy.sparse.csr_matrix"
+    b_eq:    np.ndarray
+    A_ub:    "scipy.sparse.csr_matrix"
+    b_ub:    np.ndarray
+    lower:   np.ndarray
+    upper:   np.ndarray
+    columns: Dict[str, slice]      = field(default_factory=dict)
+    eq_rows: Dict[str, slice]      = field(default_factory=dict)
+    ub_rows: Dict[str, slice]      = field(default_factory=dict)
+    ids:     Dict[str, np.ndarray] = field(default_factory=dict)
+    name:    str = "LP"
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.c)
+
+    @property
+    def n_rows(self) -> int:
+        return self.A_eq.shape[0] + self.A_ub.shape[0]
+
+    def add_ub_rows(self, block: str, A, b: np.ndarray, ids: np.ndarray) -> slice:
+        """
+        Appends rows A x <= b to the block `block` of ub_rows, creating it if
+        needed. Rows are only appended at the end, so the block must be the
+        last one. Returns the slice of the new rows.
+        """
+        from scipy import sparse
+
+        start = self.A_ub.shape[0]
+        rows = self.ub_rows.get(block, slice(start, start))
+        if rows.stop != start:
+            raise ValueError(f"Rows can only be appended to the last block of ub_rows, not to '{block}'.")
+        self.A_ub = sparse.vstack([self.A_ub, sparse.csr_matrix(A)], format="csr")
+        self.b_ub = np.concatenate([self.b_ub, b])
+        self.ub_rows[block] = slice(rows.start, self.A_ub.shape[0])
+        self.ids[block] = np.concatenate([self.ids.get(block, np.zeros(0, dtype=np.int64)), ids])
+        return slice(start, self.A_ub.shape[0])
+
+    def __repr__(self):
+        return (f"LPModel(name={self.name}, cols={self.n_cols}, eq_rows={self.A_eq.shape[0]}, "
+                f"ub_rows={self.A_ub.shape[0]}, nnz={self.A_eq.nnz + self.A_ub.nnz})")
+
+
+@dataclass
+class LPSolution:
+    """
+    Primal and dual arrays of a solved LPModel. Duals are sensitivities of
+    the objective to the right-hand side / bound (the sign convention of
+    PuLP's `pi`): >= 0 for lower bounds, <= 0 for upper bounds and <= rows.
+    """
+    status:     int                        # Códigos de status do PuLP (pl.LpStatusOptimal, ...)
+    objective:  Optional[float]   = None
+    x:          Optional[np.ndarray] = None
+    eq_dual:    Optional[np.ndarray] = None
+    ub_dual:    Optional[np.ndarray] = None
+    lower_dual: Optional[np.ndarray] = None
+    upper_dual: Optional[np.ndarray] = None
+    message:    str = ""
+    iterations: int = 0                    # Iterações do simplex/pontos interiores
+
+    @property
+    def optimal(self) -> bool:
+        return self.status == pl.LpStatusOptimal
+
+
+# ----------------------------------------------------------------VISÃO ESTILO PULP----------------------------------------------------------------#
+class ModelVariable:
+    """Column of a matrix problem read like a pulp LpVariable: value() reads the last solution."""
+    __slots__ = ("problem", "col", "name")
+
+    def __init__(self, problem: "MatrixProblem", col: int, name: str):
+        self.problem, self.col, self.name = problem, col, name
+
+    def value(self) -> Optional[float]:
+        sol = self.problem.solution
+        return None if sol is None or sol.x is None else float(sol.x[self.col])
+
+    def __repr__(self):
+        return self.name
+
+
+class ModelConstraint:
+    """Row or bound of a matrix problem read like a pulp LpConstraint: pi is its dual."""
+    __slots__ = ("problem", "kind", "index", "sign")
+
+    def __init__(self, problem: "MatrixProblem", kind: str, index: int, sign: float = 1.0):
+        self.problem, self.kind, self.index, self.sign = problem, kind, index, sign
+
+    @property
+    def pi(self) -> Optional[float]:
+        sol = self.problem.solution
+        duals = None if sol is None else getattr(sol, f"{self.kind}_dual")
+        return None if duals is None else self.sign * float(duals[self.index])
+
+
+class _Objective:
+    __slots__ = ("problem",)
+
+    def __init__(self, problem: "MatrixProblem"):
+        self.problem = problem
+
+    def value(self) -> Optional[float]:
+        sol = self.problem.solution
+        return None if sol is None else sol.objective
+
+
+class MatrixProblem:
+    """
+    An LPModel with its last solution, exposed like a pulp LpProblem
+    (status, objective.value(), constraints[name].pi) for the code that reads
+    results by name. The name -> row map is only built on the first access
+    to `constraints`.
+    """
+
+    def __init__(self, model: LPModel, names=None):
+        self.model = model
+        self.name = model.name
+        self.solution: Optional[LPSolution] = None
+        self.objective = _Objective(self)
+        self._names = names          # Função que devolve {nome: (tipo, índice, sinal)}
+        self._constraints = None
+
+    @property
+    def status(self) -> int:
+        return pl.LpStatusNotSolved if self.solution is None else self.solution.status
+
+    @property
+    def constraints(self) -> Dict[str, ModelConstraint]:
+        if self._constraints is None:
+            names = self._names() if self._names is not None else {}
+            self._constraints = {name: ModelConstraint(self, kind, index, sign)
+                                 for name, (kind, index, sign) in names.items()}
+        return self._constraints
+
+    def variables(self, block: str, prefix: str) -> Dict[int, ModelVariable]:
+        """{element id: ModelVariable} of the columns of a block, named prefix + id."""
+        cols = self.model.columns[block]
+        return {int(i): ModelVariable(self, col, f"{prefix}{i}")
+                for i, col in zip(self.model.ids[block].tolist(), range(cols.start, cols.stop))}
+
+    def solve(self, backend) -> int:
+        """Solves the model with a backend (see backends.py) and keeps the solution."""
+        self.solution = backend.solve(self.model)
+        return self.solution.status
+
+    def __repr__(self):
+        return f"MatrixProblem({self.model!r}, status={pl.LpStatus[self.status]})"
@@ -0,0 +1,539 @@
+"""
+Despacho DC multiperíodo em um único LP.
+
+Os T períodos de um TemporalStructure compartilham a rede: as colunas e as
+linhas do despacho de um período (build_dispatch_model) são replicadas em
+blocos diagonais e ligadas por
+
+    soc_balance  soc_t - soc_{t-1} - ηc·Δt·p_in_t + Δt/ηd·p_out_t == 0   (soc_{-1}: SOC inicial)
+    ramp_up      p_t - p_{t-1} <= rampa de subida · Δt      (térmicas)
+    ramp_down    p_{t-1} - p_t <= rampa de descida · Δt
+
+com 0 <= soc_t <= capacidade (energia em pu·h). As colunas ficam agrupadas
+por bloco: "p" guarda os T períodos em sequência (p[t, g] na posição
+t·n_gen + g), de modo que cada bloco do LPModel continua sendo uma fatia e
+os nomes dos blocos são os do modelo de um período. As cargas e a
+disponibilidade eólica de cada período vêm de TimeSeries e os custos são
+ponderados pela duração dos períodos (Δt em horas).
+
+RollingHorizonDispatch resolve horizontes longos em janelas de H períodos
+sobre um único LPModel de H períodos: a cada janela só o lado direito e os
+limites mudam, e com backend="highs" cada janela parte da base da anterior
+deslocada (o padrão é o DEFAULT_BACKEND, "cbc", que resolve cada janela do zero).
+"""
+from __future__ import annotations
+import numpy as np
+import pulp as pl
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Union
+from data_models.temporal_structure import TemporalStructure
+from data_models.time_series import TimeSeries
+from power.electricity_models.network_models.network_arrays import NetworkArrays, GenKind
+from optimal_power_flow.linear_opf.lp_model import LPModel, MatrixProblem
+from optimal_power_flow.linear_opf.backends import SolverBackend, HighsBackend, get_backend, DEFAULT_BACKEND
+from optimal_power_flow.linear_opf.dispatch_model import (build_dispatch_model, dispatchable, incidence,
+                                                          load_incidence, series_conductance, StorageArrays)
+from optimal_power_flow.linear_opf.opf_loss import OptimizationError, ConvergenceError
+
+
+@dataclass
+class RampArrays:
+    """Ramp limits (pu/h) of the thermal units, indexed like the thermal positions of NetworkArrays.gen_*."""
+    gen_pos: np.ndarray   # Posição da térmica nos arrays de geradores
+    up_pu:   np.ndarray
+    down_pu: np.ndarray   # Valor absoluto (max_ramp_down_mw é negativo)
+
+    @classmethod
+    def from_network(cls, net, arrays: NetworkArrays) -> "RampArrays":
+        gen_pos = np.flatnonzero(arrays.gen_kind == GenKind.THERMAL)
+        gen_idx, gens = net.gen_idx, net.generators
+        thermal = [gens[gen_idx[int(i)]] for i in arrays.gen_id[gen_pos]]
+
+        def col(getter):
+            return np.fromiter((getter(g) for g in thermal), dtype=float, count=len(thermal))
+        return cls(gen_pos=gen_pos,
+                   up_pu=np.abs(col(lambda g: g.max_ramp_up_pu)),
+                   down_pu=np.abs(col(lambda g: g.max_ramp_down_pu)))
+
+
+def stacked_index(sizes: Dict[str, int], n_periods: int):
+    """
+    Positions, in the stacked (block-major) layout, of every column/row of
+    n_periods copies of a model (periods or scenarios): index[t, k] for
+    position k of copy t of the layout with blocks `sizes`. Also returns the
+    slices of the stacked blocks.
+    """
+    size = np.array(list(sizes.values()), dtype=np.int64)
+    start = np.concatenate([[0], np.cumsum(size)[:-1]])
+    block = np.repeat(np.arange(len(size)), size)
+    k = np.arange(size.sum())
+    t = np.arange(n_periods)[:, None]
+    index = n_periods * start[block] + t * size[block] + (k - start[block])
+    slices = {name: slice(n_periods * s, n_periods * (s + z)) for name, s, z in zip(sizes, start, size)}
+    return index, slices
+
+
+def block_diagonal(A, row_index: np.ndarray, col_index: np.ndarray, shape):
+    """Block-diagonal copy of A (one block per period/scenario) in the stacked layout."""
+    from scipy import sparse
+
+    A = A.tocoo()
+    T = row_index.shape[0]
+    t = np.repeat(np.arange(T), A.nnz)
+    rows, cols = row_index[t, np.tile(A.row, T)], col_index[t, np.tile(A.col, T)]
+    return sparse.csr_matrix((np.tile(A.data, T), (rows, cols)), shape=shape)
+
+
+def initial_ramp_rhs(arrays: NetworkArrays, ramps: RampArrays, gen_ids: np.ndarray, block: str,
+                     p_initial_pu: np.ndarray, duration_h: float) -> np.ndarray:
+    """
+    RHS of the first-period rows of a ramp block (units gen_ids) for the
+    generation p_initial_pu before the horizon (ramps order; NaN: free):
+    p_0 <= p_initial + up·Δt and -p_0 <= down·Δt - p_initial.
+    """
+    pos = {int(i): k for k, i in enumerate(arrays.gen_id[ramps.gen_pos].tolist())}
+    k = np.array([pos[int(i)] for i in gen_ids], dtype=np.int64)
+    p0 = np.asarray(p_initial_pu, dtype=float)[k]
+    if block == "ramp_up":
+        return np.where(np.isnan(p0), arrays.gen_p_max_pu[ramps.gen_pos[k]], ramps.up_pu[k] * duration_h + p0)
+    return np.where(np.isnan(p0), -arrays.gen_p_min_pu[ramps.gen_pos[k]], ramps.down_pu[k] * duration_h - p0)
+
+
+def build_multi_period_model(arrays: NetworkArrays, load_pu: np.ndarray, p_max_pu: np.ndarray, duration_h: np.ndarray,
+                             storage: Optional[StorageArrays] = None, ramps: Optional[RampArrays] = None,
+                             bus_loss: Optional[np.ndarray] = None, final_soc_pu: Optional[np.ndarray] = None,
+                             p_initial_pu: Optional[np.ndarray] = None, name: str = "Multi_Period_Dispatch") -> LPModel:
+    """
+    Builds the multi-period DC dispatch LP in matrix form.
+
+    Args:
+        arrays: compiled network (the same in every period).
+        load_pu: load of each period (T x n_load, pu).
+        p_max_pu: maximum generation of each period (T x n_gen, pu): wind availability.
+        duration_h: duration of each period in hours (T).
+        storage: battery data; the state of charge links the periods.
+        ramps: ramp limits of the thermal units (pu/h).
+        bus_loss: losses allocated to each bus in each period (T x n_bus, pu).
+        final_soc_pu: minimum state of charge of each battery at the end of the horizon (pu·h).
+        p_initial_pu: generation of the thermal units (ramps order) before the first
+            period; the first period is ramp-limited from it (NaN: free). Without it
+            the first period has no ramp rows.
+    """
+    from scipy import sparse
+
+    T = len(duration_h)
+    duration_h = np.asarray(duration_h, dtype=float)
+    load_pu, p_max_pu = np.atleast_2d(load_pu), np.atleast_2d(p_max_pu)
+    if load_pu.shape != (T, arrays.n_load) or p_max_pu.shape != (T, arrays.n_gen):
+        raise ValueError(f"Expected load {(T, arrays.n_load)} and p_max {(T, arrays.n_gen)} arrays, "
+                         f"got {load_pu.shape} and {p_max_pu.shape}.")
+    base = build_dispatch_model(arrays, storage=storage, name=name)
+    n_bat = 0 if storage is None else len(storage.gen_pos)
+    gen_pos = dispatchable(arrays)
+
+    # --- Layout de um período (colunas do modelo de um período + soc) e índices no modelo empilhado ---
+    col_sizes = {block: s.stop - s.start for block, s in base.columns.items()}
+    col_sizes["soc"] = n_bat
+    col_index, columns = stacked_index(col_sizes, T)
+    row_sizes = {block: s.stop - s.start for block, s in base.eq_rows.items()}
+    row_index, eq_rows = stacked_index(row_sizes, T)
+    n_col, n_net = col_index.size, row_index.size
+
+    c, lower, upper = np.empty(n_col), np.empty(n_col), np.empty(n_col)
+    pad = np.zeros(n_bat)
+    c[col_index] = np.concatenate([base.c, pad])[None, :] * duration_h[:, None]
+    lower[col_index] = np.concatenate([base.lower, pad])
+    upper[col_index] = np.concatenate([base.upper, pad])
+    upper[columns["p"]] = p_max_pu[:, gen_pos].ravel()
+    upper[columns["shed"]] = load_pu.ravel()
+
+    # --- Rede: blocos diagonais do modelo de um período ---
+    A_net = block_diagonal(sparse.hstack([base.A_eq, sparse.csr_matrix((base.A_eq.shape[0], n_bat))]),
+                           row_index, col_index, (n_net, n_col))
+    demand = (load_incidence(arrays) @ load_pu.T).T + (0.0 if bus_loss is None else bus_loss)
+    b_net = np.zeros(n_net)
+    b_net[eq_rows["balance"]] = demand.ravel()
+
+    # --- Balanço do estado de carga das baterias ---
+    ids = {block: np.tile(ids, T) for block, ids in base.ids.items() if block in col_sizes or block in row_sizes}
+    if n_bat:
+        bat = np.arange(n_bat)
+        col = lambda block, t: columns[block].start + t[:, None] * n_bat + bat
+        t = np.arange(T)
+        rows = n_net + t[:, None] * n_bat + bat
+        dt = np.repeat(duration_h, n_bat).reshape(T, n_bat)
+        entries = [(rows, col("soc", t), np.ones((T, n_bat))),
+                   (rows, col("p_in", t), -storage.efficiency_charge * dt),
+                   (rows, col("p_out", t), dt / storage.efficiency_discharge),
+                   (rows[1:], col("soc", t[:-1]), -np.ones((T - 1, n_bat)))]
+        r, k, v = (np.concatenate([e[i].ravel() for e in entries]) for i in range(3))
+        A_soc = sparse.csr_matrix((v, (r - n_net, k)), shape=(T * n_bat, n_col))
+        b_soc = np.zeros(T * n_bat)
+        b_soc[:n_bat] = storage.soc_pu
+        lower[columns["soc"]] = 0.0
+        upper[columns["soc"]] = np.tile(storage.capacity_pu, T)
+        if final_soc_pu is not None:
+            last = columns["soc"].stop - n_bat
+            lower[last:columns["soc"].stop] = np.minimum(final_soc_pu, storage.capacity_pu)
+        ids["soc"] = ids["soc_balance"] = np.tile(arrays.gen_id[storage.gen_pos], T)
+    else:
+        A_soc, b_soc = sparse.csr_matrix((0, n_col)), np.zeros(0)
+        ids["soc"] = ids["soc_balance"] = np.zeros(0, dtype=np.int64)
+    A_eq = sparse.vstack([A_net, A_soc], format="csr")
+    b_eq = np.concatenate([b_net, b_soc])
+    eq_rows["soc_balance"] = slice(n_net, n_net + len(b_soc))
+
+    # --- Rampas das térmicas (só as que podem ser ativas: rampa·Δt < p_max - p_min) ---
+    A_ub, b_ub, ub_rows = sparse.csr_matrix((0, n_col)), np.zeros(0), {}
+    first = 0 if p_initial_pu is not None else 1    # Com p_initial_pu o primeiro período também tem rampa
+    if ramps is not None and T > first:
+        p_col = np.searchsorted(gen_pos, ramps.gen_pos)
+        span = arrays.gen_p_max_pu[ramps.gen_pos] - arrays.gen_p_min_pu[ramps.gen_pos]
+        t = np.arange(first, T)[:, None]
+        dt = duration_h[first:, None]
+        A_blocks, b_blocks, start = [], [], 0
+        for block, limit in (("ramp_up", ramps.up_pu), ("ramp_down", ramps.down_pu)):
+            g = np.flatnonzero(np.any(limit[None, :] * dt < span[None, :], axis=0))
+            sign = 1.0 if block == "ramp_up" else -1.0
+            now = columns["p"].start + t * len(gen_pos) + p_col[g]     # Coluna p_t de cada linha (períodos x g)
+            rows = np.arange(now.size).reshape(now.shape)
+            linked = t[:, 0] > 0                                       # Linhas com a coluna p_{t-1}
+            r = np.concatenate([rows.ravel(), rows[linked].ravel()])
+            k = np.concatenate([now.ravel(), (now[linked] - len(gen_pos)).ravel()])
+            v = np.concatenate([np.full(now.size, sign), np.full(rows[linked].size, -sign)])
+            A_blocks.append(sparse.csr_matrix((v, (r, k)), shape=(now.size, n_col)))
+            b = limit[g][None, :] * dt
+            gen_ids = arrays.gen_id[ramps.gen_pos[g]]
+            if first == 0:
+                b[0] = initial_ramp_rhs(arrays, ramps, gen_ids, block, p_initial_pu, duration_h[0])
+            b_blocks.append(b.ravel())
+            ub_rows[block] = slice(start, start + now.size)
+            ids[block] = np.tile(gen_ids, len(t))
+            start += now.size
+        A_ub = sparse.vstack(A_blocks, format="csr")
+        b_ub = np.concatenate(b_blocks)
+    return LPModel(c=c, A_eq=A_eq, b_eq=b_eq, A_ub=A_ub, b_ub=b_ub, lower=lower, upper=upper,
+                   columns=columns, eq_rows=eq_rows, ub_rows=ub_rows, ids=ids, name=name)
+
+
+class MultiPeriodDispatch:
+    """
+    Despacho econômico DC de todos os períodos de um TemporalStructure em um
+    único LP (ver build_multi_period_model): o estado de carga das baterias
+    (com as eficiências de carga/descarga) e as rampas das térmicas ligam os
+    períodos, substituindo os despachos horários independentes em que o SOC
+    era atualizado à mão.
+
+    Args:
+        net: rede (Network) ou cenário (Scenario).
+        temporal: períodos do despacho (num_stages e duração de cada estágio).
+        loads: {id da carga: TimeSeries} com a carga de cada estágio. Sem série, a
+            carga usa load.p_mw_series (MW), se houver, ou p_mw em todos os períodos.
+        wind: {id do gerador eólico: TimeSeries} com a disponibilidade de cada estágio;
+            sem série, p_max_mw em todos os períodos.
+        scenario: coluna (cenário) das TimeSeries usada.
+        final_soc: SOC mínimo das baterias no fim do horizonte: None (livre), "initial"
+            (o SOC inicial) ou um array em MWh na ordem de net.batteries.
+        backend: solver do LP (ver LinearDispatch); padrão DEFAULT_BACKEND ("cbc").
+            Com o "highs" o horizonte rolante parte da base da janela anterior.
+            Com perdas, o CBC pode alternar entre vértices ótimos de LPs
+            degenerados e a iteração não convergir (ex.: IEEE118 com bateria em
+            janelas de 24 h): use o "highs".
+
+    Os valores das TimeSeries estão em MW quando unit == "MW" e em pu do
+    sistema caso contrário.
+    """
+
+    def __init__(self, net, temporal: TemporalStructure, loads: Optional[Dict[int, TimeSeries]] = None,
+                 wind: Optional[Dict[int, TimeSeries]] = None, scenario: int = 0,
+                 final_soc: Union[None, str, np.ndarray] = None, backend: Union[str, SolverBackend, None] = None):
+        self.net = net
+        self.temporal = temporal
+        self.scenario = scenario
+        self.backend = get_backend(DEFAULT_BACKEND if backend is None else backend)
+        self.arrays = net.compile()
+        self.storage = StorageArrays.from_network(net, self.arrays)
+        self.ramps = RampArrays.from_network(net, self.arrays)
+        self.n_periods = temporal.num_stages
+        self.duration_h = np.array([temporal.get_stage_duration(t).total_seconds() / 3600.0
+                                    for t in range(self.n_periods)])
+        load_series, load_idx, net_loads = {}, net.load_idx, net.loads
+        for i in self.arrays.load_id.tolist():
+            ts = net_loads[load_idx[i]].p_mw_series
+            if ts is not None:
+                load_series[i] = TimeSeries(ts.data, ts.name, "MW")   # p_mw_series está em MW
+        load_series.update(loads or {})
+        self.load_pu = self._profile(load_series, self.arrays.load_id, self.arrays.load_p_pu, "Carga")
+        wind_pos = np.flatnonzero(self.arrays.gen_kind == GenKind.WIND)
+        self.p_max_pu = np.tile(self.arrays.gen_p_max_pu, (self.n_periods, 1))
+        self.p_max_pu[:, wind_pos] = self._profile(wind or {}, self.arrays.gen_id[wind_pos],
+                                                   self.arrays.gen_p_max_pu[wind_pos], "Gerador eólico")
+        if isinstance(final_soc, str):
+            if final_soc != "initial":
+                raise ValueError(f"final_soc desconhecido '{final_soc}'. Use None, 'initial' ou um array em MWh.")
+            self.final_soc_pu = self.storage.soc_pu
+        else:
+            self.final_soc_pu = None if final_soc is None else np.asarray(final_soc, dtype=float) / self.arrays.sb_mva
+        self.bus_loss = np.zeros((self.n_periods, self.arrays.n_bus))
+        self.line_loss = np.zeros((self.n_periods, self.arrays.n_line))
+        self.model = None
+        self.problem = None
+        self.solver_iterations = []
+
+    def _profile(self, series: Dict[int, TimeSeries], ids: np.ndarray, base_pu: np.ndarray, what: str) -> np.ndarray:
+        """Matriz períodos x elementos (pu): base_pu em todos os períodos, exceto nos elementos com série."""
+        T = self.n_periods
+        out = np.tile(base_pu, (T, 1))
+        pos = {int(i): k for k, i in enumerate(ids.tolist())}
+        for i, ts in series.items():
+            if int(i) not in pos:
+                raise ValueError(f"{what} {i} não faz parte da rede.")
+            if ts.num_stages < T:
+                raise ValueError(f"A série '{ts.name}' tem {ts.num_stages} estágios; o despacho tem {T}.")
+            if not 0 <= self.scenario < ts.num_scenarios:
+                raise ValueError(f"A série '{ts.name}' não tem o cenário {self.scenario}.")
+            values = ts.data[:T, self.scenario]
+            out[:, pos[int(i)]] = values / self.arrays.sb_mva if ts.unit.lower() == "mw" else values
+        return out
+
+    # ----------------------------------------------------------------MODEL------------------------------------------------------------------------------------------------#
+    def _build(self, load_pu: np.ndarray, p_max_pu: np.ndarray, duration_h: np.ndarray, bus_loss: np.ndarray,
+               soc_pu: Optional[np.ndarray] = None, p_initial_pu: Optional[np.ndarray] = None,
+               final_soc_pu: Optional[np.ndarray] = None):
+        """Monta o LP dos períodos dados (todos, ou uma janela) em self.model / self.problem."""
+        storage = self.storage if soc_pu is None else replace(self.storage, soc_pu=soc_pu)
+        self.model = build_multi_period_model(self.arrays, load_pu, p_max_pu, duration_h, storage=storage,
+                                              ramps=self.ramps, bus_loss=bus_loss, final_soc_pu=final_soc_pu,
+                                              p_initial_pu=p_initial_pu)
+        self.problem = MatrixProblem(self.model)
+
+    def _demand(self, load_pu: np.ndarray, bus_loss: np.ndarray) -> np.ndarray:
+        """Carga + perdas de cada barra em cada período (períodos x n_bus, pu)."""
+        return (load_incidence(self.arrays) @ load_pu.T).T + bus_loss
+
+    def _losses(self):
+        """Perdas g·Δθ² de cada linha em cada período pelos ângulos da solução e metade delas em cada barra terminal."""
+        arrays = self.arrays
+        theta = self.problem.solution.x[self.model.columns["theta"]].reshape(-1, arrays.n_bus)
+        line_loss = series_conductance(arrays) * (theta[:, arrays.line_from] - theta[:, arrays.line_to]) ** 2
+        return line_loss, 0.5 * (abs(incidence(arrays)) @ line_loss.T).T
+
+    def _iterate(self, load_pu: np.ndarray, bus_loss: np.ndarray, losses: bool, iter_max: int, max_tol: float):
+        """
+        Resolve o modelo atual. Com losses, as perdas dos ângulos entram como
+        carga no balanço e o modelo é re-resolvido (a quente, só o lado
+        direito muda) até a variação das perdas totais ficar abaixo de
+        max_tol. Retorna as perdas (barras, linhas) da última solução.
+        """
+        line_loss = np.zeros((len(load_pu), self.arrays.n_line))
+        prev_total_loss = float(bus_loss.sum())
+        for i in range(1, (iter_max if losses else 1) + 1):
+            self.problem.solve(self.backend)
+            self.solver_iterations.append(self.problem.solution.iterations)
+            if self.problem.status != pl.LpStatusOptimal:
+                raise OptimizationError(
+                    f"Solução ótima não encontrada no despacho multiperíodo (iteração {i}). "
+                    f"Status: {pl.LpStatus[self.problem.status]}"
+                )
+            if not losses:
+                return bus_loss, line_loss
+            line_loss, bus_loss = self._losses()
+            current_total_loss = float(line_loss.sum())
+            if abs(current_total_loss - prev_total_loss) <= max_tol:
+                return bus_loss, line_loss
+            prev_total_loss = current_total_loss
+            self.model.b_eq[self.model.eq_rows["balance"]] = self._demand(load_pu, bus_loss).ravel()
+        raise ConvergenceError(f"Convergência não atingida após {iter_max} iterações.")
+
+    # ----------------------------------------------------------------SOLVING----------------------------------------------------------------------------------------------#
+    def solve(self, losses: bool = False, iter_max: int = 100, max_tol: float = 1e-6, verbose: bool = False) -> dict:
+        """
+        Resolve o despacho de todos os períodos. Com losses, as perdas de cada
+        período entram como carga no balanço e são recalculadas pelos ângulos
+        até a variação das perdas totais ficar abaixo de max_tol (só o lado
+        direito muda: re-solve a quente, como no solve_loss do LinearDispatch).
+        """
+        self.solver_iterations = []
+        self._build(self.load_pu, self.p_max_pu, self.duration_h, self.bus_loss, final_soc_pu=self.final_soc_pu)
+        self.bus_loss, self.line_loss = self._iterate(self.load_pu, self.bus_loss, losses, iter_max, max_tol)
+        results = self._frames(self._values(self.p_max_pu, self.duration_h, self.line_loss))
+        if verbose:
+            self._print(results)
+        return results
+
+    def _print(self, results: dict):
+        print("FOB: {:.4f}".format(results["FOB_Value"]))
+        print("Períodos: {} | Iterações do simplex: {}".format(self.n_periods, self.solver_iterations))
+        print(results["Resumo"])
+
+    # ----------------------------------------------------------------RESULTS----------------------------------------------------------------------------------------------#
+    def _values(self, p_max_pu: np.ndarray, duration_h: np.ndarray, line_loss: np.ndarray) -> Dict[str, np.ndarray]:
+        """Resultados da solução atual como arrays períodos x elementos (MW, MWh e preços)."""
+        arrays, model, sol = self.arrays, self.model, self.problem.solution
+        T, sb, x = len(duration_h), arrays.sb_mva, sol.x
+        block = lambda name: x[model.columns[name]].reshape(T, -1)
+        gen_pos = dispatchable(arrays)
+        thermal = arrays.gen_kind[gen_pos] == GenKind.THERMAL
+        wind = arrays.gen_kind[gen_pos] == GenKind.WIND
+        p = block("p") * sb
+        curtailment = p_max_pu[:, gen_pos][:, wind] * sb - p[:, wind]
+        shed = block("shed") * sb
+        period_cost = sum((model.c[s] * x[s]).reshape(T, -1).sum(axis=1) for s in model.columns.values()
+                          if s.stop > s.start)
+        return {
+            "Thermal_Generation": p[:, thermal],
+            "Wind_Generation": p[:, wind],
+            "Wind_Curtailment": curtailment,
+            "Battery_P_Out": block("p_out") * sb,
+            "Battery_P_In": block("p_in") * sb,
+            "Battery_SOC": block("soc") * sb,
+            "Load_Shed": shed,
+            "Line_Flow": block("flow") * sb,
+            "LMP": sol.eq_dual[model.eq_rows["balance"]].reshape(T, arrays.n_bus) / duration_h[:, None],
+            "Resumo": np.column_stack([period_cost, line_loss.sum(axis=1) * sb, curtailment.sum(axis=1),
+                                       shed.sum(axis=1)]),
+        }
+
+    def _frames(self, values: Dict[str, np.ndarray]) -> dict:
+        """DataFrames dos resultados: linhas = início de cada estágio, colunas = nomes dos elementos."""
+        import pandas as pd   # Importado só na extração, como no LinearDispatch
+
+        arrays = self.arrays
+        index = pd.Index([self.temporal.get_stage_start_date(t) for t in range(self.n_periods)], name="Period")
+        gens, gen_idx = self.net.generators, self.net.gen_idx
+        names = lambda ids, items, idx: np.array([items[idx[int(i)]].name for i in ids], dtype=object)
+        gen_pos = dispatchable(arrays)
+        gen_names = names(arrays.gen_id[gen_pos], gens, gen_idx)
+        bat_names = names(arrays.gen_id[self.storage.gen_pos], gens, gen_idx)
+        columns = {
+            "Thermal_Generation": gen_names[arrays.gen_kind[gen_pos] == GenKind.THERMAL],
+            "Wind_Generation": gen_names[arrays.gen_kind[gen_pos] == GenKind.WIND],
+            "Battery_P_Out": bat_names, "Battery_P_In": bat_names, "Battery_SOC": bat_names,
+            "Load_Shed": names(arrays.load_id, self.net.loads, self.net.load_idx),
+            "Line_Flow": [f"Line {i} ({arrays.bus_id[f]}->{arrays.bus_id[t]})"
+                          for i, f, t in zip(arrays.line_id, arrays.line_from, arrays.line_to)],
+            "LMP": [b.name for b in self.net.buses],
+            "Resumo": ["Total_Cost_System", "Total_Losses_MW", "Total_Curtailment_MW", "Total_Shed_MW"],
+        }
+        columns["Wind_Curtailment"] = columns["Wind_Generation"]
+        results = {key: pd.DataFrame(v, index=index, columns=columns[key]) for key, v in values.items()}
+        results["FOB_Value"] = float(values["Resumo"][:, 0].sum())
+        return results
+
+
+def shift_basis(status: np.ndarray, blocks: Dict[str, slice], n_periods: int, k: int) -> np.ndarray:
+    """
+    Basis statuses of a stacked multi-period model shifted k periods back:
+    period t takes the status of period t + k and the last k periods repeat
+    the status of the last one. `blocks` are the column (or row) blocks.
+    """
+    out = status.copy()
+    for s in blocks.values():
+        size = (s.stop - s.start) // n_periods
+        if size == 0:
+            continue
+        periods = status[s].reshape(n_periods, size)
+        out[s] = np.concatenate([periods[k:], np.repeat(periods[-1:], min(k, n_periods), axis=0)]).ravel()
+    return out
+
+
+class RollingHorizonDispatch(MultiPeriodDispatch):
+    """
+    Despacho em horizonte rolante: cada janela de `window` períodos é
+    resolvida como um despacho multiperíodo, só os `commit` primeiros
+    períodos são fixados e a janela avança `commit` períodos, partindo do SOC
+    e da geração térmica (rampas) do último período fixado. A janela que
+    passa do fim do horizonte repete os dados do último período.
+
+    O mesmo LPModel (e a mesma instância do backend) serve a todas as
+    janelas: só cargas, disponibilidade eólica, SOC inicial e rampas do
+    primeiro período mudam (lado direito e limites). Com o HiGHS, cada
+    janela parte da base ótima da anterior deslocada de `commit` períodos.
+
+    Args:
+        window: períodos de cada janela (o horizonte de previsão).
+        commit: períodos fixados por janela (1 <= commit <= window).
+        Os demais como em MultiPeriodDispatch (sem final_soc).
+    """
+
+    def __init__(self, net, temporal: TemporalStructure, window: int, commit: int = 1,
+                 loads: Optional[Dict[int, TimeSeries]] = None, wind: Optional[Dict[int, TimeSeries]] = None,
+                 scenario: int = 0, backend: Union[str, SolverBackend, None] = None):
+        if not 1 <= commit <= window:
+            raise ValueError(f"commit deve estar entre 1 e window ({window}), recebido {commit}.")
+        super().__init__(net, temporal, loads=loads, wind=wind, scenario=scenario, backend=backend)
+        self.window = min(window, self.n_periods)
+        self.commit = min(commit, self.window)
+        self.windows = 0          # Janelas resolvidas no último solve
+        self.model_builds = 0     # Vezes que o LP foi montado (só muda se a duração dos períodos da janela mudar)
+
+    def _update_window(self, load_pu: np.ndarray, p_max_pu: np.ndarray, bus_loss: np.ndarray, soc_pu: np.ndarray,
+                       p_initial_pu: np.ndarray, duration_h: float):
+        """Dados de uma nova janela no modelo montado: só lado direito e limites das colunas mudam."""
+        model, arrays = self.model, self.arrays
+        model.upper[model.columns["p"]] = p_max_pu[:, dispatchable(arrays)].ravel()
+        model.upper[model.columns["shed"]] = load_pu.ravel()
+        model.b_eq[model.eq_rows["balance"]] = self._demand(load_pu, bus_loss).ravel()
+        soc_rows = model.eq_rows["soc_balance"]
+        model.b_eq[soc_rows.start:soc_rows.start + len(soc_pu)] = soc_pu
+        for block in ("ramp_up", "ramp_down"):
+            rows = model.ub_rows.get(block)
+            if rows is None:
+                continue
+            n = (rows.stop - rows.start) // self.window
+            model.b_ub[rows.start:rows.start + n] = initial_ramp_rhs(arrays, self.ramps, model.ids[block][:n], block,
+                                                                     p_initial_pu, duration_h)
+
+    def _shift_basis(self, k: int):
+        """Desloca a base da janela anterior de k períodos (só HighsBackend; senão a base anterior é mantida)."""
+        if not isinstance(self.backend, HighsBackend):
+            return
+        basis = self.backend.basis()
+        if basis is None:
+            return
+        model, H = self.model, self.window
+        n_eq = model.A_eq.shape[0]
+        rows = dict(model.eq_rows, **{f"ub_{b}": slice(s.start + n_eq, s.stop + n_eq) for b, s in model.ub_rows.items()})
+        self.backend.set_basis(shift_basis(basis[0], model.columns, H, k), shift_basis(basis[1], rows, H, k))
+
+    def solve(self, losses: bool = False, iter_max: int = 100, max_tol: float = 1e-6, verbose: bool = False) -> dict:
+        """
+        Resolve as janelas em sequência e devolve os resultados dos períodos
+        fixados (como MultiPeriodDispatch.solve). Com losses, as perdas de
+        cada janela são iteradas como no despacho multiperíodo, partindo das
+        perdas da janela anterior deslocadas.
+        """
+        T, H = self.n_periods, self.window
+        pad = lambda a: np.concatenate([a, np.repeat(a[-1:], H, axis=0)])
+        load, p_max, duration = pad(self.load_pu), pad(self.p_max_pu), pad(self.duration_h)
+        gen_pos = dispatchable(self.arrays)
+        ramp_col = np.searchsorted(gen_pos, self.ramps.gen_pos)
+        soc = self.storage.soc_pu.copy()
+        p_initial = np.full(len(self.ramps.gen_pos), np.nan)   # Antes do horizonte: sem rampa
+        bus_loss = np.zeros((H, self.arrays.n_bus))
+        self.model, self.solver_iterations, self.windows, self.model_builds = None, [], 0, 0
+        committed, built_duration = [], None
+        for start in range(0, T, self.commit):
+            w = slice(start, start + H)
+            if self.model is None or not np.array_equal(duration[w], built_duration):
+                self._build(load[w], p_max[w], duration[w], bus_loss, soc_pu=soc, p_initial_pu=p_initial)
+                built_duration = duration[w]
+                self.model_builds += 1
+            else:
+                self._update_window(load[w], p_max[w], bus_loss, soc, p_initial, duration[start])
+                self._shift_basis(self.commit)
+            bus_loss, line_loss = self._iterate(load[w], bus_loss, losses, iter_max, max_tol)
+            self.windows += 1
+
+            n = min(self.commit, T - start)
+            committed.append({key: v[:n] for key, v in self._values(p_max[w], duration[w], line_loss).items()})
+            x = self.problem.solution.x
+            soc = x[self.model.columns["soc"]].reshape(H, -1)[n - 1].copy()
+            p_initial = x[self.model.columns["p"]].reshape(H, -1)[n - 1, ramp_col]
+            bus_loss = np.concatenate([bus_loss[n:], np.repeat(bus_loss[-1:], n, axis=0)])
+
+        results = self._frames({key: np.concatenate([c[key] for c in committed]) for key in committed[0]})
+        if verbose:
+            print("Janelas: {} de {} períodos (fixando {})".format(self.windows, H, self.commit))
+            self._print(results)
+        return results
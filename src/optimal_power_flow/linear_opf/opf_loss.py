@@ -1,7 +1,21 @@
-from power import Network, ThermalGenerator, BusType
+from power import Network, GenKind
+from functools import partial
+from typing import Union
 import numpy as np
-import pandas as pd
 import pulp as pl
+from optimal_power_flow.linear_opf.lp_model import MatrixProblem
+from optimal_power_flow.linear_opf.backends import SolverBackend, get_backend, DEFAULT_BACKEND
+from optimal_power_flow.linear_opf.dispatch_model import (build_dispatch_model, bus_load, StorageArrays, loss_cuts,
+                                                          series_conductance, dispatchable, LazyLimitProblem)
+from optimal_power_flow.linear_opf.ptdf_model import PTDFFormulation, PTDFProblem
+from optimal_power_flow.linear_opf.scopf import ContingencyScreening, outage_positions
+from optimal_power_flow.linear_opf.solution import DispatchSolution
+from optimal_power_flow.linear_opf.solution_cache import SolutionCache, dispatch_fingerprint
+
+# Modelos de perdas de solve_loss
+LOSS_MODELS = ("fixed_point", "pwl")
+# Formulações do LP: "angle" (ângulos + fluxos, modelo completo) ou "ptdf" (compacta, ver ptdf_model.py)
+FORMULATIONS = ("angle", "ptdf")
 
 class OptimizationError(RuntimeError):
     """Raised when the LP/MIP solver does not find an optimal solution within an iteration."""
@@ -12,373 +26,649 @@ class ConvergenceError(RuntimeError):
     pass
 
 class LinearDispatch:
-    def __init__(self, net: Network):
+    def __init__(self, net: Network, backend: Union[str, SolverBackend, None] = None, cache: SolutionCache = None):
         """
         Inicializa e constrói o problema de despacho econômico linear para uma dada rede.
+
+        Args:
+            net: rede (Network) ou cenário (Scenario) a despachar.
+            backend: solver do LP: "cbc" (PuLP, padrão), "highs" (HiGHS em processo,
+                re-solves a quente), "linprog" (scipy) ou uma instância de SolverBackend
+                (ver backends.py). O custo ótimo é o mesmo, mas os LPs do despacho são
+                degenerados e o HiGHS pode parar em outro vértice ótimo: com perdas
+                (solve_loss) o despacho final muda (ex.: IEEE 14, perdas de 15,33 MW
+                com o CBC e 6,32 MW com o HiGHS).
+            cache: SolutionCache consultado pelos solve_*: uma rede/cenário com os mesmos
+                dados e opções de um solve anterior devolve a solução guardada sem montar
+                nem resolver o LP (ver solution_cache.py). Pode ser compartilhado entre
+                instâncias (ex.: avaliações de uma metaheurística). As perdas que entram
+                na chave são as informadas pelo chamador: um solve_loss repetido sobre as
+                perdas calculadas pelo solve_loss anterior tem a chave deste. Num acerto o
+                modelo não é montado (o já montado com a mesma chave é mantido); update(),
+                resolve() e solve_batch() o montam e resolvem na primeira vez que precisam dele.
         """
         self.net = net
-        self.problem = None
-
-        # Initializing losses on each bus:
-        for b in self.net.buses:
-            b.loss = 0
-        
-        for l in self.net.lines:
-            l.loss = 0
+        self.backend = get_backend(DEFAULT_BACKEND if backend is None else backend)
+        self.cache = cache
+        self._cache_key = None  # Chave do solve_* atual no cache (None sem cache)
+        self._model_key = None  # Chave do solve_* que montou e resolveu o modelo atual (None se alterado por update())
+        self._rebuild = None    # (solve_*, perdas de partida) do último acerto do cache, montado só quando usado
+        self.problem = None     # MatrixProblem: modelo matricial + última solução
+        self.model = None       # LPModel (A, b, c, limites) resolvido pelo backend, montado a partir de self.arrays
+        self.formulation = None # PTDFFormulation quando o LP é o compacto (formulation="ptdf")
+        self.security = None    # ContingencyScreening do despacho com segurança (contingencies=...)
+        self._last_solve = None # (tipo, opções) do último solve_*, repetido por resolve()/solve_batch()
+        self.arrays = None      # NetworkArrays da rede/cenário no momento da montagem
+
+        # Estado do solver: as variáveis de decisão ficam em dicionários (id do elemento -> variável do modelo)
+        # e as perdas em arrays indexados como net.buses / self.lines. Os elementos da rede não são alterados.
+        self.lines = list(self.net.lines)
+        self.theta_var = {}
+        self.flow_var = {}
+        self.p_var = {}
+        self.p_shed_var = {}
+        self.p_out_var = {}
+        self.p_in_var = {}
+        self.loss_var = {}      # Perda de cada linha (apenas no modelo de perdas "pwl")
+
+        # Initializing losses on each bus/line:
+        self.bus_loss = np.zeros(len(self.net.buses))
+        self.line_loss = np.zeros(len(self.lines))
+        self.flow_sign = np.zeros(len(self.lines), dtype=int)
+        self.solver_iterations = []   # Iterações do solver em cada iteração de perdas (solve_loss)
+        self.loss_approx_error = np.zeros(len(self.lines))   # g·Δθ² - perda linearizada de cada linha ("pwl")
+        self._g_series = None                                 # Condutância série das linhas (montada com o modelo)
+        self._loss_origin = None   # (perdas calculadas pelo último solve_loss de ponto fixo, perdas de que ele partiu)
 
         # RNG da classe
         self.rng = np.random.default_rng(seed=42)
-    # ----------------------------------------------------------------OBJECTIVE FUNCTIONS------------------------------------------------------------------------------------#
-    def _fob_linear_econ_dispatch(self):
-        """Define a função objetivo do problema (minimizar custo total)."""
-        thermal_cost = pl.lpSum([g.cost_b_pu * g.p_var for g in self.net.thermal_generators])
-        shedding_cost = pl.lpSum([l.cost_shed_pu * l.p_shed_var for l in self.net.loads if hasattr(l, 'p_shed_var')])
-        battery_out = pl.lpSum([b.cost_discharge_pu * b.p_out_var for b in self.net.batteries if hasattr(b, 'p_out_var')])
-        battery_in = pl.lpSum([b.cost_charge_pu * b.p_in_var for b in self.net.batteries if hasattr(b, 'p_in_var')])
-        self.problem += thermal_cost + shedding_cost + battery_out + battery_in, "Min_Total_System_Cost"
-    
-    def _fob_min_loss(self):
-        self.problem += pl.lpSum([g.p_var for g in self.net.generators]), "Min_Loss"
-    
-    def _fob_transmission_cost(self):
-        self._update_flow_sign()
-        self.problem += pl.lpSum([l.flow_sign * l.flow_max_pu * l.flow_var for l in self.net.lines]), "Min_Transmission_Cost"
-
-    # ----------------------------------------------------------------CREATE VARIABLES------------------------------------------------------------------------------------#
-    def _create_theta_variable(self):
-        # Ângulo das Barras
-        for b in self.net.buses:
-                if b.btype == BusType.SLACK:
-                    b.theta_var = pl.LpVariable(f"Theta{b.id}")
-                    self.problem += b.theta_var <=  0, f"Constraint_Theta_{b.id}_Upper"
-                    self.problem += b.theta_var >= 0, f"Constraint_Theta_{b.id}_Lower"
-                    b.theta_var.setInitialValue(0)   
-                else:
-                    b.theta_var = pl.LpVariable(f"Theta{b.id}")
-                    self.problem += b.theta_var <=  np.pi, f"Constraint_Theta_{b.id}_Upper"
-                    self.problem += b.theta_var >= -np.pi, f"Constraint_Theta_{b.id}_Lower"
-                    b.theta_var.setInitialValue(0)   
-
-    def _create_flow_variable(self):
-        for line in self.net.lines:
-            line.flow_var = pl.LpVariable(f"Flow_{line.id}")
-            self.problem += line.flow_var <=  line.flow_max_pu, f"Constraint_Flow_{line.id}_Upper"
-            self.problem += line.flow_var >= -line.flow_max_pu, f"Constraint_Flow_{line.id}_Lower"
-            self.problem += line.flow_var == ((line.from_bus.theta_var - line.to_bus.theta_var) / line.x_pu), f"Constraint_Flow_{line.id}"
-    
-    def _create_generation_variable(self):
-        for g in self.net.thermal_generators:
-            g.p_var = pl.LpVariable(f"P{g.id}")
-            self.problem += g.p_var <= g.p_max_pu, f"Constraint_P{g.id}_Upper"
-            self.problem += g.p_var >= g.p_min_pu, f"Constraint_P{g.id}_Lower"
-        
-        for g in self.net.wind_generators:
-            g.p_var = pl.LpVariable(f"P{g.id}")
-            self.problem += g.p_var <= g.p_max_pu, f"Constraint_P{g.id}_Upper"
-            self.problem += g.p_var >= g.p_min_pu, f"Constraint_P{g.id}_Lower"
-
-
-    def _create_load_shed_variable(self):
-        for l in self.net.loads:
-            l.p_shed_var = pl.LpVariable(f"L_shed{l.id}")
-            self.problem += l.p_shed_var <= l.p_pu, f"Constraint_P_Shed{l.id}_Upper"
-            self.problem += l.p_shed_var >= 0,      f"Constraint_P_Shed{l.id}_Lower"
-
-    def _create_battery_variable(self):
-        for b in self.net.batteries:
-            # Battery Discharge Variable
-            b.p_out_var = pl.LpVariable(f"P_Out{b.id}")
-            # Discharge limits
-            self.problem += b.p_out_var <= b.p_max_pu, f"Constraint_P_Out{b.id}_Upper"
-            self.problem += b.p_out_var >= 0,          f"Constraint_P_Out{b.id}_Lower"
-
-            # Battery Charge Variable
-            b.p_in_var = pl.LpVariable(f"P_In{b.id}")
-            # Charge limits
-            self.problem += b.p_in_var <= -b.p_min_pu, f"Constraint_P_In{b.id}_Upper"
-            self.problem += b.p_in_var >= 0,           f"Constraint_P_In{b.id}_Lower"
-
-            # Battery SOC Constraint
-            self.problem += b.p_in_var + b.soc_pu <= b.capacity_pu, f"Constraint_SOC_{b.id}_Upper"
-            self.problem += b.soc_pu - b.p_out_var >= 0,            f"Constraint_SOC_{b.id}_Lower"
-
-    # ----------------------------------------------------------------CREATE CONSTRAINTS------------------------------------------------------------------------------------#
-    def _nodal_power_balance(self):
-        for b in self.net.buses:
-            thermal_generation = pl.lpSum([g.p_var for g in b.thermal_generators])
-            wind_generation = pl.lpSum([g.p_var for g in b.wind_generators])
-            bat_generation = pl.lpSum([ (batt.p_out_var) for batt in b.batteries])
-            bat_charge = pl.lpSum([ (batt.p_in_var) for batt in b.batteries])
-            generation = thermal_generation + wind_generation + bat_generation - bat_charge
-            load_shed = pl.lpSum([l.p_shed_var for l in b.loads])
-            flow_in = pl.lpSum([(l.from_bus.theta_var - b.theta_var) / l.x_pu for l in self.net.lines if l.to_bus == b])
-            flow_out = pl.lpSum([(b.theta_var - l.to_bus.theta_var) / l.x_pu for l in self.net.lines if l.from_bus == b])
-            load = sum([l.p_pu for l in b.loads]) + b.loss
-            self.problem += generation + load_shed + flow_in - flow_out == load, f"B{b.id}_Power_Balance"
+    # ----------------------------------------------------------------MODEL------------------------------------------------------------------------------------------------#
+    def _build_problem(self, name: str, objective: str = "cost", storage: bool = False, loss_segments: int = None,
+                       formulation: str = "angle", lazy_limits: bool = False, contingencies=None,
+                       ctg_rating: float = 1.0, arrays=None):
+        """
+        Monta o LP em forma matricial a partir dos arrays compilados da rede
+        (ver dispatch_model.build_dispatch_model) e expõe as colunas nos
+        dicionários theta_var, flow_var, p_var, ... (id do elemento -> variável).
+        Com loss_segments as perdas das linhas são variáveis do LP (loss_var).
+        Com formulation="ptdf" o backend resolve o LP compacto (ver
+        ptdf_model.py) e a solução é expandida para o modelo completo, de modo
+        que as variáveis e restrições são lidas pelos mesmos nomes.
+        Com lazy_limits os limites de fluxo da formulação "angle" só entram no
+        modelo quando violados (ver dispatch_model.LazyLimitProblem); na
+        formulação "ptdf" eles já são gerados sob demanda.
+        Com contingencies (ids de linhas ou "all") o despacho é preventivo N-1:
+        os limites pós-contingência (rating · flow_max) violados entram no
+        modelo via LODF (ver scopf.py).
+        arrays: NetworkArrays já compilados da rede (ex.: pela consulta ao cache).
+        """
+        if formulation not in FORMULATIONS:
+            raise ValueError(f"Formulação desconhecida '{formulation}'. Opções: {FORMULATIONS}.")
+        self._model_key, self._rebuild = self._cache_key, None
+        self.arrays = self.net.compile() if arrays is None else arrays
+        self._g_series = series_conductance(self.arrays)
+        batteries = StorageArrays.from_network(self.net, self.arrays) if storage else None
+        flow_sign = self.flow_sign if objective == "transmission" else None
+        layout = build_dispatch_model(self.arrays, objective, bus_loss=self.bus_loss, storage=batteries,
+                                      flow_sign=flow_sign, loss_segments=loss_segments, name=name)
+        if formulation == "ptdf":
+            self.formulation = PTDFFormulation(layout, self.arrays)
+            self.model = self.formulation.model
+            self.problem = PTDFProblem(self.formulation, names=self._constraint_names)
+        else:
+            self.formulation = None
+            self.model = layout
+            problem = LazyLimitProblem if lazy_limits else MatrixProblem
+            self.problem = problem(layout, names=self._constraint_names)
+        self.security = None
+        if contingencies is not None:
+            if formulation != "angle":
+                raise ValueError("O despacho com contingências só está disponível na formulação 'angle'.")
+            self.security = ContingencyScreening(self.model, self.arrays, outage_positions(self.arrays, contingencies),
+                                                 rating=ctg_rating)
+        self.theta_var = self.problem.variables("theta", "Theta")
+        self.flow_var = self.problem.variables("flow", "Flow_")
+        self.p_var = self.problem.variables("p", "P")
+        self.p_shed_var = self.problem.variables("shed", "L_shed")
+        self.p_out_var = self.problem.variables("p_out", "P_Out")
+        self.p_in_var = self.problem.variables("p_in", "P_In")
+        self.loss_var = self.problem.variables("loss", "Loss_")
+
+    @property
+    def activated_limits(self) -> int:
+        """Número de linhas com limite de fluxo no modelo atual (nos modos sob demanda, só as ativadas)."""
+        if isinstance(self.problem, LazyLimitProblem):
+            return int(self.problem.active.sum())
+        if self.formulation is not None:
+            return len(self.formulation.monitored)
+        return 0 if self.arrays is None else int(np.isfinite(self.arrays.line_flow_max_pu).sum())
+
+    def _print_limits(self):
+        if self.formulation is not None or isinstance(self.problem, LazyLimitProblem):
+            print("Limites de fluxo ativados: {} de {} linhas".format(self.activated_limits, len(self.lines)))
+        if self.security is not None:
+            print("Contingências: {}".format(self.security.report()))
+
+    def _solve_problem(self) -> int:
+        """
+        Resolve o problema atual com o backend. No despacho com contingências,
+        adiciona as restrições pós-contingência violadas e re-resolve até
+        nenhuma contingência violar os limites (iterações do solver somadas).
+        """
+        status = self.problem.solve(self.backend)
+        if self.security is None:
+            return status
+        iterations = self.problem.solution.iterations
+        while status == pl.LpStatusOptimal and self.security.update(self.problem.solution.x):
+            status = self.problem.solve(self.backend)
+            iterations += self.problem.solution.iterations
+        self.problem.solution.iterations = iterations
+        return status
+
+    def _constraint_names(self) -> dict:
+        """Nomes das restrições (os mesmos do modelo PuLP por objeto) -> (tipo, índice, sinal) no modelo matricial."""
+        model = self.problem.model
+        names = {}
+
+        def add(fmt, block, kind, sign=1.0):
+            section = model.columns if kind in ("lower", "upper") else model.eq_rows if kind == "eq" else model.ub_rows
+            start = section[block].start
+            names.update((fmt.format(i), (kind, start + k, sign)) for k, i in enumerate(model.ids[block].tolist()))
+
+        for fmt, block in (("Constraint_Theta_{}", "theta"), ("Constraint_Flow_{}", "flow"), ("Constraint_P{}", "p"),
+                           ("Constraint_P_Shed{}", "shed"), ("Constraint_P_Out{}", "p_out"), ("Constraint_P_In{}", "p_in")):
+            add(fmt + "_Upper", block, "upper")
+            add(fmt + "_Lower", block, "lower")
+        add("Constraint_Flow_{}", "flow_def", "eq")
+        add("B{}_Power_Balance", "balance", "eq")
+        add("Constraint_SOC_{}_Upper", "soc_upper", "ub")
+        add("Constraint_SOC_{}_Lower", "soc_lower", "ub", -1.0)   # soc - p_out >= 0 no modelo original
+        return names
+
+    def _update_balance_rhs(self):
+        """Atualiza o lado direito do balanço nodal (carga + perdas da barra) com as perdas atuais."""
+        if self.formulation is not None:
+            self.formulation.update_rhs(self.bus_loss)
+        elif self.loss_var:
+            # Modelo de perdas linearizadas: as perdas são colunas do LP, o lado direito é só a carga
+            self.model.b_eq[self.model.eq_rows["balance"]] = bus_load(self.arrays)
+        else:
+            self.model.b_eq[self.model.eq_rows["balance"]] = bus_load(self.arrays) + self.bus_loss
 
     # ----------------------------------------------------------------UTILS------------------------------------------------------------------------------------------------#
+    def _angle_differences(self) -> np.ndarray:
+        """θ_from - θ_to de cada linha (ordem de self.lines) na solução atual."""
+        arrays = self.arrays
+        theta = self.problem.solution.x[self.problem.model.columns["theta"]]
+        return theta[arrays.line_from] - theta[arrays.line_to]
+
+    def _allocate_losses(self):
+        """Metade da perda de cada linha em cada barra terminal (soma por barra, como no balanço do modelo)."""
+        arrays = self.arrays
+        self.bus_loss[:] = 0.5 * (np.bincount(arrays.line_from, weights=self.line_loss, minlength=arrays.n_bus)
+                                  + np.bincount(arrays.line_to, weights=self.line_loss, minlength=arrays.n_bus))
+
     def _update_losses(self):
         """
-        Calcula as perdas com base nos ângulos da solução atual e as atualiza nas barras.
-        Retorna o valor total das perdas calculadas.
+        Calcula as perdas g·Δθ² de cada linha com base nos ângulos da solução
+        atual e as atualiza nas barras. Retorna o valor total das perdas calculadas.
         """
-        current_total_loss = 0
-        # 1. Zera as perdas da iteração anterior em todas as barras
-        for b in self.net.buses:
-            b.loss = 0
-
-        # 2. Calcula e distribui as novas perdas
-        for l in self.net.lines:
-            r = l.r_pu
-            x = l.x_pu
-            g_series = r / (r**2 + x**2) if (r**2 + x**2) > 0 else 0
-            dtheta = l.from_bus.theta_var.value() - l.to_bus.theta_var.value()
-            line_loss = g_series * (dtheta ** 2)
-            l.loss = line_loss
-            current_total_loss += line_loss
+        self.line_loss[:] = self._g_series * self._angle_differences() ** 2
+        self._allocate_losses()
+        return float(self.line_loss.sum())
 
-            # Atribui metade da perda para cada barra da linha
-            l.from_bus.loss += line_loss / 2
-            l.to_bus.loss += line_loss / 2
+    def _update_flow_sign(self):
+        """Sentido do fluxo de cada linha pelos ângulos: 1 (FROM -> TO), -1 (TO -> FROM) ou 0."""
+        dtheta = self._angle_differences()
+        if np.isnan(dtheta).any():
+            raise ValueError(f"Fluxo não foi corretamente calculado, o sentido do fluxo não é negativo, nem positivo, nem zero")
+        self.flow_sign[:] = np.sign(dtheta).astype(int)
 
-        return current_total_loss
+    def dispatch_solution(self, FOB_value: float = None) -> DispatchSolution:
+        """
+        Solução primal e dual do último solve em arrays indexados como a rede
+        compilada (self.arrays), lida por fatias do modelo, sem DataFrames.
+        """
+        return DispatchSolution.from_model(self.arrays, self.problem.model, self.problem.solution,
+                                           bus_loss_pu=self.bus_loss, line_loss_pu=self.line_loss, objective=FOB_value)
 
-    def _update_flow_sign(self):
-        for line in self.net.lines:
-            if line.from_bus.theta_var.value() > line.to_bus.theta_var.value(): # Fluxo de "FROM" para "TO"
-                line.flow_sign = 1
-            elif line.from_bus.theta_var.value() < line.to_bus.theta_var.value(): #Fluxo de "TO" para "FROM"
-                line.flow_sign = -1
-            elif line.from_bus.theta_var.value() == line.to_bus.theta_var.value(): #Fluxo 0
-                line.flow_sign = 0
-            else:
-                raise ValueError(f"Fluxo não foi corretamente calculado, o sentido do fluxo não é negativo, nem positivo, nem zero")
-            
     def _extract_results(self, FOB_value: float = None) -> dict:
-        """Extrai os resultados das variáveis de decisão após a resolução do problema."""
-        #Variáveis primais e duais dos geradores térmicos:
-        thermal_gen_results = {g.name: {
-            "P_MW": g.p_var.value() * self.net.sb_mva,
-            "Dual_Lower_Cost": self.problem.constraints[f"Constraint_P{g.id}_Lower"].pi,
-            "Dual_Upper_Cost": self.problem.constraints[f"Constraint_P{g.id}_Upper"].pi
-        } for g in self.net.thermal_generators}
-
-        # Variáveis Primais e duais dos geradores eólicos:
-        wind_gen_results = {g.name: {
-            "Avaible_MW": g.p_max_pu * self.net.sb_mva,
-            "P_MW": g.p_var.value() * self.net.sb_mva,
-            "Curtailment_MW": (g.p_max_pu - g.p_var.value()) * self.net.sb_mva,
-            "Dual_Lower_Cost": self.problem.constraints[f"Constraint_P{g.id}_Lower"].pi,
-            "Dual_Upper_Cost": self.problem.constraints[f"Constraint_P{g.id}_Upper"].pi
-        } for g in self.net.wind_generators}
-
-        # Variáveis Primais e duais das baterias:
-        battery_results = {b.name: {
-            "P_Out_MW": b.p_out_var.value() * self.net.sb_mva,
-            "P_In_MW": b.p_in_var.value() * self.net.sb_mva,
-            "Initial_SOC_MWh": b.soc_mwh,
-            "Final_SOC_MWh": b.soc_mwh + (b.p_in_var.value() - b.p_out_var.value()) * self.net.sb_mva,
-            "Dual_Lower_Out": self.problem.constraints[f"Constraint_P_Out{b.id}_Lower"].pi,
-            "Dual_Upper_Out": self.problem.constraints[f"Constraint_P_Out{b.id}_Upper"].pi,
-            "Dual_Lower_In": self.problem.constraints[f"Constraint_P_In{b.id}_Lower"].pi,
-            "Dual_Upper_In": self.problem.constraints[f"Constraint_P_In{b.id}_Upper"].pi,
-            "Dual_Lower_SOC": self.problem.constraints[f"Constraint_SOC_{b.id}_Lower"].pi,
-            "Dual_Upper_SOC": self.problem.constraints[f"Constraint_SOC_{b.id}_Upper"].pi,
-        } for b in self.net.batteries}
-
-        # Variáveis Primais e duais dos cortes de carga:
-        load_shed_results = {l.name: {
-            "P_MW": l.p_pu * self.net.sb_mva,
-            "P_Shed_MW": l.p_shed_var.value() * self.net.sb_mva,
-            "Dual_Lower_Cost": self.problem.constraints[f"Constraint_P_Shed{l.id}_Lower"].pi,
-            "Dual_Upper_Cost": self.problem.constraints[f"Constraint_P_Shed{l.id}_Upper"].pi,
-        } for l in self.net.loads}
-
-        # Variáveis Primais e duais das linhas:
-        line_results = {f"Line {l.id} ({l.from_bus.id}->{l.to_bus.id})": {
-            "Flow_MW": l.flow_var.value() * self.net.sb_mva,
-            "Losses_MW": l.loss * self.net.sb_mva,
-            "Dual_Lower_Cost": self.problem.constraints[f"Constraint_Flow_{l.id}_Lower"].pi,
-            "Dual_Upper_Cost": self.problem.constraints[f"Constraint_Flow_{l.id}_Upper"].pi,
-        } for l in self.net.lines}
-
-        # Variáveis Primais e duais das barras:
-        bus_results = {b.name: {
-            "Theta_deg": float(np.rad2deg(b.theta_var.value())),
-            "Local_Marginal_Price": self.problem.constraints[f"B{b.id}_Power_Balance"].pi,
-            "Losses_MW": b.loss * self.net.sb_mva,
-            "Dual_Lower_Angle": self.problem.constraints[f"Constraint_Theta_{b.id}_Lower"].pi,
-            "Dual_Upper_Angle": self.problem.constraints[f"Constraint_Theta_{b.id}_Upper"].pi,
-        } for b in self.net.buses}
-
-        # Retorna todos os dados em um dicionário com DataFrames separados
-        results = {
-            "Thermal_Generation": pd.DataFrame(thermal_gen_results).T if thermal_gen_results else pd.DataFrame(),
-            "Wind_Generation": pd.DataFrame(wind_gen_results).T if wind_gen_results else pd.DataFrame(),
-            "Battery": pd.DataFrame(battery_results).T if battery_results else pd.DataFrame(),
-            "Load_Shed": pd.DataFrame(load_shed_results).T if load_shed_results else pd.DataFrame(),
-            "Line": pd.DataFrame(line_results).T if line_results else pd.DataFrame(),
-            "Bus": pd.DataFrame(bus_results).T if bus_results else pd.DataFrame(),
-            "FOB_Value": FOB_value
-        }
+        """Extrai os resultados das variáveis de decisão após a resolução do problema (DataFrames por elemento)."""
+        return self.dispatch_solution(FOB_value).to_frames(self.net)
 
-        return results
-    
-    # ----------------------------------------------------------------SOLVING----------------------------------------------------------------------------------------------#
-    def solve_min_loss(self, verbose=False, detailed_output=False):
-        self.problem = pl.LpProblem("Min_Loss", pl.LpMinimize)
-        self._create_theta_variable()
-        self._create_flow_variable()
-        self._create_generation_variable()
-        self._create_load_shed_variable()
-        self._fob_min_loss()
-        self._nodal_power_balance() 
-        self.problem.solve(pl.PULP_CBC_CMD(msg=False)) 
-        if self.problem.status == pl.LpStatusOptimal:
-            results = self._extract_results(pl.value(self.problem.objective))
-            if verbose:
-                print("Solução encontrada.")
-                print("Custo Total do Sistema: {:.4f}".format(pl.value(self.problem.objective)))
-                if getattr(self.net, 'wind_generators', []):
-                    print(f"Curtailment Total: {sum((g.p_max_pu - g.p_var.value()) * self.net.sb_mva for g in self.net.wind_generators):.4f} MW")
-                print(f"Shed Total: {sum(l.p_shed_var.value() * self.net.sb_mva for l in self.net.loads):.4f} MW")
-                if detailed_output:
-                    if not results["Thermal_Generation"].empty:
-                        print("\n--- Geradores Térmicos ---")
-                        print(results["Thermal_Generation"])
-                    if not results["Wind_Generation"].empty:
-                        print("\n--- Geradores Eólicos ---")
-                        print(results["Wind_Generation"])
-                    if not results["Load_Shed"].empty:
-                        print("\n--- Cortes de Carga ---")
-                        print(results["Load_Shed"])
-                    if not results["Line"].empty:
-                        print("\n--- Linhas ---")
-                        print(results["Line"])
-                    if not results["Bus"].empty:
-                        print("\n--- Barras ---")
-                        print(results["Bus"])
-            return results
-        else:
-            raise OptimizationError(
-                f"Solução ótima não encontrada em solve_min_loss. Status: {pl.LpStatus[self.problem.status]}"
-            )
+    # ----------------------------------------------------------------CACHE------------------------------------------------------------------------------------------------#
+    def _cache_lookup(self, method: str, rebuild, storage: bool = False, fixed_loss: bool = True, **options):
+        """
+        Consulta o cache antes de um solve_*: compila a rede e calcula a chave
+        (dados da rede, baterias, opções, backend e, com fixed_loss, as perdas
+        que entram no balanço; no solve_loss, as do chamador, ver _caller_loss).
+        Retorna (arrays, solução guardada ou None). Num acerto as perdas do
+        solver passam a ser as da solução guardada e o modelo não é montado:
+        o atual é mantido se foi montado e resolvido com a mesma chave; senão
+        `rebuild` (o solve_* com as mesmas opções) fica guardado e é chamado,
+        sem o cache, quando update/resolve/solve_batch precisarem do modelo.
+        """
+        if self.cache is None:
+            self._cache_key = None
+            return None, None
+        arrays = self.net.compile()
+        if options.get("contingencies") is not None:
+            options["contingencies"] = outage_positions(arrays, options["contingencies"])
+        if fixed_loss:
+            options["bus_loss"] = self._caller_loss() if method == "loss" else self.bus_loss
+        batteries = StorageArrays.from_network(self.net, arrays) if storage else None
+        options.update(method=method, backend=self.backend.name)
+        self._cache_key = dispatch_fingerprint(arrays, options, batteries)
+        solution = self.cache.get(self._cache_key, arrays)
+        if solution is not None and not (self.model is not None and self._model_key == self._cache_key):
+            self._rebuild = (rebuild, np.array(options.get("bus_loss", self.bus_loss), dtype=float))
+            self.arrays = arrays
+            self.problem = self.model = self.formulation = self.security = None
+            self._last_solve = None
+            self.theta_var, self.flow_var, self.p_var, self.p_shed_var = {}, {}, {}, {}
+            self.p_out_var, self.p_in_var, self.loss_var = {}, {}, {}
+        if solution is not None:
+            self.bus_loss[:] = solution.bus_loss_pu
+            self.line_loss[:] = solution.line_loss_pu
+        return arrays, solution
+
+    def _caller_loss(self) -> np.ndarray:
+        """
+        Perdas de partida do solve_loss informadas pelo chamador. Se as perdas
+        atuais são as que o último solve_loss calculou, a chamada é a repetição
+        dele e vale a partida daquele (senão a chave mudaria a cada repetição).
+        """
+        if self._loss_origin is not None and np.array_equal(self.bus_loss, self._loss_origin[0]):
+            return self._loss_origin[1]
+        return self.bus_loss
 
-    def solve_econ_dispatch(self, verbose=False, detailed_output=False):
-        self.problem = pl.LpProblem("Economic_Dispatch", pl.LpMinimize)
-        self._create_theta_variable()
-        self._create_flow_variable()
-        self._create_generation_variable()
-        self._create_load_shed_variable()
-        self._fob_linear_econ_dispatch()
-        self._nodal_power_balance() 
-        self.problem.solve(pl.PULP_CBC_CMD(msg=False))
-        if self.problem.status == pl.LpStatusOptimal:
-            results = self._extract_results(pl.value(self.problem.objective))
-            if verbose:
-                print("Solução encontrada.")
-                print("Custo Total do Sistema: {:.4f}".format(pl.value(self.problem.objective)))
-                if getattr(self.net, 'wind_generators', []):
-                    print(f"Curtailment Total: {sum((g.p_max_pu - g.p_var.value()) * self.net.sb_mva for g in self.net.wind_generators):.4f} MW")
-                print(f"Shed Total: {sum(l.p_shed_var.value() * self.net.sb_mva for l in self.net.loads):.4f} MW")
-                if detailed_output:
-                    if not results["Thermal_Generation"].empty:
-                        print("\n--- Geradores Térmicos ---")
-                        print(results["Thermal_Generation"])
-                    if not results["Wind_Generation"].empty:
-                        print("\n--- Geradores Eólicos ---")
-                        print(results["Wind_Generation"])
-                    if not results["Load_Shed"].empty:
-                        print("\n--- Cortes de Carga ---")
-                        print(results["Load_Shed"])
-                    if not results["Line"].empty:
-                        print("\n--- Linhas ---")
-                        print(results["Line"])
-                    if not results["Bus"].empty:
-                        print("\n--- Barras ---")
-                        print(results["Bus"])
-            return results
-        else:
-            raise OptimizationError(
-                f"Solução ótima não encontrada em solve_min_loss. Status: {pl.LpStatus[self.problem.status]}"
-            )
+    def _require_model(self, method: str) -> None:
+        """
+        Garante o modelo do último solve_* para update/resolve/solve_batch:
+        depois de um acerto do cache ele é montado e resolvido agora, sem o
+        cache e partindo das mesmas perdas (ver _cache_lookup).
+        """
+        if self.model is None and self._rebuild is not None:
+            (rebuild, bus_loss), self._rebuild = self._rebuild, None
+            cache, self.cache = self.cache, None
+            self.bus_loss[:] = bus_loss
+            try:
+                rebuild()
+            finally:
+                self.cache = cache
+        if self.model is None:
+            raise ValueError(f"Nenhum modelo montado: chame solve_econ_dispatch/solve_loss antes de {method}().")
+
+    def _cache_store(self, solution: DispatchSolution):
+        """Guarda a solução do solve_* atual no cache (se houver)."""
+        if self._cache_key is not None:
+            self.cache.put(self._cache_key, solution)
 
-    def solve_loss(self, iter_max=100, max_tol=1e-6, verbose=False, detailed_output=False):
+    # ----------------------------------------------------------------SOLVING----------------------------------------------------------------------------------------------#
+    def _print_detailed(self, results: dict):
+        """Imprime os DataFrames por elemento dos resultados."""
+        for key, title in (("Thermal_Generation", "Geradores Térmicos"), ("Wind_Generation", "Geradores Eólicos"),
+                           ("Load_Shed", "Cortes de Carga"), ("Line", "Linhas"), ("Bus", "Barras")):
+            if not results[key].empty:
+                print(f"\n--- {title} ---")
+                print(results[key])
+
+    def _single_results(self, method: str, verbose: bool, detailed_output: bool, frames: bool,
+                        solution: DispatchSolution = None):
         """
-        Resolve o despacho econômico de forma iterativa para incluir as perdas da rede.
+        Resultados de solve_min_loss / solve_econ_dispatch: DataFrames ou, sem
+        frames, a DispatchSolution (a do cache, se dada; senão a do último solve).
         """
-        self.problem = pl.LpProblem("Linear_Economic_Dispatch", pl.LpMinimize)
-        self._create_theta_variable()
-        self._create_flow_variable()
-        self._create_generation_variable()
-        self._create_load_shed_variable()
-        self._create_battery_variable()
-        self._fob_linear_econ_dispatch()
-        self._nodal_power_balance() 
-        prev_total_loss = 0
-        for i in range(1, iter_max + 1):
-            self.problem.solve(pl.PULP_CBC_CMD(msg=False))
+        cached = solution is not None
+        if not cached:
             if self.problem.status != pl.LpStatusOptimal:
                 raise OptimizationError(
-                    f"Solução ótima não encontrada durante a iteração {i} do solver com perdas. Status: {pl.LpStatus[self.problem.status]}"
+                    f"Solução ótima não encontrada em {method}. Status: {pl.LpStatus[self.problem.status]}"
                 )
+            solution = self.dispatch_solution(pl.value(self.problem.objective))
+            self._cache_store(solution)
+        results = solution.to_frames(self.net) if frames or (verbose and detailed_output) else None
+        if verbose:
+            summary = solution.summary()
+            print("Solução recuperada do cache." if cached else "Solução encontrada.")
+            self._print_limits()
+            print("Custo Total do Sistema: {:.4f}".format(summary["Total_Cost_System"]))
+            if getattr(self.net, 'wind_generators', []):
+                print(f"Curtailment Total: {summary['Total_Curtailment_MW']:.4f} MW")
+            print(f"Shed Total: {summary['Total_Shed_MW']:.4f} MW")
+            if detailed_output:
+                self._print_detailed(results)
+        return results if frames else solution
+
+    def solve_min_loss(self, verbose=False, detailed_output=False, formulation: str = "angle", lazy_limits: bool = False,
+                       frames: bool = True):
+        """
+        Despacho de mínima geração total (mínimas perdas). Com frames=False
+        devolve a DispatchSolution (arrays) em vez dos DataFrames.
+        """
+        rebuild = partial(self.solve_min_loss, formulation=formulation, lazy_limits=lazy_limits, frames=False)
+        arrays, cached = self._cache_lookup("min_loss", rebuild, formulation=formulation, lazy_limits=lazy_limits)
+        if cached is not None:
+            return self._single_results("solve_min_loss", verbose, detailed_output, frames, cached)
+        self._build_problem("Min_Loss", objective="min_loss", formulation=formulation, lazy_limits=lazy_limits,
+                            arrays=arrays)
+        self._last_solve = ("single", {})
+        self._solve_problem()
+        return self._single_results("solve_min_loss", verbose, detailed_output, frames)
+
+    def solve_econ_dispatch(self, verbose=False, detailed_output=False, formulation: str = "angle", lazy_limits: bool = False,
+                            contingencies=None, ctg_rating: float = 1.0, frames: bool = True):
+        """
+        Despacho econômico DC sem perdas. Com contingencies (ids das linhas ou
+        "all") o despacho é preventivo N-1 (ver solve_loss). Com frames=False
+        devolve a DispatchSolution (arrays) em vez dos DataFrames.
+        """
+        rebuild = partial(self.solve_econ_dispatch, formulation=formulation, lazy_limits=lazy_limits,
+                          contingencies=contingencies, ctg_rating=ctg_rating, frames=False)
+        arrays, cached = self._cache_lookup("econ_dispatch", rebuild, formulation=formulation, lazy_limits=lazy_limits,
+                                            contingencies=contingencies, ctg_rating=ctg_rating)
+        if cached is not None:
+            return self._single_results("solve_econ_dispatch", verbose, detailed_output, frames, cached)
+        self._build_problem("Economic_Dispatch", formulation=formulation, lazy_limits=lazy_limits,
+                            contingencies=contingencies, ctg_rating=ctg_rating, arrays=arrays)
+        self._last_solve = ("single", {})
+        self._solve_problem()
+        return self._single_results("solve_econ_dispatch", verbose, detailed_output, frames)
+
+    def _solve_loss_iteration(self, i: int):
+        """Resolve o modelo atual (a quente, se o backend permitir) e registra as iterações do solver."""
+        self._solve_problem()
+        self.solver_iterations.append(self.problem.solution.iterations)
+        if self.problem.status != pl.LpStatusOptimal:
+            raise OptimizationError(
+                f"Solução ótima não encontrada durante a iteração {i} do solver com perdas. Status: {pl.LpStatus[self.problem.status]}"
+            )
+
+    def _solve_loss_fixed_point(self, iter_max: int, max_tol: float, formulation: str = "angle",
+                                lazy_limits: bool = False, **security) -> int:
+        """Perdas como carga fixa no balanço, recalculadas pelos ângulos até convergir. Retorna o nº de iterações."""
+        self._build_problem("Linear_Economic_Dispatch", storage=True, formulation=formulation, lazy_limits=lazy_limits,
+                            **security)
+        return self._iterate_fixed_point(iter_max, max_tol)
+
+    def _iterate_fixed_point(self, iter_max: int, max_tol: float) -> int:
+        """Iterações de perdas sobre o modelo já montado, partindo das perdas atuais (já no lado direito)."""
+        prev_total_loss = float(self.line_loss.sum())
+        for i in range(1, iter_max + 1):
+            self._solve_loss_iteration(i)
             current_total_loss = self._update_losses()
             loss_diff = abs(current_total_loss - prev_total_loss)
             if loss_diff <= max_tol:
-                break    
+                return i
             prev_total_loss = current_total_loss
-            for b in self.net.buses:
-                constraint_name = f"B{b.id}_Power_Balance"
-                self.problem.constraints.pop(constraint_name)
-            self._nodal_power_balance()
-        else: 
+            self._update_balance_rhs()
+        raise ConvergenceError(
+            f"Convergência não atingida após {iter_max} iterações."
+        )
+
+    def _solve_loss_pwl(self, segments: int, refine: bool, iter_max: int, max_tol: float, lazy_limits: bool = False,
+                        **security) -> int:
+        """
+        Perdas linearizadas por partes dentro do LP (um único solve). Com
+        refine, as linhas cuja perda g·Δθ² excede a linearizada em mais de
+        max_tol ganham um corte tangente no Δθ da solução e o LP é re-resolvido
+        a quente, até nenhuma linha exceder a tolerância. Retorna o nº de solves.
+        """
+        if segments < 1:
+            raise ValueError(f"segments deve ser >= 1, recebido {segments}.")
+        self._build_problem("Linear_Economic_Dispatch", storage=True, loss_segments=segments, lazy_limits=lazy_limits,
+                            **security)
+        return self._iterate_pwl(refine, iter_max, max_tol)
+
+    def _iterate_pwl(self, refine: bool, iter_max: int, max_tol: float) -> int:
+        """Solve (e refinamento) do modelo de perdas linearizadas já montado."""
+        model, arrays = self.model, self.arrays
+        for i in range(1, iter_max + 1):
+            self._solve_loss_iteration(i)
+            dtheta = self._angle_differences()
+            self.line_loss[:] = self.problem.solution.x[model.columns["loss"]]
+            self.loss_approx_error = self._g_series * dtheta ** 2 - self.line_loss
+            violated = np.flatnonzero(self.loss_approx_error > max_tol)
+            if not refine or len(violated) == 0:
+                break
+            model.add_ub_rows("loss_cut", *loss_cuts(arrays, model, violated, np.abs(dtheta[violated])))
+        else:
             raise ConvergenceError(
-                f"Convergência não atingida após {iter_max} iterações."
+                f"Refinamento das perdas linearizadas não convergiu após {iter_max} iterações."
             )
-        
-        perdas_totais = sum(b.loss for b in self.net.buses) * self.net.sb_mva
-        curtailment_total = sum((g.p_max_pu - g.p_var.value()) * self.net.sb_mva for g in self.net.wind_generators) if getattr(self.net, 'wind_generators', []) else 0.0
-        shed_total = sum(l.p_shed_var.value() * self.net.sb_mva for l in self.net.loads) if getattr(self.net, 'loads', []) else 0.0    
-        df_resumo = pd.DataFrame({
-            "Total_Cost_System": [pl.value(self.problem.objective)],
-            "Total_Losses_MW": [perdas_totais],
-            "Total_Curtailment_MW": [curtailment_total],
-            "Total_Shed_MW": [shed_total]
-        })
-        results = self._extract_results(pl.value(self.problem.objective))
-        results["Resumo"] = df_resumo
+        self._allocate_losses()
+        return i
+
+    def solve_loss(self, iter_max=100, max_tol=1e-6, verbose=False, detailed_output=False,
+                   loss_model: str = "fixed_point", segments: int = 8, refine: bool = False,
+                   formulation: str = "angle", lazy_limits: bool = False, contingencies=None, ctg_rating: float = 1.0,
+                   frames: bool = True):
+        """
+        Resolve o despacho econômico incluindo as perdas da rede. O resultado
+        depende do backend (ver __init__): os valores de referência são os do
+        "cbc", o padrão.
+
+        No "fixed_point" a iteração parte das perdas atuais do solver. Com
+        cache, um solve_loss repetido logo depois de outro (perdas atuais =
+        as que ele calculou) tem a chave daquele, a das perdas de que ele
+        partiu: devolve o ponto fixo da primeira execução, enquanto sem cache
+        a repetição parte das perdas já convergidas e pode parar em outro
+        ponto fixo dentro de max_tol. Para continuar a partir das perdas
+        atuais com cache, altere-as (ex.: resolve()) ou use outra instância.
+
+        Args:
+            iter_max: máximo de iterações de perdas (fixed_point) ou de rodadas de refinamento (pwl).
+            max_tol: tolerância da variação das perdas totais (fixed_point) ou do erro de
+                linearização por linha (pwl, com refine).
+            loss_model: "fixed_point" (padrão) monta o modelo uma única vez e, a cada
+                iteração, só atualiza o lado direito do balanço nodal (carga + perdas)
+                e re-resolve a partir da base anterior (com backend="highs", simplex
+                dual a quente). "pwl" aproxima a perda g·Δθ² de cada linha por `segments`
+                cortes tangentes por sentido de fluxo dentro do próprio LP, de modo que
+                um único solve já dá o despacho que considera as perdas; o erro da
+                aproximação fica em self.loss_approx_error.
+            segments: número de segmentos por sentido de fluxo do modelo "pwl".
+            refine: no modelo "pwl", adiciona cortes nas linhas com erro acima de max_tol
+                e re-resolve a quente até a aproximação ficar dentro da tolerância.
+            formulation: "angle" (padrão) ou "ptdf" (LP compacto sem ângulos, só com o
+                balanço do sistema e os limites das linhas perto do limite; apenas com
+                loss_model="fixed_point").
+            lazy_limits: na formulação "angle", resolve sem limites de fluxo e só impõe os
+                das linhas violadas, re-resolvendo a quente até não haver violações; o
+                número de limites ativados fica em self.activated_limits.
+            contingencies: despacho preventivo N-1: ids das linhas em contingência (ou "all").
+                Um único LP com os limites pós-contingência flow_l + LODF[l, k]·flow_k,
+                adicionados só quando violados (triagem iterativa, ver scopf.py), substitui
+                os len(lines) + 1 despachos independentes. Só na formulação "angle" e,
+                no modelo "pwl", sem refine.
+            ctg_rating: limite pós-contingência como fração de flow_max (limite de emergência).
+            frames: devolve os DataFrames por elemento (com o "Resumo"); com False, devolve
+                a DispatchSolution (arrays indexados como a rede compilada), sem pandas.
+        """
+        if loss_model not in LOSS_MODELS:
+            raise ValueError(f"Modelo de perdas desconhecido '{loss_model}'. Opções: {LOSS_MODELS}.")
+        if loss_model == "pwl" and formulation != "angle":
+            raise ValueError("O modelo de perdas 'pwl' só está disponível na formulação 'angle'.")
+        if loss_model == "pwl" and refine and contingencies is not None:
+            raise ValueError("O refinamento das perdas 'pwl' não pode ser combinado com contingências.")
+        self.solver_iterations = []
+        options = {"loss_model": loss_model, "refine": refine, "iter_max": iter_max, "max_tol": max_tol}
+        if loss_model == "pwl":
+            options["segments"] = segments
+        # No "pwl" as perdas são colunas do LP: as perdas atuais do solver não entram no modelo
+        start_loss = None if loss_model == "pwl" else self._caller_loss().copy()
+        rebuild = partial(self.solve_loss, iter_max, max_tol, loss_model=loss_model, segments=segments, refine=refine,
+                          formulation=formulation, lazy_limits=lazy_limits, contingencies=contingencies,
+                          ctg_rating=ctg_rating, frames=False)
+        arrays, solution = self._cache_lookup("loss", rebuild, storage=True, fixed_loss=loss_model != "pwl",
+                                              formulation=formulation, lazy_limits=lazy_limits,
+                                              contingencies=contingencies, ctg_rating=ctg_rating, **options)
+        cached = solution is not None
+        if not cached:
+            security = {"contingencies": contingencies, "ctg_rating": ctg_rating, "arrays": arrays}
+            self._last_solve = ("loss", {k: options[k] for k in ("loss_model", "refine", "iter_max", "max_tol")})
+            if loss_model == "pwl":
+                i = self._solve_loss_pwl(segments, refine, iter_max, max_tol, lazy_limits, **security)
+            else:
+                i = self._solve_loss_fixed_point(iter_max, max_tol, formulation, lazy_limits, **security)
+            solution = self.dispatch_solution(pl.value(self.problem.objective))
+            self._cache_store(solution)
+        self._loss_origin = None if start_loss is None else (self.bus_loss.copy(), start_loss)
+        resumo = solution.summary()
+        perdas_totais, curtailment_total, shed_total = (resumo["Total_Losses_MW"], resumo["Total_Curtailment_MW"],
+                                                        resumo["Total_Shed_MW"])
+        results = None
+        if frames or (verbose and detailed_output):
+            import pandas as pd
+            results = solution.to_frames(self.net)
+            results["Resumo"] = pd.DataFrame({k: [v] for k, v in resumo.items()})
 
         if verbose:
             # Imprime resultado na tela:
-            print("FOB: {:.4f}".format(pl.value(self.problem.objective)))
-            print ("Solução encontrada após {} iterações.".format(i))
+            print("FOB: {:.4f}".format(solution.objective))
+            if cached:
+                print ("Solução recuperada do cache.")
+            else:
+                print ("Solução encontrada após {} iterações.".format(i))
+            self._print_limits()
+            print ("Iterações do simplex por iteração de perdas: {}".format(self.solver_iterations))
+            if loss_model == "pwl":
+                print ("Erro máximo da linearização das perdas: {:.6f} MW".format(float(self.loss_approx_error.max(initial=0.0)) * self.net.sb_mva))
             print ("Perdas Totais do Sistema: {:.4f} MW".format(perdas_totais))
             print ("Curtailment Total: {:.4f} MW".format(curtailment_total))
             print ("Shed Total: {:.4f} MW".format(shed_total))
-
             if detailed_output:
-                # Imprime resultados detalhados dos geradores térmicos
-                if not results["Thermal_Generation"].empty:
-                    print("\n--- Geradores Térmicos ---")
-                    print(results["Thermal_Generation"])
-                # Imprime resultados detalhados dos geradores eólicos
-                if not results["Wind_Generation"].empty:
-                    print("\n--- Geradores Eólicos ---")
-                    print(results["Wind_Generation"])
-                # Imprime resultados detalhados dos cortes de carga
-                if not results["Load_Shed"].empty:
-                    print("\n--- Cortes de Carga ---")
-                    print(results["Load_Shed"])
-                # Imprime resultados detalhados das linhas
-                if not results["Line"].empty:
-                    print("\n--- Linhas ---")
-                    print(results["Line"])
-                # Imprime resultados detalhados das barras
-                if not results["Bus"].empty:
-                    print("\n--- Barras ---")
-                    print(results["Bus"])
+                self._print_detailed(results)
+        return results if frames else solution
+
+    # ----------------------------------------------------------------PARAMETRIC------------------------------------------------------------------------------------------#
+    def _element_values(self, values, ids: np.ndarray, current: np.ndarray, what: str) -> np.ndarray:
+        """Valores em MW (array na ordem de ids ou dict id -> MW) -> array em pu na ordem de ids."""
+        sb = self.arrays.sb_mva
+        if isinstance(values, dict):
+            out = current.copy()
+            pos = {int(i): k for k, i in enumerate(ids.tolist())}
+            missing = [i for i in values if int(i) not in pos]
+            if missing:
+                raise ValueError(f"{what} {missing[:10]} não fazem parte do modelo.")
+            for i, v in values.items():
+                out[pos[int(i)]] = v / sb
+            return out
+        values = np.asarray(values, dtype=float)
+        if values.shape != (len(ids),):
+            raise ValueError(f"Esperados {len(ids)} valores de {what}, recebidos {values.shape}.")
+        return values / sb
+
+    def _set_upper(self, block: str, upper: np.ndarray):
+        """Limite superior das colunas de um bloco no modelo completo e, se houver, no LP compacto."""
+        for model in {id(m): m for m in (self.problem.model, self.model)}.values():
+            model.upper[model.columns[block]] = upper
+
+    def update(self, loads=None, wind_max=None) -> "LinearDispatch":
+        """
+        Altera as cargas e/ou a disponibilidade eólica do modelo montado pelo
+        último solve_*, sem remontá-lo: só o lado direito do balanço e os
+        limites das colunas (corte de carga e eólicas) mudam, de modo que
+        resolve() re-resolve a partir da base anterior. A rede não é alterada.
+
+        Args:
+            loads: potência das cargas (MW), array na ordem de net.loads ou dict {id: MW}.
+            wind_max: potência disponível das eólicas (MW), array na ordem dos geradores
+                eólicos de net.generators ou dict {id: MW}.
+        """
+        self._require_model("update")
+        from dataclasses import replace
+
+        arrays, changes = self.arrays, {}
+        if loads is not None:
+            changes["load_p_pu"] = self._element_values(loads, arrays.load_id, arrays.load_p_pu, "Cargas")
+        if wind_max is not None:
+            wind = arrays.gen_kind == GenKind.WIND
+            p_max = arrays.gen_p_max_pu.copy()
+            p_max[wind] = self._element_values(wind_max, arrays.gen_id[wind], p_max[wind], "Eólicas")
+            changes["gen_p_max_pu"] = p_max
+        if not changes:
+            return self
+        self._model_key = None
+        self.arrays = replace(arrays, **changes)
+        if self.formulation is not None:
+            self.formulation.arrays = self.arrays
+        self._set_upper("shed", self.arrays.load_p_pu)
+        self._set_upper("p", self.arrays.gen_p_max_pu[dispatchable(self.arrays)])
+        self._update_balance_rhs()
+        return self
+
+    def _summary(self) -> dict:
+        """Custo, perdas, curtailment e corte de carga totais da solução atual (vetorizado)."""
+        return self.dispatch_solution(pl.value(self.problem.objective)).summary()
+
+    def resolve(self, detailed: bool = False) -> dict:
+        """
+        Re-resolve o modelo atual (após update()) com as mesmas opções do
+        último solve_*, a partir da base e das perdas da solução anterior.
+        Retorna o resumo (custo, perdas, curtailment, corte de carga e
+        iterações do solver) ou, com detailed, os resultados completos de
+        _extract_results com o "Resumo". No modelo de perdas "fixed_point" a
+        iteração parte das perdas do cenário anterior e pode convergir para
+        outro ponto fixo (igualmente válido) que o de um solve a frio.
+        """
+        self._require_model("resolve")
+        kind, options = self._last_solve
+        self.solver_iterations = []
+        if kind == "loss":
+            if options["loss_model"] == "pwl":
+                self._iterate_pwl(options["refine"], options["iter_max"], options["max_tol"])
+            else:
+                self._iterate_fixed_point(options["iter_max"], options["max_tol"])
+        else:
+            self._solve_loss_iteration(1)
+        summary = self._summary()
+        summary["Solver_Iterations"] = sum(self.solver_iterations)
+        if not detailed:
+            return summary
+        import pandas as pd
+        results = self._extract_results(summary["Total_Cost_System"])
+        results["Resumo"] = pd.DataFrame({k: [v] for k, v in summary.items()})
         return results
 
+    def solve_batch(self, scenario_matrix, detailed: bool = False):
+        """
+        Resolve uma sequência de cenários sobre o modelo do último solve_*,
+        re-resolvendo a quente de um cenário para o próximo. É um gerador: os
+        resultados (ver resolve) são entregues à medida que cada cenário é
+        resolvido, com "Scenario" (índice) e "Status"; cenários sem solução
+        ótima ou sem convergência têm Status "Infeasible"/"NotConverged".
+
+        Args:
+            scenario_matrix: array (cenários x (cargas + eólicas)) em MW, com as colunas
+                na ordem de net.loads seguida dos geradores eólicos; ou dict
+                {"loads": array cenários x cargas, "wind_max": array cenários x eólicas}.
+            detailed: entrega os resultados completos de cada cenário (mais lento).
+        """
+        self._require_model("solve_batch")
+        n_load = self.arrays.n_load
+        n_wind = int(np.sum(self.arrays.gen_kind == GenKind.WIND))
+        if isinstance(scenario_matrix, dict):
+            loads, wind = scenario_matrix.get("loads"), scenario_matrix.get("wind_max")
+            n_scen = len(loads) if loads is not None else len(wind)
+        else:
+            matrix = np.atleast_2d(np.asarray(scenario_matrix, dtype=float))
+            if matrix.shape[1] != n_load + n_wind:
+                raise ValueError(f"A matriz de cenários deve ter {n_load} + {n_wind} colunas (cargas + eólicas), "
+                                 f"recebidas {matrix.shape[1]}.")
+            loads, wind, n_scen = matrix[:, :n_load], matrix[:, n_load:], len(matrix)
+        for k in range(n_scen):
+            self.update(loads=None if loads is None else loads[k], wind_max=None if wind is None else wind[k])
+            try:
+                result = self.resolve(detailed=detailed)
+                result["Status"] = "Optimal"
+            except OptimizationError:
+                result = {"Status": "Infeasible"}
+            except ConvergenceError:
+                result = {"Status": "NotConverged"}
+            result["Scenario"] = k
+            yield result
+
 if __name__ == "__main__":
     from power.systems.b6l8 import B6L8
     from power.systems.ieee118 import IEEE118
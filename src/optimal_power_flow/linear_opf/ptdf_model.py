@@ -0,0 +1,192 @@
+"""
+Formulação compacta (PTDF) do despacho DC: sem colunas de ângulo e de fluxo.
+
+O LP compacto tem só as colunas de injeção (p, shed, p_out, p_in) do modelo
+completo de build_dispatch_model e as linhas:
+
+    system_balance  soma das injeções == carga total + perdas totais
+    soc_upper / soc_lower                       (como no modelo completo)
+    flow_limit      +-PTDF_l · (injeção - carga - perdas) <= flow_max_l
+
+As restrições de fluxo só existem para as linhas monitoradas: o LP começa
+sem nenhuma e, a cada solução, os fluxos de todas as linhas são calculados
+(um solve triangular com a LU de B') e as linhas violadas ou perto do
+limite entram no modelo, que é re-resolvido a quente até não haver
+violações. Os limites de ângulo (+-pi) do modelo completo não são impostos.
+
+A solução é expandida para o modelo completo (ângulos, fluxos, LMPs e duais
+das linhas), de modo que os nomes das variáveis/restrições e a extração de
+resultados do LinearDispatch são os mesmos nas duas formulações.
+"""
+from __future__ import annotations
+import numpy as np
+from typing import Optional
+from power.electricity_models.network_models.network_arrays import NetworkArrays
+from power.electricity_models.network_models.sensitivity import PTDF
+from optimal_power_flow.linear_opf.lp_model import LPModel, LPSolution, MatrixProblem
+from optimal_power_flow.linear_opf.dispatch_model import bus_load
+
+
+class PTDFFormulation:
+    """
+    Compact PTDF version of a dispatch model built by build_dispatch_model
+    (the `layout`). `model` is the LP that is solved; expand() maps its
+    solution back to the columns and rows of the layout.
+
+    Args:
+        layout: full (angle) dispatch model, without loss columns.
+        arrays: compiled network the layout was built from.
+        ptdf: PTDF of the network (default: PTDF.from_arrays, cached).
+        near_limit: lines whose flow reaches near_limit * flow_max are
+            monitored together with the violated ones.
+        max_new: maximum number of lines added per round (the most loaded
+            ones, relative to flow_max); None adds all of them.
+        tol: flow violation tolerance (pu).
+    """
+
+    def __init__(self, layout: LPModel, arrays: NetworkArrays, ptdf: Optional[PTDF] = None,
+                 near_limit: float = 0.95, max_new: Optional[int] = 200, tol: float = 1e-6):
+        from scipy import sparse
+
+        tail = layout.columns["p"].start
+        if np.any(layout.c[:tail]):
+            raise ValueError("The PTDF formulation has no angle/flow columns: the objective cannot depend on them.")
+        if layout.columns.get("loss", slice(0, 0)).stop > layout.columns.get("loss", slice(0, 0)).start:
+            raise ValueError("The PTDF formulation does not support the piecewise-linear loss model.")
+        self.layout, self.arrays, self.tail = layout, arrays, tail
+        self.ptdf = ptdf if ptdf is not None else PTDF.from_arrays(arrays)
+        self.near_limit, self.max_new, self.tol = near_limit, max_new, tol
+        self.flow_max = np.where(np.isnan(arrays.line_flow_max_pu), np.inf, arrays.line_flow_max_pu)
+
+        # Injeção de cada coluna em cada barra: o bloco do balanço nodal do modelo completo sem theta/flow
+        self.injection = layout.A_eq[layout.eq_rows["balance"]][:, tail:].tocsr()
+        columns = {block: slice(s.start - tail, s.stop - tail) for block, s in layout.columns.items() if s.start >= tail}
+        ids = {block: layout.ids[block] for block in list(columns) + list(layout.ub_rows) if block in layout.ids}
+        ids["system_balance"] = np.zeros(1, dtype=np.int64)
+        self.model = LPModel(c=layout.c[tail:].copy(),
+                             A_eq=sparse.csr_matrix(self.injection.sum(axis=0)), b_eq=np.array([self._demand().sum()]),
+                             A_ub=layout.A_ub[:, tail:].tocsr(), b_ub=layout.b_ub.copy(),
+                             lower=layout.lower[tail:].copy(), upper=layout.upper[tail:].copy(),
+                             columns=columns, eq_rows={"system_balance": slice(0, 1)}, ub_rows=dict(layout.ub_rows),
+                             ids=ids, name=layout.name)
+        # Linha da rede e sentido (+1: limite superior, -1: inferior) de cada restrição de fluxo
+        self.limit_pos = np.zeros(0, dtype=np.int64)
+        self.limit_sign = np.zeros(0)
+
+    def _demand(self) -> np.ndarray:
+        """Load + losses of each bus (RHS of the balance rows of the layout)."""
+        return self.layout.b_eq[self.layout.eq_rows["balance"]]
+
+    @property
+    def monitored(self) -> np.ndarray:
+        """Positions of the lines with flow limit rows in the model."""
+        return np.unique(self.limit_pos)
+
+    def add_limits(self, line_pos) -> slice:
+        """Adds the upper and lower flow limit rows of the lines line_pos (appended to 'flow_limit')."""
+        from scipy import sparse
+
+        line_pos = np.setdiff1d(np.asarray(line_pos, dtype=np.int64), self.limit_pos)
+        P = self.ptdf.rows(line_pos)
+        A = np.asarray(self.injection.T @ P.T).T   # PTDF_L @ injeção: fluxo na linha por unidade de cada coluna
+        A[np.abs(A) < 1e-12] = 0.0
+        flow_d = P @ self._demand()
+        fmax = self.flow_max[line_pos]
+        rows = self.model.add_ub_rows("flow_limit", sparse.csr_matrix(np.vstack([A, -A])),
+                                      np.concatenate([fmax + flow_d, fmax - flow_d]),
+                                      np.tile(self.arrays.line_id[line_pos], 2))
+        self.limit_pos = np.concatenate([self.limit_pos, line_pos, line_pos])
+        self.limit_sign = np.concatenate([self.limit_sign, np.ones(len(line_pos)), -np.ones(len(line_pos))])
+        return rows
+
+    def update_rhs(self, bus_loss: np.ndarray) -> None:
+        """Sets the losses of each bus: RHS of the system balance and of the flow limit rows."""
+        demand = bus_load(self.arrays) + bus_loss
+        self.layout.b_eq[self.layout.eq_rows["balance"]] = demand
+        self.model.b_eq[:] = demand.sum()
+        if len(self.limit_pos):
+            rows = self.model.ub_rows["flow_limit"]
+            self.model.b_ub[rows] = self.flow_max[self.limit_pos] + self.limit_sign * (self.ptdf.rows(self.limit_pos) @ demand)
+
+    def expand(self, solution: LPSolution) -> LPSolution:
+        """
+        Maps a solution of the compact model to the layout: angles and flows
+        from the DC power flow of the injections, LMP = system price +
+        PTDF^T (mu_upper - mu_lower), flow bound duals from the limit rows.
+        """
+        if not solution.optimal:
+            return solution
+        layout, cols = self.layout, self.layout.columns
+        n_line = self.ptdf.n_line
+        theta = self.ptdf.angles(self.injection @ solution.x - self._demand())
+        flow = self.ptdf.branch_flows(theta)
+        x = np.zeros(layout.n_cols)
+        x[cols["theta"]], x[cols["flow"]], x[self.tail:] = theta, flow, solution.x
+
+        mu = solution.ub_dual[self.model.ub_rows.get("flow_limit", slice(0, 0))]
+        up, lo = self.limit_sign > 0, self.limit_sign < 0
+        mu_upper = np.bincount(self.limit_pos[up], weights=mu[up], minlength=n_line)     # <= 0
+        mu_lower = np.bincount(self.limit_pos[lo], weights=mu[lo], minlength=n_line)     # <= 0
+        congestion = mu_upper - mu_lower
+        active = np.flatnonzero(congestion)
+        lmp = solution.eq_dual[0] + self.ptdf.rows(active).T @ congestion[active]
+
+        lower_dual, upper_dual = np.zeros(layout.n_cols), np.zeros(layout.n_cols)
+        lower_dual[cols["flow"]], upper_dual[cols["flow"]] = -mu_lower, mu_upper
+        lower_dual[self.tail:], upper_dual[self.tail:] = solution.lower_dual, solution.upper_dual
+        eq_dual = np.zeros(layout.A_eq.shape[0])
+        eq_dual[layout.eq_rows["balance"]] = lmp
+        eq_dual[layout.eq_rows["flow_def"]] = (lmp[self.arrays.line_from] - lmp[self.arrays.line_to]
+                                               + mu_lower - mu_upper)
+        n_ub = layout.A_ub.shape[0]
+        return LPSolution(status=solution.status, objective=solution.objective, x=x, eq_dual=eq_dual,
+                          ub_dual=solution.ub_dual[:n_ub], lower_dual=lower_dual, upper_dual=upper_dual,
+                          message=solution.message, iterations=solution.iterations)
+
+    def violated_lines(self, solution: LPSolution) -> np.ndarray:
+        """
+        Unmonitored lines whose flow in the (expanded) solution exceeds the
+        limit; if there is any, the unmonitored lines above near_limit too
+        (at most max_new, the most loaded first).
+        """
+        flow = np.abs(solution.x[self.layout.columns["flow"]])
+        free = np.ones(len(flow), dtype=bool)
+        free[self.limit_pos] = False
+        free &= np.isfinite(self.flow_max)
+        if not np.any(free & (flow > self.flow_max + self.tol)):
+            return np.zeros(0, dtype=np.int64)
+        new = np.flatnonzero(free & (flow >= self.near_limit * self.flow_max))
+        if self.max_new is not None and len(new) > self.max_new:
+            new = new[np.argsort(-flow[new] / self.flow_max[new], kind="stable")[:self.max_new]]
+        return new
+
+    def __repr__(self):
+        return f"PTDFFormulation({self.model!r}, monitored={len(self.monitored)}/{self.ptdf.n_line})"
+
+
+class PTDFProblem(MatrixProblem):
+    """
+    MatrixProblem over the layout of a PTDFFormulation: solve() solves the
+    compact model, adds the violated flow limits and re-solves (warm with
+    HighsBackend) until every line is within its limit; the solution is the
+    expanded one, so variables and constraints are read by the same names as
+    in the full model.
+    """
+
+    def __init__(self, formulation: PTDFFormulation, names=None):
+        super().__init__(formulation.layout, names=names)
+        self.formulation = formulation
+
+    def solve(self, backend) -> int:
+        formulation = self.formulation
+        iterations = 0
+        while True:
+            solution = formulation.expand(backend.solve(formulation.model))
+            iterations += solution.iterations
+            new = formulation.violated_lines(solution) if solution.optimal else []
+            if len(new) == 0:
+                break
+            formulation.add_limits(new)
+        solution.iterations = iterations
+        self.solution = solution
+        return solution.status
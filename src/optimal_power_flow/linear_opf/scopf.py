@@ -0,0 +1,138 @@
+"""
+Despacho DC com segurança preventiva (SCOPF N-1 de linhas) por LODF.
+
+Para cada contingência k (saída da linha k) e linha monitorada l, o fluxo
+pós-contingência é flow_l + LODF[l, k] · flow_k, linear nas colunas flow do
+modelo completo (formulação "angle"). As restrições
+
+    sign · (flow_l + LODF[l, k] · flow_k) <= rating · flow_max_l
+
+só entram no LP quando violadas: a cada solução, os fluxos pós-contingência
+de todos os pares (l, k) são calculados em blocos de contingências e os
+pares violados são adicionados como linhas "ctg_limit" (duas entradas cada),
+re-resolvendo a quente até nenhuma contingência violar os limites. Um único
+despacho substitui os len(lines) + 1 despachos independentes.
+"""
+from __future__ import annotations
+import numpy as np
+from typing import Optional
+from power.electricity_models.network_models.network_arrays import NetworkArrays
+from power.electricity_models.network_models.sensitivity import PTDF
+from optimal_power_flow.linear_opf.lp_model import LPModel
+
+
+def outage_positions(arrays: NetworkArrays, contingencies) -> np.ndarray:
+    """Positions in the line arrays of the outaged lines: 'all' or an iterable of line ids (or Line objects)."""
+    if isinstance(contingencies, str):
+        if contingencies != "all":
+            raise ValueError(f"Unknown contingency list '{contingencies}'. Use 'all' or a list of line ids.")
+        return np.arange(arrays.n_line)
+    pos = {int(i): k for k, i in enumerate(arrays.line_id.tolist())}
+    ids = [int(getattr(c, "id", c)) for c in contingencies]
+    missing = [i for i in ids if i not in pos]
+    if missing:
+        raise ValueError(f"Lines {missing[:10]} are not part of the network.")
+    return np.unique(np.array([pos[i] for i in ids], dtype=np.int64))
+
+
+class ContingencyScreening:
+    """
+    Post-contingency flow limits of a dispatch model (angle formulation),
+    added on demand as rows of the 'ctg_limit' block of model.A_ub.
+
+    Args:
+        model: dispatch model from build_dispatch_model (flow columns).
+        arrays: compiled network of the model.
+        outages: positions of the outaged lines (see outage_positions).
+        ptdf: PTDF of the network (default: PTDF.from_arrays, cached).
+        rating: post-contingency limit as a fraction of flow_max (emergency rating).
+        max_new: maximum number of constraints added per round (the largest
+            relative violations first); None adds all of them.
+        chunk: number of contingencies screened at once (memory: n_line x chunk).
+        tol: violation tolerance (pu).
+    """
+
+    def __init__(self, model: LPModel, arrays: NetworkArrays, outages: np.ndarray, ptdf: Optional[PTDF] = None,
+                 rating: float = 1.0, max_new: Optional[int] = 500, chunk: int = 256, tol: float = 1e-6):
+        self.model, self.arrays = model, arrays
+        self.ptdf = ptdf if ptdf is not None else PTDF.from_arrays(arrays)
+        self.outages = np.asarray(outages, dtype=np.int64)
+        flow_max = np.where(np.isnan(arrays.line_flow_max_pu), np.inf, arrays.line_flow_max_pu)
+        self.limit = rating * flow_max
+        self.max_new, self.chunk, self.tol = max_new, chunk, tol
+        # Pares (linha monitorada, contingência, sentido) já no modelo
+        self.line_pos = np.zeros(0, dtype=np.int64)
+        self.outage_pos = np.zeros(0, dtype=np.int64)
+        self.sign = np.zeros(0)
+        self.islanding = np.zeros(0, dtype=np.int64)    # Contingências que ilham a rede (ignoradas)
+        self.rounds = 0
+
+    @property
+    def n_constraints(self) -> int:
+        return len(self.line_pos)
+
+    @property
+    def islanding_ids(self) -> np.ndarray:
+        """Ids of the outaged lines that island the network (not screened)."""
+        return self.arrays.line_id[self.islanding]
+
+    def violations(self, flow: np.ndarray):
+        """
+        Post-contingency violations of the pre-contingency flows `flow` that
+        are not in the model yet: (line positions, outage positions, sign,
+        LODF, relative violation), the largest violations first.
+        """
+        found = []
+        islanding = []
+        key = set(zip(self.line_pos.tolist(), self.outage_pos.tolist(), self.sign.tolist()))
+        for start in range(0, len(self.outages), self.chunk):
+            out = self.outages[start:start + self.chunk]
+            L = self.ptdf.lodf(out)
+            islanding.append(out[np.isnan(L[0])])
+            post = flow[:, None] + L * flow[out][None, :]
+            excess = np.abs(post) - self.limit[:, None]
+            excess[out, np.arange(len(out))] = -np.inf       # A própria linha em contingência
+            with np.errstate(invalid="ignore"):
+                l, j = np.nonzero(excess > self.tol)
+            if len(l):
+                found.append((l, out[j], np.sign(post[l, j]), L[l, j], excess[l, j] / self.limit[l]))
+        self.islanding = np.unique(np.concatenate(islanding)) if islanding else self.islanding
+        if not found:
+            return (np.zeros(0, dtype=np.int64),) * 2 + (np.zeros(0),) * 3
+        l, k, sign, lodf, rel = (np.concatenate(v) for v in zip(*found))
+        new = np.array([t not in key for t in zip(l.tolist(), k.tolist(), sign.tolist())], dtype=bool)
+        l, k, sign, lodf, rel = l[new], k[new], sign[new], lodf[new], rel[new]
+        order = np.argsort(-rel, kind="stable")
+        if self.max_new is not None:
+            order = order[:self.max_new]
+        return l[order], k[order], sign[order], lodf[order], rel[order]
+
+    def add(self, line_pos, outage_pos, sign, lodf) -> slice:
+        """Adds the rows sign * (flow_l + lodf * flow_k) <= limit_l."""
+        from scipy.sparse import csr_matrix
+
+        n = len(line_pos)
+        flow = self.model.columns["flow"].start
+        cols = np.column_stack([flow + line_pos, flow + outage_pos]).ravel()
+        vals = np.column_stack([sign, sign * lodf]).ravel()
+        A = csr_matrix((vals, (np.repeat(np.arange(n), 2), cols)), shape=(n, self.model.n_cols))
+        rows = self.model.add_ub_rows("ctg_limit", A, self.limit[line_pos], self.arrays.line_id[line_pos])
+        self.line_pos = np.concatenate([self.line_pos, line_pos])
+        self.outage_pos = np.concatenate([self.outage_pos, outage_pos])
+        self.sign = np.concatenate([self.sign, sign])
+        return rows
+
+    def update(self, x: np.ndarray) -> int:
+        """Screens the solution x and adds the violated constraints. Returns how many were added."""
+        self.rounds += 1
+        l, k, sign, lodf, _ = self.violations(x[self.model.columns["flow"]])
+        if len(l):
+            self.add(l, k, sign, lodf)
+        return len(l)
+
+    def report(self) -> str:
+        return (f"{self.n_constraints} post-contingency constraints for {len(self.outages)} contingencies "
+                f"({len(self.islanding)} islanding, not screened) after {self.rounds} screening rounds.")
+
+    def __repr__(self):
+        return f"ContingencyScreening(contingencies={len(self.outages)}, constraints={self.n_constraints})"
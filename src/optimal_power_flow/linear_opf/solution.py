@@ -0,0 +1,185 @@
+"""
+Solução do despacho DC em arrays indexados como a rede compilada.
+
+DispatchSolution lê a solução primal e dual de um LPModel de
+build_dispatch_model por fatias dos blocos (model.columns / eq_rows /
+ub_rows), sem consultar variáveis ou restrições pelo nome: cada array segue
+a ordem dos arrays de NetworkArrays (barras, linhas, geradores, cargas) ou
+das baterias de StorageArrays. Os DataFrames do LinearDispatch só são
+montados quando pedidos (to_frames).
+
+Os duais seguem a convenção do `pi` do PuLP (ver LPSolution): >= 0 nos
+limites inferiores, <= 0 nos superiores.
+"""
+from __future__ import annotations
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional
+from power.electricity_models.network_models.network_arrays import NetworkArrays, GenKind
+from optimal_power_flow.linear_opf.lp_model import LPModel, LPSolution
+from optimal_power_flow.linear_opf.dispatch_model import dispatchable
+
+
+@dataclass
+class DispatchSolution:
+    """Primal and dual values of a solved dispatch, in pu, indexed like the compiled network."""
+    arrays:    NetworkArrays
+    objective: Optional[float]
+    # Barras (arrays.bus_*)
+    theta_rad:        np.ndarray
+    lmp:              np.ndarray   # Dual do balanço nodal
+    theta_dual_lower: np.ndarray
+    theta_dual_upper: np.ndarray
+    bus_loss_pu:      np.ndarray
+    # Linhas (arrays.line_*)
+    flow_pu:          np.ndarray
+    flow_dual_lower:  np.ndarray
+    flow_dual_upper:  np.ndarray
+    line_loss_pu:     np.ndarray
+    # Geradores com coluna p (arrays.gen_* nas posições gen_pos: térmicas e eólicas)
+    gen_pos:          np.ndarray
+    p_pu:             np.ndarray
+    p_dual_lower:     np.ndarray
+    p_dual_upper:     np.ndarray
+    # Cargas (arrays.load_*)
+    shed_pu:          np.ndarray
+    shed_dual_lower:  np.ndarray
+    shed_dual_upper:  np.ndarray
+    # Baterias do modelo (arrays.gen_* nas posições bat_pos; vazias sem armazenamento)
+    bat_pos:          np.ndarray
+    p_out_pu:         np.ndarray
+    p_in_pu:          np.ndarray
+    p_out_dual_lower: np.ndarray
+    p_out_dual_upper: np.ndarray
+    p_in_dual_lower:  np.ndarray
+    p_in_dual_upper:  np.ndarray
+    soc_dual_lower:   np.ndarray
+    soc_dual_upper:   np.ndarray
+
+    @classmethod
+    def from_model(cls, arrays: NetworkArrays, model: LPModel, solution: LPSolution,
+                   bus_loss_pu: Optional[np.ndarray] = None, line_loss_pu: Optional[np.ndarray] = None,
+                   objective: Optional[float] = None) -> "DispatchSolution":
+        """
+        Slices the solution of a model from build_dispatch_model (or the
+        expanded solution of the PTDF formulation). bus_loss_pu / line_loss_pu
+        are the losses of the dispatch (zero if not given).
+        """
+        x, cols = solution.x, model.columns
+        lower, upper = solution.lower_dual, solution.upper_dual
+        soc_upper = model.ub_rows.get("soc_upper", slice(0, 0))
+        soc_lower = model.ub_rows.get("soc_lower", slice(0, 0))
+        gen_pos = {int(i): k for k, i in enumerate(arrays.gen_id.tolist())}
+        bat_pos = np.array([gen_pos[int(i)] for i in model.ids["p_out"].tolist()], dtype=np.int64)
+        return cls(
+            arrays=arrays,
+            objective=solution.objective if objective is None else objective,
+            theta_rad=x[cols["theta"]], lmp=solution.eq_dual[model.eq_rows["balance"]],
+            theta_dual_lower=lower[cols["theta"]], theta_dual_upper=upper[cols["theta"]],
+            bus_loss_pu=np.zeros(arrays.n_bus) if bus_loss_pu is None else np.asarray(bus_loss_pu),
+            flow_pu=x[cols["flow"]], flow_dual_lower=lower[cols["flow"]], flow_dual_upper=upper[cols["flow"]],
+            line_loss_pu=np.zeros(arrays.n_line) if line_loss_pu is None else np.asarray(line_loss_pu),
+            gen_pos=dispatchable(arrays),
+            p_pu=x[cols["p"]], p_dual_lower=lower[cols["p"]], p_dual_upper=upper[cols["p"]],
+            shed_pu=x[cols["shed"]], shed_dual_lower=lower[cols["shed"]], shed_dual_upper=upper[cols["shed"]],
+            bat_pos=bat_pos,
+            p_out_pu=x[cols["p_out"]], p_in_pu=x[cols["p_in"]],
+            p_out_dual_lower=lower[cols["p_out"]], p_out_dual_upper=upper[cols["p_out"]],
+            p_in_dual_lower=lower[cols["p_in"]], p_in_dual_upper=upper[cols["p_in"]],
+            # soc - p_out >= 0 no modelo original: o dual da linha <= é o oposto do da restrição >=
+            soc_dual_lower=-solution.ub_dual[soc_lower], soc_dual_upper=solution.ub_dual[soc_upper],
+        )
+
+    # ----------------------------------------------------------------TOTAIS-----------------------------------------------------------------------------------------------#
+    @property
+    def thermal(self) -> np.ndarray:
+        """Mask of the thermal units among the p columns (gen_pos)."""
+        return self.arrays.gen_kind[self.gen_pos] == GenKind.THERMAL
+
+    @property
+    def wind(self) -> np.ndarray:
+        """Mask of the wind units among the p columns (gen_pos)."""
+        return self.arrays.gen_kind[self.gen_pos] == GenKind.WIND
+
+    @property
+    def curtailment_pu(self) -> np.ndarray:
+        """Available minus dispatched power of the wind units (order of gen_pos[wind])."""
+        return self.arrays.gen_p_max_pu[self.gen_pos][self.wind] - self.p_pu[self.wind]
+
+    def summary(self) -> dict:
+        """Cost and total losses, curtailment and shedding (MW)."""
+        sb = self.arrays.sb_mva
+        return {
+            "Total_Cost_System": self.objective,
+            "Total_Losses_MW": float(self.bus_loss_pu.sum()) * sb,
+            "Total_Curtailment_MW": float(self.curtailment_pu.sum()) * sb,
+            "Total_Shed_MW": float(self.shed_pu.sum()) * sb,
+        }
+
+    # ----------------------------------------------------------------DATAFRAMES-------------------------------------------------------------------------------------------#
+    def to_frames(self, net) -> dict:
+        """
+        DataFrames of LinearDispatch (Thermal_Generation, Wind_Generation,
+        Battery, Load_Shed, Line, Bus and FOB_Value), indexed by element name.
+        """
+        import pandas as pd   # Importado só na extração: o pandas é caro e não é usado para montar/resolver o LP
+
+        arrays, sb = self.arrays, self.arrays.sb_mva
+        gen_names = {g.id: g.name for g in net.generators}
+        names = lambda ids, lookup: [lookup[int(i)] for i in ids.tolist()]
+
+        def frame(index, columns):
+            if not len(index):
+                return pd.DataFrame()
+            return pd.DataFrame(columns, index=pd.Index(index, dtype=object))
+
+        gen_ids = arrays.gen_id[self.gen_pos]
+        thermal, wind = self.thermal, self.wind
+        p_max = arrays.gen_p_max_pu[self.gen_pos][wind]
+        bat_ids = arrays.gen_id[self.bat_pos]
+        soc_mwh = np.array([net.generators[net.gen_idx[int(i)]].soc_mwh for i in bat_ids.tolist()], dtype=float)
+        bus_names = [b.name for b in net.buses]
+        line_names = [f"Line {i} ({f}->{t})" for i, f, t in zip(arrays.line_id.tolist(),
+                                                               arrays.bus_id[arrays.line_from].tolist(),
+                                                               arrays.bus_id[arrays.line_to].tolist())]
+        return {
+            "Thermal_Generation": frame(names(gen_ids[thermal], gen_names), {
+                "P_MW": self.p_pu[thermal] * sb,
+                "Dual_Lower_Cost": self.p_dual_lower[thermal],
+                "Dual_Upper_Cost": self.p_dual_upper[thermal]}),
+            "Wind_Generation": frame(names(gen_ids[wind], gen_names), {
+                "Avaible_MW": p_max * sb,
+                "P_MW": self.p_pu[wind] * sb,
+                "Curtailment_MW": (p_max - self.p_pu[wind]) * sb,
+                "Dual_Lower_Cost": self.p_dual_lower[wind],
+                "Dual_Upper_Cost": self.p_dual_upper[wind]}),
+            "Battery": frame(names(bat_ids, gen_names), {
+                "P_Out_MW": self.p_out_pu * sb,
+                "P_In_MW": self.p_in_pu * sb,
+                "Initial_SOC_MWh": soc_mwh,
+                "Final_SOC_MWh": soc_mwh + (self.p_in_pu - self.p_out_pu) * sb,
+                "Dual_Lower_Out": self.p_out_dual_lower, "Dual_Upper_Out": self.p_out_dual_upper,
+                "Dual_Lower_In": self.p_in_dual_lower, "Dual_Upper_In": self.p_in_dual_upper,
+                "Dual_Lower_SOC": self.soc_dual_lower, "Dual_Upper_SOC": self.soc_dual_upper}),
+            "Load_Shed": frame([l.name for l in net.loads], {
+                "P_MW": arrays.load_p_pu * sb,
+                "P_Shed_MW": self.shed_pu * sb,
+                "Dual_Lower_Cost": self.shed_dual_lower,
+                "Dual_Upper_Cost": self.shed_dual_upper}),
+            "Line": frame(line_names, {
+                "Flow_MW": self.flow_pu * sb,
+                "Losses_MW": self.line_loss_pu * sb,
+                "Dual_Lower_Cost": self.flow_dual_lower,
+                "Dual_Upper_Cost": self.flow_dual_upper}),
+            "Bus": frame(bus_names, {
+                "Theta_deg": np.rad2deg(self.theta_rad),
+                "Local_Marginal_Price": self.lmp,
+                "Losses_MW": self.bus_loss_pu * sb,
+                "Dual_Lower_Angle": self.theta_dual_lower,
+                "Dual_Upper_Angle": self.theta_dual_upper}),
+            "FOB_Value": self.objective,
+        }
+
+    def __repr__(self):
+        return (f"DispatchSolution(objective={self.objective}, buses={self.arrays.n_bus}, lines={self.arrays.n_line}, "
+                f"generators={len(self.gen_pos)}, batteries={len(self.bat_pos)})")
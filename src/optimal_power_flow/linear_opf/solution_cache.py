@@ -0,0 +1,182 @@
+"""
+Cache de soluções do despacho DC endereçado pelo conteúdo dos dados.
+
+A chave (dispatch_fingerprint) é o sha1 dos arrays compilados que entram no
+LP (topologia, reatâncias e resistências, limites, cargas, disponibilidade
+eólica e custos), das baterias e das opções do solve. Redes ou cenários
+iguais, mesmo montados por objetos diferentes, têm a mesma chave, de modo
+que avaliar de novo o mesmo indivíduo de uma metaheurística (ou o mesmo
+cenário) não resolve o LP. As soluções ficam em memória (LRU) e,
+opcionalmente, em um diretório de arquivos Parquet (um por chave), que
+sobrevive entre processos e pode ser consultado diretamente pelo DuckDB
+(ex.: SELECT key, objective FROM 'dir/*.parquet').
+"""
+from __future__ import annotations
+import hashlib
+import os
+import numpy as np
+from collections import OrderedDict
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, Optional
+from power.electricity_models.network_models.network_arrays import NetworkArrays
+from optimal_power_flow.linear_opf.dispatch_model import StorageArrays
+from optimal_power_flow.linear_opf.solution import DispatchSolution
+
+# Incrementar quando o modelo de despacho ou os campos de DispatchSolution mudarem (invalida o cache em disco)
+CACHE_VERSION = 1
+
+# Campos de NetworkArrays lidos pelo modelo de despacho (os demais não mudam a solução)
+DISPATCH_FIELDS = ("bus_id", "bus_type",
+                   "line_id", "line_from", "line_to", "line_r_pu", "line_x_pu", "line_flow_max_pu",
+                   "gen_id", "gen_bus", "gen_kind", "gen_p_min_pu", "gen_p_max_pu", "gen_cost_b_pu",
+                   "load_id", "load_bus", "load_p_pu", "load_cost_shed_pu")
+
+# Campos de DispatchSolution guardados (arrays é o da rede que consulta o cache)
+SOLUTION_FIELDS = tuple(f.name for f in fields(DispatchSolution) if f.name != "arrays")
+
+
+def dispatch_fingerprint(arrays: NetworkArrays, options: Optional[dict] = None,
+                         storage: Optional[StorageArrays] = None) -> str:
+    """
+    sha1 (hex) das entradas do despacho: os DISPATCH_FIELDS da rede
+    compilada, os dados das baterias (se o modelo tem armazenamento) e as
+    opções do solve (método, formulação, modelo de perdas, tolerâncias, ...).
+    """
+    h = hashlib.sha1(f"v{CACHE_VERSION}|{float(arrays.sb_mva)!r}".encode())
+
+    def update(name, a):
+        a = np.ascontiguousarray(a)
+        h.update(f"|{name}:{a.dtype.str}:{a.shape}|".encode())
+        h.update(a.tobytes())
+
+    for name in DISPATCH_FIELDS:
+        update(name, getattr(arrays, name))
+    if storage is not None:
+        for f in fields(StorageArrays):
+            update(f"storage.{f.name}", getattr(storage, f.name))
+    for name, value in sorted((options or {}).items()):
+        if isinstance(value, np.ndarray):
+            update(f"option.{name}", value)
+        else:
+            h.update(f"|option.{name}={value!r}".encode())
+    return h.hexdigest()
+
+
+class SolutionCache:
+    """
+    Cache LRU de soluções do despacho (DispatchSolution) endereçado por
+    dispatch_fingerprint, opcionalmente apoiado em disco.
+
+    Args:
+        max_size: número de soluções mantidas em memória (as usadas há mais tempo saem).
+        path: diretório do cache em disco (um arquivo Parquet por chave, requer pyarrow).
+            As soluções que não estão em memória são lidas dele e toda solução nova é
+            escrita nele. None mantém o cache só em memória.
+    """
+
+    def __init__(self, max_size: int = 128, path=None):
+        if max_size < 1:
+            raise ValueError(f"max_size deve ser >= 1, recebido {max_size}.")
+        self.max_size = int(max_size)
+        self.path = None if path is None else Path(path)
+        self._entries: "OrderedDict[str, Dict[str, object]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or (self.path is not None and self._file(key).exists())
+
+    def get(self, key: str, arrays: NetworkArrays) -> Optional[DispatchSolution]:
+        """
+        Solução guardada sob `key`, ligada a `arrays` (a rede compilada de que
+        a chave foi calculada), ou None. Os arrays da solução são somente
+        leitura: são compartilhados com o cache.
+        """
+        entry = self._entries.get(key)
+        if entry is None and self.path is not None:
+            entry = self._read(key)
+            if entry is not None:
+                self._insert(key, entry)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return DispatchSolution(arrays=arrays, **entry)
+
+    def put(self, key: str, solution: DispatchSolution) -> None:
+        """Guarda uma cópia da solução sob `key` (e a escreve em disco, se o cache tiver path)."""
+        entry = {}
+        for name in SOLUTION_FIELDS:
+            value = getattr(solution, name)
+            if isinstance(value, np.ndarray):
+                value = value.copy()
+                value.flags.writeable = False
+            entry[name] = value
+        self._insert(key, entry)
+        if self.path is not None:
+            try:
+                self._write(key, entry)
+            except OSError:
+                pass  # Cache em disco é só uma otimização (ex.: diretório somente leitura)
+
+    def clear(self) -> None:
+        """Esvazia o cache em memória (os arquivos em disco são mantidos)."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def _insert(self, key: str, entry: dict):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    # ----------------------------------------------------------------DISCO------------------------------------------------------------------------------------------------#
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.parquet"
+
+    def _write(self, key: str, entry: dict):
+        """Uma linha por solução: cada array vira uma coluna de lista (Parquet escrito em arquivo temporário e renomeado)."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = {"key": pa.array([key]), "version": pa.array([CACHE_VERSION], type=pa.int32())}
+        for name, value in entry.items():
+            if isinstance(value, np.ndarray):
+                columns[name] = pa.array([value], type=pa.list_(pa.from_numpy_dtype(value.dtype)))
+            else:
+                columns[name] = pa.array([value], type=pa.float64())
+        path = self._file(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        pq.write_table(pa.table(columns), tmp)
+        os.replace(tmp, path)
+
+    def _read(self, key: str) -> Optional[dict]:
+        path = self._file(key)
+        if not path.exists():
+            return None
+        import pyarrow.parquet as pq
+        try:
+            table = pq.read_table(path)
+            if table.column("version")[0].as_py() != CACHE_VERSION:
+                return None
+            entry = {}
+            for name in SOLUTION_FIELDS:
+                value = table.column(name)[0]
+                if name == "objective":
+                    entry[name] = value.as_py()
+                else:
+                    entry[name] = value.values.to_numpy(zero_copy_only=False)
+                    entry[name].flags.writeable = False
+            return entry
+        except (OSError, ValueError, KeyError):
+            return None  # Arquivo corrompido ou de outro formato: a solução é recalculada e sobrescrita
+
+    def __repr__(self):
+        where = "" if self.path is None else f", path='{self.path}'"
+        return f"SolutionCache(size={len(self)}/{self.max_size}, hits={self.hits}, misses={self.misses}{where})"
@@ -0,0 +1,397 @@
+"""
+Despacho DC estocástico de dois estágios sobre cenários de carga e vento.
+
+Primeiro estágio: a geração das térmicas (p_first), única para todos os
+cenários. Segundo estágio: em cada cenário s, com probabilidade π_s, a rede
+(ângulos e fluxos), o vento, o corte de carga e as baterias se ajustam à
+carga e à disponibilidade eólica do cenário (recurso). A forma extensiva é
+um único LP com as colunas e linhas do despacho de um período
+(build_dispatch_model) replicadas em blocos diagonais, como no despacho
+multiperíodo, ligadas por
+
+    nonanticipativity   p_s[térmica] - p_first == 0
+
+e com os custos de segundo estágio ponderados por π_s.
+
+Para muitos cenários, solve(method="benders") decompõe o problema
+(L-shaped multi-corte): o mestre tem p_first e uma variável θ_s por cenário,
+e cada cenário é um LP de um cenário com p_first fixado nos limites, cujo
+dual dá o corte θ_s >= Q_s(p̂) + g_s·(p_first - p̂). Os cenários inviáveis
+com p̂ (térmica acima da carga, por exemplo) dão cortes de viabilidade pela
+fase 1 do mesmo LP, com a não-antecipatividade elástica. Um único LPModel
+serve a todos os cenários, re-resolvido a quente com o HighsBackend. O
+backend padrão é o DEFAULT_BACKEND ("cbc"); para o Benders use backend="highs".
+"""
+from __future__ import annotations
+import numpy as np
+import pulp as pl
+from typing import Optional, Sequence, Union
+from power.electricity_models.network_models.network_arrays import NetworkArrays, GenKind
+from optimal_power_flow.linear_opf.lp_model import LPModel, MatrixProblem
+from optimal_power_flow.linear_opf.backends import SolverBackend, get_backend, DEFAULT_BACKEND
+from optimal_power_flow.linear_opf.dispatch_model import (build_dispatch_model, dispatchable, load_incidence,
+                                                          StorageArrays)
+from optimal_power_flow.linear_opf.multi_period import stacked_index, block_diagonal
+from optimal_power_flow.linear_opf.opf_loss import OptimizationError, ConvergenceError
+
+METHODS = ("extensive", "benders")
+
+
+def build_stochastic_model(arrays: NetworkArrays, load_pu: np.ndarray, p_max_pu: np.ndarray, probability: np.ndarray,
+                           storage: Optional[StorageArrays] = None, penalty: Optional[float] = None,
+                           name: str = "Stochastic_Dispatch") -> LPModel:
+    """
+    Builds the extensive form of the two-stage stochastic DC dispatch.
+
+    Args:
+        arrays: compiled network (the same network in every scenario).
+        load_pu: load of each scenario (S x n_load, pu).
+        p_max_pu: maximum generation of each scenario (S x n_gen, pu): wind availability.
+        probability: probability of each scenario (S).
+        storage: battery data; each scenario has its own battery dispatch.
+        penalty: if given, the nonanticipativity rows are elastic: columns
+            dev_up / dev_down (cost penalty · π_s) absorb p_s - p_first.
+
+    Column blocks: the blocks of build_dispatch_model stacked over the
+    scenarios (block-major: p[s, g] at s·n_gen + g), then "p_first" (thermal
+    units) and, with penalty, "dev_up" / "dev_down".
+    """
+    from scipy import sparse
+
+    load_pu, p_max_pu = np.atleast_2d(load_pu), np.atleast_2d(p_max_pu)
+    probability = np.asarray(probability, dtype=float)
+    S = len(probability)
+    if load_pu.shape != (S, arrays.n_load) or p_max_pu.shape != (S, arrays.n_gen):
+        raise ValueError(f"Expected load {(S, arrays.n_load)} and p_max {(S, arrays.n_gen)} arrays, "
+                         f"got {load_pu.shape} and {p_max_pu.shape}.")
+    base = build_dispatch_model(arrays, storage=storage, name=name)
+    gen_pos = dispatchable(arrays)
+    n_gen = len(gen_pos)
+    thermal = np.flatnonzero(arrays.gen_kind[gen_pos] == GenKind.THERMAL)   # Posição das térmicas no bloco p
+    n_th = len(thermal)
+    n_dev = S * n_th if penalty is not None else 0
+
+    # --- Cenários: blocos diagonais do modelo de um período, seguidos das colunas de primeiro estágio ---
+    col_sizes = {block: s.stop - s.start for block, s in base.columns.items()}
+    col_index, columns = stacked_index(col_sizes, S)
+    eq_index, eq_rows = stacked_index({block: s.stop - s.start for block, s in base.eq_rows.items()}, S)
+    ub_index, ub_rows = stacked_index({block: s.stop - s.start for block, s in base.ub_rows.items()}, S)
+    n_rec = col_index.size
+    columns["p_first"] = slice(n_rec, n_rec + n_th)
+    columns["dev_up"] = slice(n_rec + n_th, n_rec + n_th + n_dev)
+    columns["dev_down"] = slice(n_rec + n_th + n_dev, n_rec + n_th + 2 * n_dev)
+    n_col = columns["dev_down"].stop
+
+    c, lower, upper = np.zeros(n_col), np.zeros(n_col), np.full(n_col, np.inf)
+    c[col_index] = base.c[None, :] * probability[:, None]
+    lower[col_index], upper[col_index] = base.lower, base.upper
+    upper[columns["p"]] = p_max_pu[:, gen_pos].ravel()
+    upper[columns["shed"]] = load_pu.ravel()
+    p_rec = columns["p"].start + np.arange(S)[:, None] * n_gen + thermal     # Coluna p_s de cada térmica (S x n_th)
+    c[p_rec] = 0.0                                                           # O custo das térmicas é do primeiro estágio
+    c[columns["p_first"]] = base.c[base.columns["p"]][thermal]
+    lower[columns["p_first"]] = base.lower[base.columns["p"]][thermal]
+    upper[columns["p_first"]] = base.upper[base.columns["p"]][thermal]
+    if n_dev:
+        c[columns["dev_up"]] = c[columns["dev_down"]] = penalty * np.repeat(probability, n_th)
+
+    # --- Rede de cada cenário e não-antecipatividade ---
+    n_net = eq_index.size
+    A_net = block_diagonal(base.A_eq, eq_index, col_index, (n_net, n_col))
+    b_net = np.zeros(n_net)
+    b_net[eq_rows["balance"]] = (load_incidence(arrays) @ load_pu.T).T.ravel()
+    rows = np.arange(S * n_th)
+    entries = [(rows, p_rec.ravel(), np.ones(S * n_th)),
+               (rows, columns["p_first"].start + np.tile(np.arange(n_th), S), -np.ones(S * n_th))]
+    if n_dev:
+        entries += [(rows, columns["dev_up"].start + rows, -np.ones(n_dev)),
+                    (rows, columns["dev_down"].start + rows, np.ones(n_dev))]
+    r, k, v = (np.concatenate([e[i] for e in entries]) for i in range(3))
+    A_na = sparse.csr_matrix((v, (r, k)), shape=(S * n_th, n_col))
+    A_eq = sparse.vstack([A_net, A_na], format="csr")
+    b_eq = np.concatenate([b_net, np.zeros(S * n_th)])
+    eq_rows["nonanticipativity"] = slice(n_net, n_net + S * n_th)
+
+    # --- Estado de carga das baterias de cada cenário ---
+    A_ub = block_diagonal(base.A_ub, ub_index, col_index, (ub_index.size, n_col))
+    b_ub = np.empty(ub_index.size)
+    b_ub[ub_index] = base.b_ub
+
+    th_ids = arrays.gen_id[gen_pos[thermal]]
+    ids = {block: np.tile(v, S) for block, v in base.ids.items()}
+    ids.update({"p_first": th_ids, "dev_up": np.tile(th_ids, S)[:n_dev], "dev_down": np.tile(th_ids, S)[:n_dev],
+                "nonanticipativity": np.tile(th_ids, S)})
+    return LPModel(c=c, A_eq=A_eq, b_eq=b_eq, A_ub=A_ub, b_ub=b_ub, lower=lower, upper=upper,
+                   columns=columns, eq_rows=eq_rows, ub_rows=ub_rows, ids=ids, name=name)
+
+
+class StochasticDispatch:
+    """
+    Despacho econômico DC estocástico de dois estágios (ver
+    build_stochastic_model): a geração térmica é decidida antes de conhecer
+    o cenário e o vento, o corte de carga e as baterias são o recurso de
+    cada cenário. Substitui os despachos independentes por cenário, cujos
+    resultados eram apenas promediados.
+
+    Args:
+        net: rede base (Network).
+        scenarios: redes de cada cenário (Scenario sobre net, ou Network com a
+            mesma topologia e reatâncias); só cargas e disponibilidade eólica
+            podem mudar entre eles.
+        probabilities: probabilidade de cada cenário (padrão: uniforme); são normalizadas.
+        backend: solver do LP (ver LinearDispatch); padrão DEFAULT_BACKEND ("cbc").
+            Para method="benders" use o "highs" (ou o "linprog"): com o CBC o
+            Benders pode não fechar o gap (ex.: IEEE118EOL, ver _solve_benders).
+    """
+
+    def __init__(self, net, scenarios: Sequence, probabilities: Optional[Sequence[float]] = None,
+                 backend: Union[str, SolverBackend, None] = None):
+        if not len(scenarios):
+            raise ValueError("O despacho estocástico precisa de pelo menos um cenário.")
+        self.net = net
+        self.scenarios = list(scenarios)
+        self.backend = get_backend(DEFAULT_BACKEND if backend is None else backend)
+        self.arrays = net.compile()
+        arrays = self.arrays
+        compiled = [s.compile() for s in self.scenarios]
+        for s, a in zip(self.scenarios, compiled):
+            if (a.n_bus != arrays.n_bus or a.n_load != arrays.n_load or a.n_gen != arrays.n_gen
+                    or not np.array_equal(a.line_id, arrays.line_id) or not np.allclose(a.line_x_pu, arrays.line_x_pu)):
+                raise ValueError(f"O cenário '{getattr(s, 'name', s)}' não tem a mesma rede que '{net.name}': "
+                                 f"só cargas e disponibilidade eólica podem mudar entre cenários.")
+        self.load_pu = np.array([a.load_p_pu for a in compiled])
+        self.p_max_pu = np.array([a.gen_p_max_pu for a in compiled])
+        S = len(compiled)
+        p = np.full(S, 1.0 / S) if probabilities is None else np.asarray(probabilities, dtype=float)
+        if p.shape != (S,) or np.any(p <= 0):
+            raise ValueError(f"Esperadas {S} probabilidades positivas, recebido {probabilities}.")
+        self.probability = p / p.sum()
+        self.storage = StorageArrays.from_network(net, arrays)
+        self.model = None
+        self.problem = None
+        self.method = None
+        self.solver_iterations = []
+        self.benders_iterations = 0
+        self.gap = None
+
+    @property
+    def n_scenarios(self) -> int:
+        return len(self.probability)
+
+    # ----------------------------------------------------------------SOLVING----------------------------------------------------------------------------------------------#
+    def solve(self, method: str = "extensive", tol: float = 1e-6, iter_max: int = 200, verbose: bool = False) -> dict:
+        """
+        Resolve o despacho estocástico.
+
+        Args:
+            method: "extensive" (um LP com todos os cenários) ou "benders"
+                (decomposição L-shaped multi-corte, para muitos cenários).
+            tol: gap relativo entre os limites superior e inferior do Benders.
+            iter_max: iterações máximas do Benders.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Método desconhecido '{method}'. Opções: {METHODS}.")
+        self.method, self.solver_iterations, self.benders_iterations, self.gap = method, [], 0, None
+        if method == "extensive":
+            self.model = build_stochastic_model(self.arrays, self.load_pu, self.p_max_pu, self.probability,
+                                                storage=self.storage)
+            self.problem = MatrixProblem(self.model)
+            self.problem.solve(self.backend)
+            self.solver_iterations.append(self.problem.solution.iterations)
+            if self.problem.status != pl.LpStatusOptimal:
+                raise OptimizationError(f"Solução ótima não encontrada no despacho estocástico. "
+                                        f"Status: {pl.LpStatus[self.problem.status]}")
+            values = self._values(self.model, self.problem.solution, np.arange(self.n_scenarios), self.probability)
+        else:
+            values = self._solve_benders(tol, iter_max)
+        results = self._frames(values)
+        if verbose:
+            self._print(results)
+        return results
+
+    def _set_scenario(self, model: LPModel, s: int, p_first: np.ndarray):
+        """Carga e vento do cenário s e p_first fixado em p_first no subproblema."""
+        gen_pos = dispatchable(self.arrays)
+        model.upper[model.columns["p"]] = self.p_max_pu[s, gen_pos]
+        model.upper[model.columns["shed"]] = self.load_pu[s]
+        model.b_eq[model.eq_rows["balance"]] = load_incidence(self.arrays) @ self.load_pu[s]
+        model.lower[model.columns["p_first"]] = model.upper[model.columns["p_first"]] = p_first
+
+    def _set_phase(self, model: LPModel, cost: np.ndarray, dev: np.ndarray, elastic: bool):
+        """Subproblema de recurso (desvios fixos em zero) ou de fase 1 (custo = soma dos desvios)."""
+        model.c = dev.astype(float) if elastic else cost
+        model.upper[dev] = np.inf if elastic else 0.0
+
+    def _solve_benders(self, tol: float, iter_max: int) -> dict:
+        """
+        L-shaped multi-corte. O mestre minimiza c·p_first + Σ π_s θ_s sujeito a
+        cortes de otimalidade g_s·p_first - θ_s <= g_s·p̂ - Q_s(p̂), com g_s a
+        sensibilidade do custo do cenário s aos limites fixados de p_first.
+        Quando o cenário é inviável com p̂, o mesmo LP é re-resolvido como
+        fase 1 (desvios da não-antecipatividade livres, custo = soma dos
+        desvios w_s) e entra o corte de viabilidade g_s·p_first <= g_s·p̂ - w_s(p̂).
+        O limite superior só é atualizado por p̂ viável em todos os cenários.
+        Com backend="cbc" o mestre volta arredondado pelo arquivo de solução
+        do PuLP e um p̂ inviável por ~1e-7 pode se repetir sem fechar o gap:
+        use o "highs" ou o "linprog".
+        """
+        from scipy import sparse
+
+        S = self.n_scenarios
+        # Um único LP de um cenário serve a todos (só limites, custos e lado direito mudam)
+        sub = build_stochastic_model(self.arrays, self.load_pu[:1], self.p_max_pu[:1], np.ones(1),
+                                     storage=self.storage, penalty=0.0, name="Stochastic_Subproblem")
+        first = sub.columns["p_first"]
+        sub.c[first] = 0.0
+        cost = sub.c.copy()
+        dev = np.zeros(sub.n_cols, dtype=bool)
+        dev[sub.columns["dev_up"]] = dev[sub.columns["dev_down"]] = True
+        n_th = first.stop - first.start
+        p_lower, p_upper = sub.lower[first].copy(), sub.upper[first].copy()
+        cost_first = self._first_stage_cost()
+
+        # Limite inferior de cada Q_s: todas as colunas de recurso no limite mais barato
+        self._set_phase(sub, cost, dev, elastic=False)
+        recourse = np.ones(sub.n_cols, dtype=bool)
+        recourse[first] = False
+        theta_lower = []
+        for s in range(S):
+            self._set_scenario(sub, s, p_lower)
+            lo, up, c = sub.lower[recourse], sub.upper[recourse], sub.c[recourse]
+            theta_lower.append(float(np.sum(np.where(c > 0, c * lo, np.where(c < 0, c * up, 0.0)))))
+
+        master = LPModel(c=np.concatenate([cost_first, self.probability]),
+                         A_eq=sparse.csr_matrix((0, n_th + S)), b_eq=np.zeros(0),
+                         A_ub=sparse.csr_matrix((0, n_th + S)), b_ub=np.zeros(0),
+                         lower=np.concatenate([p_lower, theta_lower]), upper=np.concatenate([p_upper, np.full(S, np.inf)]),
+                         columns={"p_first": slice(0, n_th), "theta": slice(n_th, n_th + S)},
+                         ids={"p_first": sub.ids["p_first"], "theta": np.arange(S)}, name="Benders_Master")
+        # Mestre e subproblema em instâncias separadas do backend para que ambos re-resolvam a quente
+        master_backend = get_backend(self.backend.name)
+        master_problem = MatrixProblem(master)
+
+        p_hat, best, upper_bound = p_lower.copy(), None, np.inf
+        for it in range(1, iter_max + 1):
+            rows, rhs, cut_ids, solutions = [], [], [], []
+            for s in range(S):
+                self._set_scenario(sub, s, p_hat)
+                sol = self.backend.solve(sub)
+                self.solver_iterations.append(sol.iterations)
+                feasible = sol.optimal
+                if not feasible:
+                    self._set_phase(sub, cost, dev, elastic=True)
+                    sol = self.backend.solve(sub)
+                    self.solver_iterations.append(sol.iterations)
+                    self._set_phase(sub, cost, dev, elastic=False)
+                    if not sol.optimal:
+                        raise OptimizationError(f"Subproblema do cenário {s} sem solução ótima (iteração {it}). "
+                                                f"Status: {pl.LpStatus[sol.status]}")
+                # Corte de otimalidade (com θ_s) ou de viabilidade (sem θ_s)
+                g = sol.lower_dual[first] + sol.upper_dual[first]
+                theta = np.zeros(S)
+                theta[s] = -1.0 if feasible else 0.0
+                rows.append(np.concatenate([g, theta]))
+                rhs.append(g @ p_hat - sol.objective)
+                cut_ids.append(s)
+                solutions.append(sol if feasible else None)
+            if all(sol is not None for sol in solutions):
+                value = float(cost_first @ p_hat + self.probability @ [sol.objective for sol in solutions])
+                if value < upper_bound:
+                    upper_bound, best = value, (p_hat.copy(), solutions)
+
+            master.add_ub_rows("cut", np.array(rows), np.array(rhs), np.array(cut_ids))
+            master_problem.solve(master_backend)
+            self.solver_iterations.append(master_problem.solution.iterations)
+            if master_problem.status != pl.LpStatusOptimal:
+                raise OptimizationError(f"Mestre do Benders sem solução ótima (iteração {it}): os cenários não são "
+                                        f"viáveis com uma geração térmica comum. "
+                                        f"Status: {pl.LpStatus[master_problem.status]}")
+            lower_bound = master_problem.solution.objective
+            self.benders_iterations = it
+            self.gap = (upper_bound - lower_bound) / max(1.0, abs(upper_bound))
+            if self.gap <= tol:
+                break
+            p_hat = master_problem.solution.x[master.columns["p_first"]]
+        else:
+            raise ConvergenceError(f"Benders não convergiu após {iter_max} iterações (gap {self.gap:.2e}).")
+
+        solutions = best[1]
+        self.model, self.problem = master, master_problem
+        values = [self._values(sub, sol, np.array([s]), np.ones(1)) for s, sol in enumerate(solutions)]
+        out = {key: np.concatenate([v[key] for v in values]) for key in values[0] if key != "Thermal_Schedule"}
+        out["Thermal_Schedule"] = values[0]["Thermal_Schedule"]
+        return out
+
+    def _thermal(self) -> np.ndarray:
+        """Posições das térmicas no bloco p."""
+        return np.flatnonzero(self.arrays.gen_kind[dispatchable(self.arrays)] == GenKind.THERMAL)
+
+    def _first_stage_cost(self) -> np.ndarray:
+        """Custo (pu) da geração de cada térmica, na ordem de p_first."""
+        return self.arrays.gen_cost_b_pu[dispatchable(self.arrays)][self._thermal()]
+
+    def _print(self, results: dict):
+        print("FOB (custo esperado): {:.4f}".format(results["FOB_Value"]))
+        print("Cenários: {} | Método: {} | Iterações do simplex: {}".format(
+            self.n_scenarios, self.method, sum(self.solver_iterations)))
+        if self.method == "benders":
+            print("Iterações do Benders: {} | Gap: {:.2e}".format(self.benders_iterations, self.gap))
+        print(results["Resumo"])
+
+    # ----------------------------------------------------------------RESULTS----------------------------------------------------------------------------------------------#
+    def _values(self, model: LPModel, sol, scenarios: np.ndarray, weight: np.ndarray) -> dict:
+        """
+        Resultados dos cenários `scenarios` do modelo resolvido como arrays
+        cenários x elementos (MW e preços); `weight` é o peso de cada cenário
+        nos custos do modelo (π_s na forma extensiva, 1 no subproblema).
+        """
+        arrays = self.arrays
+        S, sb, x = len(scenarios), arrays.sb_mva, sol.x
+        block = lambda name: x[model.columns[name]].reshape(S, -1)
+        gen_pos = dispatchable(arrays)
+        wind = arrays.gen_kind[gen_pos] == GenKind.WIND
+        p = block("p") * sb
+        curtailment = self.p_max_pu[scenarios][:, gen_pos][:, wind] * sb - p[:, wind]
+        shed = block("shed") * sb
+        p_first = x[model.columns["p_first"]]
+        # Custo de cada cenário: primeiro estágio + recurso (sem a ponderação por π_s)
+        recourse = sum((model.c[s] * x[s]).reshape(S, -1).sum(axis=1) for b, s in model.columns.items()
+                       if s.stop > s.start and b not in ("p_first", "dev_up", "dev_down")) / weight
+        first_cost = float(self._first_stage_cost() @ p_first)
+        return {
+            "Thermal_Schedule": p_first * sb,
+            "Wind_Generation": p[:, wind],
+            "Wind_Curtailment": curtailment,
+            "Battery_P_Out": block("p_out") * sb,
+            "Battery_P_In": block("p_in") * sb,
+            "Load_Shed": shed,
+            "LMP": sol.eq_dual[model.eq_rows["balance"]].reshape(S, arrays.n_bus) / weight[:, None],
+            "Resumo": np.column_stack([recourse + first_cost, curtailment.sum(axis=1), shed.sum(axis=1)]),
+        }
+
+    def _frames(self, values: dict) -> dict:
+        """DataFrames dos resultados: linhas = cenários, colunas = nomes dos elementos."""
+        import pandas as pd   # Importado só na extração, como no LinearDispatch
+
+        arrays = self.arrays
+        index = pd.Index([getattr(s, "name", str(k)) for k, s in enumerate(self.scenarios)], name="Scenario")
+        gens, gen_idx = self.net.generators, self.net.gen_idx
+        names = lambda ids: np.array([gens[gen_idx[int(i)]].name for i in ids], dtype=object)
+        gen_pos = dispatchable(arrays)
+        gen_names = names(arrays.gen_id[gen_pos])
+        bat_names = names(arrays.gen_id[self.storage.gen_pos])
+        columns = {
+            "Wind_Generation": gen_names[arrays.gen_kind[gen_pos] == GenKind.WIND],
+            "Battery_P_Out": bat_names, "Battery_P_In": bat_names,
+            "Load_Shed": [l.name for l in self.net.loads],
+            "LMP": [b.name for b in self.net.buses],
+            "Resumo": ["Total_Cost_System", "Total_Curtailment_MW", "Total_Shed_MW"],
+        }
+        columns["Wind_Curtailment"] = columns["Wind_Generation"]
+        results = {key: pd.DataFrame(v, index=index, columns=columns[key])
+                   for key, v in values.items() if key != "Thermal_Schedule"}
+        results["Resumo"]["Probability"] = self.probability
+        results["Thermal_Schedule"] = pd.Series(values["Thermal_Schedule"], index=gen_names[self._thermal()],
+                                                name="P_MW")
+        results["FOB_Value"] = float(self.probability @ values["Resumo"][:, 0])
+        return results
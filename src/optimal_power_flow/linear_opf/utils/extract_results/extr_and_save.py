@@ -1,22 +1,20 @@
 import pulp as pl
 import numpy as np
 import json
-from power import Network
-from power import WindGenerator
-
-def extract_and_save_results(problem: pl.LpProblem, net: Network, output_filename: str = None) -> dict:
+def extract_and_save_results(solver, output_filename: str = None) -> dict:
     """
     Extrai as variáveis primais e duais de um problema de otimização resolvido,
     estrutura os resultados e os exporta para um arquivo JSON.
 
     Args:
-        problem (pl.LpProblem): O objeto do problema PuLP já resolvido.
-        net (object): O objeto da rede contendo as listas de 'buses' e 'lines'.
+        solver (LinearDispatch): O solver já resolvido, que guarda as variáveis e as perdas.
         output_filename (str): O nome do arquivo para salvar os resultados em JSON.
 
     Returns:
         dict
     """
+    problem, net = solver.problem, solver.net
+
     # 1. Verifica o status do solver antes de prosseguir
     if problem.status != pl.LpStatusOptimal:
         print(f"\n[AVISO] A solução não é ótima ({pl.LpStatus[problem.status]}). Nenhum resultado será extraído.")
@@ -25,20 +23,20 @@ def extract_and_save_results(problem: pl.LpProblem, net: Network, output_filenam
     # --- Extração das Variáveis Primais ---
     try:
         primal_results = {
-            'geracao_pu': {gen.id: gen.p_var.value() for gen in net.generators},
-            'corte_carga_pu': {load.id: load.p_shed_var.value() for load in net.loads if hasattr(load, 'p_shed_var')},
-            'thetas_deg': {bus.id: np.rad2deg(bus.theta_var.value()) for bus in net.buses},
-            'fluxo_pu': {line.id: line.flow_var.value() for line in net.lines}
+            'geracao_pu': {gen_id: p_var.value() for gen_id, p_var in solver.p_var.items()},
+            'corte_carga_pu': {load_id: p_shed_var.value() for load_id, p_shed_var in solver.p_shed_var.items()},
+            'thetas_deg': {bus_id: np.rad2deg(theta_var.value()) for bus_id, theta_var in solver.theta_var.items()},
+            'fluxo_pu': {line_id: flow_var.value() for line_id, flow_var in solver.flow_var.items()}
         }
-    except AttributeError as e:
-        print(f"[ERRO] Falha ao extrair variáveis primais. Verifique os nomes dos atributos (ex: p_var, theta_var): {e}")
+    except (AttributeError, TypeError) as e:
+        print(f"[ERRO] Falha ao extrair variáveis primais. Verifique se o solver foi resolvido: {e}")
         return None
     
     # ----- Sumário de Cargas e Perdas --------
     try:
-        total_load_pu = sum(load.p_pu for load in net.loads)
-        total_loss_pu = sum(bus.loss for bus in net.buses if hasattr(bus, "loss"))
-        total_shed_pu = sum(l.p_shed_var.value() for l in net.loads if hasattr(l, 'p_shed_var'))
+        total_load_pu = sum(net.load_p_pu(load) for load in net.loads)
+        total_loss_pu = float(solver.bus_loss.sum())
+        total_shed_pu = sum(p_shed_var.value() for p_shed_var in solver.p_shed_var.values())
         loss_summary = {
             # Valores totais do sistema
             'carga_total_pu': total_load_pu,
@@ -46,19 +44,19 @@ def extract_and_save_results(problem: pl.LpProblem, net: Network, output_filenam
             'corte_total_pu'  : total_shed_pu,
             # Valores individuais
             'cargas_individuais_pu': {
-                load.id: load.p_pu for load in net.loads
+                load.id: net.load_p_pu(load) for load in net.loads
             },
             'perdas_por_barra_pu': {
-                bus.id: bus.loss for bus in net.buses if hasattr(bus, 'loss')
+                bus.id: loss for bus, loss in zip(net.buses, solver.bus_loss)
             },
         }
 
         curtailment_individual = {}
         total_curtailment = 0
-        for g in net.generators:
-            if isinstance(g, WindGenerator):
-                disponivel = g.p_max_pu
-                despachado = g.p_var.value()
+        for g in net.wind_generators:
+            if g.id in solver.p_var:
+                disponivel = net.gen_p_max_pu(g)
+                despachado = solver.p_var[g.id].value()
                 curtailment = disponivel - despachado
                 if curtailment > 1e-6:
                     curtailment_individual[g.id] = {
@@ -75,13 +73,13 @@ def extract_and_save_results(problem: pl.LpProblem, net: Network, output_filenam
         shedding_individual = {}
         total_shedding = 0
         for l in net.loads:
-            if hasattr(l, 'p_shed_var'):
-                shed_amount = l.p_shed_var.value()
+            if l.id in solver.p_shed_var:
+                shed_amount = solver.p_shed_var[l.id].value()
                 if shed_amount > 1e-6: # Apenas registra se for significativo
                     shedding_individual[l.id] = {
-                        "demanda_nominal_pu": l.p_pu,
+                        "demanda_nominal_pu": net.load_p_pu(l),
                         "carga_cortada_pu": shed_amount,
-                        "carga_atendida_pu": l.p_pu - shed_amount
+                        "carga_atendida_pu": net.load_p_pu(l) - shed_amount
                     }
                     total_shedding += shed_amount
         shedding_summary = {
@@ -118,14 +116,14 @@ def extract_and_save_results(problem: pl.LpProblem, net: Network, output_filenam
                 # Para restrições >=, o lambda é pi
                 'limite_inferior': get_dual(f'Constraint_Flow_{line.id}_Lower')
             }
-            for line in net.lines
+            for line in solver.lines
         },
         'limites_de_geracao': {
             gen.id: {
                 'limite_superior': get_dual(f'Constraint_P{gen.id}_Upper', multiplier=-1),
                 'limite_inferior': get_dual(f'Constraint_P{gen.id}_Lower')
             }
-            for gen in net.generators
+            for gen in net.generators if gen.id in solver.p_var
         }
     }
     
@@ -6,7 +6,6 @@ from .extract_primal import extract_primal
 from .extract_loads import extract_loads
 from .extract_dual import extract_dual
 
-from power import Network
 import numpy as np
 import pulp as pl
 import json
@@ -21,31 +20,33 @@ class NpEncoder(json.JSONEncoder):
         return super(NpEncoder, self).default(obj)
 
 
-def extract_all(problem: pl.LpProblem, net: Network, output_filename: str = None) -> dict:
+def extract_all(solver, output_filename: str = None) -> dict:
     """
     Orquestra a extração de todos os resultados da simulação chamando funções especialistas.
 
     Args:
-        problem (pl.LpProblem): O objeto do problema PuLP já resolvido.
-        net (Network): O objeto da rede contendo o estado da solução.
+        solver (LinearDispatch): O solver já resolvido. As variáveis e perdas são lidas
+            do próprio solver (solver.p_var, solver.bus_loss, ...), não dos elementos da rede.
         output_filename (str, optional): Se fornecido, salva os resultados em um arquivo JSON.
 
     Returns:
         dict: Um dicionário completo com todos os resultados, ou None se a solução não for ótima.
     """
+    problem = solver.problem
+
     # 1. Verificação de Status: Garante que só prosseguimos com uma solução válida.
     if problem.status != pl.LpStatusOptimal:
         print(f"\n[AVISO] A solução não é ótima ({pl.LpStatus[problem.status]}). Nenhum resultado será extraído.")
         return None
 
     # 2. Delegação: Chama cada função "trabalhadora" para fazer sua parte.
-    system_summary = extract_summary(net, problem)
-    primal_results = extract_primal(net)
-    dual_results = extract_dual(problem, net)
-    load_details = extract_loads(net)
-    loss_details = extract_losses(net)
-    curtailment_details = extract_curtailment(net)
-    shedding_details = extract_shedding(net)
+    system_summary = extract_summary(solver)
+    primal_results = extract_primal(solver)
+    dual_results = extract_dual(solver)
+    load_details = extract_loads(solver)
+    loss_details = extract_losses(solver)
+    curtailment_details = extract_curtailment(solver)
+    shedding_details = extract_shedding(solver)
 
     # 3. Validação: Checa se alguma das extrações essenciais falhou.
     essential_results = [system_summary, primal_results, dual_results]
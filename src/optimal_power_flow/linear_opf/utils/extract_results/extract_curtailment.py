@@ -1,6 +1,4 @@
-from power import Network, WindGenerator
-
-def extract_curtailment(net: Network) -> dict:
+def extract_curtailment(solver) -> dict:
     """
     Cria um sumário detalhado do curtailment dos geradores eólicos em MEGAWATTS (MW).
 
@@ -8,24 +6,25 @@ def extract_curtailment(net: Network) -> dict:
     para cada gerador eólico, além do total do sistema, tudo em MW.
 
     Args:
-        net (Network): O objeto da rede já resolvido.
+        solver (LinearDispatch): O solver já resolvido.
 
     Returns:
         dict: Um dicionário contendo o curtailment total e os detalhes por gerador em MW.
     """
+    net = solver.net
     try:
         # 1. Pega a base de potência do sistema (ex: 100 MVA) para a conversão.
-        power_base = net.sb
+        power_base = net.sb_mva
 
         # 2. Filtra a lista para pegar apenas os geradores eólicos que tiveram curtailment.
         #    A lógica de comparação continua em p.u., pois é mais estável.
         curtailed_gens = [
-            g for g in net.generators 
-            if isinstance(g, WindGenerator) and (g.p_max_pu - g.p_var.value()) > 1e-6
+            (g, net.gen_p_max_pu(g), solver.p_var[g.id].value()) for g in net.wind_generators
+            if (net.gen_p_max_pu(g) - solver.p_var[g.id].value()) > 1e-6
         ]
 
         # 3. Calcula o total de curtailment em p.u. primeiro.
-        total_curtailment_pu = sum(g.p_max_pu - g.p_var.value() for g in curtailed_gens)
+        total_curtailment_pu = sum(p_max - p for _, p_max, p in curtailed_gens)
         
         # 4. Monta o dicionário de retorno, convertendo todos os valores para MW.
         curtailment_summary = {
@@ -33,11 +32,11 @@ def extract_curtailment(net: Network) -> dict:
             "curtailment_por_gerador": {
                 g.id: {
                     # As chaves agora refletem a nova unidade (MW)
-                    "disponivel_mw": g.p_max_pu * power_base,
-                    "despachado_mw": g.p_var.value() * power_base,
-                    "curtailment_mw": (g.p_max_pu - g.p_var.value()) * power_base
+                    "disponivel_mw": p_max * power_base,
+                    "despachado_mw": p * power_base,
+                    "curtailment_mw": (p_max - p) * power_base
                 }
-                for g in curtailed_gens
+                for g, p_max, p in curtailed_gens
             }
         }
         
@@ -1,22 +1,21 @@
-from power import Network
-
-def extract_loads(net: Network) -> dict:
+def extract_loads(solver) -> dict:
     """
     Cria um sumário detalhado com a demanda nominal de cada carga em MW.
 
     Args:
-        net (Network): O objeto da rede.
+        solver (LinearDispatch): O solver cuja rede (ou cenário) foi resolvida.
 
     Returns:
         dict: Um dicionário contendo as cargas individuais do sistema em MW.
     """
+    net = solver.net
     try:
-        power_base = net.sb
+        power_base = net.sb_mva
 
         # A chave principal 'cargas_individuais_mw' já descreve o conteúdo
         return {
             'cargas_individuais_mw': {
-                load.id: load.p_pu * power_base
+                load.id: net.load_p_pu(load) * power_base
                 for load in net.loads
             }
         }
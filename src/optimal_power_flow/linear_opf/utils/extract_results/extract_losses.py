@@ -1,6 +1,4 @@
-from power import Network
-
-def extract_losses(net: Network) -> dict:
+def extract_losses(solver) -> dict:
     """
     Cria um sumário detalhado das perdas do sistema em MEGAWATTS (MW).
 
@@ -8,18 +6,19 @@ def extract_losses(net: Network) -> dict:
     de perdas por barra.
 
     Args:
-        net (Network): O objeto da rede já resolvido.
+        solver (LinearDispatch): O solver já resolvido (as perdas ficam em solver.line_loss e solver.bus_loss).
 
     Returns:
         dict: Um dicionário contendo os detalhes das perdas em MW.
     """
+    net = solver.net
     try:
         # 1. Pega a base de potência do sistema (ex: 100 MVA) para a conversão.
-        power_base = net.sb
+        power_base = net.sb_mva
 
         # 2. Calcula o total de perdas a partir da soma das perdas das linhas.
         #    Isso evita contar em dobro, já que as perdas das barras são a soma de metades das perdas das linhas.
-        total_loss_pu = sum(l.loss for l in net.lines if hasattr(l, 'loss'))
+        total_loss_pu = float(solver.line_loss.sum())
 
         # 3. Monta o dicionário de retorno, convertendo todos os valores para MW.
         loss_summary = {
@@ -28,14 +27,14 @@ def extract_losses(net: Network) -> dict:
             
             # O detalhamento de perdas em cada linha
             "perdas_por_linha_mw": {
-                l.id: l.loss * power_base
-                for l in net.lines if hasattr(l, 'loss') and l.loss > 1e-9 # Filtra valores insignificantes
+                l.id: loss * power_base
+                for l, loss in zip(solver.lines, solver.line_loss) if loss > 1e-9 # Filtra valores insignificantes
             },
             
             # O detalhamento da alocação de perdas em cada barra
             "perdas_por_barra_mw": {
-                b.id: b.loss * power_base
-                for b in net.buses if hasattr(b, 'loss') and b.loss > 1e-9 # Filtra valores insignificantes
+                b.id: loss * power_base
+                for b, loss in zip(net.buses, solver.bus_loss) if loss > 1e-9 # Filtra valores insignificantes
             }
         }
         
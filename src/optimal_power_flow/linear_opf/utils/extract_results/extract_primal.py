@@ -1,34 +1,25 @@
-from power import Network
 import numpy as np
 
-def extract_primal(net: Network) -> dict:
+def extract_primal(solver) -> dict:
     """
     Extrai os valores das variáveis primais do problema resolvido e os converte
-    para unidades físicas (MW, MVA, graus).
+    para unidades físicas (MW, MVA, graus), a partir dos arrays da solução
+    (solver.dispatch_solution()).
     """
     try:
+        sol = solver.dispatch_solution()
+        arrays = sol.arrays
         # Pega a base de potência do sistema (ex: 100 MVA) para a conversão
-        power_base = net.sb
+        power_base = arrays.sb_mva
 
         return {
             # As chaves agora refletem as novas unidades
-            'geracao_mw': {
-                gen.id: gen.p_var.value() * power_base 
-                for gen in net.generators
-            },
-            'corte_carga_mw': {
-                load.id: load.p_shed_var.value() * power_base 
-                for load in net.loads if hasattr(load, 'p_shed_var')
-            },
-            'thetas_deg': {
-                bus.id: np.rad2deg(bus.theta_var.value()) 
-                for bus in net.buses
-            },
-            'fluxo_mva': { # Fluxo de potência é tipicamente em MVA
-                line.id: line.flow_var.value() * power_base 
-                for line in net.lines
-            }
+            'geracao_mw': dict(zip(arrays.gen_id[sol.gen_pos].tolist(), (sol.p_pu * power_base).tolist())),
+            'corte_carga_mw': dict(zip(arrays.load_id.tolist(), (sol.shed_pu * power_base).tolist())),
+            'thetas_deg': dict(zip(arrays.bus_id.tolist(), np.rad2deg(sol.theta_rad).tolist())),
+            # Fluxo de potência é tipicamente em MVA
+            'fluxo_mva': dict(zip(arrays.line_id.tolist(), (sol.flow_pu * power_base).tolist()))
         }
     except AttributeError as e:
         print(f"[ERRO] Falha ao extrair variáveis primais: {e}")
-        return None
\ No newline at end of file
+        return None
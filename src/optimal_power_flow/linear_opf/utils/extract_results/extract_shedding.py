@@ -1,6 +1,4 @@
-from power import Network
-
-def extract_shedding(net: Network) -> dict:
+def extract_shedding(solver) -> dict:
     """
     Cria um sumário detalhado do corte de carga do sistema em MEGAWATTS (MW).
 
@@ -8,24 +6,25 @@ def extract_shedding(net: Network) -> dict:
     demanda nominal, o valor cortado e a demanda efetivamente atendida.
 
     Args:
-        net (Network): O objeto da rede já com os resultados da otimização.
+        solver (LinearDispatch): O solver já com os resultados da otimização.
 
     Returns:
         dict: Um dicionário contendo os detalhes de corte de carga em MW.
     """
+    net = solver.net
     try:
         # 1. Pega a base de potência do sistema (ex: 100 MVA) para a conversão.
-        power_base = net.sb
+        power_base = net.sb_mva
 
         # 2. Filtra a lista para pegar apenas as cargas que tiveram um corte significativo.
         #    Isso evita poluir o resultado com valores muito pequenos (ruído numérico).
         shed_loads = [
-            l for l in net.loads 
-            if hasattr(l, 'p_shed_var') and l.p_shed_var.value() > 1e-6
+            (l, net.load_p_pu(l), solver.p_shed_var[l.id].value()) for l in net.loads
+            if l.id in solver.p_shed_var and solver.p_shed_var[l.id].value() > 1e-6
         ]
 
         # 3. Calcula o total de corte de carga em p.u. a partir da lista filtrada.
-        total_shedding_pu = sum(l.p_shed_var.value() for l in shed_loads)
+        total_shedding_pu = sum(shed for _, _, shed in shed_loads)
         
         # 4. Monta o dicionário de retorno, convertendo todos os valores para MW.
         shedding_summary = {
@@ -33,11 +32,11 @@ def extract_shedding(net: Network) -> dict:
             "corte_por_carga_mw": {
                 l.id: {
                     # As chaves agora refletem a unidade (MW)
-                    "demanda_nominal_mw": l.p_pu * power_base,
-                    "carga_cortada_mw": l.p_shed_var.value() * power_base,
-                    "carga_atendida_mw": (l.p_pu - l.p_shed_var.value()) * power_base
+                    "demanda_nominal_mw": p * power_base,
+                    "carga_cortada_mw": shed * power_base,
+                    "carga_atendida_mw": (p - shed) * power_base
                 }
-                for l in shed_loads
+                for l, p, shed in shed_loads
             }
         }
         
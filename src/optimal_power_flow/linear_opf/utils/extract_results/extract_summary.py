@@ -1,20 +1,20 @@
-from power import Network
 import pulp as pl
 
-def extract_summary(net: Network, problem: pl.LpProblem) -> dict:
+def extract_summary(solver) -> dict:
     """
     Cria um sumário de alto nível com os totais do sistema em MW.
     Inclui o status do solver e o valor final da função objetivo.
     """
+    net, problem = solver.net, solver.problem
     try:
         # 1. Pega a base de potência do sistema (ex: 100 MVA)
-        power_base = net.sb
+        power_base = net.sb_mva
 
         # 2. Calcula todos os totais em p.u. primeiro
-        total_generation_pu = sum(g.p_var.value() for g in net.generators)
-        total_load_pu = sum(l.p_pu for l in net.loads)
-        total_loss_pu = sum(b.loss for b in net.buses if hasattr(b, "loss"))
-        total_shedding_pu = sum(l.p_shed_var.value() for l in net.loads if hasattr(l, 'p_shed_var'))
+        total_generation_pu = sum(p_var.value() for p_var in solver.p_var.values())
+        total_load_pu = sum(net.load_p_pu(l) for l in net.loads)
+        total_loss_pu = float(solver.bus_loss.sum())
+        total_shedding_pu = sum(p_shed_var.value() for p_shed_var in solver.p_shed_var.values())
 
         # 3. Faz a verificação do balanço ainda em p.u.
         balance_check_pu = (total_generation_pu + total_shedding_pu) - (total_load_pu + total_loss_pu)
@@ -3,11 +3,16 @@ import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Optional
 from abc import ABC, abstractmethod
+from power.electricity_models.injection_field import data_fields
 
-@dataclass 
+@data_fields(id="id")   # O id das barras é guardado na tabela da rede e compilado em NetworkArrays.bus_id (ver InjectionField)
+@dataclass(slots=True)
 class AbstractNode(ABC):
     "Define common elements with a power net injection"
     network: "Network"
+    # Tabela e linha da rede que guardam os atributos compilados (ver InjectionField); None enquanto não registrado
+    _table: Optional["ElementTable"] = field(default=None, init=False, repr=False, compare=False)
+    _row: int = field(default=-1, init=False, repr=False, compare=False)
     id: int
     name: Optional[str] = None
 
@@ -1,17 +1,28 @@
 from __future__ import annotations
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 from enum import Enum
 import cmath
 from power.electricity_models.bus_models.abc_node import AbstractNode
+from power.electricity_models.element_list import ElementList, lazy_element_lists
+from power.electricity_models.injection_field import data_fields, code_column, deg_to_rad, mw_to_pu
 
 class BusType(Enum):
     SLACK = "SLACK"
     PQ = "PQ"
     PV = "PV"
 
-@dataclass
+# Códigos de btype nos arrays compilados (NetworkArrays.bus_type)
+BUS_TYPE_CODES = (BusType.PQ, BusType.PV, BusType.SLACK)
+
+# Atributos guardados na tabela da rede e compilados em NetworkArrays.bus_* (ver InjectionField)
+@data_fields(btype=code_column("type", BUS_TYPE_CODES), v_pu="v_pu", theta_deg=("theta_deg", "theta_rad", deg_to_rad),
+             q_shunt_mvar=("q_shunt_mvar", "q_shunt_pu", mw_to_pu))
+# As listas de elementos da barra só são criadas quando usadas (a maioria das barras não tem geradores)
+@lazy_element_lists("loads", "generators", "thermal_generators", "wind_generators", "solar_generators",
+                    "hydro_generators", "batteries")
+@dataclass(slots=True)
 class Bus(AbstractNode):
     """
     Representa uma barra (Bus) em um sistema de potência.
@@ -27,18 +38,18 @@ class Bus(AbstractNode):
     theta_deg: float = 0.0   # Ângulo: Armazenamos em 'graus' (degrees) por ser mais intuitivo.
     q_shunt_mvar: float = 0.0   # Potência reativa do shunt em MVAr (a 1.0 pu V)
 
-    loads:              List["Load"]             = field(default_factory=list, repr=False)
-    generators:         List["Generator"]        = field(default_factory=list, repr=False)
-    thermal_generators: List["ThermalGenerator"] = field(default_factory=list)
-    wind_generators:    List["WindGenerator"]    = field(default_factory=list)
-    solar_generators:   List["SolarGenerator"]   = field(default_factory=list)
-    hydro_generators:   List["HydroGenerator"]   = field(default_factory=list)
-    batteries:          List["Battery"]          = field(default_factory=list)
+    loads:              List["Load"]             = field(default=None, repr=False)
+    generators:         List["Generator"]        = field(default=None, repr=False)
+    thermal_generators: List["ThermalGenerator"] = None
+    wind_generators:    List["WindGenerator"]    = None
+    solar_generators:   List["SolarGenerator"]   = None
+    hydro_generators:   List["HydroGenerator"]   = None
+    batteries:          List["Battery"]          = None
 
     def __post_init__(self):
         if self.name is None:
             self.name = f"Bus_{self.id}"
-        self.network.buses.append(self) #Add this bus to network's buses list
+        self.network._register("buses", self) #Add this bus to network's buses list
     
     @property
     def theta_rad(self) -> float:
@@ -56,37 +67,50 @@ class Bus(AbstractNode):
     def shunt_pu(self) -> complex:
         return self.q_shunt_mvar * 1j / self.sb_mva
     
+    def _injection(self, column: int) -> Optional[float]:
+        """Net injection (0 = p, 1 = q) read from the cached vectors of the network; None if unavailable."""
+        net = self.network
+        vectors = getattr(net, "_injection_vectors", None)
+        if vectors is None:
+            return None
+        pos, buses = self._row, net.buses
+        if not (0 <= pos < len(buses) and buses[pos] is self):
+            # Lista reordenada desde o último compile: a linha da tabela ainda não é a posição
+            pos = net.bus_idx.get(self.id)
+            if pos is None or buses[pos] is not self:
+                return None
+        return float(vectors()[column][pos])
+
     @property
     def p_pu(self) -> float:
-        """Net active power injection (pu)"""
-        return sum(g.p_pu for g in self.generators) - sum(l.p_pu for l in self.loads)
+        """Net active power injection (pu), an O(1) read of the network injection vector"""
+        p = self._injection(0)
+        if p is None:
+            return sum(g.p_pu for g in self.generators) - sum(l.p_pu for l in self.loads)
+        return p
 
     @property
     def q_pu(self) -> float:
-        """Net reactive power injection (pu)"""
-        return sum(g.q_pu for g in self.generators) - sum(l.q_pu for l in self.loads) 
-    
+        """Net reactive power injection (pu), an O(1) read of the network injection vector"""
+        q = self._injection(1)
+        if q is None:
+            return sum(g.q_pu for g in self.generators) - sum(l.q_pu for l in self.loads)
+        return q
+
     def add_generator(self, generator: 'Generator'):
-        "Add a generator to this bus"
-        if generator not in self.generators:
-            self.generators.append(generator)
-            # Verifica o nome da classe como string
-            class_name = generator.__class__.__name__
-            if class_name == 'ThermalGenerator':
-                self.thermal_generators.append(generator)
-            elif class_name == 'WindGenerator':
-                self.wind_generators.append(generator)
-            elif class_name == 'HydroGenerator':
-                self.hydro_generators.append(generator)
-            elif class_name == 'SolarGenerator':
-                self.solar_generators.append(generator)
-            elif class_name == 'Battery':
-                self.batteries.append(generator)
+        "Add a generator to this bus (O(1): identity check + bucket declared by the generator class)"
+        if not isinstance(self.generators, ElementList):
+            self.generators = ElementList(self.generators)
+        if self.generators.add_unique(generator):
+            bucket = getattr(generator, "bucket", None)
+            if bucket is not None:
+                getattr(self, bucket).append(generator)
 
     def add_load(self, load: 'Load'):
         "Add a load to this bus"
-        if load not in self.loads:
-            self.loads.append(load)
+        if not isinstance(self.loads, ElementList):
+            self.loads = ElementList(self.loads)
+        self.loads.add_unique(load)
 
     def __repr__(self):
                 """Representação textual amigável da barra."""
@@ -109,6 +133,9 @@ if __name__ == "__main__":
         sb_mva: float = 100.0
         buses: List[Bus] = field(default_factory=list)
 
+        def _register(self, attr, element):
+            getattr(self, attr).append(element)
+
     @dataclass
     class MockLoad:
         """Simulação da classe Load."""
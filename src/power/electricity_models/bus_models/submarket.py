@@ -1,22 +1,24 @@
 from __future__ import annotations
 from power.electricity_models.bus_models.abc_node import AbstractNode
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 from power.electricity_models.bus_models.abc_node import AbstractNode
+from power.electricity_models.element_list import ElementList
 import numpy as np
 from enum import Enum
 
 
-@dataclass
+@dataclass(slots=True)
 class SubMarket(AbstractNode):
     """
     Representa um Submercado. Agrega um conjunto de Bus e implementa 
     AbstractNode para fornecer injeção líquida agregada.
     """
-    buses: List["Bus"] = field(default_factory=list, repr=False)
+    buses: List["Bus"] = field(default_factory=ElementList, repr=False)
     price_usd_per_mwh: float = 0.0      # Preço em $/MWh
     max_import_mw: float = 1e9          # Limite máximo de importação (entrada)
     max_export_mw: float = 1e9          # Limite máximo de exportação (saída)
+    _positions: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # O __post_init__ do AbstractNode não faz nada. 
@@ -30,20 +32,42 @@ class SubMarket(AbstractNode):
         
     def add_bus(self, bus: 'Bus'):
         """Adiciona uma barra a este submercado."""
-        if bus not in self.buses:
-            self.buses.append(bus)
+        if not isinstance(self.buses, ElementList):
+            self.buses = ElementList(self.buses)
+        self.buses.add_unique(bus)
+
+    def _bus_positions(self) -> Optional[np.ndarray]:
+        """
+        Índices das barras do submercado nos vetores de injeção da rede (cache
+        refeito só quando a lista de barras do submercado ou da rede muda).
+        None se a rede não tiver vetores de injeção.
+        """
+        net = self.network
+        if not hasattr(net, "_injection_vectors"):
+            return None
+        if not isinstance(self.buses, ElementList):
+            self.buses = ElementList(self.buses)
+        key = (id(self.buses), self.buses.version, id(net.buses), getattr(net.buses, "version", None))
+        if self._positions is None or self._positions[0] != key:
+            bus_idx = net.bus_idx
+            self._positions = (key, np.array([bus_idx[b.id] for b in self.buses], dtype=np.int64))
+        return self._positions[1]
 
     @property
     def p_pu(self) -> float:
         """Agregação da injeção líquida de potência ativa de todas as barras em p.u."""
-        # Usa a propriedade p_pu de cada Bus contido
-        return sum(bus.p_pu for bus in self.buses)
+        pos = self._bus_positions()
+        if pos is None:
+            return sum(bus.p_pu for bus in self.buses)
+        return float(self.network.p_injection_pu[pos].sum())
 
     @property
     def q_pu(self) -> float:
         """Agregação da injeção líquida de potência reativa de todas as barras em p.u."""
-        # Usa a propriedade q_pu de cada Bus contido
-        return sum(bus.q_pu for bus in self.buses)
+        pos = self._bus_positions()
+        if pos is None:
+            return sum(bus.q_pu for bus in self.buses)
+        return float(self.network.q_injection_pu[pos].sum())
     
     @property
     def max_import_pu(self) -> float:
@@ -0,0 +1,145 @@
+from typing import Iterable
+
+
+class ElementList(list):
+    """
+    List of network elements that counts its own mutations.
+
+    Behaves exactly like a list, but every operation that adds, removes or
+    reorders elements increments `version`. Caches derived from the list
+    (e.g. id -> index maps on Network) compare the version they were built
+    with and are rebuilt only when the list actually changed.
+
+    It also keeps an identity set of its elements, so `add_unique` registers
+    an element in O(1) instead of scanning the list with `item not in list`
+    (which, for dataclasses, also compares every field of every element).
+    Short lists (e.g. the elements of one bus) are scanned by identity instead,
+    which costs less than keeping a set per list.
+    """
+    # Sem __dict__: as barras têm várias listas curtas e um dict por lista custaria mais que a própria lista
+    __slots__ = ("version", "_identities")
+    # Até este tamanho add_unique compara identidades sem montar o conjunto
+    SCAN_LIMIT = 16
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls, *args, **kwargs)
+        self.version = 0
+        self._identities = None
+        return self
+
+    def _touch(self):
+        self.version += 1
+        # Operações que não sejam append invalidam o conjunto de identidades (reconstruído sob demanda)
+        self._identities = None
+
+    @property
+    def _identity_set(self) -> set:
+        if self._identities is None:
+            self._identities = {id(item) for item in self}
+        return self._identities
+
+    def add_unique(self, item) -> bool:
+        """Appends item unless this same object is already in the list. Returns True if it was added."""
+        if len(self) < self.SCAN_LIMIT and self._identities is None:
+            if any(element is item for element in self):
+                return False
+            self.append(item)
+            return True
+        identities = self._identity_set
+        if id(item) in identities:
+            return False
+        self.append(item)
+        return True
+
+    def __getstate__(self):
+        # ids de objetos não sobrevivem a copy/pickle: a cópia reconstrói o conjunto sob demanda
+        return None, {"version": self.version}
+
+    def append(self, item):
+        super().append(item)
+        self.version += 1
+        if self._identities is not None:
+            self._identities.add(id(item))
+
+    def extend(self, items: Iterable):
+        super().extend(items)
+        self._touch()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._touch()
+
+    def remove(self, item):
+        super().remove(item)
+        self._touch()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._touch()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._touch()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._touch()
+
+    def reverse(self):
+        super().reverse()
+        self._touch()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._touch()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._touch()
+
+    def __iadd__(self, items):
+        result = super().__iadd__(items)
+        self._touch()
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._touch()
+        return result
+
+
+class LazyElementList:
+    """
+    Descriptor over the slot of an element list attribute that creates an
+    empty ElementList on first access, so objects that never use the list
+    (e.g. the generator lists of a load bus) do not allocate one.
+    """
+    __slots__ = ("slot",)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        items = self.slot.__get__(obj, owner)
+        if items is None:
+            items = ElementList()
+            self.slot.__set__(obj, items)
+        return items
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+    def __delete__(self, obj):
+        self.slot.__delete__(obj)
+
+
+def lazy_element_lists(*names: str):
+    """Class decorator (applied over @dataclass(slots=True)) for list slots that default to None (see LazyElementList)."""
+    def wrap(cls):
+        for name in names:
+            setattr(cls, name, LazyElementList(cls.__dict__[name]))
+        return cls
+    return wrap
@@ -0,0 +1,85 @@
+from __future__ import annotations
+import numpy as np
+from typing import Dict, Optional
+
+
+class ElementTable:
+    """
+    Columns holding the compiled attributes of the elements of one list of a
+    network (buses, lines, generators or loads), one numpy array per column.
+
+    Each element of the list owns a row (element._row) and its InjectionField
+    attributes read and write that row, so the network keeps a single copy of
+    the numeric data and Network.compile hands out read-only views of the
+    columns. Views are copy-on-write: the first assignment to a column after
+    it was viewed moves the column to a new buffer, so compiled arrays that
+    are still in use keep the values they were compiled with.
+
+    Rows follow the list while elements are only appended (Network._register);
+    any other change to the list is resolved by Network.compile, which moves
+    the rows of the current elements to a new table in list order.
+    """
+    __slots__ = ("columns", "size", "sb_mva", "synced", "conversions", "_viewed")
+
+    def __init__(self, dtypes: Dict[str, type], sb_mva: float, capacity: int = 0):
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+        self.size = 0
+        self.sb_mva = sb_mva
+        # (id, version) da lista de elementos quando as linhas da tabela estavam na ordem dela
+        self.synced: Optional[tuple] = None
+        # Coluna convertida -> (coluna de origem, conversão), registradas pelos InjectionField (ver rescale)
+        self.conversions: Dict[str, tuple] = {}
+        self._viewed = set()
+
+    @property
+    def capacity(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def reserve(self, n: int) -> None:
+        """Garante espaço para n linhas a mais (a capacidade dobra, como em list.append)."""
+        needed = self.size + n
+        if needed <= self.capacity:
+            return
+        capacity = max(needed, 2 * self.capacity, 16)
+        for name, column in self.columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self.columns[name] = grown
+        self._viewed.clear()
+
+    def add_rows(self, n: int) -> int:
+        """Reserva n linhas novas (zeradas) no fim da tabela e devolve a primeira."""
+        self.reserve(n)
+        start = self.size
+        self.size += n
+        return start
+
+    def set(self, column: str, row, value) -> None:
+        """Escreve em uma coluna (row pode ser um índice ou uma fatia), copiando-a antes se ela foi exposta por view()."""
+        if column in self._viewed:
+            self.columns[column] = self.columns[column].copy()
+            self._viewed.discard(column)
+        self.columns[column][row] = value
+
+    def view(self, column: str) -> np.ndarray:
+        """View somente leitura das linhas ocupadas de uma coluna (sem cópia)."""
+        values = self.columns[column][:self.size]
+        values.flags.writeable = False
+        self._viewed.add(column)
+        return values
+
+    def rescale(self, sb_mva: float) -> None:
+        """Refaz as colunas convertidas para pu a partir das de origem quando a potência base da rede mudou."""
+        if sb_mva == self.sb_mva:
+            return
+        self.sb_mva = sb_mva
+        for column, (source, convert) in self.conversions.items():
+            self.set(column, slice(0, self.size), convert(self.columns[source][:self.size], sb_mva))
+
+    def take(self, rows: np.ndarray) -> "ElementTable":
+        """Nova tabela com as linhas dadas, na ordem dada (usada ao reordenar a lista de elementos)."""
+        table = ElementTable({}, self.sb_mva)
+        table.columns = {name: column[rows] for name, column in self.columns.items()}
+        table.size = len(rows)
+        table.conversions = dict(self.conversions)
+        return table
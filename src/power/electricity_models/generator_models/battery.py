@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 from power.electricity_models.generator_models.generator import Generator
 
-@dataclass
+@dataclass(slots=True)
 class Battery(Generator):
+    bucket: ClassVar[str] = "batteries"
     capacity_mwh:         float = 0.0           # Energia total armazenável
     soc_mwh:              float = 0.0           # Estado de carga atual (energia) em MWh
     efficiency_charge:    float = 0.95     # Eficiência de carga
@@ -12,7 +13,7 @@ class Battery(Generator):
     cost_discharge_mw:    float = 0.0      # Custo de descarregar por MW
 
     def __post_init__(self):
-        super().__post_init__()
+        Generator.__post_init__(self)
         if self.soc_mwh > self.capacity_mwh:
             raise ValueError("Estado de carga (soc_mwh) não pode exceder a capacidade (capacity_mwh).")
         # Renomeia se vier com nome default do Generator
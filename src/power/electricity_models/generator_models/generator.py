@@ -1,9 +1,18 @@
 from power.electricity_models.bus_models import Bus
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from power.electricity_models.injection_field import injection_fields, data_fields, bus_column, mw_to_pu
+from typing import ClassVar, Optional
 
-@dataclass
+# Guardados na tabela de geradores da rede (ver InjectionField): p_mw, q_mvar e bus alteram a injeção líquida da barra;
+# os limites e o id só os arrays compilados
+@injection_fields(p_mw=("p_mw", "p_pu", mw_to_pu), q_mvar=("q_mvar", "q_pu", mw_to_pu), bus=bus_column("bus"))
+@data_fields(id="id", p_max_mw=("p_max_mw", "p_max_pu", mw_to_pu), p_min_mw=("p_min_mw", "p_min_pu", mw_to_pu))
+@dataclass(slots=True)
 class Generator:
+    # Definidos no registro na rede; declarados primeiro para já valerem None quando o __init__ atribui os campos rastreados (ver InjectionField)
+    network:    'Network'     = field(default=None, init=False, repr=False, compare=False)
+    _table:     Optional['ElementTable'] = field(default=None, init=False, repr=False, compare=False)
+    _row:       int           = field(default=-1, init=False, repr=False, compare=False)
     bus:       'Bus'
     id:         int
     name:       Optional[str] = None
@@ -14,6 +23,12 @@ class Generator:
     q_max_mvar: float         = 99999
     q_min_mvar: float         = 0.0
 
+    # Nome da lista (em Bus e Network) em que o gerador é registrado; None para o gerador genérico
+    bucket: ClassVar[Optional[str]] = None
+
+    # Definidos no __post_init__ a partir da barra
+    sb_mva:     float         = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.name is None:
             self.name = f"Generator_{self.id}"
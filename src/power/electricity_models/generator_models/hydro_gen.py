@@ -1,25 +1,28 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import ClassVar, Optional
 from power.electricity_models.generator_models.generator import Generator
 
 # from power.hydraulic_models.node_models.hydro_node import HydroBus
 
 
-@dataclass
+@dataclass(slots=True)
 class HydroGenerator(Generator):
     """
     Representa um gerador hidráulico. Conectado a um nó elétrico e hidráulico.
     """
+    bucket: ClassVar[str] = "hydro_generators"
+
     hydro_bus: Optional['HydroBus'] = None
     # Atributos Físicos do Reservatório e Máquina   
     vol_min: float = 0.0         # Volume Mínimo (hm3)
     vol_max: float = 0.0         # Volume Máximo (hm3) - Se 0, é fio d'água
     prod: float = 1.0            # Produtibilidade (MW / m3/s)
     engolimento_max: float = 10000.0  # Engolimento máximo (m3/s)
+    hydro_network: Optional['HydroNetwork'] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        super().__post_init__()
+        Generator.__post_init__(self)
         if self.name == f"Generator_{self.id}":
             self.name = f"HydroGenerator_{self.id}"
         self.hydro_bus.add_generator(self)
@@ -39,5 +42,5 @@ class HydroGenerator(Generator):
         return 0.0
 
     def __repr__(self):
-        base_repr = super().__repr__()
+        base_repr = Generator.__repr__(self)
         return f"Hydro{base_repr}"
\ No newline at end of file
@@ -1,8 +1,12 @@
 from power.electricity_models.generator_models.generator import Generator
 from dataclasses import dataclass
+from typing import ClassVar
+from power.electricity_models.injection_field import data_fields, cost_to_pu
 
-@dataclass
+@data_fields(cost_b_mw=("cost_b_mw", "cost_b_pu", cost_to_pu))   # Custo compilado em NetworkArrays.gen_cost_b_pu (ver InjectionField)
+@dataclass(slots=True)
 class ThermalGenerator(Generator):
+    bucket: ClassVar[str] = "thermal_generators"
 # --- Thermal-Specific Attributes ---
     cost_a_mw: float = 0.0
     cost_b_mw: float = 0.0
@@ -11,7 +15,7 @@ class ThermalGenerator(Generator):
     max_ramp_down_mw: float = -99999
 
     def __post_init__(self):
-        super().__post_init__()
+        Generator.__post_init__(self)
         if self.name == f"Generator_{self.id}":
             self.name = f"ThermalGenerator_{self.id}"
 
@@ -1,14 +1,16 @@
 from dataclasses import dataclass
+from typing import ClassVar
 from .generator import Generator
 
-@dataclass
+@dataclass(slots=True)
 class WindGenerator(Generator):
     """
     Representa um gerador eólico. Não possui custos de combustível.
     """
+    bucket: ClassVar[str] = "wind_generators"
 
     def __post_init__(self):
-        super().__post_init__()
+        Generator.__post_init__(self)
         if self.name == f"Generator_{self.id}":
             self.name = f"WindGenerator_{self.id}"
     @property
@@ -24,5 +26,5 @@ class WindGenerator(Generator):
         return 0.0
 
     def __repr__(self):
-        base_repr = super().__repr__()
+        base_repr = Generator.__repr__(self)
         return f"Wind{base_repr}"
\ No newline at end of file
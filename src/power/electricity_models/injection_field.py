@@ -0,0 +1,237 @@
+from __future__ import annotations
+import numpy as np
+from functools import partial
+from typing import Callable, Optional
+
+
+class InjectionField:
+    """
+    Data descriptor placed over the slot of an attribute that is part of the
+    compiled data of the network (see Network.compile), e.g. p_mw, q_mvar and
+    bus of generators and loads, or the parameters of lines and buses.
+
+    Once the element is registered in a network (Network._register) the value
+    lives in `column` of the network's ElementTable for that element list, at
+    the row of the element; fields whose compiled unit differs (MW -> pu,
+    degrees -> radians) also keep the converted value in `compiled`. The slot
+    only holds the value while the element is being built, and is cleared when
+    the value moves to the table. Network.compile returns views of the columns.
+
+    Every assignment to a registered element notifies its network
+    (Network._element_changed), which bumps the versions that key the cached
+    compiled arrays and, for the fields that change a bus injection
+    (injection=True), the cached injection vectors. The versions belong to the
+    network of the element, so a write never invalidates the caches of other
+    networks.
+    """
+    __slots__ = ("slot", "column", "compiled", "convert", "injection")
+
+    def __init__(self, slot, column: str, compiled: Optional[str] = None,
+                 convert: Optional[Callable] = None, injection: bool = True):
+        self.slot = slot
+        self.column = column
+        self.compiled = compiled
+        self.convert = convert
+        self.injection = injection
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        table = obj._table
+        if table is None:
+            return self.slot.__get__(obj, owner)
+        return self.decode(table.columns[self.column][obj._row])
+
+    def __set__(self, obj, value):
+        table = getattr(obj, "_table", None)
+        if table is None:
+            self.slot.__set__(obj, value)
+            return
+        self.store(obj, table, obj._row, value)
+        changed = getattr(obj.network, "_element_changed", None)
+        if changed is not None:
+            changed(self.injection)
+
+    def __delete__(self, obj):
+        self.slot.__delete__(obj)
+
+    def decode(self, value):
+        """Column value -> attribute value."""
+        return value.item()
+
+    def encode(self, obj, value):
+        """Attribute value -> column value."""
+        return value
+
+    def store(self, obj, table, row: int, value) -> None:
+        table.set(self.column, row, self.encode(obj, value))
+        if self.compiled is not None:
+            table.conversions[self.compiled] = (self.column, self.convert)
+            table.set(self.compiled, row, self.convert(value, table.sb_mva))
+
+    def attach(self, obj, table, row: int) -> None:
+        """Moves the value kept in the slot while the element was being built to its row of the table."""
+        self.store(obj, table, row, self.slot.__get__(obj))
+        self.slot.__set__(obj, None)
+
+    def store_column(self, table, rows, values) -> None:
+        """Writes the values of many rows at once (bulk ingestion, see network_tables.load_tables)."""
+        table.set(self.column, rows, values)
+        if self.compiled is not None:
+            table.conversions[self.compiled] = (self.column, self.convert)
+            table.set(self.compiled, rows, self.convert(np.asarray(values, dtype=float), table.sb_mva))
+
+
+class CodeField(InjectionField):
+    """InjectionField for an enum attribute, stored as the position of its value in `codes`."""
+    __slots__ = ("codes",)
+
+    def __init__(self, slot, column: str, codes: tuple, injection: bool = False):
+        super().__init__(slot, column, injection=injection)
+        self.codes = codes
+
+    def decode(self, value):
+        return self.codes[value]
+
+    def encode(self, obj, value):
+        return self.codes.index(type(self.codes[0])(value))
+
+    def store_column(self, table, rows, values) -> None:
+        code = {value: i for i, value in enumerate(self.codes)}
+        table.set(self.column, rows, [code[type(self.codes[0])(v)] for v in values])
+
+
+class BusField(InjectionField):
+    """
+    InjectionField for a reference to a bus. The object stays in the slot and
+    the column holds the row of the bus in the bus table of the network
+    (-1 if the bus is not part of it), which Network.compile turns into the
+    bus position of the compiled arrays.
+    """
+    __slots__ = ()
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return self.slot.__get__(obj, owner)
+
+    def encode(self, obj, value):
+        return obj.network._bus_row(value)
+
+    def store(self, obj, table, row: int, value) -> None:
+        self.slot.__set__(obj, value)
+        table.set(self.column, row, self.encode(obj, value))
+
+    def attach(self, obj, table, row: int) -> None:
+        table.set(self.column, row, self.encode(obj, self.slot.__get__(obj)))
+
+
+def mw_to_pu(value, sb_mva):
+    return value / sb_mva
+
+
+def cost_to_pu(value, sb_mva):
+    return value * sb_mva
+
+
+def deg_to_rad(value, sb_mva):
+    return np.deg2rad(value)
+
+
+def bus_column(column: str):
+    """Column spec of injection_fields/data_fields for a bus reference (see BusField)."""
+    return partial(BusField, column=column)
+
+
+def code_column(column: str, codes: tuple):
+    """Column spec of injection_fields/data_fields for an enum stored as a code (see CodeField)."""
+    return partial(CodeField, column=column, codes=codes)
+
+
+def _fields(cls, columns: dict, injection: bool) -> type:
+    for name, column in columns.items():
+        slot = cls.__dict__[name]
+        if callable(column):
+            field = column(slot, injection=injection)
+        elif isinstance(column, tuple):
+            field = InjectionField(slot, *column, injection=injection)
+        else:
+            field = InjectionField(slot, column, injection=injection)
+        setattr(cls, name, field)
+    cls.__getstate__, cls.__setstate__ = _getstate, _setstate
+    return cls
+
+
+_CLASS_SLOTS = {}
+
+
+def slot_members(cls) -> dict:
+    """
+    Slot name -> member descriptor of the slot itself, under the descriptors
+    placed over it (raw access for copy/pickle and bulk construction).
+    """
+    found = _CLASS_SLOTS.get(cls)
+    if found is None:
+        found = {}
+        for klass in cls.__mro__:
+            for name in vars(klass).get("__slots__", ()):
+                found.setdefault(name, getattr(klass.__dict__[name], "slot", klass.__dict__[name]))
+        _CLASS_SLOTS[cls] = found
+    return found
+
+
+def _getstate(self):
+    # copy/pickle leem e restauram os slots diretamente: a tabela é copiada junto e os valores já estão nela
+    state = {}
+    for name, member in slot_members(type(self)).items():
+        try:
+            state[name] = member.__get__(self)
+        except AttributeError:
+            pass
+    return None, state
+
+
+def _setstate(self, state):
+    members = slot_members(type(self))
+    for name, value in state[1].items():
+        members[name].__set__(self, value)
+
+
+def injection_fields(**columns):
+    """
+    Class decorator (applied over @dataclass(slots=True)) that stores the given
+    slots in the network's element table. Each keyword maps an attribute to its
+    column: a column name, (column, compiled column, conversion) for values
+    also kept in pu/radians, bus_column(...) for bus references or
+    code_column(...) for enums.
+    """
+    return lambda cls: _fields(cls, columns, injection=True)
+
+
+def data_fields(**columns):
+    """Like injection_fields, for slots that are compiled data but do not change a bus injection."""
+    return lambda cls: _fields(cls, columns, injection=False)
+
+
+_CLASS_FIELDS = {}
+
+
+def table_fields(cls) -> tuple:
+    """(name, InjectionField) pairs of a class, including the inherited ones."""
+    found = _CLASS_FIELDS.get(cls)
+    if found is None:
+        by_name = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, InjectionField):
+                    by_name[name] = value
+        found = _CLASS_FIELDS[cls] = tuple(by_name.items())
+    return found
+
+
+def attach_fields(obj, table, row: int) -> None:
+    """Moves the InjectionField values of a new element to its row of the table (see Network._register)."""
+    for _, field in table_fields(type(obj)):
+        field.attach(obj, table, row)
+    obj._table = table
+    obj._row = row
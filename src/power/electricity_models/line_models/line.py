@@ -1,10 +1,19 @@
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict
 from power.electricity_models.bus_models import Bus
+from power.electricity_models.injection_field import data_fields, bus_column, deg_to_rad
 
-@dataclass
+# Atributos guardados na tabela de linhas da rede e compilados em NetworkArrays.line_* (ver InjectionField)
+@data_fields(id="id", from_bus=bus_column("from"), to_bus=bus_column("to"), r_pu="r_pu", x_pu="x_pu",
+             shunt_half_pu="b_half_pu", flow_max_pu="flow_max_pu", tap_ratio="tap_ratio",
+             tap_phase_deg=("tap_phase_deg", "tap_phase_rad", deg_to_rad))
+@dataclass(slots=True)
 class Line:
+    # Definidos no registro na rede; declarados primeiro para já valerem None quando o __init__ atribui os campos rastreados (ver InjectionField)
+    network:       'Network' = field(default=None, init=False, repr=False, compare=False)
+    _table:        Optional['ElementTable'] = field(default=None, init=False, repr=False, compare=False)
+    _row:          int = field(default=-1, init=False, repr=False, compare=False)
     from_bus:      Bus
     to_bus:        Bus
     id:            int
@@ -17,6 +26,9 @@ class Line:
     tap_ratio:     float = 1.0
     tap_phase_deg: float = 0.0
 
+    # Definidos no __post_init__ a partir das barras
+    sb_mva:        float     = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.name is None:
             self.name = f"Line_{self.id}"
@@ -27,7 +39,7 @@ class Line:
             raise ValueError("Both buses must belong to the same network.")
         
         self.network = self.from_bus.network #Add network to line
-        self.network.lines.append(self) #Add line to network
+        self.network._register("lines", self) #Add line to network
         self.sb_mva = self.network.sb_mva
 
     @property
@@ -55,9 +67,12 @@ class Line:
     #     """Define o fluxo máximo a partir de um valor em pu."""
     #     self.flow_max_mw = new_flow_max_pu * self.sb_mva
 
-    def get_ybus_elements(self):
-        """Gera os elementos de admitância baseados nos parâmetros da linha"""
-        y = self.y_pu
+    def get_ybus_elements(self, x_pu: Optional[float] = None):
+        """
+        Gera os elementos de admitância baseados nos parâmetros da linha.
+        Se x_pu for informado, ele substitui a reatância da linha (usado por Scenario).
+        """
+        y = self.y_pu if x_pu is None else 1 / complex(self.r_pu, x_pu)
         b = self.shunt_half_pu * 1j
         a = self.tap_ratio * np.exp(1j * self.tap_phase_rad)
         if self.tap_ratio != 1.0 or self.tap_phase_deg != 0.0:
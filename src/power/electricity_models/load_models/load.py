@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from power.electricity_models.injection_field import injection_fields, data_fields, bus_column, mw_to_pu, cost_to_pu
 from typing import ClassVar, Optional
 import numpy as np
 
@@ -6,8 +7,16 @@ from data_models.time_series import TimeSeries
 
 from ..bus_models import Bus
 
-@dataclass
+# Guardados na tabela de cargas da rede (ver InjectionField): p_mw, q_mvar e bus alteram a injeção líquida da barra;
+# o custo de corte e o id só os arrays compilados
+@injection_fields(p_mw=("p_mw", "p_pu", mw_to_pu), q_mvar=("q_mvar", "q_pu", mw_to_pu), bus=bus_column("bus"))
+@data_fields(id="id", cost_shed_mw=("cost_shed_mw", "cost_shed_pu", cost_to_pu))
+@dataclass(slots=True)
 class Load:
+    # Definidos no registro na rede; declarados primeiro para já valerem None quando o __init__ atribui os campos rastreados (ver InjectionField)
+    network:      'Network' = field(default=None, init=False, repr=False, compare=False)
+    _table:       Optional['ElementTable'] = field(default=None, init=False, repr=False, compare=False)
+    _row:         int = field(default=-1, init=False, repr=False, compare=False)
     bus:         'Bus'
     id:           int
     name:         Optional[str] = None
@@ -26,12 +35,15 @@ class Load:
     cost_b_mw:    float = 0.0
     cost_c_mw:    float = 0.0
 
+    # Definidos no __post_init__ a partir da barra
+    sb_mva:       float     = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.name is None:
             self.name = f"Load_{self.id}"
-        self.bus.add_load(self)
         self.network = self.bus.network
-        self.network.loads.append(self)
+        self.network._register("loads", self)
+        self.bus.add_load(self)
         self.sb_mva = self.network.sb_mva
 
     # --- Potência Ativa (p) ---
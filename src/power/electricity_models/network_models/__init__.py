@@ -1,3 +1,7 @@
 from .network import Network
+from .scenario import Scenario
+from .network_arrays import NetworkArrays, GenKind
+from .reduction import NetworkReduction, reduce_network, kron_reduce
+from .sensitivity import PTDF
 
-__all__ = ["Network"]
\ No newline at end of file
+__all__ = ["Network", "Scenario", "NetworkArrays", "GenKind", "NetworkReduction", "reduce_network", "kron_reduce", "PTDF"]
\ No newline at end of file
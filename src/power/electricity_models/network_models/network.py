@@ -1,29 +1,50 @@
 import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from power.electricity_models.generator_models import Generator, ThermalGenerator, WindGenerator, SolarGenerator, HydroGenerator, Battery
 from power.electricity_models.line_models import Line
 from power.electricity_models.load_models import Load
 from power.electricity_models.bus_models import Bus
+from power.electricity_models.network_models.scenario import Scenario
+from power.electricity_models.network_models.network_arrays import (NetworkArrays, compile_network, gen_kind,
+                                                                    TABLE_COLUMNS, BUS_REFERENCES)
+from power.electricity_models.network_models.network_tables import load_tables, dump_tables
+from power.electricity_models.network_models.npz_store import write_npz, read_npz
+from power.electricity_models.element_list import ElementList
+from power.electricity_models.element_table import ElementTable
+from power.electricity_models.injection_field import attach_fields
+
+# Versão do formato de Network.save (incrementar se o conteúdo do arquivo mudar)
+SNAPSHOT_FORMAT = 1
 
 @dataclass
 class Network:
     sb_mva:             float                  = 100
     id:                 Optional[int]          = None
     name:               Optional[str]          = None
-    buses:              List[Bus]              = field(default_factory=list)
-    lines:              List[Line]             = field(default_factory=list)
-    loads:              List[Load]             = field(default_factory=list)
-    generators:         List[Generator]        = field(default_factory=list)
-    thermal_generators: List[ThermalGenerator] = field(default_factory=list)
-    wind_generators:    List[WindGenerator]    = field(default_factory=list)
-    solar_generators:   List[SolarGenerator]   = field(default_factory=list)
-    hydro_generators:   List[HydroGenerator]   = field(default_factory=list)
-    batteries:          List[Battery]          = field(default_factory=list)
+    buses:              List[Bus]              = field(default_factory=ElementList)
+    lines:              List[Line]             = field(default_factory=ElementList)
+    loads:              List[Load]             = field(default_factory=ElementList)
+    generators:         List[Generator]        = field(default_factory=ElementList)
+    thermal_generators: List[ThermalGenerator] = field(default_factory=ElementList)
+    wind_generators:    List[WindGenerator]    = field(default_factory=ElementList)
+    solar_generators:   List[SolarGenerator]   = field(default_factory=ElementList)
+    hydro_generators:   List[HydroGenerator]   = field(default_factory=ElementList)
+    batteries:          List[Battery]          = field(default_factory=ElementList)
 
     #Attributes for caching
     _ybus: Optional[np.ndarray] = field(default=None, init=False, repr=False)
     _zbus_ground: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _idx_cache: Dict[str, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _injections: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _arrays: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Colunas dos atributos compilados dos elementos, uma ElementTable por lista (ver InjectionField)
+    _tables: Dict[str, ElementTable] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Incrementada a cada alteração de um atributo compilado de um elemento da rede (ver InjectionField)
+    _data_version: int = field(default=0, init=False, repr=False, compare=False)
+    # Incrementada só quando muda a injeção de uma barra desta rede (p_mw, q_mvar ou bus de geradores e cargas)
+    _injection_version: int = field(default=0, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.name is None:
             if self.id is not None:
@@ -31,14 +52,217 @@ class Network:
             else:
                 self.name = "Network"
 
+    def _elements(self, attr: str) -> ElementList:
+        """The element list `attr`, converted to an ElementList if it was replaced by a plain list."""
+        elements = getattr(self, attr)
+        if not isinstance(elements, ElementList):
+            elements = ElementList(elements)
+            setattr(self, attr, elements)
+        return elements
+
+    def _element_idx(self, attr: str) -> Dict[int, int]:
+        """
+        Returns the cached id -> index map of the element list `attr`.
+        The map is rebuilt only when the list was replaced or mutated.
+        """
+        elements = self._elements(attr)
+        key = (id(elements), elements.version)
+        cached = self._idx_cache.get(attr)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        idx = {element.id: i for i, element in enumerate(elements)}
+        self._idx_cache[attr] = (key, idx)
+        return idx
+
     @property
-    def bus_idx(self) -> dict:
+    def bus_idx(self) -> Dict[int, int]:
         """
         Returns a dictionary mapping bus IDs to their indices in the buses list.
         This is useful for quickly accessing buses by their ID.
+        The dictionary is cached and must not be modified by the caller.
         """
-        return {bus.id: i for i, bus in enumerate(self.buses)}
+        return self._element_idx("buses")
+
+    @property
+    def line_idx(self) -> Dict[int, int]:
+        """Cached mapping of line IDs to their indices in the lines list."""
+        return self._element_idx("lines")
+
+    @property
+    def gen_idx(self) -> Dict[int, int]:
+        """Cached mapping of generator IDs to their indices in the generators list."""
+        return self._element_idx("generators")
+
+    @property
+    def load_idx(self) -> Dict[int, int]:
+        """Cached mapping of load IDs to their indices in the loads list."""
+        return self._element_idx("loads")
+
+    def get_bus(self, bus_id: int) -> Bus:
+        """Returns the bus with the given id in O(1)."""
+        try:
+            return self.buses[self.bus_idx[bus_id]]
+        except KeyError:
+            raise ValueError(f"Bus {bus_id} is not part of the network.") from None
+
+    def get_line(self, line_id: int) -> Line:
+        """Returns the line with the given id in O(1)."""
+        try:
+            return self.lines[self.line_idx[line_id]]
+        except KeyError:
+            raise ValueError(f"Line {line_id} is not part of the network.") from None
+
+    def get_generator(self, gen_id: int) -> Generator:
+        """Returns the generator with the given id in O(1)."""
+        try:
+            return self.generators[self.gen_idx[gen_id]]
+        except KeyError:
+            raise ValueError(f"Generator {gen_id} is not part of the network.") from None
+
+    def get_load(self, load_id: int) -> Load:
+        """Returns the load with the given id in O(1)."""
+        try:
+            return self.loads[self.load_idx[load_id]]
+        except KeyError:
+            raise ValueError(f"Load {load_id} is not part of the network.") from None
     
+    def _element_table(self, attr: str) -> ElementTable:
+        """Tabela de colunas da lista `attr` (criada vazia no primeiro uso)."""
+        table = self._tables.get(attr)
+        if table is None:
+            elements = self._elements(attr)
+            table = self._tables[attr] = ElementTable(TABLE_COLUMNS[attr][1], self.sb_mva)
+            if not elements:
+                table.synced = (id(elements), elements.version)
+        return table
+
+    def _attach(self, attr: str, element, table: ElementTable, row: int) -> None:
+        attach_fields(element, table, row)
+        if attr == "generators":
+            table.set("kind", row, gen_kind(element))
+
+    def _register(self, attr: str, element) -> bool:
+        """
+        Chamado pelos construtores dos elementos: acrescenta o elemento à lista
+        `attr` e move os seus atributos compilados para uma nova linha da
+        tabela da lista (ver InjectionField). O(1); retorna False se o elemento
+        já está registrado.
+        """
+        elements = self._elements(attr)
+        table = self._element_table(attr)
+        if element._table is table:
+            return False
+        in_order = table.synced == (id(elements), elements.version)
+        self._attach(attr, element, table, table.add_rows(1))
+        elements.append(element)
+        if in_order:
+            table.synced = (id(elements), elements.version)
+        return True
+
+    def _bus_row(self, bus) -> int:
+        """Linha de uma barra na tabela de barras desta rede (-1 se a barra não pertence a ela)."""
+        table = self._tables.get("buses")
+        return bus._row if table is not None and getattr(bus, "_table", None) is table else -1
+
+    def _element_tables(self) -> Dict[str, ElementTable]:
+        """
+        As tabelas de elementos com as linhas na ordem das listas. Enquanto as
+        listas só recebem elementos pelos construtores ou por load_tables isso
+        já vale e nada é feito; depois de outra alteração (remove, sort, lista
+        substituída...)
+        as linhas dos elementos atuais são copiadas para uma nova tabela na
+        ordem da lista e, se as barras mudaram de linha, as referências a
+        barras das demais tabelas são refeitas.
+        """
+        moved = self._sync_table("buses")
+        for attr in ("lines", "generators", "loads"):
+            if self._sync_table(attr) or moved:
+                table, elements = self._tables[attr], getattr(self, attr)
+                for name, column in BUS_REFERENCES[attr].items():
+                    rows = np.fromiter((self._bus_row(getattr(e, name)) for e in elements), np.int64, len(elements))
+                    table.set(column, slice(0, len(elements)), rows)
+        return self._tables
+
+    def _sync_table(self, attr: str) -> bool:
+        """Reordena a tabela da lista `attr` conforme a lista (ver _element_tables). Retorna True se algo mudou."""
+        elements = self._elements(attr)
+        table = self._element_table(attr)
+        key = (id(elements), elements.version)
+        if table.synced == key:
+            return False
+        rows = np.fromiter((e._row if e._table is table else -1 for e in elements), np.int64, len(elements))
+        if not len(rows) or rows.min() >= 0:
+            new = table.take(rows)
+        else:
+            # Elementos de outra tabela (ou nunca registrados): cópia linha a linha
+            new = ElementTable(TABLE_COLUMNS[attr][1], self.sb_mva)
+            new.conversions = dict(table.conversions)
+            new.add_rows(len(elements))
+            for row, e in enumerate(elements):
+                source = e._table
+                if source is None:
+                    self._attach(attr, e, new, row)
+                else:
+                    for name, column in new.columns.items():
+                        column[row] = source.columns[name][e._row]
+        for row, e in enumerate(elements):
+            e._table, e._row = new, row
+        new.synced = key
+        self._tables[attr] = new
+        return True
+
+    def _element_changed(self, injection: bool) -> None:
+        """
+        Chamado pelos InjectionField dos elementos da rede a cada atribuição:
+        invalida os arrays compilados e, se a injeção de uma barra mudou, os
+        vetores de injeção desta rede (as demais redes não são afetadas).
+        """
+        self._data_version += 1
+        if injection:
+            self._injection_version += 1
+
+    def _list_versions(self) -> tuple:
+        """Identidade e versão das listas de elementos (parte da chave dos caches derivados delas)."""
+        key = ()
+        for attr in ("buses", "lines", "generators", "loads"):
+            elements = self._elements(attr)
+            key += (id(elements), elements.version)
+        return key
+
+    def _injection_vectors(self):
+        """
+        Vetores (p, q) de injeção líquida em pu, indexados como net.buses e
+        guardados em cache. São refeitos com uma soma por barra (bincount)
+        sobre as colunas compiladas dos geradores e cargas só quando uma lista
+        de elementos mudou ou uma injeção desta rede foi alterada (ver
+        InjectionField).
+        """
+        b, g, l = self._elements("buses"), self._elements("generators"), self._elements("loads")
+        cached = self._injections
+        if cached is not None and cached[0] == (id(b), b.version, id(g), g.version, id(l), l.version, self._injection_version):
+            return cached[1], cached[2]
+
+        arrays = self.compile()
+        gens, loads, n = self.generators, self.loads, arrays.n_bus
+        p = (np.bincount(arrays.gen_bus, arrays.gen_p_pu, minlength=n)
+             - np.bincount(arrays.load_bus, arrays.load_p_pu, minlength=n))
+        q = (np.bincount(arrays.gen_bus, arrays.gen_q_pu, minlength=n)
+             - np.bincount(arrays.load_bus, arrays.load_q_pu, minlength=n))
+        p.flags.writeable = False   # Compartilhados por todas as barras: cópia fica a cargo de quem for alterar
+        q.flags.writeable = False
+        self._injections = ((id(b), b.version, id(gens), gens.version, id(loads), loads.version, self._injection_version), p, q)
+        return p, q
+
+    @property
+    def p_injection_pu(self) -> np.ndarray:
+        """Injeção líquida de potência ativa de cada barra (pu, somente leitura, indexada como buses)."""
+        return self._injection_vectors()[0]
+
+    @property
+    def q_injection_pu(self) -> np.ndarray:
+        """Injeção líquida de potência reativa de cada barra (pu, somente leitura, indexada como buses)."""
+        return self._injection_vectors()[1]
+
     @property
     def y_bus(self) -> np.ndarray:
         """Retorna a Matriz Ybus da rede (calculada apenas se necessário)."""
@@ -78,19 +302,120 @@ class Network:
         return self.y_bus.imag
     
     def add_generator(self, generator: Generator):
-        if generator not in self.generators:
-            self.generators.append(generator)
-            if isinstance(generator, ThermalGenerator):
-                self.thermal_generators.append(generator)
-            elif isinstance(generator, WindGenerator):
-                self.wind_generators.append(generator)
-            elif isinstance(generator, HydroGenerator):
-                self.hydro_generators.append(generator)
-            elif isinstance(generator, SolarGenerator):
-                self.solar_generators.append(generator)
-            elif isinstance(generator, Battery):
-                self.batteries.append(generator)
+        """
+        Registers a generator in O(1) (see _register; a generator already in the
+        network is not added again) and appends it to the type list declared by
+        the generator class (Generator.bucket).
+        """
+        if self._register("generators", generator) and generator.bucket is not None:
+            getattr(self, generator.bucket).append(generator)
     
+    def load_tables(self, buses=None, lines=None, generators=None, loads=None) -> "Network":
+        """
+        Adiciona barras, linhas, geradores e cargas descritos por tabelas em
+        colunas (dict de arrays, array estruturado do numpy, DataFrame do
+        pandas ou Table do pyarrow). As colunas dos atributos compilados vão
+        em bloco para as tabelas de elementos da rede: ver
+        network_tables.load_tables para as colunas.
+        """
+        load_tables(self, buses=buses, lines=lines, generators=generators, loads=loads)
+        return self
+
+    @classmethod
+    def from_tables(cls, buses, lines=None, generators=None, loads=None, sb_mva: float = 100, name: Optional[str] = None) -> "Network":
+        """Nova Network montada a partir de tabelas em colunas (ver load_tables)."""
+        return cls(sb_mva=sb_mva, name=name).load_tables(buses=buses, lines=lines, generators=generators, loads=loads)
+
+    def compile(self) -> NetworkArrays:
+        """
+        Dados numéricos da rede como NetworkArrays (um array por atributo,
+        indexado como as listas de elementos, valores em pu). Os arrays são
+        views somente leitura das colunas em que a rede guarda os atributos
+        dos elementos (ver InjectionField), sem cópia; uma alteração posterior
+        de um elemento copia antes a coluna alterada, de modo que os arrays já
+        devolvidos continuam com os valores do momento do compile (use copy()
+        para alterá-los). O resultado é reutilizado até uma lista de elementos
+        ou um atributo compilado mudar.
+        """
+        key = (self._list_versions(), self._data_version, self.sb_mva)
+        cached = self._arrays
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        arrays = compile_network(self)
+        self._arrays = (key, arrays)
+        return arrays
+
+    def save(self, path) -> None:
+        """
+        Grava um snapshot binário da rede (.npz sem compressão): as tabelas dos
+        elementos (ver network_tables.dump_tables) e os NetworkArrays
+        compilados. Processos que só precisam dos dados numéricos mapeiam os
+        arrays com NetworkArrays.load(path), sem cópia; Network.load(path)
+        reconstrói os objetos.
+        """
+        arrays = self.compile().to_npz()
+        arrays["__name__"] = np.array(self.name)
+        arrays["__format__"] = np.array(SNAPSHOT_FORMAT)
+        for table, columns in dump_tables(self).items():
+            for column, values in columns.items():
+                arrays[f"{table}/{column}"] = values
+        write_npz(path, arrays)
+
+    @classmethod
+    def load(cls, path) -> "Network":
+        """
+        Reconstrói uma Network gravada com save(). As tabelas são lidas e as
+        colunas copiadas em bloco para as tabelas de elementos da nova rede
+        (ver from_tables); o código específico do sistema que a montou
+        originalmente não é executado de novo. Não há mapeamento em memória:
+        o acesso sem cópia aos dados numéricos é o de NetworkArrays.load(path).
+        """
+        data = read_npz(path)
+        if "__format__" not in data or int(data["__format__"]) != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path}: not a network snapshot (format {SNAPSHOT_FORMAT}).")
+        tables = {"buses": {}, "lines": {}, "generators": {}, "loads": {}}
+        for key, values in data.items():
+            table, _, column = key.partition("/")
+            if table in tables:
+                tables[table][column] = values
+        return cls.from_tables(tables["buses"], lines=tables["lines"], generators=tables["generators"],
+                               loads=tables["loads"], sb_mva=float(data["__sb_mva__"]), name=str(data["__name__"]))
+
+    def reduce(self, keep, **options) -> "NetworkReduction":
+        """
+        DC Ward/Kron equivalent of the network onto the buses `keep` (ids, Bus
+        objects or a SubMarket). See reduction.reduce_network for the options.
+        """
+        from power.electricity_models.network_models.reduction import reduce_network
+        return reduce_network(self, keep, **options)
+
+    def scenario(self, name: Optional[str] = None) -> Scenario:
+        """
+        Returns an empty copy-on-write Scenario over this network.
+        Use it instead of copy.deepcopy(net) to create load/wind scenarios and contingencies.
+        """
+        return Scenario(base=self, name=name)
+
+    # Accessors shared with Scenario: solvers read element data through them so
+    # that a Scenario can override values without copying the network.
+    def load_p_pu(self, load: Load) -> float:
+        return load.p_pu
+
+    def gen_p_max_pu(self, gen: Generator) -> float:
+        return gen.p_max_pu
+
+    def gen_p_min_pu(self, gen: Generator) -> float:
+        return gen.p_min_pu
+
+    def line_x_pu(self, line: Line) -> float:
+        return line.x_pu
+
+    def line_flow_max_pu(self, line: Line) -> float:
+        return line.flow_max_pu
+
+    def bus_p_pu(self, bus: Bus) -> float:
+        return bus.p_pu
+
     def _reset_matrices(self):
         """Invalida as matrizes Y/Z para forçar o recálculo após uma alteração na rede."""
         self._ybus = None
@@ -104,13 +429,14 @@ class Network:
         Returns:
             Z_bus (np.ndarray): The Z bus matrix of the network.
         """
-        Z = np.linalg.inv(self.y_bus())
+        Z = np.linalg.inv(self.y_bus)
         if ref_bus is None:
             return Z
         
-        if ref_bus.id not in self.bus_idx:
+        bus_idx = self.bus_idx
+        if ref_bus.id not in bus_idx:
             raise ValueError(f"Bus {ref_bus.id} is not part of the network.")
-        s = self.bus_idx[ref_bus.id]
+        s = bus_idx[ref_bus.id]
         Zs = (Z - Z[:, [s]] - Z[[s], :] + Z[s, s])
         return Zs
     
@@ -127,10 +453,11 @@ class Network:
         # Ground referenced Z bus
         Z = self.get_Z_bus()
 
-        if ref_bus.id not in self.bus_idx:
+        bus_idx = self.bus_idx
+        if ref_bus.id not in bus_idx:
             raise ValueError(f"Bus {ref_bus.id} is not part of the network.")
         
-        s = self.bus_idx[ref_bus.id]
+        s = bus_idx[ref_bus.id]
 
         #Denominator:
         denom = Z[s, s] + z_tie
@@ -155,7 +482,8 @@ class Network:
         else:
             Zbus = self.get_Z_bus_arb_tie(ref_bus, z_tie)
 
-        CTDF = np.array([line.get_dfactors(Zbus, self.bus_idx) for line in self.lines])
+        bus_idx = self.bus_idx
+        CTDF = np.array([line.get_dfactors(Zbus, bus_idx) for line in self.lines])
         return CTDF
 
     def ACtoDC(self):
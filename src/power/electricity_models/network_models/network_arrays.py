@@ -0,0 +1,185 @@
+from __future__ import annotations
+import numpy as np
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from power.electricity_models.generator_models import (Generator, ThermalGenerator, WindGenerator, SolarGenerator,
+                                                       HydroGenerator, Battery)
+from power.electricity_models.bus_models import Bus
+from power.electricity_models.line_models import Line
+from power.electricity_models.load_models import Load
+from power.electricity_models.network_models.npz_store import write_npz, read_npz
+
+
+class GenKind(IntEnum):
+    """Código numérico do tipo de gerador usado nos arrays compilados."""
+    THERMAL = 0
+    WIND = 1
+    SOLAR = 2
+    HYDRO = 3
+    BATTERY = 4
+    OTHER = 5
+
+
+BUS_TYPE_CODE = {"PQ": 0, "PV": 1, "SLACK": 2}   # Posições em bus.BUS_TYPE_CODES
+
+# Colunas da ElementTable de cada lista da rede: as dos NetworkArrays (sem o prefixo) e, para os
+# valores convertidos para pu/radianos, as de origem nas unidades dos elementos (ver InjectionField)
+TABLE_COLUMNS = {
+    "buses": ("bus", {"id": np.int64, "type": np.int8, "v_pu": float, "theta_deg": float, "theta_rad": float,
+                      "q_shunt_mvar": float, "q_shunt_pu": float}),
+    "lines": ("line", {"id": np.int64, "from": np.int64, "to": np.int64, "r_pu": float, "x_pu": float,
+                       "b_half_pu": float, "flow_max_pu": float, "tap_ratio": float, "tap_phase_deg": float,
+                       "tap_phase_rad": float}),
+    "generators": ("gen", {"id": np.int64, "bus": np.int64, "kind": np.int8, "p_mw": float, "p_pu": float,
+                           "q_mvar": float, "q_pu": float, "p_min_mw": float, "p_min_pu": float, "p_max_mw": float,
+                           "p_max_pu": float, "cost_b_mw": float, "cost_b_pu": float}),
+    "loads": ("load", {"id": np.int64, "bus": np.int64, "p_mw": float, "p_pu": float, "q_mvar": float, "q_pu": float,
+                       "cost_shed_mw": float, "cost_shed_pu": float}),
+}
+
+# Atributos que referenciam barras, por lista (atributo -> coluna com a linha da barra na tabela de barras)
+BUS_REFERENCES = {
+    "lines": {"from_bus": "from", "to_bus": "to"},
+    "generators": {"bus": "bus"},
+    "loads": {"bus": "bus"},
+}
+
+
+@dataclass
+class NetworkArrays:
+    """
+    Dados numéricos de uma Network em colunas (um array por atributo).
+
+    Cada array é indexado como a lista de elementos correspondente da rede
+    (barras, linhas, geradores, cargas) e as potências estão em pu. Os
+    atributos numéricos dos elementos já são guardados em colunas por rede
+    (ElementTable, ver InjectionField) e Network.compile devolve views
+    somente leitura dessas colunas, sem cópia. Solvers e rotinas vetorizadas
+    leem estes arrays em vez de percorrer os atributos objeto a objeto.
+    """
+    sb_mva: float
+
+    # --- Barras ---
+    bus_id:           np.ndarray
+    bus_type:         np.ndarray   # Códigos de BUS_TYPE_CODE
+    bus_v_pu:         np.ndarray
+    bus_theta_rad:    np.ndarray
+    bus_q_shunt_pu:   np.ndarray
+
+    # --- Linhas ---
+    line_id:          np.ndarray
+    line_from:        np.ndarray   # Índice da barra 'from' em bus_id
+    line_to:          np.ndarray   # Índice da barra 'to' em bus_id
+    line_r_pu:        np.ndarray
+    line_x_pu:        np.ndarray
+    line_b_half_pu:   np.ndarray
+    line_flow_max_pu: np.ndarray
+    line_tap_ratio:   np.ndarray
+    line_tap_phase_rad: np.ndarray
+
+    # --- Geradores ---
+    gen_id:           np.ndarray
+    gen_bus:          np.ndarray   # Índice da barra em bus_id
+    gen_kind:         np.ndarray   # Códigos de GenKind
+    gen_p_pu:         np.ndarray
+    gen_q_pu:         np.ndarray
+    gen_p_min_pu:     np.ndarray
+    gen_p_max_pu:     np.ndarray
+    gen_cost_b_pu:    np.ndarray
+
+    # --- Cargas ---
+    load_id:          np.ndarray
+    load_bus:         np.ndarray   # Índice da barra em bus_id
+    load_p_pu:        np.ndarray
+    load_q_pu:        np.ndarray
+    load_cost_shed_pu: np.ndarray
+
+    @property
+    def n_bus(self) -> int:
+        return len(self.bus_id)
+
+    @property
+    def n_line(self) -> int:
+        return len(self.line_id)
+
+    @property
+    def n_gen(self) -> int:
+        return len(self.gen_id)
+
+    @property
+    def n_load(self) -> int:
+        return len(self.load_id)
+
+    @property
+    def nbytes(self) -> int:
+        """Memória total ocupada pelos arrays (bytes)."""
+        return sum(v.nbytes for v in vars(self).values() if isinstance(v, np.ndarray))
+
+    def copy(self) -> "NetworkArrays":
+        """Cópia com todos os arrays copiados (graváveis; usada para aplicar as alterações dos cenários)."""
+        return NetworkArrays(**{k: (v.copy() if isinstance(v, np.ndarray) else v) for k, v in vars(self).items()})
+
+    def to_npz(self, prefix: str = "arrays/") -> dict:
+        """Arrays com as chaves usadas nos arquivos de snapshot."""
+        arrays = {f"{prefix}{f.name}": getattr(self, f.name) for f in fields(self) if f.name != "sb_mva"}
+        arrays["__sb_mva__"] = np.array(self.sb_mva)
+        return arrays
+
+    def save(self, path) -> None:
+        """Grava os arrays em um .npz sem compressão, que load(mmap=True) consegue mapear."""
+        write_npz(path, self.to_npz())
+
+    @classmethod
+    def load(cls, path, mmap: bool = True) -> "NetworkArrays":
+        """
+        Lê os arrays gravados por save() ou Network.save(). Com mmap=True
+        (padrão) os arrays são mapeamentos somente leitura do arquivo: os
+        processos que carregam o mesmo snapshot compartilham uma única cópia
+        dos dados e nada é reconstruído. Use copy() para obter arrays graváveis.
+        """
+        data = read_npz(path, mmap=mmap)
+        missing = [f.name for f in fields(cls) if f.name != "sb_mva" and f"arrays/{f.name}" not in data]
+        if missing:
+            raise ValueError(f"{path}: not a network snapshot (missing arrays {missing}).")
+        return cls(sb_mva=float(data["__sb_mva__"]),
+                   **{f.name: data[f"arrays/{f.name}"] for f in fields(cls) if f.name != "sb_mva"})
+
+
+def gen_kind(gen) -> int:
+    """Código GenKind da classe de um gerador."""
+    for cls, kind in ((ThermalGenerator, GenKind.THERMAL), (WindGenerator, GenKind.WIND),
+                      (SolarGenerator, GenKind.SOLAR), (HydroGenerator, GenKind.HYDRO),
+                      (Battery, GenKind.BATTERY)):
+        if isinstance(gen, cls):
+            return kind
+    return GenKind.OTHER
+
+
+def compile_network(net) -> NetworkArrays:
+    """
+    Monta os NetworkArrays de uma Network a partir das tabelas de elementos
+    da rede (Network._element_tables): cada array é uma view somente leitura
+    de uma coluna, sem cópia e sem percorrer os objetos (Network.compile
+    guarda o resultado).
+    """
+    tables = net._element_tables()
+    arrays = {}
+    for attr, (prefix, _) in TABLE_COLUMNS.items():
+        table = tables[attr]
+        table.rescale(net.sb_mva)
+        for name in _COMPILED[prefix]:
+            arrays[f"{prefix}_{name}"] = table.view(name)
+    for attr, references in BUS_REFERENCES.items():
+        prefix = TABLE_COLUMNS[attr][0]
+        for name, column in references.items():
+            missing = np.flatnonzero(arrays[f"{prefix}_{column}"] < 0)
+            if len(missing):
+                element = getattr(net, attr)[missing[0]]
+                raise ValueError(f"{type(element).__name__} {element.id}: {name} {getattr(element, name).id} "
+                                 f"is not part of the network.")
+    return NetworkArrays(sb_mva=net.sb_mva, **arrays)
+
+
+# Colunas de cada tabela que são campos dos NetworkArrays (as demais são as de origem dos valores convertidos)
+_COMPILED = {prefix: [name for name in columns if f"{prefix}_{name}" in {f.name for f in fields(NetworkArrays)}]
+             for prefix, columns in TABLE_COLUMNS.values()}
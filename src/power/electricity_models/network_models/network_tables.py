@@ -0,0 +1,275 @@
+"""
+Front end tabular das redes: monta os elementos de uma Network a partir de
+tabelas em colunas (load_tables) e faz o caminho inverso (dump_tables).
+
+A ingestão é feita por coluna: os atributos compilados (ver InjectionField)
+são copiados em bloco para as tabelas de elementos da rede (ElementTable),
+sem passar valor a valor pelos objetos. Os objetos dos elementos ainda são
+criados, um por linha, mas sem os construtores: recebem só os slots que não
+estão nas tabelas (nome, referências às barras, atributos não compilados) e
+são registrados nas listas da rede e das barras como os construtores fariam,
+com os mesmos defaults e nomes padrão.
+"""
+from __future__ import annotations
+import numpy as np
+from dataclasses import fields, MISSING
+from enum import Enum
+from typing import Dict, List, Optional
+from power.electricity_models.bus_models import Bus, BusType
+from power.electricity_models.line_models import Line
+from power.electricity_models.load_models import Load
+from power.electricity_models.generator_models import (ThermalGenerator, WindGenerator, SolarGenerator,
+                                                       HydroGenerator, Battery)
+from power.electricity_models.injection_field import BusField, table_fields, slot_members
+from power.electricity_models.network_models.network_arrays import gen_kind
+
+# Valores da coluna "kind" da tabela de geradores
+GENERATOR_KINDS = {
+    "thermal": ThermalGenerator,
+    "wind":    WindGenerator,
+    "solar":   SolarGenerator,
+    "hydro":   HydroGenerator,
+    "battery": Battery,
+}
+
+# Prefixo dos nomes padrão dados pelos construtores (ex.: "Line_7")
+_DEFAULT_NAMES = {Bus: "Bus", Line: "Line", Load: "Load", ThermalGenerator: "ThermalGenerator",
+                  WindGenerator: "WindGenerator", SolarGenerator: "SolarGenerator", Battery: "Battery"}
+
+
+def table_columns(table) -> Dict[str, np.ndarray]:
+    """
+    Converte uma tabela em um dict nome da coluna -> array numpy.
+
+    Aceita dict de sequências, array estruturado do numpy, DataFrame do
+    pandas ou Table do pyarrow (qualquer objeto com `column_names` e `column()`).
+    """
+    if isinstance(table, np.ndarray) and table.dtype.names is not None:
+        return {name: table[name] for name in table.dtype.names}
+    if hasattr(table, "column_names") and hasattr(table, "column"):   # pyarrow.Table
+        return {name: table.column(name).to_numpy(zero_copy_only=False) for name in table.column_names}
+    if hasattr(table, "columns") and hasattr(table, "to_numpy"):      # pandas.DataFrame
+        return {str(name): table[name].to_numpy() for name in table.columns}
+    if isinstance(table, dict):
+        return {name: np.asarray(values) for name, values in table.items()}
+    raise TypeError(f"Unsupported table type: {type(table).__name__}")
+
+
+def _init_fields(cls) -> set:
+    return {f.name for f in fields(cls) if f.init}
+
+
+def _bus_lookup(net, ids: np.ndarray, table: str, column: str) -> list:
+    bus_idx = net.bus_idx
+    try:
+        return [net.buses[bus_idx[i]] for i in ids.tolist()]
+    except KeyError as e:
+        raise ValueError(f"{table}.{column} references bus {e.args[0]}, which is not part of the network.") from None
+
+
+def _missing(values: np.ndarray) -> np.ndarray:
+    """Células None/NaN de uma coluna (ficam com o default do atributo)."""
+    if values.dtype.kind == "f":
+        return np.isnan(values)
+    if values.dtype.kind == "O":
+        return np.array([v is None or v != v for v in values.tolist()], dtype=bool)
+    return np.zeros(len(values), dtype=bool)
+
+
+def _array_values(table: str, column: Optional[np.ndarray], idx: np.ndarray, field) -> np.ndarray:
+    """Valores de um atributo compilado nas linhas idx, com o default do atributo nas células vazias."""
+    if column is None:
+        if field.default is MISSING:
+            raise ValueError(f"{table}: missing column '{field.name}'.")
+        return np.full(len(idx), field.default, dtype=object if isinstance(field.default, Enum) else None)
+    values = column[idx]
+    missing = _missing(values)
+    if missing.any():
+        if field.default is MISSING:
+            raise ValueError(f"{table}.{field.name}: empty cells in a required column.")
+        values = values.astype(object if values.dtype.kind in "OUS" else float)
+        values[missing] = field.default
+    return values
+
+
+def _default(field):
+    return field.default_factory() if field.default_factory is not MISSING else field.default
+
+
+def _ingest(net, attr: str, table_name: str, groups: List[tuple], cols: Dict[str, np.ndarray],
+            refs: Dict[str, list], n: int) -> List[list]:
+    """
+    Acrescenta n elementos à lista `attr` de `net`. groups: [(classe, linhas
+    da tabela dessa classe)]. As colunas dos atributos compilados vão em bloco
+    para a ElementTable da lista; os objetos são criados sem __init__ e
+    recebem os demais slots (valor da coluna ou default do dataclass).
+    Devolve os objetos de cada grupo.
+    """
+    elements = net._elements(attr)
+    table = net._element_table(attr)
+    in_order = table.synced == (id(elements), elements.version)
+    start = table.add_rows(n)
+    created = [None] * n
+    by_group = []
+    for cls, idx in groups:
+        objects = [object.__new__(cls) for _ in range(len(idx))]
+        rows = start + idx
+        compiled = dict(table_fields(cls))
+        members = slot_members(cls)
+        ids = cols["id"][idx].tolist() if "id" in cols else None
+        for field in fields(cls):
+            name, setter = field.name, members[field.name].__set__
+            if isinstance(compiled.get(name), BusField):
+                buses = [refs[name][i] for i in idx.tolist()]
+                table.set(compiled[name].column, rows,
+                          np.fromiter(map(net._bus_row, buses), np.int64, len(buses)))
+                values = buses
+            elif name in compiled:
+                compiled[name].store_column(table, rows, _array_values(table_name, cols.get(name), idx, field))
+                values = [None] * len(idx)
+            elif name == "network":
+                values = [net] * len(idx)
+            elif name == "_table":
+                values = [table] * len(idx)
+            elif name == "_row":
+                values = rows.tolist()
+            elif name == "sb_mva":
+                values = [net.sb_mva] * len(idx)
+            elif field.init and name in cols:
+                default = _default(field)
+                values = [default if v is None or v != v else v for v in cols[name][idx].tolist()]
+            else:
+                values = [_default(field) for _ in range(len(idx))]
+            for obj, value in zip(objects, values):
+                setter(obj, value)
+        # Nomes padrão dos construtores (o de Line é sempre str; "Generator_<id>" vira o da subclasse)
+        name = members["name"]
+        prefix = _DEFAULT_NAMES[cls]
+        for obj, i in zip(objects, ids):
+            given = name.__get__(obj)
+            if given is None or (attr == "generators" and given == f"Generator_{i}"):
+                name.__set__(obj, f"{prefix}_{i}")
+            elif cls is Line:
+                name.__set__(obj, str(given))
+        if attr == "generators":
+            table.set("kind", rows, gen_kind(objects[0]))
+        for i, obj in zip(idx.tolist(), objects):
+            created[i] = obj
+        by_group.append(objects)
+    elements.extend(created)
+    if in_order:
+        table.synced = (id(elements), elements.version)
+    return by_group
+
+
+def load_tables(net, buses=None, lines=None, generators=None, loads=None) -> None:
+    """
+    Adiciona a `net` os elementos descritos por tabelas em colunas.
+
+    Cada tabela tem uma linha por elemento e uma coluna por argumento do
+    construtor da classe do elemento (unidades físicas, como nos
+    construtores). As barras são referenciadas pelo id:
+        buses:      id, btype ("PQ"/"PV"/"SLACK"), v_pu, theta_deg, q_shunt_mvar, ...
+        lines:      id, from_bus, to_bus, r_pu, x_pu, shunt_half_pu, flow_max_pu, ...
+        generators: id, bus, kind (ver GENERATOR_KINDS), p_mw, p_max_mw, cost_b_mw, ...
+        loads:      id, bus, p_mw, q_mvar, cost_shed_mw, ...
+    Colunas que não se aplicam a uma classe são ignoradas e células
+    None/NaN ficam com o default do construtor, de modo que uma única
+    tabela de geradores pode ter todos os tipos. As colunas dos atributos
+    compilados são copiadas em bloco para as tabelas da rede (ver o
+    docstring do módulo); geradores hidráulicos, que dependem de uma barra
+    hidráulica, não podem ser carregados de tabelas.
+    """
+    if buses is not None:
+        cols = table_columns(buses)
+        if "btype" in cols:
+            names, inverse = np.unique(cols["btype"].astype(str), return_inverse=True)
+            codes = np.array([BusType(name.upper()) for name in names.tolist()], dtype=object)
+            cols["btype"] = codes[inverse.ravel()]
+        n = len(cols["id"]) if "id" in cols else 0
+        _ingest(net, "buses", "buses", [(Bus, np.arange(n))], cols, {}, n)
+
+    if lines is not None:
+        cols = table_columns(lines)
+        refs = {"from_bus": _bus_lookup(net, cols["from_bus"], "lines", "from_bus"),
+                "to_bus": _bus_lookup(net, cols["to_bus"], "lines", "to_bus")}
+        n = len(refs["from_bus"])
+        _ingest(net, "lines", "lines", [(Line, np.arange(n))], cols, refs, n)
+
+    if generators is not None:
+        cols = table_columns(generators)
+        refs = {"bus": _bus_lookup(net, cols["bus"], "generators", "bus")}
+        n = len(refs["bus"])
+        kinds = cols["kind"].astype(str) if "kind" in cols else np.full(n, "thermal")
+        unknown = set(kinds.tolist()) - GENERATOR_KINDS.keys()
+        if unknown:
+            raise ValueError(f"Unknown generator kind(s) {sorted(unknown)}. Valid kinds: {list(GENERATOR_KINDS)}.")
+        if "hydro" in kinds:
+            raise ValueError("Hydro generators need a hydro bus and cannot be loaded from tables.")
+        groups = [(cls, np.flatnonzero(kinds == kind)) for kind, cls in GENERATOR_KINDS.items() if kind in kinds]
+        for cls, idx in groups:
+            if cls is Battery:
+                soc = _array_values("generators", cols.get("soc_mwh"), idx, _field(Battery, "soc_mwh"))
+                capacity = _array_values("generators", cols.get("capacity_mwh"), idx, _field(Battery, "capacity_mwh"))
+                if np.any(soc.astype(float) > capacity.astype(float)):
+                    raise ValueError("Estado de carga (soc_mwh) não pode exceder a capacidade (capacity_mwh).")
+        for (cls, idx), gens in zip(groups, _ingest(net, "generators", "generators", groups, cols, refs, n)):
+            if cls.bucket is not None:
+                getattr(net, cls.bucket).extend(gens)
+            for gen in gens:
+                gen.bus.add_generator(gen)
+
+    if loads is not None:
+        cols = table_columns(loads)
+        refs = {"bus": _bus_lookup(net, cols["bus"], "loads", "bus")}
+        n = len(refs["bus"])
+        for load in _ingest(net, "loads", "loads", [(Load, np.arange(n))], cols, refs, n)[0]:
+            load.bus.add_load(load)
+
+
+def _field(cls, name: str):
+    return next(f for f in fields(cls) if f.name == name)
+
+
+def _column(values: list) -> Optional[np.ndarray]:
+    """Converte os valores de um atributo em array, ou None se não forem dados escalares."""
+    if all(v is None or isinstance(v, (bool, int, float, np.number)) for v in values):
+        return np.array([np.nan if v is None else v for v in values], dtype=float)
+    if all(isinstance(v, (str, Enum)) for v in values):
+        return np.array([v.value if isinstance(v, Enum) else v for v in values], dtype=str)
+    return None   # referências a objetos, listas, séries temporais...
+
+
+def _dump(elements, names, refs: Dict[str, str]) -> Dict[str, np.ndarray]:
+    cols = {"id": np.array([e.id for e in elements], dtype=np.int64)}
+    for name, attr in refs.items():
+        cols[name] = np.array([getattr(e, attr).id for e in elements], dtype=np.int64)
+    for name in sorted(names - {"id"} - refs.keys()):
+        values = [getattr(e, name, None) for e in elements]
+        column = _column(values) if elements else None
+        if column is not None:
+            cols[name] = column
+    return cols
+
+
+def dump_tables(net) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Inverso de load_tables: devolve as barras, linhas, geradores e cargas de
+    `net` como tabelas (dict de arrays). Só os argumentos escalares dos
+    construtores são gravados (números, strings, enums); referências a outros
+    objetos além das barras (ex.: usinas hidráulicas) e séries temporais não
+    fazem parte das tabelas.
+    """
+    kind_of = {cls: kind for kind, cls in GENERATOR_KINDS.items()}
+    unknown = {type(g).__name__ for g in net.generators if type(g) not in kind_of}
+    if unknown:
+        raise ValueError(f"Generator class(es) {sorted(unknown)} have no table kind. Valid kinds: {list(GENERATOR_KINDS)}.")
+    gen_names = set().union(*(_init_fields(cls) for cls in GENERATOR_KINDS.values()))
+    generators = _dump(net.generators, gen_names, {"bus": "bus"})
+    generators["kind"] = np.array([kind_of[type(g)] for g in net.generators], dtype=str)
+    return {
+        "buses":      _dump(net.buses, _init_fields(Bus) - {"network"}, {}),
+        "lines":      _dump(net.lines, _init_fields(Line), {"from_bus": "from_bus", "to_bus": "to_bus"}),
+        "generators": generators,
+        "loads":      _dump(net.loads, _init_fields(Load), {"bus": "bus"}),
+    }
@@ -0,0 +1,56 @@
+from __future__ import annotations
+import os
+import zipfile
+import numpy as np
+from pathlib import Path
+from typing import Dict
+
+
+def write_npz(path, arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Writes arrays to an uncompressed .npz file. The file is written to a
+    temporary name and then renamed, so readers never see a partial file.
+    Uncompressed members are what allows read_npz(mmap=True).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, **{k: np.asarray(v) for k, v in arrays.items()})
+    os.replace(tmp, path)
+
+
+def _member_memmap(path, fh, info: zipfile.ZipInfo) -> np.ndarray:
+    # Cabeçalho local do zip: 30 bytes fixos + nome + campo extra (tamanhos nos bytes 26..29)
+    fh.seek(info.header_offset + 26)
+    name_len = int.from_bytes(fh.read(2), "little")
+    extra_len = int.from_bytes(fh.read(2), "little")
+    fh.seek(info.header_offset + 30 + name_len + extra_len)
+    version = np.lib.format.read_magic(fh)
+    read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+    shape, fortran, dtype = read_header(fh)
+    if dtype.hasobject:
+        raise ValueError(f"Member {info.filename} holds Python objects and cannot be memory-mapped.")
+    if not shape or 0 in shape:   # np.memmap não aceita arrays vazios/escalares: lidos diretamente
+        count = int(np.prod(shape))
+        return np.frombuffer(fh.read(count * dtype.itemsize), dtype=dtype, count=count).reshape(shape)
+    return np.memmap(path, dtype=dtype, mode="r", offset=fh.tell(), shape=shape, order="F" if fortran else "C")
+
+
+def read_npz(path, mmap: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Reads every array of an .npz file. With mmap=True the arrays are
+    read-only np.memmap views on the file: nothing is copied up front, and
+    processes mapping the same file share its pages through the OS cache.
+    """
+    if not mmap:
+        with np.load(path, allow_pickle=False) as data:
+            return {key: data[key] for key in data.files}
+    arrays = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as fh:
+        for info in zf.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path}: member {info.filename} is compressed; mmap needs an uncompressed .npz.")
+            key = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            arrays[key] = _member_memmap(path, fh, info)
+    return arrays
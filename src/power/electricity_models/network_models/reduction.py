@@ -0,0 +1,253 @@
+from __future__ import annotations
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from power.electricity_models.network_models.network_tables import dump_tables
+
+
+def kron_reduce(matrix, keep) -> np.ndarray:
+    """
+    Kron reduction of a nodal matrix (Ybus, B', dense or scipy sparse) onto
+    the positions `keep`: M_RR - M_RE M_EE^-1 M_ER. Returns a dense matrix.
+    """
+    from scipy import sparse
+    from scipy.sparse.linalg import splu
+
+    M = sparse.csr_matrix(matrix)
+    keep = np.asarray(keep, dtype=np.int64)
+    elim = np.setdiff1d(np.arange(M.shape[0]), keep)
+    M_RR = M[keep][:, keep].toarray()
+    if len(elim) == 0:
+        return M_RR
+    lu = splu(M[elim][:, elim].tocsc())
+    return M_RR - M[keep][:, elim] @ lu.solve(M[elim][:, keep].toarray())
+
+
+def dc_angles(n: int, line_from: np.ndarray, line_to: np.ndarray, x_pu: np.ndarray, p_pu: np.ndarray, slack: int) -> np.ndarray:
+    """Sparse DC power flow: bus angles (rad) for the injections p_pu, with theta[slack] = 0."""
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.linalg import spsolve
+
+    y = 1.0 / x_pu
+    rows = np.concatenate([line_from, line_to, line_from, line_to])
+    cols = np.concatenate([line_from, line_to, line_to, line_from])
+    B = coo_matrix((np.concatenate([y, y, -y, -y]), (rows, cols)), shape=(n, n)).tocsr()
+    keep = np.flatnonzero(np.arange(n) != slack)
+    theta = np.zeros(n)
+    theta[keep] = spsolve(B[keep][:, keep].tocsc(), p_pu[keep])
+    return theta
+
+
+@dataclass
+class NetworkReduction:
+    """
+    Result of reduce_network: the reduced Network and how it maps to the
+    original one, with the approximation error of the reduction measured on
+    the DC flows of the current injections.
+    """
+    network:             "Network"
+    retained_bus_ids:    np.ndarray
+    equivalent_line_ids: List[int]        = field(default_factory=list)
+    # Elementos das barras eliminadas: id original -> {id da parcela na rede reduzida: fração}
+    generator_split:     Dict[int, Dict[int, float]] = field(default_factory=dict)
+    load_split:          Dict[int, Dict[int, float]] = field(default_factory=dict)
+
+    # --- Erro da aproximação (fluxo DC, injeções atuais) ---
+    max_flow_error_pu:   float = 0.0      # Maior erro absoluto nos fluxos das linhas retidas
+    rel_flow_error:      float = 0.0      # max_flow_error_pu / maior fluxo das linhas retidas
+    max_angle_error_rad: float = 0.0      # Maior erro de ângulo nas barras retidas
+    dropped_admittance:  float = 0.0      # Soma das admitâncias equivalentes descartadas (pu)
+
+    def report(self) -> str:
+        net = self.network
+        return (f"Reduced to {len(net.buses)} buses / {len(net.lines)} lines "
+                f"({len(self.equivalent_line_ids)} equivalent lines, {len(self.generator_split)} generators and "
+                f"{len(self.load_split)} loads split). DC flow error: {self.max_flow_error_pu:.3e} pu "
+                f"({self.rel_flow_error:.2%}), angle error: {self.max_angle_error_rad:.3e} rad, "
+                f"dropped admittance: {self.dropped_admittance:.3e} pu.")
+
+
+def _keep_positions(net, keep) -> np.ndarray:
+    buses = getattr(keep, "buses", keep)   # SubMarket: barras do submercado
+    bus_idx = net.bus_idx
+    ids = [getattr(b, "id", b) for b in buses]
+    missing = [i for i in ids if i not in bus_idx]
+    if missing:
+        raise ValueError(f"Buses {missing[:10]} are not part of the network.")
+    return np.unique(np.array([bus_idx[i] for i in ids], dtype=np.int64))
+
+
+def _take(table: Dict[str, np.ndarray], mask) -> Dict[str, np.ndarray]:
+    return {k: v[mask] for k, v in table.items()}
+
+
+def _concat(a: Dict[str, np.ndarray], b: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    out = {}
+    for k in a.keys() | b.keys():
+        va = a.get(k, np.full(len(a["id"]), np.nan))
+        vb = b.get(k, np.full(len(b["id"]), np.nan))
+        out[k] = np.concatenate([va, vb]) if va.dtype.kind == vb.dtype.kind else np.concatenate([va.astype(object), vb.astype(object)])
+    return out
+
+
+# Colunas proporcionais à potência: escaladas pela fração de cada parcela
+SPLIT_COLUMNS = ("p_mw", "q_mvar", "p_max_mw", "p_min_mw", "q_max_mvar", "q_min_mvar", "max_ramp_up_mw", "max_ramp_down_mw")
+
+
+def _split_rows(table: Dict[str, np.ndarray], row_elim: np.ndarray, D: np.ndarray, boundary_ids: np.ndarray, split_tol: float):
+    """
+    Replaces every row whose bus was eliminated (row_elim >= 0) by one piece
+    per boundary bus with a distribution factor >= split_tol (factors
+    renormalized; the largest one is used if none reaches the tolerance).
+    Returns the new table and {original id: {piece id: fraction}}.
+    """
+    moved = np.flatnonzero(row_elim >= 0)
+    if len(moved) == 0:
+        return table, {}
+    F = D[row_elim[moved]]
+    share = np.where(F >= split_tol, F, 0.0)
+    none = share.sum(axis=1) == 0
+    share[none, F[none].argmax(axis=1)] = 1.0
+    share /= share.sum(axis=1, keepdims=True)
+
+    k, b = np.nonzero(share)
+    rows = moved[k]
+    frac = share[k, b]
+    first = int(table["id"].max()) + 1
+    piece_ids = np.arange(first, first + len(rows), dtype=np.int64)
+    pieces = {c: v[rows] for c, v in table.items()}
+    for c in SPLIT_COLUMNS:
+        if c in pieces:
+            pieces[c] = pieces[c] * frac
+    pieces["id"] = piece_ids
+    pieces["bus"] = boundary_ids[b]
+    if "name" in pieces:
+        pieces["name"] = np.char.add(np.char.add(pieces["name"].astype(str), "_eq"), pieces["bus"].astype(str))
+
+    split: Dict[int, Dict[int, float]] = {}
+    for orig, pid, f in zip(table["id"][rows].tolist(), piece_ids.tolist(), frac.tolist()):
+        split.setdefault(orig, {})[pid] = f
+    keep = np.ones(len(table["id"]), dtype=bool)
+    keep[moved] = False
+    return _concat(_take(table, keep), pieces), split
+
+
+def reduce_network(net, keep, min_admittance: float = 1e-6, split_tol: float = 0.05, name: Optional[str] = None) -> NetworkReduction:
+    """
+    Ward/Kron reduction of the DC (B') model of `net` onto the buses `keep`
+    (bus ids, Bus objects or a SubMarket). The slack bus is always kept.
+
+    - Eliminated buses are removed by Kron reduction of B'. The fill-in
+      between boundary buses becomes equivalent lines (r = 0, x = 1/y, no
+      flow limit); equivalents with y below min_admittance * max(y) are dropped.
+    - Generators and loads of eliminated buses are split over the boundary
+      buses with the Ward distribution factors D = -B_RE B_EE^-1 (factors
+      below split_tol are dropped and the rest renormalized). Each piece keeps
+      the costs of the original element, with its powers and limits scaled by
+      the factor. At the current injections the DC flows of the retained lines
+      are exact up to split_tol and min_admittance; in a dispatch the pieces
+      of one generator may be dispatched unevenly, which relaxes the original
+      problem.
+
+    Retained elements keep their ids; equivalent lines and pieces get new ids
+    above the largest existing one (see generator_split / load_split).
+    """
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+    from scipy.sparse.linalg import splu
+    from power.electricity_models.network_models.network import Network
+    from power.electricity_models.bus_models import BusType
+
+    arrays = net.compile()
+    n = arrays.n_bus
+    slack = [i for i, b in enumerate(net.buses) if b.btype == BusType.SLACK]
+    kept = np.union1d(_keep_positions(net, keep), np.array(slack, dtype=np.int64))
+    is_kept = np.zeros(n, dtype=bool)
+    is_kept[kept] = True
+    elim = np.flatnonzero(~is_kept)
+    elim_pos = np.full(n, -1)
+    elim_pos[elim] = np.arange(len(elim))
+
+    f, t = arrays.line_from, arrays.line_to
+    y = 1.0 / arrays.line_x_pu
+    B = sparse.coo_matrix((np.concatenate([y, y, -y, -y]),
+                           (np.concatenate([f, t, f, t]), np.concatenate([f, t, t, f]))), shape=(n, n)).tocsr()
+
+    # Barras de fronteira: retidas com alguma linha para barras eliminadas
+    cut = is_kept[f] != is_kept[t]
+    boundary = np.unique(np.where(is_kept[f[cut]], f[cut], t[cut]))
+    if len(elim):
+        # Cada ilha de barras eliminadas precisa tocar a fronteira (senão B_EE é singular)
+        n_comp, labels = connected_components(B[elim][:, elim], directed=False)
+        touching = np.zeros(n_comp, dtype=bool)
+        touching[labels[elim_pos[np.where(is_kept[f[cut]], t[cut], f[cut])]]] = True
+        if not touching.all():
+            isolated = arrays.bus_id[elim[~touching[labels]]]
+            raise ValueError(f"Buses {isolated[:10].tolist()} are not connected to any retained bus.")
+        X = splu(B[elim][:, elim].tocsc()).solve(B[elim][:, boundary].toarray())   # B_EE^-1 B_Eb
+        C = B[boundary][:, elim] @ X                                               # Correção de Kron (b x b)
+        D = -X                                                                     # D[e, b]: fração de e em b
+    else:
+        C = np.zeros((0, 0))
+        D = np.zeros((0, 0))
+
+    tables = dump_tables(net)
+    bus_ids = arrays.bus_id
+    kept_ids = bus_ids[kept]
+    retained_bus = np.isin(tables["buses"]["id"], kept_ids)
+    retained_line = is_kept[f] & is_kept[t]
+
+    # --- Linhas equivalentes (parte triangular superior da correção) ---
+    i, j = np.triu_indices(len(boundary), k=1)
+    y_eq = C[i, j] if len(boundary) else np.zeros(0)
+    threshold = min_admittance * (y.max() if len(y) else 0.0)
+    use = y_eq > threshold
+    dropped = float(y_eq[(~use) & (y_eq > 0)].sum())
+    first_line = int(arrays.line_id.max()) + 1 if arrays.n_line else 1
+    eq_ids = np.arange(first_line, first_line + use.sum(), dtype=np.int64)
+    eq_lines = {
+        "id":            eq_ids,
+        "from_bus":      bus_ids[boundary[i[use]]],
+        "to_bus":        bus_ids[boundary[j[use]]],
+        "name":          np.array([f"Equivalent_{k}" for k in eq_ids], dtype=str),
+        "r_pu":          np.zeros(use.sum()),
+        "x_pu":          1.0 / y_eq[use],
+    }
+    lines = _concat(_take(tables["lines"], retained_line), eq_lines)
+
+    # --- Geradores e cargas das barras eliminadas: divididos pelos fatores de distribuição ---
+    bus_idx = net.bus_idx
+    row_elim = {table: elim_pos[np.array([bus_idx[b] for b in tables[table]["bus"].tolist()], dtype=np.int64)]
+                for table in ("generators", "loads")}
+    gens, gen_split = _split_rows(tables["generators"], row_elim["generators"], D, bus_ids[boundary], split_tol)
+    loads, load_split = _split_rows(tables["loads"], row_elim["loads"], D, bus_ids[boundary], split_tol)
+
+    reduced = Network.from_tables(_take(tables["buses"], retained_bus), lines=lines, generators=gens, loads=loads,
+                                  sb_mva=net.sb_mva, name=name or f"{net.name}_Reduced")
+
+    result = NetworkReduction(network=reduced, retained_bus_ids=kept_ids, equivalent_line_ids=eq_ids.tolist(),
+                              generator_split=gen_split, load_split=load_split, dropped_admittance=dropped)
+    _measure_error(net, arrays, reduced, result, slack[0] if slack else int(kept[0]))
+    return result
+
+
+def _measure_error(net, arrays, reduced, result: NetworkReduction, slack: int) -> None:
+    """Compares the DC flows of the retained lines and the retained bus angles (full vs. reduced network)."""
+    full_theta = dc_angles(arrays.n_bus, arrays.line_from, arrays.line_to, arrays.line_x_pu, np.asarray(net.p_injection_pu), slack)
+    red = reduced.compile()
+    red_slack = reduced.bus_idx[int(arrays.bus_id[slack])]
+    red_theta = dc_angles(red.n_bus, red.line_from, red.line_to, red.line_x_pu, np.asarray(reduced.p_injection_pu), red_slack)
+
+    full_flow = (full_theta[arrays.line_from] - full_theta[arrays.line_to]) / arrays.line_x_pu
+    red_flow = (red_theta[red.line_from] - red_theta[red.line_to]) / red.line_x_pu
+    line_pos = {l: k for k, l in enumerate(arrays.line_id.tolist())}
+    common = [(line_pos[l], k) for k, l in enumerate(red.line_id.tolist()) if l in line_pos]
+    if common:
+        a, b = map(list, zip(*common))
+        err = np.abs(full_flow[a] - red_flow[b])
+        result.max_flow_error_pu = float(err.max())
+        scale = np.abs(full_flow[a]).max()
+        result.rel_flow_error = float(result.max_flow_error_pu / scale) if scale > 0 else 0.0
+    bus_pos = {b: k for k, b in enumerate(arrays.bus_id.tolist())}
+    full_idx = [bus_pos[b] for b in red.bus_id.tolist()]
+    result.max_angle_error_rad = float(np.abs(full_theta[full_idx] - red_theta).max()) if len(full_idx) else 0.0
@@ -0,0 +1,271 @@
+from __future__ import annotations
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+from power.electricity_models.generator_models import WindGenerator
+
+
+@dataclass
+class Scenario:
+    """
+    Copy-on-write overlay over a base Network.
+
+    A Scenario does not copy any element of the base network. It only stores
+    sparse overrides (load scalings, wind availabilities, generator limits,
+    removed lines and modified line parameters), so creating one costs
+    O(changes) instead of O(network size) like copy.deepcopy. Solvers read
+    the overridden values through the same accessors exposed by Network
+    (load_p_pu, gen_p_max_pu, gen_p_min_pu, line_x_pu, line_flow_max_pu and
+    lines), so a Scenario can be passed anywhere a Network is expected. The
+    line lookups (line_idx, get_line) index the lines in service. Every other
+    attribute is delegated to the base network.
+    """
+    base:             "Network"
+    name:             Optional[str]    = None
+    load_scale:       Dict[int, float] = field(default_factory=dict)  # load id -> fator sobre p_mw
+    wind_p_max_mw:    Dict[int, float] = field(default_factory=dict)  # gen id -> disponibilidade (MW)
+    gen_p_min_mw:     Dict[int, float] = field(default_factory=dict)  # gen id -> p_min_mw
+    gen_p_max_mw:     Dict[int, float] = field(default_factory=dict)  # gen id -> p_max_mw
+    removed_lines:    Set[int]         = field(default_factory=set)   # ids das linhas fora de serviço
+    line_x:           Dict[int, float] = field(default_factory=dict)  # line id -> x_pu
+    line_flow_max:    Dict[int, float] = field(default_factory=dict)  # line id -> flow_max_pu
+    # Resultados derivados (linhas em serviço, line_idx, compile), cada um com a chave do estado de que foi calculado
+    _cache:           dict             = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.name is None:
+            self.name = f"{self.base.name}_Scenario"
+
+    def __getattr__(self, attr):
+        # Only called when the attribute is not found on the Scenario itself.
+        if attr in ("base", "_cache"):
+            raise AttributeError(attr)
+        return getattr(self.base, attr)
+
+    def _cached(self, name: str, key, build):
+        """Value of `build()` kept under `name` until `key` changes."""
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = build()
+        self._cache[name] = (key, value)
+        return value
+
+    def _lines_key(self) -> tuple:
+        lines = self.base._elements("lines")
+        return id(lines), lines.version, frozenset(self.removed_lines)
+
+    def _override_key(self) -> tuple:
+        """Current overrides, compared to decide whether the compiled arrays are still valid."""
+        return (tuple(self.load_scale.items()), tuple(self.wind_p_max_mw.items()), tuple(self.gen_p_min_mw.items()),
+                tuple(self.gen_p_max_mw.items()), frozenset(self.removed_lines), tuple(self.line_x.items()),
+                tuple(self.line_flow_max.items()))
+
+    # ----------------------------------------------------------------OVERRIDES----------------------------------------------------------------#
+    def scale_load(self, load_id: int, factor: float) -> "Scenario":
+        """Multiplies the active power of a load by factor (composes with previous scalings)."""
+        self.load_scale[load_id] = self.load_scale.get(load_id, 1.0) * factor
+        return self
+
+    def set_wind_available(self, gen_id: int, p_max_mw: float) -> "Scenario":
+        """Sets the available power (p_max_mw) of a wind generator."""
+        if not isinstance(self.base.get_generator(gen_id), WindGenerator):
+            raise ValueError(f"Generator {gen_id} is not a wind generator.")
+        self.wind_p_max_mw[gen_id] = p_max_mw
+        return self
+
+    def set_gen_limits(self, gen_id: int, p_min_mw: Optional[float] = None,
+                       p_max_mw: Optional[float] = None) -> "Scenario":
+        """Overrides the active power limits of a generator (e.g. ramp limits around a previous dispatch)."""
+        if p_min_mw is not None:
+            self.gen_p_min_mw[gen_id] = p_min_mw
+        if p_max_mw is not None:
+            self.gen_p_max_mw[gen_id] = p_max_mw
+        return self
+
+    def remove_line(self, line_id: int) -> "Scenario":
+        """Takes a line out of service."""
+        self.removed_lines.add(line_id)
+        return self
+
+    def set_line_reactance(self, line_id: int, x_pu: float, flow_max_pu: Optional[float] = None) -> "Scenario":
+        """Overrides the reactance (and optionally the flow limit) of a line."""
+        self.line_x[line_id] = x_pu
+        if flow_max_pu is not None:
+            self.line_flow_max[line_id] = flow_max_pu
+        return self
+
+    def derive(self, name: Optional[str] = None) -> "Scenario":
+        """
+        Returns a child scenario over the same base network with a copy of the
+        current overrides. Only the overrides are copied, e.g. one contingency
+        per line on top of a load/wind scenario.
+        """
+        return Scenario(base=self.base,
+                        name=name,
+                        load_scale=dict(self.load_scale),
+                        wind_p_max_mw=dict(self.wind_p_max_mw),
+                        gen_p_min_mw=dict(self.gen_p_min_mw),
+                        gen_p_max_mw=dict(self.gen_p_max_mw),
+                        removed_lines=set(self.removed_lines),
+                        line_x=dict(self.line_x),
+                        line_flow_max=dict(self.line_flow_max))
+
+    # ----------------------------------------------------------------ACCESSORS----------------------------------------------------------------#
+    @property
+    def lines(self) -> List["Line"]:
+        """Lines in service in this scenario (cached while the base lines and removed_lines do not change)."""
+        if not self.removed_lines:
+            return self.base.lines
+        removed = self.removed_lines
+        return self._cached("lines", self._lines_key(), lambda: [l for l in self.base.lines if l.id not in removed])
+
+    def _element_idx(self, attr: str) -> Dict[int, int]:
+        """Cached id -> index map of an element list; for "lines", of the lines in service (see line_idx)."""
+        if attr != "lines":
+            return self.base._element_idx(attr)
+        if not self.removed_lines:
+            return self.base.line_idx
+        return self._cached("line_idx", self._lines_key(), lambda: {l.id: i for i, l in enumerate(self.lines)})
+
+    @property
+    def line_idx(self) -> Dict[int, int]:
+        """Cached mapping of the ids of the lines in service to their indices in `lines` (removed lines are absent)."""
+        return self._element_idx("lines")
+
+    def get_line(self, line_id: int) -> "Line":
+        """Returns the line in service with the given id in O(1)."""
+        try:
+            return self.lines[self.line_idx[line_id]]
+        except KeyError:
+            if line_id in self.removed_lines:
+                raise ValueError(f"Line {line_id} is out of service in scenario {self.name}.") from None
+            raise ValueError(f"Line {line_id} is not part of the network.") from None
+
+    def load_p_pu(self, load: "Load") -> float:
+        return load.p_pu * self.load_scale.get(load.id, 1.0)
+
+    def gen_p_max_pu(self, gen: "Generator") -> float:
+        if gen.id in self.wind_p_max_mw:
+            return self.wind_p_max_mw[gen.id] / self.sb_mva
+        if gen.id in self.gen_p_max_mw:
+            return self.gen_p_max_mw[gen.id] / self.sb_mva
+        return gen.p_max_pu
+
+    def gen_p_min_pu(self, gen: "Generator") -> float:
+        if gen.id in self.gen_p_min_mw:
+            return self.gen_p_min_mw[gen.id] / self.sb_mva
+        return gen.p_min_pu
+
+    def line_x_pu(self, line: "Line") -> float:
+        return self.line_x.get(line.id, line.x_pu)
+
+    def line_flow_max_pu(self, line: "Line") -> float:
+        return self.line_flow_max.get(line.id, line.flow_max_pu)
+
+    def bus_p_pu(self, bus: "Bus") -> float:
+        """
+        Net active power injection (pu) of a bus with the load scalings
+        applied. Wind availabilities and generator limits only bound the
+        dispatch (gen_p_max_pu/gen_p_min_pu) and do not change injections.
+        """
+        scale = self.load_scale
+        return bus.p_pu - sum(l.p_pu * (scale[l.id] - 1.0) for l in bus.loads if l.id in scale)
+
+    @property
+    def p_injection_pu(self) -> np.ndarray:
+        """Net active power injection of every bus (pu) with the load scalings applied (see bus_p_pu)."""
+        p = self.base.p_injection_pu
+        if not self.load_scale:
+            return p
+        p = p.copy()
+        bus_idx, load_idx, loads = self.base.bus_idx, self.base.load_idx, self.base.loads
+        for load_id, factor in self.load_scale.items():
+            load = loads[load_idx[load_id]]
+            p[bus_idx[load.bus.id]] -= load.p_pu * (factor - 1.0)
+        return p
+
+    def compile(self) -> "NetworkArrays":
+        """
+        NetworkArrays of the base network with the overrides applied. Line
+        arrays only contain the lines in service, in the order of `lines`.
+        Without overrides the (read-only) arrays of the base are returned.
+        The arrays are read-only and reused until the overrides or the
+        compiled arrays of the base change.
+        """
+        base = self.base.compile()
+        if not (self.load_scale or self.wind_p_max_mw or self.gen_p_min_mw or self.gen_p_max_mw
+                or self.line_x or self.line_flow_max or self.removed_lines):
+            return base
+        cached = self._cache.get("compile")
+        key = self._override_key()
+        if cached is not None and cached[0] is base and cached[1] == key:
+            return cached[2]
+        arrays = self._apply_overrides(base)
+        self._cache["compile"] = (base, key, arrays)
+        return arrays
+
+    def _apply_overrides(self, base: "NetworkArrays") -> "NetworkArrays":
+        arrays = base.copy()
+        sb = self.sb_mva
+        load_idx, gen_idx, line_idx = self.base.load_idx, self.base.gen_idx, self.base.line_idx
+        for load_id, factor in self.load_scale.items():
+            arrays.load_p_pu[load_idx[load_id]] *= factor
+        for gen_id, p_min_mw in self.gen_p_min_mw.items():
+            arrays.gen_p_min_pu[gen_idx[gen_id]] = p_min_mw / sb
+        for gen_id, p_max_mw in self.gen_p_max_mw.items():
+            arrays.gen_p_max_pu[gen_idx[gen_id]] = p_max_mw / sb
+        for gen_id, p_max_mw in self.wind_p_max_mw.items():
+            arrays.gen_p_max_pu[gen_idx[gen_id]] = p_max_mw / sb
+        for line_id, x_pu in self.line_x.items():
+            arrays.line_x_pu[line_idx[line_id]] = x_pu
+        for line_id, flow_max_pu in self.line_flow_max.items():
+            arrays.line_flow_max_pu[line_idx[line_id]] = flow_max_pu
+        if self.removed_lines:
+            keep = ~np.isin(arrays.line_id, list(self.removed_lines))
+            for attr in [k for k in vars(arrays) if k.startswith("line_")]:
+                setattr(arrays, attr, getattr(arrays, attr)[keep])
+        for values in vars(arrays).values():
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False
+        return arrays
+
+    @property
+    def y_bus(self) -> np.ndarray:
+        """
+        Ybus of the scenario. The base Ybus is reused and only the entries of
+        the removed or modified lines are corrected.
+        """
+        ybus = self.base.y_bus.copy()
+        changed = self.removed_lines | self.line_x.keys()
+        if not changed:
+            return ybus
+        bus_idx = self.base.bus_idx
+        for line_id in changed:
+            line = self.base.get_line(line_id)
+            i = bus_idx[line.from_bus.id]
+            j = bus_idx[line.to_bus.id]
+            old = line.get_ybus_elements()
+            new = None
+            if line.id not in self.removed_lines:
+                new = line.get_ybus_elements(x_pu=self.line_x[line.id])
+            for key, (a, b) in (('Yff', (i, i)), ('Yft', (i, j)), ('Ytf', (j, i)), ('Ytt', (j, j))):
+                ybus[a, b] -= old[key]
+                if new is not None:
+                    ybus[a, b] += new[key]
+        return ybus
+
+    @property
+    def g_bus(self):
+        """ Returns real part of Ybus."""
+        return self.y_bus.real
+
+    @property
+    def b_bus(self):
+        """ Returns imaginary part of Ybus."""
+        return self.y_bus.imag
+
+    def __repr__(self):
+        return (f"Scenario(name={self.name}, base={self.base.name}, loads={len(self.load_scale)}, "
+                f"wind={len(self.wind_p_max_mw)}, gen_limits={len(self.gen_p_min_mw.keys() | self.gen_p_max_mw.keys())}, removed_lines={sorted(self.removed_lines)}, "
+                f"modified_lines={len(self.line_x)})")
@@ -0,0 +1,138 @@
+"""
+Fatores de sensibilidade do modelo DC (B') da rede.
+
+PTDF[l, b] é a variação do fluxo na linha l por unidade de potência injetada
+na barra b e retirada na barra de referência; LODF[l, k] é a fração do fluxo
+pré-contingência da linha k que passa para a linha l quando k sai de
+serviço. As matrizes completas são densas e não são montadas: as linhas do
+PTDF e as colunas do LODF são calculadas sob demanda a partir de uma única
+fatoração LU esparsa de B' reduzida (sem a referência); as linhas do PTDF
+são guardadas. Os objetos PTDF ficam em cache por topologia/reatâncias, de
+modo que resolver várias vezes a mesma rede (ou cenários que só mudam
+cargas e geração) reaproveita a fatoração e as linhas já calculadas.
+"""
+from __future__ import annotations
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Optional
+from power.electricity_models.network_models.network_arrays import NetworkArrays, BUS_TYPE_CODE
+
+# Número de fatorações mantidas no cache de PTDF.from_arrays
+PTDF_CACHE_SIZE = 8
+_PTDF_CACHE: "OrderedDict[str, PTDF]" = OrderedDict()
+
+
+class PTDF:
+    """
+    Power transfer distribution factors of a DC network, with the slack bus
+    as reference. Rows are computed on demand (rows()) from a sparse LU
+    factorization of the reduced B' matrix and cached; flows() and angles()
+    give the DC power flow of any injection vector with one triangular solve.
+    """
+
+    def __init__(self, n_bus: int, line_from: np.ndarray, line_to: np.ndarray, x_pu: np.ndarray, slack: int = 0):
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.linalg import splu
+
+        self.n_bus, self.slack = int(n_bus), int(slack)
+        self.line_from, self.line_to = np.asarray(line_from), np.asarray(line_to)
+        self.y = 1.0 / np.asarray(x_pu, dtype=float)
+        n_line = len(self.y)
+        # Incidência (barras x linhas) e B' = C diag(1/x) C^T
+        self.C = coo_matrix((np.concatenate([np.ones(n_line), -np.ones(n_line)]),
+                             (np.concatenate([self.line_from, self.line_to]), np.tile(np.arange(n_line), 2))),
+                            shape=(self.n_bus, n_line)).tocsr()
+        B = (self.C @ (self.C.multiply(self.y)).T).tocsc()
+        self.keep = np.flatnonzero(np.arange(self.n_bus) != self.slack)
+        self._lu = splu(B[self.keep][:, self.keep].tocsc())
+        self._rows: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def from_arrays(cls, arrays: NetworkArrays, slack: Optional[int] = None) -> "PTDF":
+        """
+        Returns the PTDF of a compiled network (the first SLACK bus as
+        reference if `slack` is not given). Instances are cached by topology,
+        reactances and reference bus (the last PTDF_CACHE_SIZE are kept).
+        """
+        if slack is None:
+            slacks = np.flatnonzero(arrays.bus_type == BUS_TYPE_CODE["SLACK"])
+            slack = int(slacks[0]) if len(slacks) else 0
+        h = hashlib.sha1()
+        for a in (np.asarray(arrays.line_from, dtype=np.int64), np.asarray(arrays.line_to, dtype=np.int64),
+                  np.asarray(arrays.line_x_pu, dtype=float), np.array([arrays.n_bus, slack], dtype=np.int64)):
+            h.update(np.ascontiguousarray(a).tobytes())
+        key = h.hexdigest()
+        ptdf = _PTDF_CACHE.get(key)
+        if ptdf is None:
+            ptdf = cls(arrays.n_bus, arrays.line_from, arrays.line_to, arrays.line_x_pu, slack)
+            _PTDF_CACHE[key] = ptdf
+            while len(_PTDF_CACHE) > PTDF_CACHE_SIZE:
+                _PTDF_CACHE.popitem(last=False)
+        else:
+            _PTDF_CACHE.move_to_end(key)
+        return ptdf
+
+    @property
+    def n_line(self) -> int:
+        return len(self.y)
+
+    def angles(self, p_pu: np.ndarray) -> np.ndarray:
+        """Bus angles (rad, slack = 0) of the injections p_pu (n_bus, or n_bus x k)."""
+        p_pu = np.asarray(p_pu, dtype=float)
+        theta = np.zeros(p_pu.shape)
+        theta[self.keep] = self._lu.solve(np.ascontiguousarray(p_pu[self.keep]))
+        return theta
+
+    def flows(self, p_pu: np.ndarray) -> np.ndarray:
+        """Line flows (pu) of the injections p_pu: PTDF @ p_pu without building PTDF."""
+        return self.branch_flows(self.angles(p_pu))
+
+    def branch_flows(self, theta: np.ndarray) -> np.ndarray:
+        """Line flows (pu) of the bus angles theta: (theta_from - theta_to) / x."""
+        y = self.y if np.ndim(theta) == 1 else self.y[:, None]
+        return (theta[self.line_from] - theta[self.line_to]) * y
+
+    def rows(self, line_pos) -> np.ndarray:
+        """PTDF rows (len(line_pos) x n_bus) of the lines at positions line_pos."""
+        line_pos = np.asarray(line_pos, dtype=np.int64)
+        missing = np.array([l for l in np.unique(line_pos).tolist() if l not in self._rows], dtype=np.int64)
+        if len(missing):
+            # Linha l do PTDF = B'^-1 (e_from - e_to) / x_l, pois B' é simétrica
+            rhs = self.C[:, missing].multiply(self.y[missing]).toarray()
+            rows = np.zeros((len(missing), self.n_bus))
+            rows[:, self.keep] = self._lu.solve(np.ascontiguousarray(rhs[self.keep])).T
+            self._rows.update(zip(missing.tolist(), rows))
+        out = np.empty((len(line_pos), self.n_bus))
+        for k, l in enumerate(line_pos.tolist()):
+            out[k] = self._rows[l]
+        return out
+
+    def transfer_flows(self, line_pos) -> np.ndarray:
+        """Flows on every line (n_line x len(line_pos)) per unit transferred from the 'from' to the 'to' bus of each line."""
+        line_pos = np.asarray(line_pos, dtype=np.int64)
+        return self.flows(self.C[:, line_pos].toarray())
+
+    def lodf(self, outage_pos) -> np.ndarray:
+        """
+        Line outage distribution factors (n_line x len(outage_pos)): post-outage
+        flow of line l = flow_l + LODF[l, k] * flow_k. The outaged line itself
+        gets -1; outages that island the network (bridges) get a NaN column.
+        """
+        outage_pos = np.asarray(outage_pos, dtype=np.int64)
+        k = np.arange(len(outage_pos))
+        F = self.transfer_flows(outage_pos)
+        denom = 1.0 - F[outage_pos, k]
+        islanding = np.abs(denom) < 1e-8
+        L = F / np.where(islanding, 1.0, denom)
+        L[outage_pos, k] = -1.0
+        L[:, islanding] = np.nan
+        return L
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Full PTDF matrix (n_line x n_bus, dense): only for small networks."""
+        return self.rows(np.arange(self.n_line))
+
+    def __repr__(self):
+        return f"PTDF(buses={self.n_bus}, lines={self.n_line}, slack={self.slack}, cached_rows={len(self._rows)})"
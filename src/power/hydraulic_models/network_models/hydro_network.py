@@ -3,6 +3,7 @@ from typing import List, Optional
 from power.hydraulic_models.node_models.hydro_node import HydroBus
 from power.electricity_models.generator_models.hydro_gen import HydroGenerator
 from power.hydraulic_models.river_models.river import River
+from power.electricity_models.element_list import ElementList
 
 
 @dataclass
@@ -12,7 +13,7 @@ class HydroNetwork:
     name:            Optional[str]        = None
     hydro_buses:     List[HydroBus]       = field(default_factory=list)
     rivers:          List[River]          = field(default_factory=list)
-    hydro_generators: List[HydroGenerator] = field(default_factory=list)
+    hydro_generators: List[HydroGenerator] = field(default_factory=ElementList)
 
     def __post_init__(self):
         if self.name is None:
@@ -22,7 +23,8 @@ class HydroNetwork:
                 self.name = "HydroNetwork"
     
     def add_generator(self, generator:HydroGenerator):
-        if generator not in self.hydro_generators:
-            self.hydro_generators.append(generator)
+        if not isinstance(self.hydro_generators, ElementList):
+            self.hydro_generators = ElementList(self.hydro_generators)
+        self.hydro_generators.add_unique(generator)
     
 
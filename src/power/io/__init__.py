@@ -0,0 +1,6 @@
+from .case_tables import CaseTables
+from .matpower import parse_matpower, read_matpower
+from .psse import parse_psse_raw, read_psse_raw
+from .loader import load_case
+
+__all__ = ["CaseTables", "parse_matpower", "read_matpower", "parse_psse_raw", "read_psse_raw", "load_case"]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+import hashlib
+import os
+import numpy as np
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+from power.electricity_models.network_models.npz_store import write_npz, read_npz
+
+# Incrementar quando o formato das tabelas produzidas pelos leitores mudar (invalida o cache)
+CACHE_VERSION = 1
+
+TABLES = ("buses", "lines", "generators", "loads")
+
+
+@dataclass
+class CaseTables:
+    """
+    Parsed power flow case as columnar tables (dict of column -> numpy array),
+    in the format accepted by Network.load_tables. Readers produce a
+    CaseTables so a parsed case can be cached on disk independently of the
+    Network objects built from it.
+    """
+    name:       str
+    sb_mva:     float
+    buses:      Dict[str, np.ndarray] = field(default_factory=dict)
+    lines:      Dict[str, np.ndarray] = field(default_factory=dict)
+    generators: Dict[str, np.ndarray] = field(default_factory=dict)
+    loads:      Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def to_network(self) -> "Network":
+        from power.electricity_models.network_models import Network
+        return Network.from_tables(self.buses, lines=self.lines, generators=self.generators, loads=self.loads,
+                                   sb_mva=self.sb_mva, name=self.name)
+
+    def save(self, path) -> None:
+        """Writes the tables to an uncompressed .npz file (atomic replace)."""
+        arrays = {"__name__": np.array(self.name), "__sb_mva__": np.array(self.sb_mva)}
+        for table in TABLES:
+            for column, values in getattr(self, table).items():
+                arrays[f"{table}/{column}"] = np.asarray(values)
+        write_npz(path, arrays)
+
+    @classmethod
+    def load(cls, path) -> "CaseTables":
+        data = read_npz(path)
+        case = cls(name=str(data["__name__"]), sb_mva=float(data["__sb_mva__"]))
+        for key, values in data.items():
+            if "/" in key:
+                table, column = key.split("/", 1)
+                getattr(case, table)[column] = values
+        return case
+
+
+def default_cache_dir() -> Path:
+    """Directory of the parsed-case cache ($POWER_CASE_CACHE or ~/.cache/power_cases)."""
+    return Path(os.environ.get("POWER_CASE_CACHE", Path.home() / ".cache" / "power_cases"))
+
+
+def cache_path(source, cache_dir=None) -> Path:
+    """
+    Cache file of a case file. The key covers the resolved path, size and
+    modification time of the source, so an edited case is parsed again.
+    """
+    source = Path(source).resolve()
+    stat = source.stat()
+    key = f"{source}|{stat.st_size}|{stat.st_mtime_ns}|{CACHE_VERSION}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return Path(cache_dir or default_cache_dir()) / f"{source.stem}-{digest}.npz"
+
+
+def cached_parse(source, parser, cache: bool = True, cache_dir=None) -> CaseTables:
+    """Returns parser(source), reading/writing the on-disk cache when `cache` is True."""
+    if not cache:
+        return parser(source)
+    path = cache_path(source, cache_dir)
+    if path.exists():
+        try:
+            return CaseTables.load(path)
+        except (OSError, ValueError, KeyError):
+            pass  # Cache corrompido: analisa o arquivo de novo e sobrescreve
+    case = parser(source)
+    try:
+        case.save(path)
+    except OSError:
+        pass  # Cache é só uma otimização (ex.: diretório somente leitura)
+    return case
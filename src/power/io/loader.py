@@ -0,0 +1,24 @@
+from pathlib import Path
+from power.io.case_tables import cached_parse
+from power.io.matpower import parse_matpower
+from power.io.psse import parse_psse_raw
+
+# Leitor por extensão do arquivo
+CASE_PARSERS = {
+    ".m":   parse_matpower,
+    ".raw": parse_psse_raw,
+}
+
+
+def load_case(source, cache: bool = True, cache_dir=None) -> "Network":
+    """
+    Builds a Network from a MATPOWER (.m) or PSS/E (.raw) case file.
+
+    The parsed tables are cached on disk (see case_tables.cache_path), so
+    loading the same unchanged file again skips the text parsing and only
+    ingests the arrays.
+    """
+    suffix = Path(source).suffix.lower()
+    if suffix not in CASE_PARSERS:
+        raise ValueError(f"Unknown case format '{suffix}'. Supported: {list(CASE_PARSERS)}.")
+    return cached_parse(source, CASE_PARSERS[suffix], cache=cache, cache_dir=cache_dir).to_network()
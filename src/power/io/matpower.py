@@ -0,0 +1,142 @@
+from __future__ import annotations
+import re
+import numpy as np
+from pathlib import Path
+from typing import Dict, Optional
+from power.io.case_tables import CaseTables, cached_parse
+
+# Colunas (0-based) do formato de caso MATPOWER (versão 2)
+BUS_I, BUS_TYPE, PD, QD, GS, BS, BUS_AREA, VM, VA = range(9)
+F_BUS, T_BUS, BR_R, BR_X, BR_B, RATE_A, RATE_B, RATE_C, TAP, SHIFT, BR_STATUS = range(11)
+GEN_BUS, PG, QG, QMAX, QMIN, VG, MBASE, GEN_STATUS, PMAX, PMIN = range(10)
+MODEL, STARTUP, SHUTDOWN, NCOST, COST = range(5)
+
+MATPOWER_BUS_TYPES = {1: "PQ", 2: "PV", 3: "SLACK", 4: "PQ"}   # 4 = isolada (mantida como PQ)
+
+_COMMENT = re.compile(r"%[^\n]*")
+_MATRIX = re.compile(r"mpc\.(\w+)\s*=\s*\[(.*?)\]\s*;", re.S)
+_SCALAR = re.compile(r"mpc\.(\w+)\s*=\s*([-+\d.eE]+)\s*;")
+_FUNCTION = re.compile(r"function\s+mpc\s*=\s*(\w+)")
+
+
+def _matrix_rows(block: str):
+    """Splits a MATLAB matrix literal into rows of tokens (rows end with ';' or a new line)."""
+    return [row.replace(",", " ").split() for row in re.split(r"[;\n]", block) if row.strip()]
+
+
+def _matrix(block: str) -> np.ndarray:
+    rows = _matrix_rows(block)
+    if not rows:
+        return np.zeros((0, 0))
+    ncols = len(rows[0])
+    values = np.array(" ".join(" ".join(r) for r in rows).split(), dtype=float)
+    if values.size != ncols * len(rows):
+        raise ValueError("MATPOWER matrix rows must all have the same number of columns.")
+    return values.reshape(len(rows), ncols)
+
+
+def _gencost_coefficients(block: Optional[str], ngen: int):
+    """
+    Returns (cost_a, cost_b, cost_c) per generator in $/MW²h, $/MWh, $/h.
+    Polynomial costs (MODEL 2) keep their coefficients; piecewise linear
+    costs (MODEL 1) are reduced to the average slope of the curve.
+    """
+    cost = np.zeros((3, ngen))
+    if block is None:
+        return cost
+    for g, row in enumerate(_matrix_rows(block)[:ngen]):   # linhas extras = custos de potência reativa
+        values = [float(v) for v in row]
+        n = int(values[NCOST])
+        coeffs = values[COST:COST + (2 * n if values[MODEL] == 1 else n)]
+        if values[MODEL] == 2:
+            # c(n-1) ... c1 c0  ->  a = c2, b = c1, c = c0
+            for k, c in enumerate(reversed(coeffs[-3:])):
+                cost[2 - k, g] = c
+        elif n >= 2:
+            p, f = coeffs[0::2], coeffs[1::2]
+            if p[-1] != p[0]:
+                cost[1, g] = (f[-1] - f[0]) / (p[-1] - p[0])
+            cost[2, g] = f[0]
+    return cost
+
+
+def parse_matpower(source) -> CaseTables:
+    """
+    Parses a MATPOWER case file (`.m`, format version 2) into CaseTables.
+
+    Mapping to the network model:
+    - bus types 1/2/3 -> PQ/PV/SLACK (isolated buses are kept as PQ);
+      BS becomes q_shunt_mvar (GS has no counterpart and is ignored);
+    - PD/QD != 0 create one Load per bus;
+    - in-service branches become Lines with shunt_half_pu = BR_B / 2,
+      flow_max_pu = RATE_A / baseMVA (0 = unlimited), TAP (0 = 1) and SHIFT;
+    - in-service generators become ThermalGenerators with the polynomial
+      cost coefficients of gencost.
+    Element ids are the 1-based row numbers of the original matrices.
+    """
+    path = Path(source)
+    text = _COMMENT.sub("", path.read_text())
+    blocks = {name: body for name, body in _MATRIX.findall(text)}
+    scalars = {name: float(value) for name, value in _SCALAR.findall(text)}
+    for required in ("bus", "branch", "gen"):
+        if required not in blocks:
+            raise ValueError(f"{path.name}: mpc.{required} not found, not a MATPOWER case file.")
+    function = _FUNCTION.search(text)
+    name = function.group(1) if function else path.stem
+    sb = scalars.get("baseMVA", 100.0)
+
+    bus, branch, gen = _matrix(blocks["bus"]), _matrix(blocks["branch"]), _matrix(blocks["gen"])
+    cost_a, cost_b, cost_c = _gencost_coefficients(blocks.get("gencost"), len(gen))
+
+    buses = {
+        "id":           bus[:, BUS_I].astype(np.int64),
+        "btype":        np.array([MATPOWER_BUS_TYPES.get(int(t), "PQ") for t in bus[:, BUS_TYPE]]),
+        "v_pu":         bus[:, VM],
+        "theta_deg":    bus[:, VA],
+        "q_shunt_mvar": bus[:, BS],
+    }
+
+    has_load = (bus[:, PD] != 0) | (bus[:, QD] != 0)
+    loads = {
+        "id":     np.arange(1, has_load.sum() + 1, dtype=np.int64),
+        "bus":    bus[has_load, BUS_I].astype(np.int64),
+        "p_mw":   bus[has_load, PD],
+        "q_mvar": bus[has_load, QD],
+    }
+
+    on = branch[:, BR_STATUS] > 0 if branch.shape[1] > BR_STATUS else np.ones(len(branch), dtype=bool)
+    tap = branch[on, TAP]
+    rate = branch[on, RATE_A]
+    lines = {
+        "id":            np.flatnonzero(on).astype(np.int64) + 1,
+        "from_bus":      branch[on, F_BUS].astype(np.int64),
+        "to_bus":        branch[on, T_BUS].astype(np.int64),
+        "r_pu":          branch[on, BR_R],
+        "x_pu":          branch[on, BR_X],
+        "shunt_half_pu": branch[on, BR_B] / 2,
+        "flow_max_pu":   np.where(rate > 0, rate / sb, np.nan),
+        "tap_ratio":     np.where(tap != 0, tap, 1.0),
+        "tap_phase_deg": branch[on, SHIFT],
+    }
+
+    on = gen[:, GEN_STATUS] > 0
+    generators = {
+        "id":         np.flatnonzero(on).astype(np.int64) + 1,
+        "bus":        gen[on, GEN_BUS].astype(np.int64),
+        "kind":       np.full(on.sum(), "thermal"),
+        "p_mw":       gen[on, PG],
+        "q_mvar":     gen[on, QG],
+        "p_max_mw":   gen[on, PMAX],
+        "p_min_mw":   gen[on, PMIN],
+        "q_max_mvar": gen[on, QMAX],
+        "q_min_mvar": gen[on, QMIN],
+        "cost_a_mw":  cost_a[on],
+        "cost_b_mw":  cost_b[on],
+        "cost_c_mw":  cost_c[on],
+    }
+    return CaseTables(name=name, sb_mva=sb, buses=buses, lines=lines, generators=generators, loads=loads)
+
+
+def read_matpower(source, cache: bool = True, cache_dir=None) -> "Network":
+    """Reads a MATPOWER case file into a Network, using the parsed-case cache."""
+    return cached_parse(source, parse_matpower, cache=cache, cache_dir=cache_dir).to_network()
@@ -0,0 +1,228 @@
+from __future__ import annotations
+import re
+import numpy as np
+from pathlib import Path
+from typing import Dict, List
+from power.io.case_tables import CaseTables, cached_parse
+
+PSSE_BUS_TYPES = {1: "PQ", 2: "PV", 3: "SLACK", 4: "PQ"}   # 4 = isolada (mantida como PQ)
+
+# Ordem das seções de dados (até a de transformadores) por revisão do formato RAW
+_SECTIONS = {
+    30: ("bus", "load", "generator", "branch", "transformer"),
+    33: ("bus", "load", "fixed_shunt", "generator", "branch", "transformer"),
+    34: ("bus", "load", "fixed_shunt", "generator", "branch", "switching_device", "transformer"),
+}
+
+_TOKEN = re.compile(r"'[^']*'|\"[^\"]*\"|[^,\s]+")
+
+
+def _tokens(line: str) -> List[str]:
+    """Splits a RAW record into fields (quoted strings kept whole, '/' starts a comment)."""
+    quoted = False
+    for i, ch in enumerate(line):
+        if ch in "'\"":
+            quoted = not quoted
+        elif ch == "/" and not quoted:
+            line = line[:i]
+            break
+    return [t.strip("'\"").strip() for t in _TOKEN.findall(line)]
+
+
+def _is_section_end(line: str) -> bool:
+    stripped = line.lstrip()
+    return stripped.startswith("0") and (stripped[1:2] in ("", " ", "/", ",") or stripped.strip() == "0")
+
+
+def _split_sections(lines: List[str], names) -> Dict[str, List[str]]:
+    sections, current = {}, []
+    it = iter(names)
+    name = next(it, None)
+    for line in lines:
+        if name is None:
+            break
+        if _is_section_end(line):
+            sections[name] = current
+            current = []
+            name = next(it, None)
+        elif line.strip():
+            current.append(line)
+    return sections
+
+
+def parse_psse_raw(source) -> CaseTables:
+    """
+    Parses a PSS/E RAW case (revisions 30 to 34) into CaseTables.
+
+    Mapping to the network model:
+    - bus types 1/2/3 -> PQ/PV/SLACK (isolated buses are kept as PQ); fixed
+      shunt susceptances (BL, or bus BL in rev 30) become q_shunt_mvar;
+    - in-service loads become Loads with P = PL + IP + YP and
+      Q = QL + IQ - YQ (constant current/admittance parts at 1 pu voltage);
+    - in-service non-transformer branches and two-winding transformers
+      become Lines (three-winding transformers become three Lines joined at
+      a new star bus); RATEA / SBASE gives flow_max_pu (0 = unlimited);
+    - in-service machines become ThermalGenerators without cost data.
+    Switched shunts, DC lines and FACTS devices are not imported.
+    Element ids are 1-based record numbers; star buses get ids above the
+    largest bus number.
+    """
+    path = Path(source)
+    raw = path.read_text(errors="replace").splitlines()
+    header = _tokens(raw[0])
+    sb = float(header[1])
+    rev = int(float(header[2])) if len(header) > 2 and header[2] else 33
+    if rev >= 35 or rev < 30:
+        raise ValueError(f"{path.name}: PSS/E RAW revision {rev} is not supported (30 to 34).")
+    names = _SECTIONS[30 if rev < 31 else 33 if rev < 34 else 34]
+    name = (raw[1].strip() or path.stem) if len(raw) > 1 else path.stem
+    sections = _split_sections(raw[3:], names)
+
+    # --- Barras ---
+    bus_records = [_tokens(l) for l in sections.get("bus", [])]
+    bus_ids = np.array([int(r[0]) for r in bus_records], dtype=np.int64)
+    base_kv = np.array([float(r[2]) for r in bus_records])
+    if rev < 31:   # I, NAME, BASKV, IDE, GL, BL, AREA, ZONE, VM, VA, OWNER
+        vm_col, va_col = 8, 9
+        shunt = np.array([float(r[5]) for r in bus_records])
+    else:          # I, NAME, BASKV, IDE, AREA, ZONE, OWNER, VM, VA, ...
+        vm_col, va_col = 7, 8
+        shunt = np.zeros(len(bus_records))
+    btype = [PSSE_BUS_TYPES.get(int(r[3]), "PQ") for r in bus_records]
+    v_pu = [float(r[vm_col]) if len(r) > vm_col else 1.0 for r in bus_records]
+    theta = [float(r[va_col]) if len(r) > va_col else 0.0 for r in bus_records]
+    bus_pos = {b: i for i, b in enumerate(bus_ids.tolist())}
+
+    for r in (_tokens(l) for l in sections.get("fixed_shunt", [])):   # I, ID, STATUS, GL, BL
+        if int(r[2]) > 0:
+            shunt[bus_pos[int(r[0])]] += float(r[4])
+
+    # --- Cargas: I, ID, STATUS, AREA, ZONE, PL, QL, IP, IQ, YP, YQ, ... ---
+    load_bus, load_p, load_q = [], [], []
+    for r in (_tokens(l) for l in sections.get("load", [])):
+        if int(r[2]) > 0:
+            f = [float(v) for v in r[5:11]] + [0.0] * (6 - len(r[5:11]))
+            load_bus.append(int(r[0]))
+            load_p.append(f[0] + f[2] + f[4])
+            load_q.append(f[1] + f[3] - f[5])
+
+    # --- Geradores: I, ID, PG, QG, QT, QB, VS, IREG, MBASE, ZR, ZX, RT, XT, GTAP, STAT, RMPCT, PT, PB ---
+    gens = [r for r in (_tokens(l) for l in sections.get("generator", [])) if int(r[14]) > 0]
+
+    # --- Ramos: I, J, CKT, R, X, B, RATEA... (rev 34: I, J, CKT, R, X, B, NAME, RATE1..RATE12, GI, BI, GJ, BJ, ST) ---
+    rate_col, status_col = (7, 23) if rev >= 34 else (6, 13)
+    line_rows = []
+    for r in (_tokens(l) for l in sections.get("branch", [])):
+        if len(r) <= status_col or int(r[status_col]) > 0:
+            line_rows.append((abs(int(r[0])), abs(int(r[1])), float(r[3]), float(r[4]), float(r[5]) / 2,
+                              float(r[rate_col]) / sb, 1.0, 0.0))
+
+    extra_buses = []
+    line_rows += _transformer_lines(sections.get("transformer", []), sb, bus_pos, base_kv,
+                                    next_bus=int(bus_ids.max()) + 1 if len(bus_ids) else 1, extra_buses=extra_buses)
+
+    btype += ["PQ"] * len(extra_buses)
+    v_pu += [1.0] * len(extra_buses)
+    theta += [0.0] * len(extra_buses)
+    shunt = np.concatenate([shunt, np.zeros(len(extra_buses))])
+
+    buses = {
+        "id":           np.concatenate([bus_ids, np.array(extra_buses, dtype=np.int64)]),
+        "btype":        np.array(btype),
+        "v_pu":         np.array(v_pu),
+        "theta_deg":    np.array(theta),
+        "q_shunt_mvar": shunt,
+    }
+    loads = {
+        "id":     np.arange(1, len(load_bus) + 1, dtype=np.int64),
+        "bus":    np.array(load_bus, dtype=np.int64),
+        "p_mw":   np.array(load_p),
+        "q_mvar": np.array(load_q),
+    }
+    generators = {
+        "id":         np.arange(1, len(gens) + 1, dtype=np.int64),
+        "bus":        np.array([int(r[0]) for r in gens], dtype=np.int64),
+        "kind":       np.full(len(gens), "thermal"),
+        "p_mw":       np.array([float(r[2]) for r in gens]),
+        "q_mvar":     np.array([float(r[3]) for r in gens]),
+        "q_max_mvar": np.array([float(r[4]) for r in gens]),
+        "q_min_mvar": np.array([float(r[5]) for r in gens]),
+        "p_max_mw":   np.array([float(r[16]) for r in gens]),
+        "p_min_mw":   np.array([float(r[17]) for r in gens]),
+    }
+    rows = np.array(line_rows, dtype=float).reshape(-1, 8)
+    lines = {
+        "id":            np.arange(1, len(rows) + 1, dtype=np.int64),
+        "from_bus":      rows[:, 0].astype(np.int64),
+        "to_bus":        rows[:, 1].astype(np.int64),
+        "r_pu":          rows[:, 2],
+        "x_pu":          rows[:, 3],
+        "shunt_half_pu": rows[:, 4],
+        "flow_max_pu":   np.where(rows[:, 5] > 0, rows[:, 5], np.nan),
+        "tap_ratio":     rows[:, 6],
+        "tap_phase_deg": rows[:, 7],
+    }
+    return CaseTables(name=name, sb_mva=sb, buses=buses, lines=lines, generators=generators, loads=loads)
+
+
+def _winding_ratio(windv: float, cw: int, bus: int, bus_pos, base_kv, nomv: float) -> float:
+    """Off-nominal ratio of a winding in pu of the bus base voltage (CW = 1, 2 or 3)."""
+    if cw == 2:
+        kv = base_kv[bus_pos[bus]]
+        return windv / kv if kv else windv
+    if cw == 3:
+        kv = base_kv[bus_pos[bus]]
+        return windv * (nomv / kv if nomv and kv else 1.0)
+    return windv
+
+
+def _system_impedance(r: float, x: float, cz: int, sbase_w: float, sb: float):
+    """Converts a winding impedance to pu on the system base (CZ = 1, 2 or 3)."""
+    if cz == 1 or not sbase_w:
+        return r, x
+    if cz == 3:   # R = perdas no cobre (W), X = |Z| em pu na base do enrolamento
+        r = r / 1e6 / sbase_w
+        x = np.sqrt(max(x ** 2 - r ** 2, 0.0))
+    return r * sb / sbase_w, x * sb / sbase_w
+
+
+def _transformer_lines(records: List[str], sb: float, bus_pos, base_kv, next_bus: int, extra_buses: list) -> list:
+    rows = []
+    i = 0
+    while i < len(records):
+        head = _tokens(records[i])
+        bus_i, bus_j, bus_k = abs(int(head[0])), abs(int(head[1])), abs(int(head[2]))
+        cw, cz = int(head[4]), int(head[5])
+        status = int(head[11]) if len(head) > 11 else 1
+        imp = [float(v) for v in _tokens(records[i + 1])[:9]]
+        if bus_k == 0:
+            w1, w2 = _tokens(records[i + 2]), _tokens(records[i + 3])
+            i += 4
+            if status <= 0:
+                continue
+            r, x = _system_impedance(imp[0], imp[1], cz, imp[2], sb)
+            t1 = _winding_ratio(float(w1[0]), cw, bus_i, bus_pos, base_kv, float(w1[1]))
+            t2 = _winding_ratio(float(w2[0]), cw, bus_j, bus_pos, base_kv, float(w2[1]))
+            rows.append((bus_i, bus_j, r, x, 0.0, float(w1[3]) / sb, t1 / t2, float(w1[2])))
+        else:
+            w = [_tokens(records[i + k]) for k in (2, 3, 4)]
+            i += 5
+            if status <= 0:
+                continue
+            z12 = _system_impedance(imp[0], imp[1], cz, imp[2], sb)
+            z23 = _system_impedance(imp[3], imp[4], cz, imp[5], sb)
+            z31 = _system_impedance(imp[6], imp[7], cz, imp[8], sb)
+            star = next_bus + len(extra_buses)
+            extra_buses.append(star)
+            for (bus, wk), (za, zb, zc) in zip(((bus_i, w[0]), (bus_j, w[1]), (bus_k, w[2])),
+                                              ((z12, z31, z23), (z12, z23, z31), (z23, z31, z12))):
+                r = (za[0] + zb[0] - zc[0]) / 2
+                x = (za[1] + zb[1] - zc[1]) / 2
+                tap = _winding_ratio(float(wk[0]), cw, bus, bus_pos, base_kv, float(wk[1]))
+                rows.append((bus, star, r, x, 0.0, float(wk[3]) / sb, tap, float(wk[2])))
+    return rows
+
+
+def read_psse_raw(source, cache: bool = True, cache_dir=None) -> "Network":
+    """Reads a PSS/E RAW case file into a Network, using the parsed-case cache."""
+    return cached_parse(source, parse_psse_raw, cache=cache, cache_dir=cache_dir).to_network()
@@ -1,14 +1,34 @@
-from .b3 import B3
-from .b6l8 import B6L8
-from .b6l8_eolic import B6L8EOL
-from .b6l8_charged import B6L8Charged
-from .ieee118 import IEEE118
-from .ieee118_eolic import IEEE118EOL
-from .ieee118_charged import IEEE118Charged
-from .b3_eolic import B3EOL
-from .b3_eolic_charged import B3EOLCharged
-from .ieee14 import IEEE14
-from .sauer11bus import Sauer11Bus
-from .sauer6bus import Sauer6Bus
-
-__all__ =  ["B3", "B3EOL", "B6L8", "B6L8EOL", "IEEE118", "IEEE118EOL", "IEEE14", "Sauer11Bus", "Sauer6Bus", "B6L8Charged", "B3EOLCharged", "IEEE118Charged"]
\ No newline at end of file
+# Os módulos dos sistemas de teste são importados sob demanda (PEP 562): `import power.systems`
+# não carrega os doze casos, apenas o que for acessado (ex.: power.systems.IEEE118).
+import importlib
+
+_SYSTEMS = {
+    "B3":             "b3",
+    "B3EOL":          "b3_eolic",
+    "B3EOLCharged":   "b3_eolic_charged",
+    "B6L8":           "b6l8",
+    "B6L8EOL":        "b6l8_eolic",
+    "B6L8Charged":    "b6l8_charged",
+    "IEEE118":        "ieee118",
+    "IEEE118EOL":     "ieee118_eolic",
+    "IEEE118Charged": "ieee118_charged",
+    "IEEE14":         "ieee14",
+    "Sauer11Bus":     "sauer11bus",
+    "Sauer6Bus":      "sauer6bus",
+    "SyntheticGrid":  "synthetic",
+}
+
+__all__ =  ["B3", "B3EOL", "B6L8", "B6L8EOL", "IEEE118", "IEEE118EOL", "IEEE14", "Sauer11Bus", "Sauer6Bus", "B6L8Charged", "B3EOLCharged", "IEEE118Charged", "SyntheticGrid"]
+
+
+def __getattr__(name):
+    module = _SYSTEMS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value   # Próximos acessos não passam mais por __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SYSTEMS))
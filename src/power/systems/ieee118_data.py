@@ -0,0 +1,455 @@
+"""
+Dados do sistema IEEE 118 barras em formato de tabela (uma linha por elemento, unidades físicas).
+
+Usados por IEEE118, IEEE118EOL e IEEE118Charged através de Network.load_tables.
+As barras são referenciadas pelo id. Os geradores eólicos guardam a
+disponibilidade base, que as variantes escalam.
+"""
+import numpy as np
+
+BUS_DTYPE = [("id", "i8"), ("btype", "U5"), ("v_pu", "f8"), ("theta_deg", "f8"), ("q_shunt_mvar", "f8")]
+LINE_DTYPE = [("id", "i8"), ("from_bus", "i8"), ("to_bus", "i8"), ("r_pu", "f8"), ("x_pu", "f8"),
+              ("shunt_half_pu", "f8"), ("flow_max_pu", "f8"), ("tap_ratio", "f8")]
+THERMAL_DTYPE = [("id", "i8"), ("bus", "i8"), ("kind", "U7"), ("p_mw", "f8"), ("q_mvar", "f8"), ("p_min_mw", "f8"),
+                 ("p_max_mw", "f8"), ("q_min_mvar", "f8"), ("q_max_mvar", "f8"), ("cost_b_mw", "f8")]
+WIND_DTYPE = [("id", "i8"), ("bus", "i8"), ("kind", "U7"), ("p_min_mw", "f8"), ("p_max_mw", "f8")]
+LOAD_DTYPE = [("id", "i8"), ("bus", "i8"), ("p_mw", "f8"), ("q_mvar", "f8"), ("cost_shed_mw", "f8")]
+
+# id, btype, v_pu, theta_deg, q_shunt_mvar
+BUSES = np.array([
+    (  1, "PV",    0.955,  10.67,    0.0),
+    (  2, "PQ",    0.971,  11.22,    0.0),
+    (  3, "PQ",    0.968,  11.56,    0.0),
+    (  4, "PV",    0.998,  15.28,    0.0),
+    (  5, "PQ",    1.002,  15.73,  -40.0),
+    (  6, "PV",    0.990,  13.00,    0.0),
+    (  7, "PQ",    0.989,  12.56,    0.0),
+    (  8, "PV",    1.015,  20.77,    0.0),
+    (  9, "PQ",    1.043,  28.02,    0.0),
+    ( 10, "PV",    1.050,  35.61,    0.0),
+    ( 11, "PQ",    0.985,  12.72,    0.0),
+    ( 12, "PV",    0.990,  12.20,    0.0),
+    ( 13, "PQ",    0.968,  11.35,    0.0),
+    ( 14, "PQ",    0.984,  11.50,    0.0),
+    ( 15, "PV",    0.970,  11.23,    0.0),
+    ( 16, "PQ",    0.984,  11.91,    0.0),
+    ( 17, "PQ",    0.995,  13.74,    0.0),
+    ( 18, "PV",    0.973,  11.53,    0.0),
+    ( 19, "PV",    0.963,  11.05,    0.0),
+    ( 20, "PQ",    0.958,  11.93,    0.0),
+    ( 21, "PQ",    0.959,  13.52,    0.0),
+    ( 22, "PQ",    0.970,  16.08,    0.0),
+    ( 23, "PQ",    1.000,  21.00,    0.0),
+    ( 24, "PV",    0.992,  20.89,    0.0),
+    ( 25, "PV",    1.050,  27.93,    0.0),
+    ( 26, "PV",    1.015,  29.71,    0.0),
+    ( 27, "PV",    0.968,  15.35,    0.0),
+    ( 28, "PQ",    0.962,  13.62,    0.0),
+    ( 29, "PQ",    0.963,  12.63,    0.0),
+    ( 30, "PQ",    0.968,  18.79,    0.0),
+    ( 31, "PV",    0.967,  12.75,    0.0),
+    ( 32, "PV",    0.964,  14.80,    0.0),
+    ( 33, "PQ",    0.972,  10.63,    0.0),
+    ( 34, "PV",    0.986,  11.30,   14.0),
+    ( 35, "PQ",    0.981,  10.87,    0.0),
+    ( 36, "PV",    0.980,  10.87,    0.0),
+    ( 37, "PQ",    0.992,  11.77,  -25.0),
+    ( 38, "PQ",    0.962,  16.91,    0.0),
+    ( 39, "PQ",    0.970,   8.41,    0.0),
+    ( 40, "PV",    0.970,   7.35,    0.0),
+    ( 41, "PQ",    0.967,   6.92,    0.0),
+    ( 42, "PV",    0.985,   8.53,    0.0),
+    ( 43, "PQ",    0.978,  11.28,    0.0),
+    ( 44, "PQ",    0.985,  13.82,   10.0),
+    ( 45, "PQ",    0.987,  15.67,   10.0),
+    ( 46, "PV",    1.005,  18.49,   10.0),
+    ( 47, "PQ",    1.017,  20.73,    0.0),
+    ( 48, "PQ",    1.021,  19.93,   15.0),
+    ( 49, "PV",    1.025,  20.94,    0.0),
+    ( 50, "PQ",    1.001,  18.90,    0.0),
+    ( 51, "PQ",    0.967,  16.28,    0.0),
+    ( 52, "PQ",    0.957,  15.32,    0.0),
+    ( 53, "PQ",    0.946,  14.35,    0.0),
+    ( 54, "PV",    0.955,  15.26,    0.0),
+    ( 55, "PV",    0.952,  14.97,    0.0),
+    ( 56, "PV",    0.954,  15.16,    0.0),
+    ( 57, "PQ",    0.971,  16.36,    0.0),
+    ( 58, "PQ",    0.959,  15.51,    0.0),
+    ( 59, "PV",    0.985,  19.37,    0.0),
+    ( 60, "PQ",    0.993,  23.15,    0.0),
+    ( 61, "PV",    0.995,  24.04,    0.0),
+    ( 62, "PV",    0.998,  23.43,    0.0),
+    ( 63, "PQ",    0.969,  22.75,    0.0),
+    ( 64, "PQ",    0.984,  24.52,    0.0),
+    ( 65, "PV",    1.005,  27.65,    0.0),
+    ( 66, "PV",    1.050,  27.48,    0.0),
+    ( 67, "PQ",    1.020,  24.84,    0.0),
+    ( 68, "PQ",    1.003,  27.55,    0.0),
+    ( 69, "SLACK", 1.035,  30.00,    0.0),
+    ( 70, "PV",    0.984,  22.58,    0.0),
+    ( 71, "PQ",    0.987,  22.15,    0.0),
+    ( 72, "PV",    0.980,  20.98,    0.0),
+    ( 73, "PV",    0.991,  21.94,    0.0),
+    ( 74, "PV",    0.958,  21.64,   12.0),
+    ( 75, "PQ",    0.967,  22.91,    0.0),
+    ( 76, "PV",    0.943,  21.77,    0.0),
+    ( 77, "PV",    1.006,  26.72,    0.0),
+    ( 78, "PQ",    1.003,  26.42,    0.0),
+    ( 79, "PQ",    1.009,  26.72,   20.0),
+    ( 80, "PV",    1.040,  28.96,    0.0),
+    ( 81, "PQ",    0.997,  28.10,    0.0),
+    ( 82, "PQ",    0.989,  27.24,   20.0),
+    ( 83, "PQ",    0.985,  28.42,   10.0),
+    ( 84, "PQ",    0.980,  30.95,    0.0),
+    ( 85, "PV",    0.985,  32.51,    0.0),
+    ( 86, "PQ",    0.987,  31.14,    0.0),
+    ( 87, "PV",    1.015,  31.40,    0.0),
+    ( 88, "PQ",    0.987,  35.64,    0.0),
+    ( 89, "PV",    1.005,  39.69,    0.0),
+    ( 90, "PV",    0.985,  33.29,    0.0),
+    ( 91, "PV",    0.980,  33.31,    0.0),
+    ( 92, "PV",    0.993,  33.80,    0.0),
+    ( 93, "PQ",    0.987,  30.79,    0.0),
+    ( 94, "PQ",    0.991,  28.64,    0.0),
+    ( 95, "PQ",    0.981,  27.67,    0.0),
+    ( 96, "PQ",    0.993,  27.51,    0.0),
+    ( 97, "PQ",    1.011,  27.88,    0.0),
+    ( 98, "PQ",    1.024,  27.40,    0.0),
+    ( 99, "PV",    1.010,  27.04,    0.0),
+    (100, "PV",    1.017,  28.03,    0.0),
+    (101, "PQ",    0.993,  29.61,    0.0),
+    (102, "PQ",    0.991,  32.30,    0.0),
+    (103, "PV",    1.001,  24.44,    0.0),
+    (104, "PV",    0.971,  21.69,    0.0),
+    (105, "PV",    0.965,  20.57,   20.0),
+    (106, "PQ",    0.962,  20.32,    0.0),
+    (107, "PV",    0.952,  17.53,    6.0),
+    (108, "PQ",    0.967,  19.38,    0.0),
+    (109, "PQ",    0.967,  18.93,    0.0),
+    (110, "PV",    0.973,  18.09,    6.0),
+    (111, "PV",    0.980,  19.74,    0.0),
+    (112, "PV",    0.975,  14.99,    0.0),
+    (113, "PV",    0.993,  13.74,    0.0),
+    (114, "PQ",    0.960,  14.46,    0.0),
+    (115, "PQ",    0.960,  14.46,    0.0),
+    (116, "PV",    1.005,  27.12,    0.0),
+    (117, "PQ",    0.974,  10.67,    0.0),
+    (118, "PQ",    0.949,  21.92,    0.0),
+], dtype=BUS_DTYPE)
+
+# id, from_bus, to_bus, r_pu, x_pu, shunt_half_pu, flow_max_pu, tap_ratio
+LINES = np.array([
+    (  1,   1,   2, 0.03030, 0.09990, 0.01270, 1.00, 1.000),
+    (  2,   1,   3, 0.01290, 0.04240, 0.00541, 1.00, 1.000),
+    (  3,   4,   5, 0.00176, 0.00798, 0.00105, 1.00, 1.000),
+    (  4,   3,   5, 0.02410, 0.10800, 0.01420, 1.00, 1.000),
+    (  5,   5,   6, 0.01190, 0.05400, 0.00713, 1.00, 1.000),
+    (  6,   6,   7, 0.00459, 0.02080, 0.00275, 1.00, 1.000),
+    (  7,   8,   9, 0.00244, 0.03050, 0.58100, 1.00, 1.000),
+    (  8,   8,   5, 0.00000, 0.02670, 0.00000, 1.00, 0.985),
+    (  9,   9,  10, 0.00258, 0.03220, 0.61500, 1.00, 1.000),
+    ( 10,   4,  11, 0.02090, 0.06880, 0.00874, 1.00, 1.000),
+    ( 11,   5,  11, 0.02030, 0.06820, 0.00869, 1.00, 1.000),
+    ( 12,  11,  12, 0.00595, 0.01960, 0.00251, 1.00, 1.000),
+    ( 13,   2,  12, 0.01870, 0.06160, 0.00786, 1.00, 1.000),
+    ( 14,   3,  12, 0.04840, 0.16000, 0.02030, 1.00, 1.000),
+    ( 15,   7,  12, 0.00862, 0.03400, 0.00437, 1.00, 1.000),
+    ( 16,  11,  13, 0.02225, 0.07310, 0.00938, 1.00, 1.000),
+    ( 17,  12,  14, 0.02150, 0.07070, 0.00908, 1.00, 1.000),
+    ( 18,  13,  15, 0.07440, 0.24440, 0.03134, 1.00, 1.000),
+    ( 19,  14,  15, 0.05950, 0.19500, 0.02510, 1.00, 1.000),
+    ( 20,  12,  16, 0.02120, 0.08340, 0.01070, 1.00, 1.000),
+    ( 21,  15,  17, 0.01320, 0.04370, 0.02220, 1.00, 1.000),
+    ( 22,  16,  17, 0.04540, 0.18010, 0.02330, 1.00, 1.000),
+    ( 23,  17,  18, 0.01230, 0.05050, 0.00649, 1.00, 1.000),
+    ( 24,  18,  19, 0.01119, 0.04930, 0.00571, 1.00, 1.000),
+    ( 25,  19,  20, 0.02520, 0.11700, 0.01490, 1.00, 1.000),
+    ( 26,  15,  19, 0.01200, 0.03940, 0.00505, 1.00, 1.000),
+    ( 27,  20,  21, 0.01830, 0.08490, 0.01080, 1.00, 1.000),
+    ( 28,  21,  22, 0.02090, 0.09700, 0.01230, 1.00, 1.000),
+    ( 29,  22,  23, 0.03420, 0.15900, 0.02020, 1.00, 1.000),
+    ( 30,  23,  24, 0.01350, 0.04920, 0.02490, 1.00, 1.000),
+    ( 31,  23,  25, 0.01560, 0.08000, 0.04320, 1.00, 1.000),
+    ( 32,  26,  25, 0.00000, 0.03820, 0.00000, 1.00, 0.960),
+    ( 33,  25,  27, 0.03180, 0.16300, 0.08820, 1.00, 1.000),
+    ( 34,  27,  28, 0.01913, 0.08550, 0.01080, 1.00, 1.000),
+    ( 35,  28,  29, 0.02370, 0.09430, 0.01190, 1.00, 1.000),
+    ( 36,  30,  17, 0.00000, 0.03880, 0.00000, 1.00, 0.960),
+    ( 37,   8,  30, 0.00431, 0.05040, 0.25700, 1.00, 1.000),
+    ( 38,  26,  30, 0.00799, 0.08600, 0.45400, 1.00, 1.000),
+    ( 39,  17,  31, 0.04740, 0.15630, 0.01995, 1.00, 1.000),
+    ( 40,  29,  31, 0.01080, 0.03310, 0.00415, 1.00, 1.000),
+    ( 41,  23,  32, 0.03170, 0.11530, 0.05865, 1.00, 1.000),
+    ( 42,  31,  32, 0.02980, 0.09850, 0.01255, 1.00, 1.000),
+    ( 43,  27,  32, 0.02290, 0.07550, 0.00963, 1.00, 1.000),
+    ( 44,  15,  33, 0.03800, 0.12440, 0.01597, 1.00, 1.000),
+    ( 45,  19,  34, 0.07520, 0.24700, 0.03160, 1.00, 1.000),
+    ( 46,  35,  36, 0.00224, 0.01020, 0.00134, 1.00, 1.000),
+    ( 47,  35,  37, 0.01100, 0.04970, 0.00659, 1.00, 1.000),
+    ( 48,  33,  37, 0.04150, 0.14200, 0.01830, 1.00, 1.000),
+    ( 49,  34,  36, 0.00871, 0.02680, 0.00284, 1.00, 1.000),
+    ( 50,  34,  37, 0.00256, 0.00940, 0.00492, 1.00, 1.000),
+    ( 51,  38,  37, 0.00000, 0.03750, 0.00000, 1.00, 0.935),
+    ( 52,  37,  39, 0.03210, 0.10600, 0.01350, 1.00, 1.000),
+    ( 53,  37,  40, 0.05930, 0.16800, 0.02100, 1.00, 1.000),
+    ( 54,  30,  38, 0.00464, 0.05400, 0.21100, 1.00, 1.000),
+    ( 55,  39,  40, 0.01840, 0.06050, 0.00776, 1.00, 1.000),
+    ( 56,  40,  41, 0.01450, 0.04870, 0.00611, 1.00, 1.000),
+    ( 57,  40,  42, 0.05550, 0.18300, 0.02330, 1.00, 1.000),
+    ( 58,  41,  42, 0.04100, 0.13500, 0.01720, 1.00, 1.000),
+    ( 59,  43,  44, 0.06080, 0.24540, 0.03034, 1.00, 1.000),
+    ( 60,  34,  43, 0.04130, 0.16810, 0.02113, 1.00, 1.000),
+    ( 61,  44,  45, 0.02240, 0.09010, 0.01120, 1.00, 1.000),
+    ( 62,  45,  46, 0.04000, 0.13560, 0.01660, 1.00, 1.000),
+    ( 63,  46,  47, 0.03800, 0.12700, 0.01580, 1.00, 1.000),
+    ( 64,  46,  48, 0.06010, 0.18900, 0.02360, 1.00, 1.000),
+    ( 65,  47,  49, 0.01910, 0.06250, 0.00802, 1.00, 1.000),
+    ( 66,  42,  49, 0.07150, 0.32300, 0.04300, 1.00, 1.000),
+    ( 67,  42,  49, 0.07150, 0.32300, 0.04300, 1.00, 1.000),
+    ( 68,  45,  49, 0.06840, 0.18600, 0.02220, 1.00, 1.000),
+    ( 69,  48,  49, 0.01790, 0.05050, 0.00629, 1.00, 1.000),
+    ( 70,  49,  50, 0.02670, 0.07520, 0.00937, 1.00, 1.000),
+    ( 71,  49,  51, 0.04860, 0.13700, 0.01710, 1.00, 1.000),
+    ( 72,  51,  52, 0.02030, 0.05880, 0.00698, 1.00, 1.000),
+    ( 73,  52,  53, 0.04050, 0.16350, 0.02029, 1.00, 1.000),
+    ( 74,  53,  54, 0.02630, 0.12200, 0.01550, 1.00, 1.000),
+    ( 75,  49,  54, 0.07300, 0.28900, 0.03690, 1.00, 1.000),
+    ( 76,  49,  54, 0.08690, 0.29100, 0.03650, 1.00, 1.000),
+    ( 77,  54,  55, 0.01690, 0.07070, 0.01010, 1.00, 1.000),
+    ( 78,  54,  56, 0.00275, 0.00955, 0.00366, 1.00, 1.000),
+    ( 79,  55,  56, 0.00488, 0.01510, 0.00187, 1.00, 1.000),
+    ( 80,  56,  57, 0.03430, 0.09660, 0.01210, 1.00, 1.000),
+    ( 81,  50,  57, 0.04740, 0.13400, 0.01660, 1.00, 1.000),
+    ( 82,  56,  58, 0.03430, 0.09660, 0.01210, 1.00, 1.000),
+    ( 83,  51,  58, 0.02550, 0.07190, 0.00894, 1.00, 1.000),
+    ( 84,  54,  59, 0.05030, 0.22930, 0.02990, 1.00, 1.000),
+    ( 85,  56,  59, 0.08250, 0.25100, 0.02845, 1.00, 1.000),
+    ( 86,  56,  59, 0.08030, 0.23900, 0.02680, 1.00, 1.000),
+    ( 87,  55,  59, 0.04739, 0.21580, 0.02823, 1.00, 1.000),
+    ( 88,  59,  60, 0.03170, 0.14500, 0.01880, 1.00, 1.000),
+    ( 89,  59,  61, 0.03280, 0.15000, 0.01940, 1.00, 1.000),
+    ( 90,  60,  61, 0.00264, 0.01350, 0.00728, 1.00, 1.000),
+    ( 91,  60,  62, 0.01230, 0.05610, 0.00734, 1.00, 1.000),
+    ( 92,  61,  62, 0.00824, 0.03760, 0.00490, 1.00, 1.000),
+    ( 93,  63,  59, 0.00000, 0.03860, 0.00000, 1.00, 0.960),
+    ( 94,  63,  64, 0.00172, 0.02000, 0.10800, 1.00, 1.000),
+    ( 95,  64,  61, 0.00000, 0.02680, 0.00000, 1.00, 0.985),
+    ( 96,  38,  65, 0.00901, 0.09860, 0.52300, 1.00, 1.000),
+    ( 97,  64,  65, 0.00269, 0.03020, 0.19000, 1.00, 1.000),
+    ( 98,  49,  66, 0.01800, 0.09190, 0.01240, 1.00, 1.000),
+    ( 99,  49,  66, 0.01800, 0.09190, 0.01240, 1.00, 1.000),
+    (100,  62,  66, 0.04820, 0.21800, 0.02890, 1.00, 1.000),
+    (101,  62,  67, 0.02580, 0.11700, 0.01550, 1.00, 1.000),
+    (102,  65,  66, 0.00000, 0.03700, 0.00000, 1.00, 0.935),
+    (103,  66,  67, 0.02240, 0.10150, 0.01341, 1.00, 1.000),
+    (104,  65,  68, 0.00138, 0.01600, 0.31900, 1.00, 1.000),
+    (105,  47,  69, 0.08440, 0.27780, 0.03546, 1.00, 1.000),
+    (106,  49,  69, 0.09850, 0.32400, 0.04140, 1.00, 1.000),
+    (107,  68,  69, 0.00000, 0.03700, 0.00000, 1.00, 0.935),
+    (108,  69,  70, 0.03000, 0.12700, 0.06100, 1.00, 1.000),
+    (109,  24,  70, 0.00221, 0.41150, 0.05099, 1.00, 1.000),
+    (110,  70,  71, 0.00882, 0.03550, 0.00439, 1.00, 1.000),
+    (111,  24,  72, 0.04880, 0.19600, 0.02440, 1.00, 1.000),
+    (112,  71,  72, 0.04460, 0.18000, 0.02222, 1.00, 1.000),
+    (113,  71,  73, 0.00866, 0.04540, 0.00589, 1.00, 1.000),
+    (114,  70,  74, 0.04010, 0.13230, 0.01684, 1.00, 1.000),
+    (115,  70,  75, 0.04280, 0.14100, 0.01800, 1.00, 1.000),
+    (116,  69,  75, 0.04050, 0.12200, 0.06200, 1.00, 1.000),
+    (117,  74,  75, 0.01230, 0.04060, 0.00517, 1.00, 1.000),
+    (118,  76,  77, 0.04440, 0.14800, 0.01840, 1.00, 1.000),
+    (119,  69,  77, 0.03090, 0.10100, 0.05190, 1.00, 1.000),
+    (120,  75,  77, 0.06010, 0.19990, 0.02489, 1.00, 1.000),
+    (121,  77,  78, 0.00376, 0.01240, 0.00632, 0.85, 1.000),
+    (122,  78,  79, 0.00546, 0.02440, 0.00324, 1.00, 1.000),
+    (123,  77,  80, 0.01700, 0.04850, 0.02360, 1.00, 1.000),
+    (124,  77,  80, 0.02940, 0.10500, 0.01140, 1.00, 1.000),
+    (125,  79,  80, 0.01560, 0.07040, 0.00935, 1.00, 1.000),
+    (126,  68,  81, 0.00175, 0.02020, 0.40400, 1.00, 1.000),
+    (127,  81,  80, 0.00000, 0.03700, 0.00000, 1.00, 0.935),
+    (128,  77,  82, 0.02980, 0.08530, 0.04087, 1.00, 1.000),
+    (129,  82,  83, 0.01120, 0.03665, 0.01898, 1.00, 1.000),
+    (130,  83,  84, 0.06250, 0.13200, 0.01290, 1.00, 1.000),
+    (131,  83,  85, 0.04300, 0.14800, 0.01740, 1.00, 1.000),
+    (132,  84,  85, 0.03020, 0.06410, 0.00617, 1.00, 1.000),
+    (133,  85,  86, 0.03500, 0.12300, 0.01380, 1.00, 1.000),
+    (134,  86,  87, 0.02828, 0.20740, 0.02225, 1.00, 1.000),
+    (135,  85,  88, 0.02000, 0.10200, 0.01380, 1.00, 1.000),
+    (136,  85,  89, 0.02390, 0.17300, 0.02350, 1.00, 1.000),
+    (137,  88,  89, 0.01390, 0.07120, 0.00967, 1.00, 1.000),
+    (138,  89,  90, 0.05180, 0.18800, 0.02640, 1.00, 1.000),
+    (139,  89,  90, 0.02380, 0.09970, 0.05300, 1.00, 1.000),
+    (140,  90,  91, 0.02540, 0.08360, 0.01070, 1.00, 1.000),
+    (141,  89,  92, 0.00990, 0.05050, 0.02740, 1.00, 1.000),
+    (142,  89,  92, 0.03930, 0.15810, 0.02070, 1.00, 1.000),
+    (143,  91,  92, 0.03870, 0.12720, 0.01634, 1.00, 1.000),
+    (144,  92,  93, 0.02580, 0.08480, 0.01090, 1.00, 1.000),
+    (145,  92,  94, 0.04810, 0.15800, 0.02030, 1.00, 1.000),
+    (146,  93,  94, 0.02230, 0.07320, 0.00938, 1.00, 1.000),
+    (147,  94,  95, 0.01320, 0.04340, 0.00555, 1.00, 1.000),
+    (148,  80,  96, 0.03560, 0.18200, 0.02470, 1.00, 1.000),
+    (149,  82,  96, 0.01620, 0.05300, 0.02720, 1.00, 1.000),
+    (150,  94,  96, 0.02690, 0.08690, 0.01150, 1.00, 1.000),
+    (151,  80,  97, 0.01830, 0.09340, 0.01270, 1.00, 1.000),
+    (152,  80,  98, 0.02380, 0.10800, 0.01430, 1.00, 1.000),
+    (153,  80,  99, 0.04540, 0.20600, 0.02730, 1.00, 1.000),
+    (154,  92, 100, 0.06480, 0.29500, 0.02360, 1.00, 1.000),
+    (155,  94, 100, 0.01780, 0.05800, 0.03020, 1.00, 1.000),
+    (156,  95,  96, 0.01710, 0.05470, 0.00737, 1.00, 1.000),
+    (157,  96,  97, 0.01730, 0.08850, 0.01200, 1.00, 1.000),
+    (158,  98, 100, 0.03970, 0.17900, 0.02380, 1.00, 1.000),
+    (159,  99, 100, 0.01800, 0.08130, 0.01080, 1.00, 1.000),
+    (160, 100, 101, 0.02770, 0.12620, 0.01640, 1.00, 1.000),
+    (161,  92, 102, 0.01230, 0.05590, 0.00732, 1.00, 1.000),
+    (162, 101, 102, 0.02460, 0.11200, 0.01470, 1.00, 1.000),
+    (163, 100, 103, 0.01600, 0.05250, 0.02680, 1.00, 1.000),
+    (164, 100, 104, 0.04510, 0.20400, 0.02705, 1.00, 1.000),
+    (165, 103, 104, 0.04660, 0.15840, 0.02035, 1.00, 1.000),
+    (166, 103, 105, 0.05350, 0.16250, 0.02040, 1.00, 1.000),
+    (167, 100, 106, 0.06050, 0.22900, 0.03100, 1.00, 1.000),
+    (168, 104, 105, 0.00994, 0.03780, 0.00493, 1.00, 1.000),
+    (169, 105, 106, 0.01400, 0.05470, 0.00717, 1.00, 1.000),
+    (170, 105, 107, 0.05300, 0.18300, 0.02360, 1.00, 1.000),
+    (171, 105, 108, 0.02610, 0.07030, 0.00922, 1.00, 1.000),
+    (172, 106, 107, 0.05300, 0.18300, 0.02360, 1.00, 1.000),
+    (173, 108, 109, 0.01050, 0.02880, 0.00380, 1.00, 1.000),
+    (174, 103, 110, 0.03906, 0.18130, 0.02305, 1.00, 1.000),
+    (175, 109, 110, 0.02780, 0.07620, 0.01010, 1.00, 1.000),
+    (176, 110, 111, 0.02200, 0.07550, 0.01000, 1.00, 1.000),
+    (177, 110, 112, 0.02470, 0.06400, 0.03100, 1.00, 1.000),
+    (178,  17, 113, 0.00913, 0.03010, 0.00384, 1.00, 1.000),
+    (179,  32, 113, 0.06150, 0.20300, 0.02590, 1.00, 1.000),
+    (180,  32, 114, 0.01350, 0.06120, 0.00814, 1.00, 1.000),
+    (181,  27, 115, 0.01640, 0.07410, 0.00986, 1.00, 1.000),
+    (182, 114, 115, 0.00230, 0.01040, 0.00138, 1.00, 1.000),
+    (183,  68, 116, 0.00034, 0.00405, 0.04100, 1.00, 1.000),
+    (184,  12, 117, 0.03290, 0.14000, 0.01790, 1.00, 1.000),
+    (185,  75, 118, 0.01450, 0.04810, 0.00599, 1.00, 1.000),
+    (186,  76, 118, 0.01640, 0.05440, 0.00678, 1.00, 1.000),
+], dtype=LINE_DTYPE)
+
+# id, bus, kind, p_mw, q_mvar, p_min_mw, p_max_mw, q_min_mvar, q_max_mvar, cost_b_mw
+THERMAL_GENERATORS = np.array([
+    ( 1,   1, "thermal",   0.0, 0.0, 0.0,  130.0,   -5.0,  15.0,  1.0),
+    ( 2,   6, "thermal",   0.0, 0.0, 0.0,  150.0,  -13.0,  50.0,  6.0),
+    ( 3,   8, "thermal", -28.0, 0.0, 0.0,  470.0, -300.0, 300.0,  8.0),
+    ( 4,  15, "thermal",   0.0, 0.0, 0.0,  450.0,  -10.0,  30.0, 15.0),
+    ( 5,  24, "thermal", -13.0, 0.0, 0.0,  250.0, -300.0, 300.0, 24.0),
+    ( 6,  42, "thermal", -59.0, 0.0, 0.0,  140.0, -300.0, 300.0, 42.0),
+    ( 7,  46, "thermal",  19.0, 0.0, 0.0,  120.0, -100.0, 100.0, 46.0),
+    ( 8,  49, "thermal", 204.0, 0.0, 0.0,  450.0,  -85.0, 210.0, 49.0),
+    ( 9,  54, "thermal",  48.0, 0.0, 0.0,  570.0, -300.0, 300.0, 54.0),
+    (10,  69, "thermal", 516.4, 0.0, 0.0, 1000.0, -300.0, 300.0, 69.0),
+    (11,  80, "thermal", 477.0, 0.0, 0.0, 1000.0, -165.0, 280.0, 80.0),
+    (12,  85, "thermal",   0.0, 0.0, 0.0,  300.0,   -8.0,  23.0, 85.0),
+    (13,  90, "thermal", -85.0, 0.0, 0.0,  250.0, -300.0, 300.0, 90.0),
+], dtype=THERMAL_DTYPE)
+
+# id, bus, kind, p_min_mw, p_max_mw (disponibilidade base)
+WIND_GENERATORS = np.array([
+    (14,   1, "wind", 0.0, 10.0),
+    (15,   8, "wind", 0.0, 10.0),
+    (16,  15, "wind", 0.0, 15.0),
+    (17,  24, "wind", 0.0, 15.0),
+    (18,  54, "wind", 0.0, 30.0),
+    (19,  59, "wind", 0.0, 20.0),
+    (20,  69, "wind", 0.0, 20.0),
+    (21,  74, "wind", 0.0, 10.0),
+    (22,  80, "wind", 0.0, 15.0),
+    (23,  85, "wind", 0.0, 10.0),
+    (24, 110, "wind", 0.0, 20.0),
+], dtype=WIND_DTYPE)
+
+# id, bus, p_mw, q_mvar, cost_shed_mw
+LOADS = np.array([
+    ( 1,   1,  51.0,  27.0, 400),
+    ( 2,   2,  20.0,   9.0, 400),
+    ( 3,   3,  39.0,  10.0, 400),
+    ( 4,   4,  30.0,  12.0, 400),
+    ( 5,   6,  52.0,  22.0, 400),
+    ( 6,   7,  19.0,   2.0, 400),
+    ( 7,  11,  70.0,  23.0, 400),
+    ( 8,  12,  47.0,  10.0, 400),
+    ( 9,  13,  34.0,  16.0, 400),
+    (10,  14,  14.0,   1.0, 400),
+    (11,  15,  90.0,  30.0, 400),
+    (12,  16,  25.0,  10.0, 400),
+    (13,  17,  11.0,   3.0, 400),
+    (14,  18,  60.0,  34.0, 400),
+    (15,  19,  45.0,  25.0, 400),
+    (16,  20,  18.0,   3.0, 400),
+    (17,  21,  14.0,   8.0, 400),
+    (18,  22,  10.0,   5.0, 400),
+    (19,  23,   7.0,   3.0, 400),
+    (20,  27,  62.0,  13.0, 400),
+    (21,  28,  17.0,   7.0, 400),
+    (22,  29,  24.0,   4.0, 400),
+    (23,  31,  43.0,  27.0, 400),
+    (24,  32,  59.0,  23.0, 400),
+    (25,  33,  23.0,   9.0, 400),
+    (26,  34,  59.0,  26.0, 400),
+    (27,  35,  33.0,   9.0, 400),
+    (28,  36,  31.0,  17.0, 400),
+    (29,  39,  27.0,  11.0, 400),
+    (30,  40,  20.0,  23.0, 400),
+    (31,  41,  37.0,  10.0, 400),
+    (32,  42,  37.0,  23.0, 400),
+    (33,  43,  18.0,   7.0, 400),
+    (34,  44,  16.0,   8.0, 400),
+    (35,  45,  53.0,  22.0, 400),
+    (36,  46,  28.0,  10.0, 400),
+    (37,  47,  34.0,   0.0, 400),
+    (38,  48,  20.0,  11.0, 400),
+    (39,  49,  87.0,  30.0, 400),
+    (40,  50,  17.0,   4.0, 400),
+    (41,  51,  17.0,   8.0, 400),
+    (42,  52,  18.0,   5.0, 400),
+    (43,  53,  23.0,  11.0, 400),
+    (44,  54, 113.0,  32.0, 400),
+    (45,  55,  63.0,  22.0, 400),
+    (46,  56,  84.0,  18.0, 400),
+    (47,  57,  12.0,   3.0, 400),
+    (48,  58,  12.0,   3.0, 400),
+    (49,  59, 277.0, 113.0, 400),
+    (50,  60,  78.0,   3.0, 400),
+    (51,  62,  77.0,  14.0, 400),
+    (52,  66,  39.0,  18.0, 400),
+    (53,  67,  28.0,   7.0, 400),
+    (54,  70,  66.0,  20.0, 400),
+    (55,  74,  68.0,  27.0, 400),
+    (56,  75,  47.0,  11.0, 400),
+    (57,  76,  68.0,  36.0, 400),
+    (58,  77,  61.0,  28.0, 400),
+    (59,  78,  71.0,  26.0, 400),
+    (60,  79,  39.0,  32.0, 400),
+    (61,  80, 130.0,  26.0, 400),
+    (62,  82,  54.0,  27.0, 400),
+    (63,  83,  20.0,  10.0, 400),
+    (64,  84,  11.0,   7.0, 400),
+    (65,  85,  24.0,  15.0, 400),
+    (66,  86,  21.0,  10.0, 400),
+    (67,  88,  48.0,  10.0, 400),
+    (68,  90,  78.0,  42.0, 400),
+    (69,  92,  65.0,  10.0, 400),
+    (70,  93,  12.0,   7.0, 400),
+    (71,  94,  30.0,  16.0, 400),
+    (72,  95,  42.0,  31.0, 400),
+    (73,  96,  38.0,  15.0, 400),
+    (74,  97,  15.0,   9.0, 400),
+    (75,  98,  34.0,   8.0, 400),
+    (76, 100,  37.0,  18.0, 400),
+    (77, 101,  22.0,  15.0, 400),
+    (78, 102,   5.0,   3.0, 400),
+    (79, 103,  23.0,  16.0, 400),
+    (80, 104,  38.0,  25.0, 400),
+    (81, 105,  31.0,  26.0, 400),
+    (82, 106,  43.0,  16.0, 400),
+    (83, 107,  28.0,  12.0, 400),
+    (84, 108,   2.0,   1.0, 400),
+    (85, 109,   8.0,   3.0, 400),
+    (86, 110,  39.0,  30.0, 400),
+    (87, 112,  25.0,  13.0, 400),
+    (88, 114,   8.0,   3.0, 400),
+    (89, 115,  22.0,   7.0, 400),
+    (90, 117,  20.0,   8.0, 400),
+    (91, 118,  33.0,  15.0, 400),
+], dtype=LOAD_DTYPE)
@@ -1,479 +1,28 @@
-from power.electricity_models import Network, Bus, BusType, Line, Load, WindGenerator, ThermalGenerator
+from power.electricity_models import Network
+from power.systems import ieee118_data as data
+
+
 class IEEE118EOL(Network):
-    """Class to represent the IEEE 118 bus system.
+    """IEEE 118 bus system with the wind generators of DGW.
+
+    Conventional units come first, followed by the wind generators.
     """
 
     def __init__(self):
         super().__init__(name="IEEE_118_Eolic")
         # System base power (MVA)
-        self.sb = 100.0
+        self.sb_mva = 100.0
 
         # Build network objects
-        self._create_buses()
-        self._create_lines()
-        self._create_generators()
-        self._create_loads()
+        self.load_tables(buses=data.BUSES, lines=data.LINES, generators=data.THERMAL_GENERATORS, loads=data.LOADS)
+        self.load_tables(generators=data.WIND_GENERATORS)
 
         self.mvu = 0.2
         self.mvd = 0.2
 
-    def _create_buses(self):
-        """Create Bus objects for the 118 buses.
-        """
-
-        Bus(self, id=  1,   btype=BusType.PV,     v_pu=0.955,   theta_deg=10.67,   q_shunt_mvar=  0.0)
-        Bus(self, id=  2,   btype=BusType.PQ,     v_pu=0.971,   theta_deg=11.22,   q_shunt_mvar=  0.0)
-        Bus(self, id=  3,   btype=BusType.PQ,     v_pu=0.968,   theta_deg=11.56,   q_shunt_mvar=  0.0)
-        Bus(self, id=  4,   btype=BusType.PV,     v_pu=0.998,   theta_deg=15.28,   q_shunt_mvar=  0.0)
-        Bus(self, id=  5,   btype=BusType.PQ,     v_pu=1.002,   theta_deg=15.73,   q_shunt_mvar=-40.0)
-        Bus(self, id=  6,   btype=BusType.PV,     v_pu=0.990,   theta_deg=13.00,   q_shunt_mvar=  0.0)
-        Bus(self, id=  7,   btype=BusType.PQ,     v_pu=0.989,   theta_deg=12.56,   q_shunt_mvar=  0.0)
-        Bus(self, id=  8,   btype=BusType.PV,     v_pu=1.015,   theta_deg=20.77,   q_shunt_mvar=  0.0)
-        Bus(self, id=  9,   btype=BusType.PQ,     v_pu=1.043,   theta_deg=28.02,   q_shunt_mvar=  0.0)
-        Bus(self, id= 10,   btype=BusType.PV,     v_pu=1.050,   theta_deg=35.61,   q_shunt_mvar=  0.0)
-        Bus(self, id= 11,   btype=BusType.PQ,     v_pu=0.985,   theta_deg=12.72,   q_shunt_mvar=  0.0)
-        Bus(self, id= 12,   btype=BusType.PV,     v_pu=0.990,   theta_deg=12.20,   q_shunt_mvar=  0.0)
-        Bus(self, id= 13,   btype=BusType.PQ,     v_pu=0.968,   theta_deg=11.35,   q_shunt_mvar=  0.0)
-        Bus(self, id= 14,   btype=BusType.PQ,     v_pu=0.984,   theta_deg=11.50,   q_shunt_mvar=  0.0)
-        Bus(self, id= 15,   btype=BusType.PV,     v_pu=0.970,   theta_deg=11.23,   q_shunt_mvar=  0.0)
-        Bus(self, id= 16,   btype=BusType.PQ,     v_pu=0.984,   theta_deg=11.91,   q_shunt_mvar=  0.0)
-        Bus(self, id= 17,   btype=BusType.PQ,     v_pu=0.995,   theta_deg=13.74,   q_shunt_mvar=  0.0)
-        Bus(self, id= 18,   btype=BusType.PV,     v_pu=0.973,   theta_deg=11.53,   q_shunt_mvar=  0.0)
-        Bus(self, id= 19,   btype=BusType.PV,     v_pu=0.963,   theta_deg=11.05,   q_shunt_mvar=  0.0)
-        Bus(self, id= 20,   btype=BusType.PQ,     v_pu=0.958,   theta_deg=11.93,   q_shunt_mvar=  0.0)
-        Bus(self, id= 21,   btype=BusType.PQ,     v_pu=0.959,   theta_deg=13.52,   q_shunt_mvar=  0.0)
-        Bus(self, id= 22,   btype=BusType.PQ,     v_pu=0.970,   theta_deg=16.08,   q_shunt_mvar=  0.0)
-        Bus(self, id= 23,   btype=BusType.PQ,     v_pu=1.000,   theta_deg=21.00,   q_shunt_mvar=  0.0)
-        Bus(self, id= 24,   btype=BusType.PV,     v_pu=0.992,   theta_deg=20.89,   q_shunt_mvar=  0.0)
-        Bus(self, id= 25,   btype=BusType.PV,     v_pu=1.050,   theta_deg=27.93,   q_shunt_mvar=  0.0)
-        Bus(self, id= 26,   btype=BusType.PV,     v_pu=1.015,   theta_deg=29.71,   q_shunt_mvar=  0.0)
-        Bus(self, id= 27,   btype=BusType.PV,     v_pu=0.968,   theta_deg=15.35,   q_shunt_mvar=  0.0)
-        Bus(self, id= 28,   btype=BusType.PQ,     v_pu=0.962,   theta_deg=13.62,   q_shunt_mvar=  0.0)
-        Bus(self, id= 29,   btype=BusType.PQ,     v_pu=0.963,   theta_deg=12.63,   q_shunt_mvar=  0.0)
-        Bus(self, id= 30,   btype=BusType.PQ,     v_pu=0.968,   theta_deg=18.79,   q_shunt_mvar=  0.0)
-        Bus(self, id= 31,   btype=BusType.PV,     v_pu=0.967,   theta_deg=12.75,   q_shunt_mvar=  0.0)
-        Bus(self, id= 32,   btype=BusType.PV,     v_pu=0.964,   theta_deg=14.80,   q_shunt_mvar=  0.0)
-        Bus(self, id= 33,   btype=BusType.PQ,     v_pu=0.972,   theta_deg=10.63,   q_shunt_mvar=  0.0)
-        Bus(self, id= 34,   btype=BusType.PV,     v_pu=0.986,   theta_deg=11.30,   q_shunt_mvar= 14.0)
-        Bus(self, id= 35,   btype=BusType.PQ,     v_pu=0.981,   theta_deg=10.87,   q_shunt_mvar=  0.0)
-        Bus(self, id= 36,   btype=BusType.PV,     v_pu=0.980,   theta_deg=10.87,   q_shunt_mvar=  0.0)
-        Bus(self, id= 37,   btype=BusType.PQ,     v_pu=0.992,   theta_deg=11.77,   q_shunt_mvar=-25.0)
-        Bus(self, id= 38,   btype=BusType.PQ,     v_pu=0.962,   theta_deg=16.91,   q_shunt_mvar=  0.0)
-        Bus(self, id= 39,   btype=BusType.PQ,     v_pu=0.970,   theta_deg= 8.41,   q_shunt_mvar=  0.0)
-        Bus(self, id= 40,   btype=BusType.PV,     v_pu=0.970,   theta_deg= 7.35,   q_shunt_mvar=  0.0)
-        Bus(self, id= 41,   btype=BusType.PQ,     v_pu=0.967,   theta_deg= 6.92,   q_shunt_mvar=  0.0)
-        Bus(self, id= 42,   btype=BusType.PV,     v_pu=0.985,   theta_deg= 8.53,   q_shunt_mvar=  0.0)
-        Bus(self, id= 43,   btype=BusType.PQ,     v_pu=0.978,   theta_deg=11.28,   q_shunt_mvar=  0.0)
-        Bus(self, id= 44,   btype=BusType.PQ,     v_pu=0.985,   theta_deg=13.82,   q_shunt_mvar= 10.0)
-        Bus(self, id= 45,   btype=BusType.PQ,     v_pu=0.987,   theta_deg=15.67,   q_shunt_mvar= 10.0)
-        Bus(self, id= 46,   btype=BusType.PV,     v_pu=1.005,   theta_deg=18.49,   q_shunt_mvar= 10.0)
-        Bus(self, id= 47,   btype=BusType.PQ,     v_pu=1.017,   theta_deg=20.73,   q_shunt_mvar=  0.0)
-        Bus(self, id= 48,   btype=BusType.PQ,     v_pu=1.021,   theta_deg=19.93,   q_shunt_mvar= 15.0)
-        Bus(self, id= 49,   btype=BusType.PV,     v_pu=1.025,   theta_deg=20.94,   q_shunt_mvar=  0.0)
-        Bus(self, id= 50,   btype=BusType.PQ,     v_pu=1.001,   theta_deg=18.90,   q_shunt_mvar=  0.0)
-        Bus(self, id= 51,   btype=BusType.PQ,     v_pu=0.967,   theta_deg=16.28,   q_shunt_mvar=  0.0)
-        Bus(self, id= 52,   btype=BusType.PQ,     v_pu=0.957,   theta_deg=15.32,   q_shunt_mvar=  0.0)
-        Bus(self, id= 53,   btype=BusType.PQ,     v_pu=0.946,   theta_deg=14.35,   q_shunt_mvar=  0.0)
-        Bus(self, id= 54,   btype=BusType.PV,     v_pu=0.955,   theta_deg=15.26,   q_shunt_mvar=  0.0)
-        Bus(self, id= 55,   btype=BusType.PV,     v_pu=0.952,   theta_deg=14.97,   q_shunt_mvar=  0.0)
-        Bus(self, id= 56,   btype=BusType.PV,     v_pu=0.954,   theta_deg=15.16,   q_shunt_mvar=  0.0)
-        Bus(self, id= 57,   btype=BusType.PQ,     v_pu=0.971,   theta_deg=16.36,   q_shunt_mvar=  0.0)
-        Bus(self, id= 58,   btype=BusType.PQ,     v_pu=0.959,   theta_deg=15.51,   q_shunt_mvar=  0.0)
-        Bus(self, id= 59,   btype=BusType.PV,     v_pu=0.985,   theta_deg=19.37,   q_shunt_mvar=  0.0)
-        Bus(self, id= 60,   btype=BusType.PQ,     v_pu=0.993,   theta_deg=23.15,   q_shunt_mvar=  0.0)
-        Bus(self, id= 61,   btype=BusType.PV,     v_pu=0.995,   theta_deg=24.04,   q_shunt_mvar=  0.0)
-        Bus(self, id= 62,   btype=BusType.PV,     v_pu=0.998,   theta_deg=23.43,   q_shunt_mvar=  0.0)
-        Bus(self, id= 63,   btype=BusType.PQ,     v_pu=0.969,   theta_deg=22.75,   q_shunt_mvar=  0.0)
-        Bus(self, id= 64,   btype=BusType.PQ,     v_pu=0.984,   theta_deg=24.52,   q_shunt_mvar=  0.0)
-        Bus(self, id= 65,   btype=BusType.PV,     v_pu=1.005,   theta_deg=27.65,   q_shunt_mvar=  0.0)
-        Bus(self, id= 66,   btype=BusType.PV,     v_pu=1.050,   theta_deg=27.48,   q_shunt_mvar=  0.0)
-        Bus(self, id= 67,   btype=BusType.PQ,     v_pu=1.020,   theta_deg=24.84,   q_shunt_mvar=  0.0)
-        Bus(self, id= 68,   btype=BusType.PQ,     v_pu=1.003,   theta_deg=27.55,   q_shunt_mvar=  0.0)
-        Bus(self, id= 69,   btype=BusType.SLACK,  v_pu=1.035,   theta_deg=30.00,   q_shunt_mvar=  0.0)
-        Bus(self, id= 70,   btype=BusType.PV,     v_pu=0.984,   theta_deg=22.58,   q_shunt_mvar=  0.0)
-        Bus(self, id= 71,   btype=BusType.PQ,     v_pu=0.987,   theta_deg=22.15,   q_shunt_mvar=  0.0)
-        Bus(self, id= 72,   btype=BusType.PV,     v_pu=0.980,   theta_deg=20.98,   q_shunt_mvar=  0.0)
-        Bus(self, id= 73,   btype=BusType.PV,     v_pu=0.991,   theta_deg=21.94,   q_shunt_mvar=  0.0)
-        Bus(self, id= 74,   btype=BusType.PV,     v_pu=0.958,   theta_deg=21.64,   q_shunt_mvar= 12.0)
-        Bus(self, id= 75,   btype=BusType.PQ,     v_pu=0.967,   theta_deg=22.91,   q_shunt_mvar=  0.0)
-        Bus(self, id= 76,   btype=BusType.PV,     v_pu=0.943,   theta_deg=21.77,   q_shunt_mvar=  0.0)
-        Bus(self, id= 77,   btype=BusType.PV,     v_pu=1.006,   theta_deg=26.72,   q_shunt_mvar=  0.0)
-        Bus(self, id= 78,   btype=BusType.PQ,     v_pu=1.003,   theta_deg=26.42,   q_shunt_mvar=  0.0)
-        Bus(self, id= 79,   btype=BusType.PQ,     v_pu=1.009,   theta_deg=26.72,   q_shunt_mvar= 20.0)
-        Bus(self, id= 80,   btype=BusType.PV,     v_pu=1.040,   theta_deg=28.96,   q_shunt_mvar=  0.0)
-        Bus(self, id= 81,   btype=BusType.PQ,     v_pu=0.997,   theta_deg=28.10,   q_shunt_mvar=  0.0)
-        Bus(self, id= 82,   btype=BusType.PQ,     v_pu=0.989,   theta_deg=27.24,   q_shunt_mvar= 20.0)
-        Bus(self, id= 83,   btype=BusType.PQ,     v_pu=0.985,   theta_deg=28.42,   q_shunt_mvar= 10.0)
-        Bus(self, id= 84,   btype=BusType.PQ,     v_pu=0.980,   theta_deg=30.95,   q_shunt_mvar=  0.0)
-        Bus(self, id= 85,   btype=BusType.PV,     v_pu=0.985,   theta_deg=32.51,   q_shunt_mvar=  0.0)
-        Bus(self, id= 86,   btype=BusType.PQ,     v_pu=0.987,   theta_deg=31.14,   q_shunt_mvar=  0.0)
-        Bus(self, id= 87,   btype=BusType.PV,     v_pu=1.015,   theta_deg=31.40,   q_shunt_mvar=  0.0)
-        Bus(self, id= 88,   btype=BusType.PQ,     v_pu=0.987,   theta_deg=35.64,   q_shunt_mvar=  0.0)
-        Bus(self, id= 89,   btype=BusType.PV,     v_pu=1.005,   theta_deg=39.69,   q_shunt_mvar=  0.0)
-        Bus(self, id= 90,   btype=BusType.PV,     v_pu=0.985,   theta_deg=33.29,   q_shunt_mvar=  0.0)
-        Bus(self, id= 91,   btype=BusType.PV,     v_pu=0.980,   theta_deg=33.31,   q_shunt_mvar=  0.0)
-        Bus(self, id= 92,   btype=BusType.PV,     v_pu=0.993,   theta_deg=33.80,   q_shunt_mvar=  0.0)
-        Bus(self, id= 93,   btype=BusType.PQ,     v_pu=0.987,   theta_deg=30.79,   q_shunt_mvar=  0.0)
-        Bus(self, id= 94,   btype=BusType.PQ,     v_pu=0.991,   theta_deg=28.64,   q_shunt_mvar=  0.0)
-        Bus(self, id= 95,   btype=BusType.PQ,     v_pu=0.981,   theta_deg=27.67,   q_shunt_mvar=  0.0)
-        Bus(self, id= 96,   btype=BusType.PQ,     v_pu=0.993,   theta_deg=27.51,   q_shunt_mvar=  0.0)
-        Bus(self, id= 97,   btype=BusType.PQ,     v_pu=1.011,   theta_deg=27.88,   q_shunt_mvar=  0.0)
-        Bus(self, id= 98,   btype=BusType.PQ,     v_pu=1.024,   theta_deg=27.40,   q_shunt_mvar=  0.0)
-        Bus(self, id= 99,   btype=BusType.PV,     v_pu=1.010,   theta_deg=27.04,   q_shunt_mvar=  0.0)
-        Bus(self, id=100,   btype=BusType.PV,     v_pu=1.017,   theta_deg=28.03,   q_shunt_mvar=  0.0)
-        Bus(self, id=101,   btype=BusType.PQ,     v_pu=0.993,   theta_deg=29.61,   q_shunt_mvar=  0.0)
-        Bus(self, id=102,   btype=BusType.PQ,     v_pu=0.991,   theta_deg=32.30,   q_shunt_mvar=  0.0)
-        Bus(self, id=103,   btype=BusType.PV,     v_pu=1.001,   theta_deg=24.44,   q_shunt_mvar=  0.0)
-        Bus(self, id=104,   btype=BusType.PV,     v_pu=0.971,   theta_deg=21.69,   q_shunt_mvar=  0.0)
-        Bus(self, id=105,   btype=BusType.PV,     v_pu=0.965,   theta_deg=20.57,   q_shunt_mvar= 20.0)
-        Bus(self, id=106,   btype=BusType.PQ,     v_pu=0.962,   theta_deg=20.32,   q_shunt_mvar=  0.0)
-        Bus(self, id=107,   btype=BusType.PV,     v_pu=0.952,   theta_deg=17.53,   q_shunt_mvar=  6.0)
-        Bus(self, id=108,   btype=BusType.PQ,     v_pu=0.967,   theta_deg=19.38,   q_shunt_mvar=  0.0)
-        Bus(self, id=109,   btype=BusType.PQ,     v_pu=0.967,   theta_deg=18.93,   q_shunt_mvar=  0.0)
-        Bus(self, id=110,   btype=BusType.PV,     v_pu=0.973,   theta_deg=18.09,   q_shunt_mvar=  6.0)
-        Bus(self, id=111,   btype=BusType.PV,     v_pu=0.980,   theta_deg=19.74,   q_shunt_mvar=  0.0)
-        Bus(self, id=112,   btype=BusType.PV,     v_pu=0.975,   theta_deg=14.99,   q_shunt_mvar=  0.0)
-        Bus(self, id=113,   btype=BusType.PV,     v_pu=0.993,   theta_deg=13.74,   q_shunt_mvar=  0.0)
-        Bus(self, id=114,   btype=BusType.PQ,     v_pu=0.960,   theta_deg=14.46,   q_shunt_mvar=  0.0)
-        Bus(self, id=115,   btype=BusType.PQ,     v_pu=0.960,   theta_deg=14.46,   q_shunt_mvar=  0.0)
-        Bus(self, id=116,   btype=BusType.PV,     v_pu=1.005,   theta_deg=27.12,   q_shunt_mvar=  0.0)
-        Bus(self, id=117,   btype=BusType.PQ,     v_pu=0.974,   theta_deg=10.67,   q_shunt_mvar=  0.0)
-        Bus(self, id=118,   btype=BusType.PQ,     v_pu=0.949,   theta_deg=21.92,   q_shunt_mvar=  0.0)
-
-    def _create_lines(self):
-        """Create Line objects from the DLIN matrix entries.
-
-        where Bsh values in the source are interpreted as the total
-        line shunt and stored here as half-shunt (shunt_half_pu).
-        """
-        Line(id=  1,   from_bus=self.buses[  0],   to_bus=self.buses[  1],   r_pu=0.03030,   x_pu=0.09990,   shunt_half_pu=0.01270,   flow_max_pu=1.0)                      
-        Line(id=  2,   from_bus=self.buses[  0],   to_bus=self.buses[  2],   r_pu=0.01290,   x_pu=0.04240,   shunt_half_pu=0.00541,   flow_max_pu=1.0)                      
-        Line(id=  3,   from_bus=self.buses[  3],   to_bus=self.buses[  4],   r_pu=0.00176,   x_pu=0.00798,   shunt_half_pu=0.00105,   flow_max_pu=1.0)                      
-        Line(id=  4,   from_bus=self.buses[  2],   to_bus=self.buses[  4],   r_pu=0.02410,   x_pu=0.10800,   shunt_half_pu=0.01420,   flow_max_pu=1.0)                      
-        Line(id=  5,   from_bus=self.buses[  4],   to_bus=self.buses[  5],   r_pu=0.01190,   x_pu=0.05400,   shunt_half_pu=0.00713,   flow_max_pu=1.0)                      
-        Line(id=  6,   from_bus=self.buses[  5],   to_bus=self.buses[  6],   r_pu=0.00459,   x_pu=0.02080,   shunt_half_pu=0.00275,   flow_max_pu=1.0)                      
-        Line(id=  7,   from_bus=self.buses[  7],   to_bus=self.buses[  8],   r_pu=0.00244,   x_pu=0.03050,   shunt_half_pu=0.58100,   flow_max_pu=1.0)                      
-        Line(id=  8,   from_bus=self.buses[  7],   to_bus=self.buses[  4],   r_pu=0.00000,   x_pu=0.02670,   shunt_half_pu=0.00000,   flow_max_pu=1.0,   tap_ratio=0.985)   
-        Line(id=  9,   from_bus=self.buses[  8],   to_bus=self.buses[  9],   r_pu=0.00258,   x_pu=0.03220,   shunt_half_pu=0.61500,   flow_max_pu=1.0)                      
-        Line(id= 10,   from_bus=self.buses[  3],   to_bus=self.buses[ 10],   r_pu=0.02090,   x_pu=0.06880,   shunt_half_pu=0.00874,   flow_max_pu=1.0)                      
-        Line(id= 11,   from_bus=self.buses[  4],   to_bus=self.buses[ 10],   r_pu=0.02030,   x_pu=0.06820,   shunt_half_pu=0.00869,   flow_max_pu=1.0)                      
-        Line(id= 12,   from_bus=self.buses[ 10],   to_bus=self.buses[ 11],   r_pu=0.00595,   x_pu=0.01960,   shunt_half_pu=0.00251,   flow_max_pu=1.0)                      
-        Line(id= 13,   from_bus=self.buses[  1],   to_bus=self.buses[ 11],   r_pu=0.01870,   x_pu=0.06160,   shunt_half_pu=0.00786,   flow_max_pu=1.0)                      
-        Line(id= 14,   from_bus=self.buses[  2],   to_bus=self.buses[ 11],   r_pu=0.04840,   x_pu=0.16000,   shunt_half_pu=0.02030,   flow_max_pu=1.0)                      
-        Line(id= 15,   from_bus=self.buses[  6],   to_bus=self.buses[ 11],   r_pu=0.00862,   x_pu=0.03400,   shunt_half_pu=0.00437,   flow_max_pu=1.0)                      
-        Line(id= 16,   from_bus=self.buses[ 10],   to_bus=self.buses[ 12],   r_pu=0.02225,   x_pu=0.07310,   shunt_half_pu=0.00938,   flow_max_pu=1.0)                      
-        Line(id= 17,   from_bus=self.buses[ 11],   to_bus=self.buses[ 13],   r_pu=0.02150,   x_pu=0.07070,   shunt_half_pu=0.00908,   flow_max_pu=1.0)                      
-        Line(id= 18,   from_bus=self.buses[ 12],   to_bus=self.buses[ 14],   r_pu=0.07440,   x_pu=0.24440,   shunt_half_pu=0.03134,   flow_max_pu=1.0)                      
-        Line(id= 19,   from_bus=self.buses[ 13],   to_bus=self.buses[ 14],   r_pu=0.05950,   x_pu=0.19500,   shunt_half_pu=0.02510,   flow_max_pu=1.0)                      
-        Line(id= 20,   from_bus=self.buses[ 11],   to_bus=self.buses[ 15],   r_pu=0.02120,   x_pu=0.08340,   shunt_half_pu=0.01070,   flow_max_pu=1.0)                      
-        Line(id= 21,   from_bus=self.buses[ 14],   to_bus=self.buses[ 16],   r_pu=0.01320,   x_pu=0.04370,   shunt_half_pu=0.02220,   flow_max_pu=1.0)                      
-        Line(id= 22,   from_bus=self.buses[ 15],   to_bus=self.buses[ 16],   r_pu=0.04540,   x_pu=0.18010,   shunt_half_pu=0.02330,   flow_max_pu=1.0)                      
-        Line(id= 23,   from_bus=self.buses[ 16],   to_bus=self.buses[ 17],   r_pu=0.01230,   x_pu=0.05050,   shunt_half_pu=0.00649,   flow_max_pu=1.0)                      
-        Line(id= 24,   from_bus=self.buses[ 17],   to_bus=self.buses[ 18],   r_pu=0.01119,   x_pu=0.04930,   shunt_half_pu=0.00571,   flow_max_pu=1.0)                      
-        Line(id= 25,   from_bus=self.buses[ 18],   to_bus=self.buses[ 19],   r_pu=0.02520,   x_pu=0.11700,   shunt_half_pu=0.01490,   flow_max_pu=1.0)                      
-        Line(id= 26,   from_bus=self.buses[ 14],   to_bus=self.buses[ 18],   r_pu=0.01200,   x_pu=0.03940,   shunt_half_pu=0.00505,   flow_max_pu=1.0)                      
-        Line(id= 27,   from_bus=self.buses[ 19],   to_bus=self.buses[ 20],   r_pu=0.01830,   x_pu=0.08490,   shunt_half_pu=0.01080,   flow_max_pu=1.0)                      
-        Line(id= 28,   from_bus=self.buses[ 20],   to_bus=self.buses[ 21],   r_pu=0.02090,   x_pu=0.09700,   shunt_half_pu=0.01230,   flow_max_pu=1.0)                      
-        Line(id= 29,   from_bus=self.buses[ 21],   to_bus=self.buses[ 22],   r_pu=0.03420,   x_pu=0.15900,   shunt_half_pu=0.02020,   flow_max_pu=1.0)                      
-        Line(id= 30,   from_bus=self.buses[ 22],   to_bus=self.buses[ 23],   r_pu=0.01350,   x_pu=0.04920,   shunt_half_pu=0.02490,   flow_max_pu=1.0)                      
-        Line(id= 31,   from_bus=self.buses[ 22],   to_bus=self.buses[ 24],   r_pu=0.01560,   x_pu=0.08000,   shunt_half_pu=0.04320,   flow_max_pu=1.0)                      
-        Line(id= 32,   from_bus=self.buses[ 25],   to_bus=self.buses[ 24],   r_pu=0.00000,   x_pu=0.03820,   shunt_half_pu=0.00000,   flow_max_pu=1.0,   tap_ratio=0.960)   
-        Line(id= 33,   from_bus=self.buses[ 24],   to_bus=self.buses[ 26],   r_pu=0.03180,   x_pu=0.16300,   shunt_half_pu=0.08820,   flow_max_pu=1.0)                      
-        Line(id= 34,   from_bus=self.buses[ 26],   to_bus=self.buses[ 27],   r_pu=0.01913,   x_pu=0.08550,   shunt_half_pu=0.01080,   flow_max_pu=1.0)                      
-        Line(id= 35,   from_bus=self.buses[ 27],   to_bus=self.buses[ 28],   r_pu=0.02370,   x_pu=0.09430,   shunt_half_pu=0.01190,   flow_max_pu=1.0)                      
-        Line(id= 36,   from_bus=self.buses[ 29],   to_bus=self.buses[ 16],   r_pu=0.00000,   x_pu=0.03880,   shunt_half_pu=0.00000,   flow_max_pu=1.0,   tap_ratio=0.960)   
-        Line(id= 37,   from_bus=self.buses[  7],   to_bus=self.buses[ 29],   r_pu=0.00431,   x_pu=0.05040,   shunt_half_pu=0.25700,   flow_max_pu=1.0)                      
-        Line(id= 38,   from_bus=self.buses[ 25],   to_bus=self.buses[ 29],   r_pu=0.00799,   x_pu=0.08600,   shunt_half_pu=0.45400,   flow_max_pu=1.0)                      
-        Line(id= 39,   from_bus=self.buses[ 16],   to_bus=self.buses[ 30],   r_pu=0.04740,   x_pu=0.15630,   shunt_half_pu=0.01995,   flow_max_pu=1.0)                      
-        Line(id= 40,   from_bus=self.buses[ 28],   to_bus=self.buses[ 30],   r_pu=0.01080,   x_pu=0.03310,   shunt_half_pu=0.00415,   flow_max_pu=1.0)                      
-        Line(id= 41,   from_bus=self.buses[ 22],   to_bus=self.buses[ 31],   r_pu=0.03170,   x_pu=0.11530,   shunt_half_pu=0.05865,   flow_max_pu=1.0)                      
-        Line(id= 42,   from_bus=self.buses[ 30],   to_bus=self.buses[ 31],   r_pu=0.02980,   x_pu=0.09850,   shunt_half_pu=0.01255,   flow_max_pu=1.0)                      
-        Line(id= 43,   from_bus=self.buses[ 26],   to_bus=self.buses[ 31],   r_pu=0.02290,   x_pu=0.07550,   shunt_half_pu=0.00963,   flow_max_pu=1.0)                      
-        Line(id= 44,   from_bus=self.buses[ 14],   to_bus=self.buses[ 32],   r_pu=0.03800,   x_pu=0.12440,   shunt_half_pu=0.01597,   flow_max_pu=1.0)                      
-        Line(id= 45,   from_bus=self.buses[ 18],   to_bus=self.buses[ 33],   r_pu=0.07520,   x_pu=0.24700,   shunt_half_pu=0.03160,   flow_max_pu=1.0)                      
-        Line(id= 46,   from_bus=self.buses[ 34],   to_bus=self.buses[ 35],   r_pu=0.00224,   x_pu=0.01020,   shunt_half_pu=0.00134,   flow_max_pu=1.0)                      
-        Line(id= 47,   from_bus=self.buses[ 34],   to_bus=self.buses[ 36],   r_pu=0.01100,   x_pu=0.04970,   shunt_half_pu=0.00659,   flow_max_pu=1.0)                      
-        Line(id= 48,   from_bus=self.buses[ 32],   to_bus=self.buses[ 36],   r_pu=0.04150,   x_pu=0.14200,   shunt_half_pu=0.01830,   flow_max_pu=1.0)                      
-        Line(id= 49,   from_bus=self.buses[ 33],   to_bus=self.buses[ 35],   r_pu=0.00871,   x_pu=0.02680,   shunt_half_pu=0.00284,   flow_max_pu=1.0)                      
-        Line(id= 50,   from_bus=self.buses[ 33],   to_bus=self.buses[ 36],   r_pu=0.00256,   x_pu=0.00940,   shunt_half_pu=0.00492,   flow_max_pu=1.0)                      
-        Line(id= 51,   from_bus=self.buses[ 37],   to_bus=self.buses[ 36],   r_pu=0.00000,   x_pu=0.03750,   shunt_half_pu=0.00000,   flow_max_pu=1.0,   tap_ratio=0.935) 
-        Line(id= 52,   from_bus=self.buses[ 36],   to_bus=self.buses[ 38],   r_pu=0.03210,   x_pu=0.10600,   shunt_half_pu=0.01350,   flow_max_pu=1.0)                      
-        Line(id= 53,   from_bus=self.buses[ 36],   to_bus=self.buses[ 39],   r_pu=0.05930,   x_pu=0.16800,   shunt_half_pu=0.02100,   flow_max_pu=1.0)                      
-        Line(id= 54,   from_bus=self.buses[ 29],   to_bus=self.buses[ 37],   r_pu=0.00464,   x_pu=0.05400,   shunt_half_pu=0.21100,   flow_max_pu=1.0)                      
-        Line(id= 55,   from_bus=self.buses[ 38],   to_bus=self.buses[ 39],   r_pu=0.01840,   x_pu=0.06050,   shunt_half_pu=0.00776,   flow_max_pu=1.0)                      
-        Line(id= 56,   from_bus=self.buses[ 39],   to_bus=self.buses[ 40],   r_pu=0.01450,   x_pu=0.04870,   shunt_half_pu=0.00611,   flow_max_pu=1.0)                      
-        Line(id= 57,   from_bus=self.buses[ 39],   to_bus=self.buses[ 41],   r_pu=0.05550,   x_pu=0.18300,   shunt_half_pu=0.02330,   flow_max_pu=1.0)                      
-        Line(id= 58,   from_bus=self.buses[ 40],   to_bus=self.buses[ 41],   r_pu=0.04100,   x_pu=0.13500,   shunt_half_pu=0.01720,   flow_max_pu=1.0)                      
-        Line(id= 59,   from_bus=self.buses[ 42],   to_bus=self.buses[ 43],   r_pu=0.06080,   x_pu=0.24540,   shunt_half_pu=0.03034,   flow_max_pu=1.0)                      
-        Line(id= 60,   from_bus=self.buses[ 33],   to_bus=self.buses[ 42],   r_pu=0.04130,   x_pu=0.16810,   shunt_half_pu=0.02113,   flow_max_pu=1.0)                      
-        Line(id= 61,   from_bus=self.buses[ 43],   to_bus=self.buses[ 44],   r_pu=0.02240,   x_pu=0.09010,   shunt_half_pu=0.01120,   flow_max_pu=1.0)                      
-        Line(id= 62,   from_bus=self.buses[ 44],   to_bus=self.buses[ 45],   r_pu=0.04000,   x_pu=0.13560,   shunt_half_pu=0.01660,   flow_max_pu=1.0)                      
-        Line(id= 63,   from_bus=self.buses[ 45],   to_bus=self.buses[ 46],   r_pu=0.03800,   x_pu=0.12700,   shunt_half_pu=0.01580,   flow_max_pu=1.0)                      
-        Line(id= 64,   from_bus=self.buses[ 45],   to_bus=self.buses[ 47],   r_pu=0.06010,   x_pu=0.18900,   shunt_half_pu=0.02360,   flow_max_pu=1.0)                      
-        Line(id= 65,   from_bus=self.buses[ 46],   to_bus=self.buses[ 48],   r_pu=0.01910,   x_pu=0.06250,   shunt_half_pu=0.00802,   flow_max_pu=1.0)                      
-        Line(id= 66,   from_bus=self.buses[ 41],   to_bus=self.buses[ 48],   r_pu=0.07150,   x_pu=0.32300,   shunt_half_pu=0.04300,   flow_max_pu=1.0)                      
-        Line(id= 67,   from_bus=self.buses[ 41],   to_bus=self.buses[ 48],   r_pu=0.07150,   x_pu=0.32300,   shunt_half_pu=0.04300,   flow_max_pu=1.0)                      
-        Line(id= 68,   from_bus=self.buses[ 44],   to_bus=self.buses[ 48],   r_pu=0.06840,   x_pu=0.18600,   shunt_half_pu=0.02220,   flow_max_pu=1.0)                      
-        Line(id= 69,   from_bus=self.buses[ 47],   to_bus=self.buses[ 48],   r_pu=0.01790,   x_pu=0.05050,   shunt_half_pu=0.00629,   flow_max_pu=1.0)                      
-        Line(id= 70,   from_bus=self.buses[ 48],   to_bus=self.buses[ 49],   r_pu=0.02670,   x_pu=0.07520,   shunt_half_pu=0.00937,   flow_max_pu=1.0)                      
-        Line(id= 71,   from_bus=self.buses[ 48],   to_bus=self.buses[ 50],   r_pu=0.04860,   x_pu=0.13700,   shunt_half_pu=0.01710,   flow_max_pu=1.0)                      
-        Line(id= 72,   from_bus=self.buses[ 50],   to_bus=self.buses[ 51],   r_pu=0.02030,   x_pu=0.05880,   shunt_half_pu=0.00698,   flow_max_pu=1.0)                      
-        Line(id= 73,   from_bus=self.buses[ 51],   to_bus=self.buses[ 52],   r_pu=0.04050,   x_pu=0.16350,   shunt_half_pu=0.02029,   flow_max_pu=1.0)                      
-        Line(id= 74,   from_bus=self.buses[ 52],   to_bus=self.buses[ 53],   r_pu=0.02630,   x_pu=0.12200,   shunt_half_pu=0.01550,   flow_max_pu=1.0)                      
-        Line(id= 75,   from_bus=self.buses[ 48],   to_bus=self.buses[ 53],   r_pu=0.07300,   x_pu=0.28900,   shunt_half_pu=0.03690,   flow_max_pu=1.0)                      
-        Line(id= 76,   from_bus=self.buses[ 48],   to_bus=self.buses[ 53],   r_pu=0.08690,   x_pu=0.29100,   shunt_half_pu=0.03650,   flow_max_pu=1.0)                      
-        Line(id= 77,   from_bus=self.buses[ 53],   to_bus=self.buses[ 54],   r_pu=0.01690,   x_pu=0.07070,   shunt_half_pu=0.01010,   flow_max_pu=1.0)                      
-        Line(id= 78,   from_bus=self.buses[ 53],   to_bus=self.buses[ 55],   r_pu=0.00275,   x_pu=0.00955,   shunt_half_pu=0.00366,   flow_max_pu=1.0)                      
-        Line(id= 79,   from_bus=self.buses[ 54],   to_bus=self.buses[ 55],   r_pu=0.00488,   x_pu=0.01510,   shunt_half_pu=0.00187,   flow_max_pu=1.0)                      
-        Line(id= 80,   from_bus=self.buses[ 55],   to_bus=self.buses[ 56],   r_pu=0.03430,   x_pu=0.09660,   shunt_half_pu=0.01210,   flow_max_pu=1.0)                      
-        Line(id= 81,   from_bus=self.buses[ 49],   to_bus=self.buses[ 56],   r_pu=0.04740,   x_pu=0.13400,   shunt_half_pu=0.01660,   flow_max_pu=1.0)                      
-        Line(id= 82,   from_bus=self.buses[ 55],   to_bus=self.buses[ 57],   r_pu=0.03430,   x_pu=0.09660,   shunt_half_pu=0.01210,   flow_max_pu=1.0)                      
-        Line(id= 83,   from_bus=self.buses[ 50],   to_bus=self.buses[ 57],   r_pu=0.02550,   x_pu=0.07190,   shunt_half_pu=0.00894,   flow_max_pu=1.0)                      
-        Line(id= 84,   from_bus=self.buses[ 53],   to_bus=self.buses[ 58],   r_pu=0.05030,   x_pu=0.22930,   shunt_half_pu=0.02990,   flow_max_pu=1.0)                      
-        Line(id= 85,   from_bus=self.buses[ 55],   to_bus=self.buses[ 58],   r_pu=0.08250,   x_pu=0.25100,   shunt_half_pu=0.02845,   flow_max_pu=1.0)                      
-        Line(id= 86,   from_bus=self.buses[ 55],   to_bus=self.buses[ 58],   r_pu=0.08030,   x_pu=0.23900,   shunt_half_pu=0.02680,   flow_max_pu=1.0)                      
-        Line(id= 87,   from_bus=self.buses[ 54],   to_bus=self.buses[ 58],   r_pu=0.04739,   x_pu=0.21580,   shunt_half_pu=0.02823,   flow_max_pu=1.0)                      
-        Line(id= 88,   from_bus=self.buses[ 58],   to_bus=self.buses[ 59],   r_pu=0.03170,   x_pu=0.14500,   shunt_half_pu=0.01880,   flow_max_pu=1.0)                      
-        Line(id= 89,   from_bus=self.buses[ 58],   to_bus=self.buses[ 60],   r_pu=0.03280,   x_pu=0.15000,   shunt_half_pu=0.01940,   flow_max_pu=1.0)                      
-        Line(id= 90,   from_bus=self.buses[ 59],   to_bus=self.buses[ 60],   r_pu=0.00264,   x_pu=0.01350,   shunt_half_pu=0.00728,   flow_max_pu=1.0)                      
-        Line(id= 91,   from_bus=self.buses[ 59],   to_bus=self.buses[ 61],   r_pu=0.01230,   x_pu=0.05610,   shunt_half_pu=0.00734,   flow_max_pu=1.0)                      
-        Line(id= 92,   from_bus=self.buses[ 60],   to_bus=self.buses[ 61],   r_pu=0.00824,   x_pu=0.03760,   shunt_half_pu=0.00490,   flow_max_pu=1.0)                      
-        Line(id= 93,   from_bus=self.buses[ 62],   to_bus=self.buses[ 58],   r_pu=0.00000,   x_pu=0.03860,   shunt_half_pu=0.00000,   flow_max_pu=1.0,   tap_ratio=0.960)   
-        Line(id= 94,   from_bus=self.buses[ 62],   to_bus=self.buses[ 63],   r_pu=0.00172,   x_pu=0.02000,   shunt_half_pu=0.10800,   flow_max_pu=1.0)                      
-        Line(id= 95,   from_bus=self.buses[ 63],   to_bus=self.buses[ 60],   r_pu=0.00000,   x_pu=0.02680,   shunt_half_pu=0.00000,   flow_max_pu=1.0,   tap_ratio=0.985)   
-        Line(id= 96,   from_bus=self.buses[ 37],   to_bus=self.buses[ 64],   r_pu=0.00901,   x_pu=0.09860,   shunt_half_pu=0.52300,   flow_max_pu=1.0)                      
-        Line(id= 97,   from_bus=self.buses[ 63],   to_bus=self.buses[ 64],   r_pu=0.00269,   x_pu=0.03020,   shunt_half_pu=0.19000,   flow_max_pu=1.0)                      
-        Line(id= 98,   from_bus=self.buses[ 48],   to_bus=self.buses[ 65],   r_pu=0.01800,   x_pu=0.09190,   shunt_half_pu=0.01240,   flow_max_pu=1.0)                      
-        Line(id= 99,   from_bus=self.buses[ 48],   to_bus=self.buses[ 65],   r_pu=0.01800,   x_pu=0.09190,   shunt_half_pu=0.01240,   flow_max_pu=1.0)                      
-        Line(id=100,   from_bus=self.buses[ 61],   to_bus=self.buses[ 65],   r_pu=0.04820,   x_pu=0.21800,   shunt_half_pu=0.02890,   flow_max_pu=1.0)                      
-        Line(id=101,   from_bus=self.buses[ 61],   to_bus=self.buses[ 66],   r_pu=0.02580,   x_pu=0.11700,   shunt_half_pu=0.01550,   flow_max_pu=1.0)                      
-        Line(id=102,   from_bus=self.buses[ 64],   to_bus=self.buses[ 65],   r_pu=0.00000,   x_pu=0.03700,   shunt_half_pu=0.00000,   flow_max_pu=1.0,   tap_ratio=0.935)   
-        Line(id=103,   from_bus=self.buses[ 65],   to_bus=self.buses[ 66],   r_pu=0.02240,   x_pu=0.10150,   shunt_half_pu=0.01341,   flow_max_pu=1.0)                      
-        Line(id=104,   from_bus=self.buses[ 64],   to_bus=self.buses[ 67],   r_pu=0.00138,   x_pu=0.01600,   shunt_half_pu=0.31900,   flow_max_pu=1.0)                      
-        Line(id=105,   from_bus=self.buses[ 46],   to_bus=self.buses[ 68],   r_pu=0.08440,   x_pu=0.27780,   shunt_half_pu=0.03546,   flow_max_pu=1.0)                      
-        Line(id=106,   from_bus=self.buses[ 48],   to_bus=self.buses[ 68],   r_pu=0.09850,   x_pu=0.32400,   shunt_half_pu=0.04140,   flow_max_pu=1.0)                      
-        Line(id=107,   from_bus=self.buses[ 67],   to_bus=self.buses[ 68],   r_pu=0.00000,   x_pu=0.03700,   shunt_half_pu=0.00000,   flow_max_pu=1.0,   tap_ratio=0.935)   
-        Line(id=108,   from_bus=self.buses[ 68],   to_bus=self.buses[ 69],   r_pu=0.03000,   x_pu=0.12700,   shunt_half_pu=0.06100,   flow_max_pu=1.0)                      
-        Line(id=109,   from_bus=self.buses[ 23],   to_bus=self.buses[ 69],   r_pu=0.00221,   x_pu=0.41150,   shunt_half_pu=0.05099,   flow_max_pu=1.0)                      
-        Line(id=110,   from_bus=self.buses[ 69],   to_bus=self.buses[ 70],   r_pu=0.00882,   x_pu=0.03550,   shunt_half_pu=0.00439,   flow_max_pu=1.0)                      
-        Line(id=111,   from_bus=self.buses[ 23],   to_bus=self.buses[ 71],   r_pu=0.04880,   x_pu=0.19600,   shunt_half_pu=0.02440,   flow_max_pu=1.0)                      
-        Line(id=112,   from_bus=self.buses[ 70],   to_bus=self.buses[ 71],   r_pu=0.04460,   x_pu=0.18000,   shunt_half_pu=0.02222,   flow_max_pu=1.0)                      
-        Line(id=113,   from_bus=self.buses[ 70],   to_bus=self.buses[ 72],   r_pu=0.00866,   x_pu=0.04540,   shunt_half_pu=0.00589,   flow_max_pu=1.0)                      
-        Line(id=114,   from_bus=self.buses[ 69],   to_bus=self.buses[ 73],   r_pu=0.04010,   x_pu=0.13230,   shunt_half_pu=0.01684,   flow_max_pu=1.0)                      
-        Line(id=115,   from_bus=self.buses[ 69],   to_bus=self.buses[ 74],   r_pu=0.04280,   x_pu=0.14100,   shunt_half_pu=0.01800,   flow_max_pu=1.0)                      
-        Line(id=116,   from_bus=self.buses[ 68],   to_bus=self.buses[ 74],   r_pu=0.04050,   x_pu=0.12200,   shunt_half_pu=0.06200,   flow_max_pu=1.0)                      
-        Line(id=117,   from_bus=self.buses[ 73],   to_bus=self.buses[ 74],   r_pu=0.01230,   x_pu=0.04060,   shunt_half_pu=0.00517,   flow_max_pu=1.0)                      
-        Line(id=118,   from_bus=self.buses[ 75],   to_bus=self.buses[ 76],   r_pu=0.04440,   x_pu=0.14800,   shunt_half_pu=0.01840,   flow_max_pu=1.0)                      
-        Line(id=119,   from_bus=self.buses[ 68],   to_bus=self.buses[ 76],   r_pu=0.03090,   x_pu=0.10100,   shunt_half_pu=0.05190,   flow_max_pu=1.0)                      
-        Line(id=120,   from_bus=self.buses[ 74],   to_bus=self.buses[ 76],   r_pu=0.06010,   x_pu=0.19990,   shunt_half_pu=0.02489,   flow_max_pu=1.0)                      
-        Line(id=121,   from_bus=self.buses[ 76],   to_bus=self.buses[ 77],   r_pu=0.00376,   x_pu=0.01240,   shunt_half_pu=0.00632,   flow_max_pu=0.85)                     
-        Line(id=122,   from_bus=self.buses[ 77],   to_bus=self.buses[ 78],   r_pu=0.00546,   x_pu=0.02440,   shunt_half_pu=0.00324,   flow_max_pu=1.0)                      
-        Line(id=123,   from_bus=self.buses[ 76],   to_bus=self.buses[ 79],   r_pu=0.01700,   x_pu=0.04850,   shunt_half_pu=0.02360,   flow_max_pu=1.0)                      
-        Line(id=124,   from_bus=self.buses[ 76],   to_bus=self.buses[ 79],   r_pu=0.02940,   x_pu=0.10500,   shunt_half_pu=0.01140,   flow_max_pu=1.0)                      
-        Line(id=125,   from_bus=self.buses[ 78],   to_bus=self.buses[ 79],   r_pu=0.01560,   x_pu=0.07040,   shunt_half_pu=0.00935,   flow_max_pu=1.0)                      
-        Line(id=126,   from_bus=self.buses[ 67],   to_bus=self.buses[ 80],   r_pu=0.00175,   x_pu=0.02020,   shunt_half_pu=0.40400,   flow_max_pu=1.0)                      
-        Line(id=127,   from_bus=self.buses[ 80],   to_bus=self.buses[ 79],   r_pu=0.00000,   x_pu=0.03700,   shunt_half_pu=0.00000,   flow_max_pu=1.0,   tap_ratio=0.935)   
-        Line(id=128,   from_bus=self.buses[ 76],   to_bus=self.buses[ 81],   r_pu=0.02980,   x_pu=0.08530,   shunt_half_pu=0.04087,   flow_max_pu=1.0)                      
-        Line(id=129,   from_bus=self.buses[ 81],   to_bus=self.buses[ 82],   r_pu=0.01120,   x_pu=0.03665,   shunt_half_pu=0.01898,   flow_max_pu=1.0)                      
-        Line(id=130,   from_bus=self.buses[ 82],   to_bus=self.buses[ 83],   r_pu=0.06250,   x_pu=0.13200,   shunt_half_pu=0.01290,   flow_max_pu=1.0)                      
-        Line(id=131,   from_bus=self.buses[ 82],   to_bus=self.buses[ 84],   r_pu=0.04300,   x_pu=0.14800,   shunt_half_pu=0.01740,   flow_max_pu=1.0)                      
-        Line(id=132,   from_bus=self.buses[ 83],   to_bus=self.buses[ 84],   r_pu=0.03020,   x_pu=0.06410,   shunt_half_pu=0.00617,   flow_max_pu=1.0)                      
-        Line(id=133,   from_bus=self.buses[ 84],   to_bus=self.buses[ 85],   r_pu=0.03500,   x_pu=0.12300,   shunt_half_pu=0.01380,   flow_max_pu=1.0)                      
-        Line(id=134,   from_bus=self.buses[ 85],   to_bus=self.buses[ 86],   r_pu=0.02828,   x_pu=0.20740,   shunt_half_pu=0.02225,   flow_max_pu=1.0)                      
-        Line(id=135,   from_bus=self.buses[ 84],   to_bus=self.buses[ 87],   r_pu=0.02000,   x_pu=0.10200,   shunt_half_pu=0.01380,   flow_max_pu=1.0)                      
-        Line(id=136,   from_bus=self.buses[ 84],   to_bus=self.buses[ 88],   r_pu=0.02390,   x_pu=0.17300,   shunt_half_pu=0.02350,   flow_max_pu=1.0)                      
-        Line(id=137,   from_bus=self.buses[ 87],   to_bus=self.buses[ 88],   r_pu=0.01390,   x_pu=0.07120,   shunt_half_pu=0.00967,   flow_max_pu=1.0)                      
-        Line(id=138,   from_bus=self.buses[ 88],   to_bus=self.buses[ 89],   r_pu=0.05180,   x_pu=0.18800,   shunt_half_pu=0.02640,   flow_max_pu=1.0)                      
-        Line(id=139,   from_bus=self.buses[ 88],   to_bus=self.buses[ 89],   r_pu=0.02380,   x_pu=0.09970,   shunt_half_pu=0.05300,   flow_max_pu=1.0)                      
-        Line(id=140,   from_bus=self.buses[ 89],   to_bus=self.buses[ 90],   r_pu=0.02540,   x_pu=0.08360,   shunt_half_pu=0.01070,   flow_max_pu=1.0)                      
-        Line(id=141,   from_bus=self.buses[ 88],   to_bus=self.buses[ 91],   r_pu=0.00990,   x_pu=0.05050,   shunt_half_pu=0.02740,   flow_max_pu=1.0)                      
-        Line(id=142,   from_bus=self.buses[ 88],   to_bus=self.buses[ 91],   r_pu=0.03930,   x_pu=0.15810,   shunt_half_pu=0.02070,   flow_max_pu=1.0)                      
-        Line(id=143,   from_bus=self.buses[ 90],   to_bus=self.buses[ 91],   r_pu=0.03870,   x_pu=0.12720,   shunt_half_pu=0.01634,   flow_max_pu=1.0)                      
-        Line(id=144,   from_bus=self.buses[ 91],   to_bus=self.buses[ 92],   r_pu=0.02580,   x_pu=0.08480,   shunt_half_pu=0.01090,   flow_max_pu=1.0)                      
-        Line(id=145,   from_bus=self.buses[ 91],   to_bus=self.buses[ 93],   r_pu=0.04810,   x_pu=0.15800,   shunt_half_pu=0.02030,   flow_max_pu=1.0)                      
-        Line(id=146,   from_bus=self.buses[ 92],   to_bus=self.buses[ 93],   r_pu=0.02230,   x_pu=0.07320,   shunt_half_pu=0.00938,   flow_max_pu=1.0)                      
-        Line(id=147,   from_bus=self.buses[ 93],   to_bus=self.buses[ 94],   r_pu=0.01320,   x_pu=0.04340,   shunt_half_pu=0.00555,   flow_max_pu=1.0)                      
-        Line(id=148,   from_bus=self.buses[ 79],   to_bus=self.buses[ 95],   r_pu=0.03560,   x_pu=0.18200,   shunt_half_pu=0.02470,   flow_max_pu=1.0)                      
-        Line(id=149,   from_bus=self.buses[ 81],   to_bus=self.buses[ 95],   r_pu=0.01620,   x_pu=0.05300,   shunt_half_pu=0.02720,   flow_max_pu=1.0)                      
-        Line(id=150,   from_bus=self.buses[ 93],   to_bus=self.buses[ 95],   r_pu=0.02690,   x_pu=0.08690,   shunt_half_pu=0.01150,   flow_max_pu=1.0)                      
-        Line(id=151,   from_bus=self.buses[ 79],   to_bus=self.buses[ 96],   r_pu=0.01830,   x_pu=0.09340,   shunt_half_pu=0.01270,   flow_max_pu=1.0)                      
-        Line(id=152,   from_bus=self.buses[ 79],   to_bus=self.buses[ 97],   r_pu=0.02380,   x_pu=0.10800,   shunt_half_pu=0.01430,   flow_max_pu=1.0)                      
-        Line(id=153,   from_bus=self.buses[ 79],   to_bus=self.buses[ 98],   r_pu=0.04540,   x_pu=0.20600,   shunt_half_pu=0.02730,   flow_max_pu=1.0)                      
-        Line(id=154,   from_bus=self.buses[ 91],   to_bus=self.buses[ 99],   r_pu=0.06480,   x_pu=0.29500,   shunt_half_pu=0.02360,   flow_max_pu=1.0)                      
-        Line(id=155,   from_bus=self.buses[ 93],   to_bus=self.buses[ 99],   r_pu=0.01780,   x_pu=0.05800,   shunt_half_pu=0.03020,   flow_max_pu=1.0)                      
-        Line(id=156,   from_bus=self.buses[ 94],   to_bus=self.buses[ 95],   r_pu=0.01710,   x_pu=0.05470,   shunt_half_pu=0.00737,   flow_max_pu=1.0)                      
-        Line(id=157,   from_bus=self.buses[ 95],   to_bus=self.buses[ 96],   r_pu=0.01730,   x_pu=0.08850,   shunt_half_pu=0.01200,   flow_max_pu=1.0)                      
-        Line(id=158,   from_bus=self.buses[ 97],   to_bus=self.buses[ 99],   r_pu=0.03970,   x_pu=0.17900,   shunt_half_pu=0.02380,   flow_max_pu=1.0)                      
-        Line(id=159,   from_bus=self.buses[ 98],   to_bus=self.buses[ 99],   r_pu=0.01800,   x_pu=0.08130,   shunt_half_pu=0.01080,   flow_max_pu=1.0)                      
-        Line(id=160,   from_bus=self.buses[ 99],   to_bus=self.buses[100],   r_pu=0.02770,   x_pu=0.12620,   shunt_half_pu=0.01640,   flow_max_pu=1.0)                      
-        Line(id=161,   from_bus=self.buses[ 91],   to_bus=self.buses[101],   r_pu=0.01230,   x_pu=0.05590,   shunt_half_pu=0.00732,   flow_max_pu=1.0)                      
-        Line(id=162,   from_bus=self.buses[100],   to_bus=self.buses[101],   r_pu=0.02460,   x_pu=0.11200,   shunt_half_pu=0.01470,   flow_max_pu=1.0)                      
-        Line(id=163,   from_bus=self.buses[ 99],   to_bus=self.buses[102],   r_pu=0.01600,   x_pu=0.05250,   shunt_half_pu=0.02680,   flow_max_pu=1.0)                      
-        Line(id=164,   from_bus=self.buses[ 99],   to_bus=self.buses[103],   r_pu=0.04510,   x_pu=0.20400,   shunt_half_pu=0.02705,   flow_max_pu=1.0)                      
-        Line(id=165,   from_bus=self.buses[102],   to_bus=self.buses[103],   r_pu=0.04660,   x_pu=0.15840,   shunt_half_pu=0.02035,   flow_max_pu=1.0)                      
-        Line(id=166,   from_bus=self.buses[102],   to_bus=self.buses[104],   r_pu=0.05350,   x_pu=0.16250,   shunt_half_pu=0.02040,   flow_max_pu=1.0)                      
-        Line(id=167,   from_bus=self.buses[ 99],   to_bus=self.buses[105],   r_pu=0.06050,   x_pu=0.22900,   shunt_half_pu=0.03100,   flow_max_pu=1.0)                      
-        Line(id=168,   from_bus=self.buses[103],   to_bus=self.buses[104],   r_pu=0.00994,   x_pu=0.03780,   shunt_half_pu=0.00493,   flow_max_pu=1.0)                      
-        Line(id=169,   from_bus=self.buses[104],   to_bus=self.buses[105],   r_pu=0.01400,   x_pu=0.05470,   shunt_half_pu=0.00717,   flow_max_pu=1.0)                      
-        Line(id=170,   from_bus=self.buses[104],   to_bus=self.buses[106],   r_pu=0.05300,   x_pu=0.18300,   shunt_half_pu=0.02360,   flow_max_pu=1.0)                      
-        Line(id=171,   from_bus=self.buses[104],   to_bus=self.buses[107],   r_pu=0.02610,   x_pu=0.07030,   shunt_half_pu=0.00922,   flow_max_pu=1.0)                      
-        Line(id=172,   from_bus=self.buses[105],   to_bus=self.buses[106],   r_pu=0.05300,   x_pu=0.18300,   shunt_half_pu=0.02360,   flow_max_pu=1.0)                      
-        Line(id=173,   from_bus=self.buses[107],   to_bus=self.buses[108],   r_pu=0.01050,   x_pu=0.02880,   shunt_half_pu=0.00380,   flow_max_pu=1.0)                      
-        Line(id=174,   from_bus=self.buses[102],   to_bus=self.buses[109],   r_pu=0.03906,   x_pu=0.18130,   shunt_half_pu=0.02305,   flow_max_pu=1.0)                      
-        Line(id=175,   from_bus=self.buses[108],   to_bus=self.buses[109],   r_pu=0.02780,   x_pu=0.07620,   shunt_half_pu=0.01010,   flow_max_pu=1.0)                      
-        Line(id=176,   from_bus=self.buses[109],   to_bus=self.buses[110],   r_pu=0.02200,   x_pu=0.07550,   shunt_half_pu=0.01000,   flow_max_pu=1.0)                      
-        Line(id=177,   from_bus=self.buses[109],   to_bus=self.buses[111],   r_pu=0.02470,   x_pu=0.06400,   shunt_half_pu=0.03100,   flow_max_pu=1.0)                      
-        Line(id=178,   from_bus=self.buses[ 16],   to_bus=self.buses[112],   r_pu=0.00913,   x_pu=0.03010,   shunt_half_pu=0.00384,   flow_max_pu=1.0)                      
-        Line(id=179,   from_bus=self.buses[ 31],   to_bus=self.buses[112],   r_pu=0.06150,   x_pu=0.20300,   shunt_half_pu=0.02590,   flow_max_pu=1.0)                      
-        Line(id=180,   from_bus=self.buses[ 31],   to_bus=self.buses[113],   r_pu=0.01350,   x_pu=0.06120,   shunt_half_pu=0.00814,   flow_max_pu=1.0)                      
-        Line(id=181,   from_bus=self.buses[ 26],   to_bus=self.buses[114],   r_pu=0.01640,   x_pu=0.07410,   shunt_half_pu=0.00986,   flow_max_pu=1.0)                      
-        Line(id=182,   from_bus=self.buses[113],   to_bus=self.buses[114],   r_pu=0.00230,   x_pu=0.01040,   shunt_half_pu=0.00138,   flow_max_pu=1.0)                      
-        Line(id=183,   from_bus=self.buses[ 67],   to_bus=self.buses[115],   r_pu=0.00034,   x_pu=0.00405,   shunt_half_pu=0.04100,   flow_max_pu=1.0)                      
-        Line(id=184,   from_bus=self.buses[ 11],   to_bus=self.buses[116],   r_pu=0.03290,   x_pu=0.14000,   shunt_half_pu=0.01790,   flow_max_pu=1.0)                      
-        Line(id=185,   from_bus=self.buses[ 74],   to_bus=self.buses[117],   r_pu=0.01450,   x_pu=0.04810,   shunt_half_pu=0.00599,   flow_max_pu=1.0)                      
-        Line(id=186,   from_bus=self.buses[ 75],   to_bus=self.buses[117],   r_pu=0.01640,   x_pu=0.05440,   shunt_half_pu=0.00678,   flow_max_pu=1.0)                      
-                                                                                                                                                                                                                                                                                
-
-    def _create_generators(self):
-        """Create Generator objects (conventional and wind) from DGER/DGW.
-
-        The list contains conventional units first, followed by wind
-        generators which are appended using extend(). The numerical ids
-        follow the original mapping as closely as possible.
-        """
-
-        # Conventional Generators from DGER data
-        ThermalGenerator(id= 1,   bus=self.buses[  0], p_mw=  0.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 130.0,   q_min_mvar=  -5.0,   q_max_mvar=  15.0,   cost_b_mw=  1.0)
-        ThermalGenerator(id= 2,   bus=self.buses[  5], p_mw=  0.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 150.0,   q_min_mvar= -13.0,   q_max_mvar=  50.0,   cost_b_mw=  6.0)
-        ThermalGenerator(id= 3,   bus=self.buses[  7], p_mw=-28.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 470.0,   q_min_mvar=-300.0,   q_max_mvar= 300.0,   cost_b_mw=  8.0)
-        ThermalGenerator(id= 4,   bus=self.buses[ 14], p_mw=  0.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 450.0,   q_min_mvar= -10.0,   q_max_mvar=  30.0,   cost_b_mw= 15.0)
-        ThermalGenerator(id= 5,   bus=self.buses[ 23], p_mw=-13.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 250.0,   q_min_mvar=-300.0,   q_max_mvar= 300.0,   cost_b_mw= 24.0)
-        ThermalGenerator(id= 6,   bus=self.buses[ 41], p_mw=-59.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 140.0,   q_min_mvar=-300.0,   q_max_mvar= 300.0,   cost_b_mw= 42.0)
-        ThermalGenerator(id= 7,   bus=self.buses[ 45], p_mw= 19.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 120.0,   q_min_mvar=-100.0,   q_max_mvar= 100.0,   cost_b_mw= 46.0)
-        ThermalGenerator(id= 8,   bus=self.buses[ 48], p_mw=204.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 450.0,   q_min_mvar= -85.0,   q_max_mvar= 210.0,   cost_b_mw= 49.0)
-        ThermalGenerator(id= 9,   bus=self.buses[ 53], p_mw= 48.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 570.0,   q_min_mvar=-300.0,   q_max_mvar= 300.0,   cost_b_mw= 54.0)
-        ThermalGenerator(id=10,   bus=self.buses[ 68], p_mw=516.4,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw=1000.0,   q_min_mvar=-300.0,   q_max_mvar= 300.0,   cost_b_mw= 69.0)
-        ThermalGenerator(id=11,   bus=self.buses[ 79], p_mw=477.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw=1000.0,   q_min_mvar=-165.0,   q_max_mvar= 280.0,   cost_b_mw= 80.0)
-        ThermalGenerator(id=12,   bus=self.buses[ 84], p_mw=  0.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 300.0,   q_min_mvar=  -8.0,   q_max_mvar=  23.0,   cost_b_mw= 85.0)
-        ThermalGenerator(id=13,   bus=self.buses[ 89], p_mw=-85.0,   q_mvar=0.0,   p_min_mw=0.0,   p_max_mw= 250.0,   q_min_mvar=-300.0,   q_max_mvar= 300.0,   cost_b_mw= 90.0)
-
-        # Wind Generators from DGW data
-        WindGenerator(id=14, bus=self.buses[  0], p_min_mw=0.0, p_max_mw=10.0)
-        WindGenerator(id=15, bus=self.buses[  7], p_min_mw=0.0, p_max_mw=10.0)
-        WindGenerator(id=16, bus=self.buses[ 14], p_min_mw=0.0, p_max_mw=15.0)
-        WindGenerator(id=17, bus=self.buses[ 23], p_min_mw=0.0, p_max_mw=15.0)
-        WindGenerator(id=18, bus=self.buses[ 53], p_min_mw=0.0, p_max_mw=30.0)
-        WindGenerator(id=19, bus=self.buses[ 58], p_min_mw=0.0, p_max_mw=20.0)
-        WindGenerator(id=20, bus=self.buses[ 68], p_min_mw=0.0, p_max_mw=20.0)
-        WindGenerator(id=21, bus=self.buses[ 73], p_min_mw=0.0, p_max_mw=10.0)
-        WindGenerator(id=22, bus=self.buses[ 79], p_min_mw=0.0, p_max_mw=15.0)
-        WindGenerator(id=23, bus=self.buses[ 84], p_min_mw=0.0, p_max_mw=10.0)
-        WindGenerator(id=24, bus=self.buses[109], p_min_mw=0.0, p_max_mw=20.0)
-
-    def _create_loads(self):
-        """Create Load objects using the PLOAD/QLOAD columns from DBAR.
-
-        Loads are created only where the DBAR P/Q entries are non-zero
-        in the source dataset. The `pb` argument is set to the system
-        base `self.sb` so that per-unit properties are consistent.
-        """
-
-        Load(id=  1, bus=self.buses[  0], p_mw= 51.0, q_mvar=27.0, cost_shed_mw=400)
-        Load(id=  2, bus=self.buses[  1], p_mw= 20.0, q_mvar= 9.0, cost_shed_mw=400)
-        Load(id=  3, bus=self.buses[  2], p_mw= 39.0, q_mvar=10.0, cost_shed_mw=400)
-        Load(id=  4, bus=self.buses[  3], p_mw= 30.0, q_mvar=12.0, cost_shed_mw=400)
-        Load(id=  5, bus=self.buses[  5], p_mw= 52.0, q_mvar=22.0, cost_shed_mw=400)
-        Load(id=  6, bus=self.buses[  6], p_mw= 19.0, q_mvar= 2.0, cost_shed_mw=400)
-        Load(id=  7, bus=self.buses[ 10], p_mw= 70.0, q_mvar=23.0, cost_shed_mw=400)
-        Load(id=  8, bus=self.buses[ 11], p_mw= 47.0, q_mvar=10.0, cost_shed_mw=400)
-        Load(id=  9, bus=self.buses[ 12], p_mw= 34.0, q_mvar=16.0, cost_shed_mw=400)
-        Load(id= 10, bus=self.buses[ 13], p_mw= 14.0, q_mvar= 1.0, cost_shed_mw=400)
-        Load(id= 11, bus=self.buses[ 14], p_mw= 90.0, q_mvar=30.0, cost_shed_mw=400)
-        Load(id= 12, bus=self.buses[ 15], p_mw= 25.0, q_mvar=10.0, cost_shed_mw=400)
-        Load(id= 13, bus=self.buses[ 16], p_mw= 11.0, q_mvar= 3.0, cost_shed_mw=400)
-        Load(id= 14, bus=self.buses[ 17], p_mw= 60.0, q_mvar=34.0, cost_shed_mw=400)
-        Load(id= 15, bus=self.buses[ 18], p_mw= 45.0, q_mvar=25.0, cost_shed_mw=400)
-        Load(id= 16, bus=self.buses[ 19], p_mw= 18.0, q_mvar= 3.0, cost_shed_mw=400)
-        Load(id= 17, bus=self.buses[ 20], p_mw= 14.0, q_mvar= 8.0, cost_shed_mw=400)
-        Load(id= 18, bus=self.buses[ 21], p_mw= 10.0, q_mvar= 5.0, cost_shed_mw=400)
-        Load(id= 19, bus=self.buses[ 22], p_mw=  7.0, q_mvar= 3.0, cost_shed_mw=400)
-        Load(id= 20, bus=self.buses[ 26], p_mw= 62.0, q_mvar=13.0, cost_shed_mw=400)
-        Load(id= 21, bus=self.buses[ 27], p_mw= 17.0, q_mvar= 7.0, cost_shed_mw=400)
-        Load(id= 22, bus=self.buses[ 28], p_mw= 24.0, q_mvar= 4.0, cost_shed_mw=400)
-        Load(id= 23, bus=self.buses[ 30], p_mw= 43.0, q_mvar=27.0, cost_shed_mw=400)
-        Load(id= 24, bus=self.buses[ 31], p_mw= 59.0, q_mvar=23.0, cost_shed_mw=400)
-        Load(id= 25, bus=self.buses[ 32], p_mw= 23.0, q_mvar= 9.0, cost_shed_mw=400)
-        Load(id= 26, bus=self.buses[ 33], p_mw= 59.0, q_mvar=26.0, cost_shed_mw=400)
-        Load(id= 27, bus=self.buses[ 34], p_mw= 33.0, q_mvar= 9.0, cost_shed_mw=400)
-        Load(id= 28, bus=self.buses[ 35], p_mw= 31.0, q_mvar=17.0, cost_shed_mw=400)
-        Load(id= 29, bus=self.buses[ 38], p_mw= 27.0, q_mvar=11.0, cost_shed_mw=400)
-        Load(id= 30, bus=self.buses[ 39], p_mw= 20.0, q_mvar=23.0, cost_shed_mw=400)
-        Load(id= 31, bus=self.buses[ 40], p_mw= 37.0, q_mvar=10.0, cost_shed_mw=400)
-        Load(id= 32, bus=self.buses[ 41], p_mw= 37.0, q_mvar=23.0, cost_shed_mw=400)
-        Load(id= 33, bus=self.buses[ 42], p_mw= 18.0, q_mvar= 7.0, cost_shed_mw=400)
-        Load(id= 34, bus=self.buses[ 43], p_mw= 16.0, q_mvar= 8.0, cost_shed_mw=400)
-        Load(id= 35, bus=self.buses[ 44], p_mw= 53.0, q_mvar=22.0, cost_shed_mw=400)
-        Load(id= 36, bus=self.buses[ 45], p_mw= 28.0, q_mvar=10.0, cost_shed_mw=400)
-        Load(id= 37, bus=self.buses[ 46], p_mw= 34.0, q_mvar= 0.0, cost_shed_mw=400)
-        Load(id= 38, bus=self.buses[ 47], p_mw= 20.0, q_mvar=11.0, cost_shed_mw=400)
-        Load(id= 39, bus=self.buses[ 48], p_mw= 87.0, q_mvar=30.0, cost_shed_mw=400)
-        Load(id= 40, bus=self.buses[ 49], p_mw= 17.0, q_mvar= 4.0, cost_shed_mw=400)
-        Load(id= 41, bus=self.buses[ 50], p_mw= 17.0, q_mvar= 8.0, cost_shed_mw=400)
-        Load(id= 42, bus=self.buses[ 51], p_mw= 18.0, q_mvar= 5.0, cost_shed_mw=400)
-        Load(id= 43, bus=self.buses[ 52], p_mw= 23.0, q_mvar=11.0, cost_shed_mw=400)
-        Load(id= 44, bus=self.buses[ 53], p_mw=113.0, q_mvar=32.0, cost_shed_mw=400)
-        Load(id= 45, bus=self.buses[ 54], p_mw= 63.0, q_mvar=22.0, cost_shed_mw=400)
-        Load(id= 46, bus=self.buses[ 55], p_mw= 84.0, q_mvar=18.0, cost_shed_mw=400)
-        Load(id= 47, bus=self.buses[ 56], p_mw= 12.0, q_mvar= 3.0, cost_shed_mw=400)
-        Load(id= 48, bus=self.buses[ 57], p_mw= 12.0, q_mvar= 3.0, cost_shed_mw=400)
-        Load(id= 49, bus=self.buses[ 58], p_mw=277.0, q_mvar=113.0, cost_shed_mw=400)
-        Load(id= 50, bus=self.buses[ 59], p_mw= 78.0, q_mvar= 3.0, cost_shed_mw=400)
-        Load(id= 51, bus=self.buses[ 61], p_mw= 77.0, q_mvar=14.0, cost_shed_mw=400)
-        Load(id= 52, bus=self.buses[ 65], p_mw= 39.0, q_mvar=18.0, cost_shed_mw=400)
-        Load(id= 53, bus=self.buses[ 66], p_mw= 28.0, q_mvar= 7.0, cost_shed_mw=400)
-        Load(id= 54, bus=self.buses[ 69], p_mw= 66.0, q_mvar=20.0, cost_shed_mw=400)
-        Load(id= 55, bus=self.buses[ 73], p_mw= 68.0, q_mvar=27.0, cost_shed_mw=400)
-        Load(id= 56, bus=self.buses[ 74], p_mw= 47.0, q_mvar=11.0, cost_shed_mw=400)
-        Load(id= 57, bus=self.buses[ 75], p_mw= 68.0, q_mvar=36.0, cost_shed_mw=400)
-        Load(id= 58, bus=self.buses[ 76], p_mw= 61.0, q_mvar=28.0, cost_shed_mw=400)
-        Load(id= 59, bus=self.buses[ 77], p_mw= 71.0, q_mvar=26.0, cost_shed_mw=400)
-        Load(id= 60, bus=self.buses[ 78], p_mw= 39.0, q_mvar=32.0, cost_shed_mw=400)
-        Load(id= 61, bus=self.buses[ 79], p_mw=130.0, q_mvar=26.0, cost_shed_mw=400)
-        Load(id= 62, bus=self.buses[ 81], p_mw= 54.0, q_mvar=27.0, cost_shed_mw=400)
-        Load(id= 63, bus=self.buses[ 82], p_mw= 20.0, q_mvar=10.0, cost_shed_mw=400)
-        Load(id= 64, bus=self.buses[ 83], p_mw= 11.0, q_mvar= 7.0, cost_shed_mw=400)
-        Load(id= 65, bus=self.buses[ 84], p_mw= 24.0, q_mvar=15.0, cost_shed_mw=400)
-        Load(id= 66, bus=self.buses[ 85], p_mw= 21.0, q_mvar=10.0, cost_shed_mw=400)
-        Load(id= 67, bus=self.buses[ 87], p_mw= 48.0, q_mvar=10.0, cost_shed_mw=400)
-        Load(id= 68, bus=self.buses[ 89], p_mw= 78.0, q_mvar=42.0, cost_shed_mw=400)
-        Load(id= 69, bus=self.buses[ 91], p_mw= 65.0, q_mvar=10.0, cost_shed_mw=400)
-        Load(id= 70, bus=self.buses[ 92], p_mw= 12.0, q_mvar= 7.0, cost_shed_mw=400)
-        Load(id= 71, bus=self.buses[ 93], p_mw= 30.0, q_mvar=16.0, cost_shed_mw=400)
-        Load(id= 72, bus=self.buses[ 94], p_mw= 42.0, q_mvar=31.0, cost_shed_mw=400)
-        Load(id= 73, bus=self.buses[ 95], p_mw= 38.0, q_mvar=15.0, cost_shed_mw=400)
-        Load(id= 74, bus=self.buses[ 96], p_mw= 15.0, q_mvar= 9.0, cost_shed_mw=400)
-        Load(id= 75, bus=self.buses[ 97], p_mw= 34.0, q_mvar= 8.0, cost_shed_mw=400)
-        Load(id= 76, bus=self.buses[ 99], p_mw= 37.0, q_mvar=18.0, cost_shed_mw=400)
-        Load(id= 77, bus=self.buses[100], p_mw= 22.0, q_mvar=15.0, cost_shed_mw=400)
-        Load(id= 78, bus=self.buses[101], p_mw=  5.0, q_mvar= 3.0, cost_shed_mw=400)
-        Load(id= 79, bus=self.buses[102], p_mw= 23.0, q_mvar=16.0, cost_shed_mw=400)
-        Load(id= 80, bus=self.buses[103], p_mw= 38.0, q_mvar=25.0, cost_shed_mw=400)
-        Load(id= 81, bus=self.buses[104], p_mw= 31.0, q_mvar=26.0, cost_shed_mw=400)
-        Load(id= 82, bus=self.buses[105], p_mw= 43.0, q_mvar=16.0, cost_shed_mw=400)
-        Load(id= 83, bus=self.buses[106], p_mw= 28.0, q_mvar=12.0, cost_shed_mw=400)
-        Load(id= 84, bus=self.buses[107], p_mw=  2.0, q_mvar= 1.0, cost_shed_mw=400)
-        Load(id= 85, bus=self.buses[108], p_mw=  8.0, q_mvar= 3.0, cost_shed_mw=400)
-        Load(id= 86, bus=self.buses[109], p_mw= 39.0, q_mvar=30.0, cost_shed_mw=400)
-        Load(id= 87, bus=self.buses[111], p_mw= 25.0, q_mvar=13.0, cost_shed_mw=400)
-        Load(id= 88, bus=self.buses[113], p_mw=  8.0, q_mvar= 3.0, cost_shed_mw=400)
-        Load(id= 89, bus=self.buses[114], p_mw= 22.0, q_mvar= 7.0, cost_shed_mw=400)
-        Load(id= 90, bus=self.buses[116], p_mw= 20.0, q_mvar= 8.0, cost_shed_mw=400)
-        Load(id= 91, bus=self.buses[117], p_mw= 33.0, q_mvar=15.0, cost_shed_mw=400)
-
-
 if __name__ == "__main__":
     # Simple smoke test when running as a module
-    # Run from the repository root with: python -m power.systems.ieee118
+    # Run from the repository root with: python -m power.systems.ieee118_eolic
     net = IEEE118EOL()
     print(f"IEEE118 instantiated: buses={len(net.buses)}, lines={len(net.lines)}, generators={len(net.generators)}, loads={len(net.loads)}")
     # Print a couple of sample objects to sanity-check references
@@ -482,4 +31,4 @@ if __name__ == "__main__":
         print(f"First bus: id={b.id}, v_pu={b.v_pu}, theta_deg={b.theta_deg}")
     if net.lines:
         L = net.lines[0]
-        print(f"First line: id={L.id}, from={L.from_bus.id}, to={L.to_bus.id}, r_pu={L.r_pu}, x_pu={L.x_pu}")
\ No newline at end of file
+        print(f"First line: id={L.id}, from={L.from_bus.id}, to={L.to_bus.id}, r_pu={L.r_pu}, x_pu={L.x_pu}")
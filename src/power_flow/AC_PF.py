@@ -22,7 +22,7 @@ class AC_PF:
         self.slack_bus = [bus for bus in self.network.buses if bus.btype == BusType.SLACK] # Slack bus
 
         # Bus Maps:
-        self.bus_idx = {bus.id: i for i, bus in enumerate(self.network.buses)} # Bus Map, key: bus id, value: bus index
+        self.bus_idx = self.network.bus_idx # Bus Map, key: bus id, value: bus index
         self.pq_idx = [self.bus_idx[bus.id] for bus in self.pq_buses] # PQ buses
         self.pv_idx = [self.bus_idx[bus.id] for bus in self.pv_buses] # PV buses
         self.slack_idx = [self.bus_idx[bus.id] for bus in self.slack_bus] # Slack bus
@@ -35,8 +35,8 @@ class AC_PF:
         self.X_0 = np.concatenate((self.theta_0, self.V_0)) # State vector
 
         # Initialize P and Q
-        self.P_esp = np.array([bus.p_pu for bus in self.network.buses]) # Active power
-        self.Q_esp = np.array([bus.q_pu for bus in self.network.buses]) # Reactive power
+        self.P_esp = np.array(self.network.p_injection_pu) # Active power
+        self.Q_esp = np.array(self.network.q_injection_pu) # Reactive power
         self.PQ_esp = np.concatenate((self.P_esp, self.Q_esp)) # Power vector
 
         # Initialize the final calculated vectors
@@ -9,13 +9,13 @@ class DC_PF:
         self.network = network
 
         # Identify buses by index
-        self.bus_idx = {bus.id: i for i, bus in enumerate(network.buses)}
+        self.bus_idx = network.bus_idx
 
         # Identify bus types by index
         self.slack_idx = next(i for i, bus in enumerate(network.buses) if bus.btype == BusType.SLACK)
 
         # Active power vector
-        self.P = np.array([bus.p_pu for bus in network.buses])
+        self.P = np.array(network.p_injection_pu)
 
         # Reduced admittance matrix and power vector
         B = network.b_bus
@@ -42,10 +42,11 @@ class DC_PF:
             theta_i = self.theta_rad[i]
             theta_j = self.theta_rad[j]
 
-            if line.x_pu == 0:
+            x_pu = self.network.line_x_pu(line)
+            if x_pu == 0:
                 raise ValueError(f"Line {line.id} has zero x_pu, cannot calculate flow.")
             
-            flow = (theta_i - theta_j) / line.x_pu
+            flow = (theta_i - theta_j) / x_pu
             flows.append(flow)
         self.flows = np.array(flows)
         
@@ -0,0 +1,35 @@
+"""As formulações do LinearDispatch (angle, ptdf, lazy_limits) chegam ao mesmo ótimo."""
+import numpy as np
+import pytest
+from power.systems import IEEE118Charged, IEEE118EOL
+from optimal_power_flow.linear_opf.opf_loss import LinearDispatch
+
+FORMULATIONS = [{}, {"formulation": "ptdf"}, {"lazy_limits": True}]
+
+
+@pytest.mark.parametrize("backend", ["cbc", "highs"])
+@pytest.mark.parametrize("system", [IEEE118Charged, IEEE118EOL])
+def test_same_optimum(system, backend):
+    net = system()
+    objectives, limits = [], []
+    for options in FORMULATIONS:
+        ld = LinearDispatch(net, backend=backend)
+        objectives.append(ld.solve_econ_dispatch(frames=False, **options).objective)
+        limits.append(ld.activated_limits)
+    assert objectives[1] == pytest.approx(objectives[0], rel=1e-8)
+    assert objectives[2] == pytest.approx(objectives[0], rel=1e-8)
+    # Os modos sob demanda só impõem parte dos limites
+    assert limits[0] == len(net.lines) and max(limits[1:]) < limits[0]
+
+
+@pytest.mark.parametrize("system", [IEEE118Charged, IEEE118EOL])
+def test_flow_limits_are_binding(system):
+    """Sem os limites de fluxo o custo cai: a comparação acima envolve linhas no limite."""
+    net = system()
+    solution = LinearDispatch(net).solve_econ_dispatch(frames=False)
+    flow_max = net.compile().line_flow_max_pu
+    assert np.any(np.abs(solution.flow_pu) >= flow_max - 1e-7)
+    relaxed = net.scenario()
+    for line in net.lines:
+        relaxed.line_flow_max[line.id] = 1e6
+    assert LinearDispatch(relaxed).solve_econ_dispatch(frames=False).objective < solution.objective - 1.0
@@ -0,0 +1,63 @@
+"""Despacho multiperíodo e horizonte rolante."""
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from power.systems import B6L8, IEEE118
+from power.electricity_models.generator_models import Battery
+from data_models.temporal_structure import TemporalStructure, Discretization
+from data_models.time_series import TimeSeries
+from optimal_power_flow.linear_opf.multi_period import MultiPeriodDispatch, RollingHorizonDispatch
+
+HOURS = 24
+
+
+def _horizon():
+    return TemporalStructure(datetime(2025, 1, 1), datetime(2025, 1, 1) + timedelta(hours=HOURS), Discretization.HOUR)
+
+
+def _load_profile(net):
+    arrays = net.compile()
+    profile = 0.75 + 0.25 * np.sin(np.linspace(0, 2 * np.pi, HOURS))
+    return {int(i): TimeSeries(arrays.load_p_pu[k] * arrays.sb_mva * profile, unit="MW")
+            for k, i in enumerate(arrays.load_id)}
+
+
+@pytest.fixture(scope="module")
+def coupled_net():
+    """IEEE 118 com bateria e rampas: os períodos são acoplados."""
+    net = IEEE118()
+    Battery(id=9999, bus=net.buses[5], capacity_mwh=400, soc_mwh=200, p_max_mw=100, p_min_mw=-100,
+            cost_charge_mw=0, cost_discharge_mw=0)
+    for g in net.thermal_generators:
+        g.max_ramp_up_mw, g.max_ramp_down_mw = 0.15 * g.p_max_mw, -0.15 * g.p_max_mw
+    return net
+
+
+@pytest.mark.parametrize("backend", ["cbc", "highs"])
+def test_single_window_equals_multi_period(coupled_net, backend):
+    loads = _load_profile(coupled_net)
+    full = MultiPeriodDispatch(coupled_net, _horizon(), loads=loads, backend=backend).solve()
+    rolling = RollingHorizonDispatch(coupled_net, _horizon(), window=HOURS, commit=HOURS, loads=loads,
+                                     backend=backend).solve()
+    assert rolling["FOB_Value"] == pytest.approx(full["FOB_Value"], rel=1e-8)
+
+
+@pytest.mark.parametrize("window, commit", [(1, 1), (6, 6), (6, 2)])
+def test_uncoupled_periods_any_window(window, commit):
+    """Sem baterias nem rampas os períodos são independentes: qualquer janela dá o ótimo do horizonte todo."""
+    net = B6L8()
+    assert not net.batteries
+    loads = _load_profile(net)
+    full = MultiPeriodDispatch(net, _horizon(), loads=loads).solve()
+    rolling = RollingHorizonDispatch(net, _horizon(), window=window, commit=commit, loads=loads)
+    result = rolling.solve()
+    assert result["FOB_Value"] == pytest.approx(full["FOB_Value"], rel=1e-8)
+    assert rolling.model_builds == 1
+
+
+def test_rolling_horizon_respects_ramps(coupled_net):
+    loads = _load_profile(coupled_net)
+    result = RollingHorizonDispatch(coupled_net, _horizon(), window=6, commit=2, loads=loads, backend="highs").solve()
+    generation = result["Thermal_Generation"].to_numpy()
+    ramp = np.array([g.max_ramp_up_mw for g in coupled_net.thermal_generators])
+    assert np.all(np.abs(np.diff(generation, axis=0)) <= ramp + 1e-6)
@@ -0,0 +1,59 @@
+"""Scenario: sobreposição copy-on-write sobre uma Network."""
+import pytest
+from power.systems import IEEE118, IEEE118EOL
+from optimal_power_flow.linear_opf.opf_loss import LinearDispatch
+
+
+@pytest.fixture(scope="module")
+def net():
+    return IEEE118()
+
+
+def test_remove_line_keeps_indices_consistent(net):
+    scenario = net.scenario()
+    removed = net.lines[5]
+    scenario.remove_line(removed.id)
+
+    assert len(scenario.lines) == len(net.lines) - 1
+    assert removed not in scenario.lines
+    for line in net.lines:
+        if line is removed:
+            continue
+        assert scenario.lines[scenario.line_idx[line.id]] is line
+        assert scenario.get_line(line.id) is line
+    assert removed.id not in scenario.line_idx
+    with pytest.raises(ValueError):
+        scenario.get_line(removed.id)
+    # A rede base não muda
+    assert net.get_line(removed.id) is removed and len(net.lines) == len(net.compile().line_id)
+
+
+def test_remove_line_compile_and_solve(net):
+    scenario = net.scenario().remove_line(net.lines[5].id)
+    arrays = scenario.compile()
+    assert arrays.line_id.tolist() == [l.id for l in scenario.lines]
+    assert arrays is scenario.compile()
+    solution = LinearDispatch(scenario).solve_loss(frames=False)
+    assert len(solution.flow_pu) == len(scenario.lines)
+
+
+def test_compile_follows_overrides(net):
+    load = net.loads[0]
+    scenario = net.scenario().scale_load(load.id, 1.5)
+    first = scenario.compile()
+    assert first.load_p_pu[0] == pytest.approx(1.5 * load.p_pu)
+    assert not first.load_p_pu.flags.writeable
+    scenario.scale_load(load.id, 2.0)
+    assert scenario.compile().load_p_pu[0] == pytest.approx(3.0 * load.p_pu)
+    # Sem alterações, os arrays da base
+    assert net.scenario().compile() is net.compile()
+
+
+def test_set_wind_available_requires_wind_generator():
+    net = IEEE118EOL()
+    scenario = net.scenario()
+    with pytest.raises(ValueError):
+        scenario.set_wind_available(net.thermal_generators[0].id, 10.0)
+    wind = net.wind_generators[0]
+    scenario.set_wind_available(wind.id, 5.0)
+    assert scenario.compile().gen_p_max_pu[net.gen_idx[wind.id]] == pytest.approx(5.0 / net.sb_mva)
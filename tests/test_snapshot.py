@@ -0,0 +1,55 @@
+"""Snapshots binários da rede (Network.save / Network.load / NetworkArrays.load)."""
+from dataclasses import fields
+import numpy as np
+import pytest
+from power import Network
+from power.systems import IEEE118EOL, B6L8EOL
+from power.electricity_models.network_models.network_arrays import NetworkArrays
+from optimal_power_flow.linear_opf.opf_loss import LinearDispatch
+
+
+def _assert_same_arrays(a: NetworkArrays, b: NetworkArrays):
+    assert a.sb_mva == b.sb_mva
+    for f in fields(NetworkArrays):
+        x, y = getattr(a, f.name), getattr(b, f.name)
+        if isinstance(x, np.ndarray):
+            assert x.dtype == y.dtype and np.array_equal(x, y, equal_nan=x.dtype.kind == "f"), f.name
+
+
+@pytest.mark.parametrize("system", [B6L8EOL, IEEE118EOL])
+def test_round_trip(system, tmp_path):
+    net = system()
+    path = tmp_path / "net.npz"
+    net.save(path)
+    loaded = Network.load(path)
+
+    assert loaded.name == net.name
+    _assert_same_arrays(net.compile(), loaded.compile())
+    _assert_same_arrays(net.compile(), NetworkArrays.load(path))
+    for attr in ("buses", "lines", "generators", "loads"):
+        assert [(type(e), e.id, e.name) for e in getattr(net, attr)] == \
+               [(type(e), e.id, e.name) for e in getattr(loaded, attr)]
+    assert [g.id for g in loaded.wind_generators] == [g.id for g in net.wind_generators]
+    assert [[g.id for g in b.generators] for b in loaded.buses] == [[g.id for g in b.generators] for b in net.buses]
+    assert [[l.id for l in b.loads] for b in loaded.buses] == [[l.id for l in b.loads] for b in net.buses]
+
+    expected = LinearDispatch(net).solve_loss(frames=False).objective
+    assert LinearDispatch(loaded).solve_loss(frames=False).objective == pytest.approx(expected, rel=1e-9)
+
+
+def test_loaded_network_is_editable(tmp_path):
+    net = B6L8EOL()
+    net.save(tmp_path / "net.npz")
+    loaded = Network.load(tmp_path / "net.npz")
+    before = loaded.compile()
+    loaded.loads[0].p_mw *= 2
+    assert loaded.compile().load_p_pu[0] == pytest.approx(2 * before.load_p_pu[0])
+    # Os arrays já compilados e a rede original não mudam
+    assert before.load_p_pu[0] == pytest.approx(net.compile().load_p_pu[0])
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / "other.npz"
+    np.savez(path, x=np.zeros(3))
+    with pytest.raises(ValueError):
+        Network.load(path)
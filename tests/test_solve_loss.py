@@ -0,0 +1,16 @@
+"""Valores de referência do solve_loss (backend padrão, CBC)."""
+import pytest
+from power.systems import B3, IEEE14, IEEE118
+from optimal_power_flow.linear_opf.opf_loss import LinearDispatch
+
+
+@pytest.mark.parametrize("system, cost, losses_mw", [
+    (B3, 134.079759, 0.0501767),
+    (IEEE14, 0.0, 15.3268875),
+    (IEEE118, 320696.46526, 69.7712911),
+])
+def test_solve_loss_reference(system, cost, losses_mw):
+    summary = LinearDispatch(system()).solve_loss(frames=False).summary()
+    assert summary["Total_Cost_System"] == pytest.approx(cost, rel=1e-7, abs=1e-6)
+    assert summary["Total_Losses_MW"] == pytest.approx(losses_mw, rel=1e-6)
+
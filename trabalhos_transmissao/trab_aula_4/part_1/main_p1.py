@@ -1,5 +1,4 @@
 # --- Bibliotecas Padrão do Python ---
-import copy
 from datetime import datetime
 from pathlib import Path
 
@@ -53,7 +52,7 @@ for net in nets:
     print(f"\n{'='*20} INICIANDO SIMULAÇÃO PARA O SISTEMA: {net.name} {'='*20}")
     for scen in range(nscen):
         print(f"\n--- Processando Cenário {scen} ---")
-        net_scen = copy.deepcopy(net)
+        net_scen = net.scenario(name=f"{net.name}_Cenario_{scen}")
         apply_wnd_scen(net=net_scen, rng=rng)
         apply_load_scen(net=net_scen, rng=rng)
 
@@ -63,7 +62,7 @@ for net in nets:
         status_base, _, _ = solver_base.solve_loss()
 
         if status_base == 'Optimal':
-            results = extract_all(solver_base.problem, solver_base.net)
+            results = extract_all(solver_base)
             run_keys = {'sistema': net.name, 'cenario': scen, 'contingencia': 'BASE_CASE'}
             # UMA ÚNICA CHAMADA PARA COLETAR TODOS OS DADOS
             collect_ctg_results(results, run_keys, data_lists)
@@ -74,15 +73,13 @@ for net in nets:
         # --- b) Contingências (N-1) ---
         for line in net.lines: 
             print(f"    - Simulando contingência da linha: {line.id}")
-            ctg_net = copy.deepcopy(net_scen)
-            line_to_remove = next((l for l in ctg_net.lines if l.id == line.id), None)
-            if line_to_remove: ctg_net.lines.remove(line_to_remove)
+            ctg_net = net_scen.derive(name=f"{net.name}_Cenario_{scen}_CTG_{line.id}").remove_line(line.id)
             
             solver_ctg = LinearDispatch(ctg_net)
             status_ctg, _, _ = solver_ctg.solve_loss()
 
             if status_ctg == 'Optimal':
-                results_ctg = extract_all(solver_ctg.problem, ctg_net)
+                results_ctg = extract_all(solver_ctg)
                 run_keys_ctg = {'sistema': net.name, 'cenario': scen, 'contingencia': line.id}
                 # UMA ÚNICA CHAMADA PARA COLETAR TODOS OS DADOS
                 collect_ctg_results(results_ctg, run_keys_ctg, data_lists)
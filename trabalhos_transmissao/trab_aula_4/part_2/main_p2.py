@@ -1,5 +1,4 @@
 # --- Imports necessários (mantidos como absolutos, para robustez) ---
-import copy
 from datetime import datetime
 from pathlib import Path
 import numpy as np
@@ -42,7 +41,7 @@ for net in nets:
         print(f"\n--- Processando Cenário {scen} ---")
         
         # 1. PREPARAÇÃO DA REDE
-        net_scen = copy.deepcopy(net)
+        net_scen = net.scenario(name=f"{net.name}_Cenario_{scen}")
         apply_wnd_scen(net=net_scen, rng=rng)
         apply_load_scen(net=net_scen, rng=rng)
 
@@ -63,8 +62,8 @@ for net in nets:
                     novo_p_max = min(p_max_fisico, p_anterior + g.mvu)
                     novo_p_min = max(p_min_fisico, p_anterior - g.mvd)
                     
-                    g.p_max_pu = novo_p_max
-                    g.p_min_pu = novo_p_min
+                    # Limites registrados só no cenário (a rede base não é alterada)
+                    net_scen.set_gen_limits(g.id, p_min_mw=novo_p_min * net.sb_mva, p_max_mw=novo_p_max * net.sb_mva)
 
         # 3. RESOLUÇÃO
         solver = LinearDispatch(net_scen)
@@ -72,14 +71,14 @@ for net in nets:
 
         # 4. COLETA DE DADOS
         if status == 'Optimal':
-            results = extract_all(solver.problem, solver.net)
+            results = extract_all(solver)
             
             # Aqui, a contingência é sempre o ID do cenário (para fins de ordenação)
             run_keys = {'sistema': net.name, 'cenario': scen, 'contingencia': scen} 
             collect_ctg_results(results, run_keys, data_lists)
             
             # CRUCIAL: Atualiza a memória para o PRÓXIMO cenário (i+1)
-            prev_dispatch = {g.id: g.p_var.value() for g in net_scen.generators}
+            prev_dispatch = {g_id: p_var.value() for g_id, p_var in solver.p_var.items()}
         else:
             print(f"  ERROR: NO OPTIMAL SOLUTION FOR SCENARIO {scen}. Quebrando a cadeia cronológica.")
             prev_dispatch = None # Quebra a cadeia para o próximo cenário
@@ -1,9 +1,8 @@
 import numpy as np
-import copy
 import pulp as pl
 from power import Network, Line
 from power.systems import *
-from optimal_power_flow.linear_opf.opf_loss import LinearDispatch
+from optimal_power_flow.linear_opf.opf_loss import LinearDispatch, OptimizationError, ConvergenceError
 from metaheuristic.aoa_metaheuristic.optimizer import AOA
 from trabalhos_transmissao.utils.wnd_scen import apply_wnd_scen
 from trabalhos_transmissao.utils.load_scen import apply_load_scen
@@ -12,7 +11,7 @@ from trabalhos_transmissao.utils.load_scen import apply_load_scen
 def extract_line_duals(solver, net: Network):
     """Extrai os multiplicadores de Lagrange (duais) dos limites de fluxo das linhas."""
     
-    power_base = net.sb
+    power_base = net.sb_mva
     limites_fluxo_duais = {}
     
     # Nota: Devemos iterar sobre as linhas da rede que está sendo resolvida (net)
@@ -60,7 +59,7 @@ def main():
     # Itera sobre os cenários
     for scen in range(nscen):
         print(f"\n--- Processando Cenário {scen} ---")
-        net_scen = copy.deepcopy(BASE_NET)
+        net_scen = BASE_NET.scenario(name=f"Cenario_{scen}")
         
         apply_wnd_scen(net=net_scen, rng=rng)
         apply_load_scen(net=net_scen, rng=rng)
@@ -68,10 +67,14 @@ def main():
         # --- CASO BASE (N) ---
         print("    - Caso base sendo resolvido")
         solve_base = LinearDispatch(net_scen)
-        status_base, final_cost, _ = solve_base.solve_loss()
+        try:
+            results_base = solve_base.solve_loss()
+            status_base = 'Optimal'
+        except (OptimizationError, ConvergenceError):
+            status_base = 'Not Solved'
 
         if status_base == 'Optimal':
-            all_costs.append(final_cost)
+            all_costs.append(results_base["FOB_Value"])
             
             # 💡 ACUMULANDO DUAIS DO CASO BASE 💡
             duais_base = extract_line_duals(solve_base, net_scen)
@@ -81,15 +84,8 @@ def main():
                 count_line_duals[line_id] += 1
             
             # Cálculo Caso Base (curtailment e deficit)
-            defict_scen = 0
-            for load in net_scen.loads:
-                defict_scen += load.p_shed_var.value()
-            all_deficits.append(defict_scen)
-
-            curtailment_scen = 0
-            for wnd_gen in net_scen.wind_generators:
-                curtailment_scen += wnd_gen.p_max_pu - wnd_gen.p_var.value()
-            all_curtailment.append(curtailment_scen)
+            all_deficits.append(results_base["Resumo"]["Total_Shed_MW"].iloc[0] / net_scen.sb_mva)
+            all_curtailment.append(results_base["Resumo"]["Total_Curtailment_MW"].iloc[0] / net_scen.sb_mva)
 
             # --- CONTINGÊNCIAS (N-1) ---
             # Iteramos sobre a rede ORIGINAL (BASE_NET) para saber qual LT será contingenciada.
@@ -98,16 +94,18 @@ def main():
                 
                 print(f"    - Simulando contingência da linha: {line_id_ctg}")
                 
-                # A rede de contingência ctg_net é uma cópia da net_scen
-                ctg_net = copy.deepcopy(net_scen)
-                line_to_remove = next((l for l in ctg_net.lines if l.id == line_id_ctg), None)
-                if line_to_remove: ctg_net.lines.remove(line_to_remove)
+                # A rede de contingência ctg_net deriva da net_scen (apenas a LT é retirada)
+                ctg_net = net_scen.derive(name=f"Cenario_{scen}_CTG_{line_id_ctg}").remove_line(line_id_ctg)
                 
                 solver_ctg = LinearDispatch(ctg_net)
-                status_ctg, final_cost, _ = solver_ctg.solve_loss()
+                try:
+                    results_ctg = solver_ctg.solve_loss()
+                    status_ctg = 'Optimal'
+                except (OptimizationError, ConvergenceError):
+                    status_ctg = 'Not Solved'
                 
                 if status_ctg == 'Optimal':
-                    all_costs.append(final_cost)
+                    all_costs.append(results_ctg["FOB_Value"])
                     
                     # CÁLCULO E ACUMULAÇÃO DE DUAIS DE FLUXO PARA AS LTs REMANESCENTES
                     duais = extract_line_duals(solver_ctg, ctg_net)
@@ -121,15 +119,8 @@ def main():
                         count_line_duals[rem_line_id] += 1
                         
                     # Outros cálculos
-                    deficit_ctg = 0
-                    for load in ctg_net.loads:
-                        deficit_ctg += load.p_shed_var.value()
-                    all_deficits.append(deficit_ctg)
-
-                    curtailment_ctg = 0
-                    for wnd_gen in ctg_net.wind_generators:
-                        curtailment_ctg += wnd_gen.p_max_pu - wnd_gen.p_var.value()
-                    all_curtailment.append(curtailment_ctg)
+                    all_deficits.append(results_ctg["Resumo"]["Total_Shed_MW"].iloc[0] / ctg_net.sb_mva)
+                    all_curtailment.append(results_ctg["Resumo"]["Total_Curtailment_MW"].iloc[0] / ctg_net.sb_mva)
                 else:
                     print(f"    AVISO: Contingência para o cenário {scen} e ctg da linha {line_id_ctg} não convergiu.")
 
@@ -1,7 +1,6 @@
 import numpy as np
-import copy
 from power.systems import *  # Importa o sistema a ser estudado
-from optimal_power_flow.linear_opf.opf_loss import LinearDispatch
+from optimal_power_flow.linear_opf.opf_loss import LinearDispatch, OptimizationError, ConvergenceError
 from metaheuristic.aoa_metaheuristic.optimizer import AOA
 from trabalhos_transmissao.utils.wnd_scen import apply_wnd_scen
 from trabalhos_transmissao.utils.load_scen import apply_load_scen
@@ -50,56 +49,37 @@ def fitness_function(delta_x_vector: np.ndarray) -> float:
     # Itera sobre os cenários
     for scen in range(nscen):
         # print(f"\n--- Processando Cenário {scen} ---")
-        net_scen = copy.deepcopy(BASE_NET)
-        for i, line in enumerate(net_scen.lines):
+        # Cenário copy-on-write: só as alterações são guardadas, a BASE_NET não é copiada
+        net_scen = BASE_NET.scenario(name=f"Cenario_{scen}")
+        for i, line in enumerate(BASE_NET.lines):
             delta_x = delta_x_vector[i]
             if delta_x > 0:
                 new_reactance = max(line.x_pu - delta_x, 0.0001)
-                line.flow_max_pu = line.flow_max_pu * line.x_pu / new_reactance 
-                line.x_pu = new_reactance
+                net_scen.set_line_reactance(line.id, new_reactance,
+                                            flow_max_pu=line.flow_max_pu * line.x_pu / new_reactance)
         
         apply_wnd_scen(net=net_scen, rng=rng)
         apply_load_scen(net=net_scen, rng=rng)
         # print("    - Caso base sendo resolvido")
         solve_base = LinearDispatch(net_scen)
-        status_base, final_cost, _ = solve_base.solve_loss()
-
-        defict_scen = 0
-        for load in net_scen.loads:
-            defict_scen += load.p_shed_var.value()
-        all_deficits.append(defict_scen)
-
-        curtailment_scen = 0
-        for wnd_gen in net_scen.wind_generators:
-            curtailment_scen +=  wnd_gen.p_max_pu - wnd_gen.p_var.value()
-        all_curtailment.append(curtailment_scen)
-
-        if status_base != 'Optimal':
-            print(f"    AVISO: Caso Base para o cenário {scen} não convergiu.")
-
-        all_costs.append(final_cost)
+        results_base = solve_base.solve_loss()
+        all_costs.append(results_base["FOB_Value"])
+        all_deficits.append(results_base["Resumo"]["Total_Shed_MW"].iloc[0] / net_scen.sb_mva)
+        all_curtailment.append(results_base["Resumo"]["Total_Curtailment_MW"].iloc[0] / net_scen.sb_mva)
 
         #Contingências
-        for line in net_scen.lines: 
+        for line in BASE_NET.lines: 
             # print(f"    - Simulando contingência da linha: {line.id}")
-            ctg_net = copy.deepcopy(net_scen)    
-            line_to_remove = next((l for l in ctg_net.lines if l.id == line.id), None)
-            if line_to_remove: ctg_net.lines.remove(line_to_remove)
+            ctg_net = net_scen.derive(name=f"Cenario_{scen}_CTG_{line.id}").remove_line(line.id)
             solver_ctg = LinearDispatch(ctg_net)
-            status_ctg, final_cost, _ = solver_ctg.solve_loss()
-            if status_ctg == 'Optimal':
-                all_costs.append(final_cost)
-                deficit_ctg = 0
-                for load in ctg_net.loads:
-                    deficit_ctg += load.p_shed_var.value()
-                all_deficits.append(deficit_ctg)
-
-                curtailment_ctg = 0
-                for wnd_gen in ctg_net.wind_generators:
-                    curtailment_ctg +=  wnd_gen.p_max_pu - wnd_gen.p_var.value()
-                all_curtailment.append(curtailment_ctg)
-            else:
+            try:
+                results_ctg = solver_ctg.solve_loss()
+            except (OptimizationError, ConvergenceError):
                 print(f"    AVISO: Contingência para o cenário {scen} e ctg da linha {line.id} não convergiu.")
+                continue
+            all_costs.append(results_ctg["FOB_Value"])
+            all_deficits.append(results_ctg["Resumo"]["Total_Shed_MW"].iloc[0] / ctg_net.sb_mva)
+            all_curtailment.append(results_ctg["Resumo"]["Total_Curtailment_MW"].iloc[0] / ctg_net.sb_mva)
 
     # 7. Cálculo e Retorno (f)
     investment_cost = np.sum(delta_x_vector * COST_FACTOR_PER_UNIT_REACTANCE)
@@ -1,15 +1,22 @@
-from power import Network
+from power import Network, Scenario
 import numpy as np
 
 def apply_load_scen(net=Network, ag=0.95, bg=1.10, ac=-0.02, bc=0.02, rng=np.random.default_rng(seed=42)):
     num_loads = len(net.loads)
-    base_loads_p = np.array([load.p_pu for load in net.loads])
+    base_loads_p = np.array([net.load_p_pu(load) for load in net.loads])
     rg = ag + (bg - ag) * rng.random(num_loads)  
     rc = ac + (bc - ac) * rng.random(num_loads) 
 
     # Calcular o fator de variação total 'r' somando os dois fatores 
     r = rg + rc
+
+    # Em um Scenario apenas o fator é registrado (a rede base não é alterada)
+    if isinstance(net, Scenario):
+        for idx, load_object in enumerate(net.loads):
+            net.scale_load(load_object.id, r[idx])
+        return
+
     scenario_loads = base_loads_p * r
 
     for idx, load_object in enumerate(net.loads):
-        load_object.p_pu = scenario_loads[idx]
\ No newline at end of file
+        load_object.p_pu = scenario_loads[idx]
@@ -1,4 +1,4 @@
-from power import WindGenerator, Network
+from power import WindGenerator, Network, Scenario
 import numpy as np
 
 def apply_wnd_scen(net=Network, rng=np.random.default_rng(seed=42)):
@@ -6,10 +6,16 @@ def apply_wnd_scen(net=Network, rng=np.random.default_rng(seed=42)):
     num_wnd = len(wnd_genrators)
     if not wnd_genrators:
         return np.array([])
-    base_wnd_p_max = np.array([g.p_max_pu for g in wnd_genrators])
+    base_wnd_p_max = np.array([net.gen_p_max_pu(g) for g in wnd_genrators])
     random_factors = rng.random(num_wnd)
     scenario_wnd_p = base_wnd_p_max * random_factors
 
+    # Em um Scenario apenas a disponibilidade é registrada (a rede base não é alterada)
+    if isinstance(net, Scenario):
+        for idx, wnd_object in enumerate(wnd_genrators):
+            net.set_wind_available(wnd_object.id, scenario_wnd_p[idx] * net.sb_mva)
+        return
+
     for idx, wnd_object in enumerate(wnd_genrators):
         wnd_object.p_max_pu = scenario_wnd_p[idx]
 